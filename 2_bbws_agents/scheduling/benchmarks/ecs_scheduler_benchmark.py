@@ -0,0 +1,146 @@
+"""
+Benchmark the ECS scheduler's stop/start against a moto-backed cluster.
+
+Compares the previous per-service loop (describe, put/get item and update one
+service at a time) with the batched, thread-pooled handler. moto answers in
+microseconds, so a fixed delay is added to every AWS request to stand in for
+the network round trip the Lambda pays in AWS.
+
+Usage:
+    python benchmarks/ecs_scheduler_benchmark.py --services 500 --latency-ms 20
+"""
+
+import argparse
+import importlib
+import os
+import sys
+import time
+
+import boto3
+from moto import mock_aws
+
+CLUSTER = "benchmark"
+TABLE = "ecs-scheduler-benchmark-state"
+REGION = "eu-west-1"
+DESIRED_COUNT = 2
+
+
+def create_environment(service_count):
+    """Create the state table, SNS topic and a cluster of running services."""
+    dynamodb = boto3.client("dynamodb", region_name=REGION)
+    dynamodb.create_table(
+        TableName=TABLE,
+        KeySchema=[{"AttributeName": "service_arn", "KeyType": "HASH"}],
+        AttributeDefinitions=[{"AttributeName": "service_arn", "AttributeType": "S"}],
+        BillingMode="PAY_PER_REQUEST",
+    )
+    topic_arn = boto3.client("sns", region_name=REGION).create_topic(Name="ecs-scheduler-benchmark")["TopicArn"]
+
+    ecs = boto3.client("ecs", region_name=REGION)
+    ecs.create_cluster(clusterName=CLUSTER)
+    ecs.register_task_definition(
+        family="tenant",
+        containerDefinitions=[{"name": "web", "image": "nginx", "memory": 128}],
+    )
+    for i in range(service_count):
+        ecs.create_service(
+            cluster=CLUSTER,
+            serviceName=f"tenant-{i:04d}",
+            taskDefinition="tenant",
+            desiredCount=DESIRED_COUNT,
+        )
+    return topic_arn
+
+
+def add_latency(client, latency_seconds):
+    """Delay every request the client sends."""
+    def delay(**kwargs):
+        time.sleep(latency_seconds)
+
+    client.meta.events.register_first("before-send", delay)
+
+
+def legacy_stop(scheduler, cluster_name, service_arns):
+    """Previous stop loop: one describe, put_item and update_service per service."""
+    for arn in service_arns:
+        service = scheduler.ecs.describe_services(cluster=cluster_name, services=[arn])["services"][0]
+        if service["desiredCount"] == 0:
+            continue
+        scheduler.table.put_item(Item={
+            "service_arn": arn,
+            "cluster_name": cluster_name,
+            "service_name": service["serviceName"],
+            "desired_count": service["desiredCount"],
+        })
+        scheduler.ecs.update_service(cluster=cluster_name, service=arn, desiredCount=0)
+
+
+def legacy_start(scheduler, cluster_name, service_arns):
+    """Previous start loop: one describe, get_item and update_service per service."""
+    for arn in service_arns:
+        service = scheduler.ecs.describe_services(cluster=cluster_name, services=[arn])["services"][0]
+        if service["desiredCount"] > 0:
+            continue
+        item = scheduler.table.get_item(Key={"service_arn": arn}).get("Item")
+        restore_count = int(item["desired_count"]) if item else 1
+        scheduler.ecs.update_service(cluster=cluster_name, service=arn, desiredCount=max(restore_count, 1))
+
+
+def running_counts(scheduler):
+    """Desired counts of every service in the cluster."""
+    arns = scheduler.list_all_services(CLUSTER)
+    services, _ = scheduler.describe_services(CLUSTER, arns)
+    return {service["desiredCount"] for service in services.values()}
+
+
+def timed(label, function, *args):
+    """Run function and return (label, seconds)."""
+    start = time.perf_counter()
+    function(*args)
+    return label, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--services", type=int, default=500, help="Services in the cluster")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="Delay added to every AWS request")
+    parser.add_argument("--concurrency", type=int, default=10, help="UPDATE_CONCURRENCY for the handler")
+    args = parser.parse_args()
+
+    os.environ.setdefault("AWS_ACCESS_KEY_ID", "testing")
+    os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "testing")
+    os.environ["AWS_DEFAULT_REGION"] = REGION
+    os.environ["DYNAMO_TABLE"] = TABLE
+    os.environ["UPDATE_CONCURRENCY"] = str(args.concurrency)
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "lambda"))
+
+    with mock_aws():
+        print(f"Creating {args.services} services...", flush=True)
+        os.environ["SNS_TOPIC_ARN"] = create_environment(args.services)
+        scheduler = importlib.import_module("ecs_scheduler")
+        for client in (scheduler.ecs, scheduler.sns, scheduler.dynamodb.meta.client):
+            add_latency(client, args.latency_ms / 1000)
+
+        arns = scheduler.list_all_services(CLUSTER)
+        event = {"cluster_name": CLUSTER, "region": REGION}
+        results = [
+            timed("legacy stop", legacy_stop, scheduler, CLUSTER, arns),
+            timed("legacy start", legacy_start, scheduler, CLUSTER, arns),
+            timed("handler stop", scheduler.handler, {**event, "action": "stop"}, None),
+        ]
+        assert running_counts(scheduler) == {0}, "handler stop left services running"
+        results.append(timed("handler start", scheduler.handler, {**event, "action": "start"}, None))
+        assert running_counts(scheduler) == {DESIRED_COUNT}, "handler start did not restore counts"
+
+    print(f"\n{args.services} services, {args.latency_ms:.0f} ms per request, concurrency {args.concurrency}")
+    print(f"{'run':<15}{'seconds':>10}")
+    for label, seconds in results:
+        print(f"{label:<15}{seconds:>10.2f}")
+    for action in ("stop", "start"):
+        legacy = dict(results)[f"legacy {action}"]
+        batched = dict(results)[f"handler {action}"]
+        print(f"{action} speed-up: {legacy / batched:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,15 +5,55 @@ Stops or starts all ECS services in a cluster on a schedule.
 - Stop: saves current desired_count to DynamoDB, sets to 0
 - Start: reads saved count from DynamoDB, restores (defaults to 1)
 - Sends SNS summary notification on stop only (morning starts are silent)
+
+Services are described 10 at a time, state is saved/read with
+BatchWriteItem/BatchGetItem, and update_service calls run in a bounded
+thread pool (UPDATE_CONCURRENCY) with backoff on throttling.
+
+Start with "mode": "staggered" restores services in waves instead of all at
+once: lowest priority tier first (the service's scheduler-priority tag, saved
+with desired_count on stop), each wave capped at wave_max_tasks tasks, and
+each wave waited on until its tasks are running before the next launches.
+
+Start with "warm_up" set requests each tenant's homepage, sitemap and top
+pages through the ALB once its service is running, so the first visitor does
+not pay for a cold opcache, object cache and EFS. Time-to-first-byte before
+(first request) and after warming (last request) goes into the notification.
+
+Action "stop_idle" stops running services whose ALB target groups served no
+more than idle_max_requests requests (CloudWatch RequestCount) in the last
+idle_minutes, saving their desired counts like "stop" so the next start
+restores them. A service counts as up since its last scale-up: the start time
+the scheduler saves when it starts it, its latest deployment, or its latest
+"has started N tasks" event, whichever is newest. Set CLOUDWATCH_ENDPOINT_URL
+to run it against a local stand-in for CloudWatch.
+
+Action "plan" (with "plan_action": "stop", "start" or "stop_idle" and the same
+options) changes nothing: it returns the desired-count changes that run would
+make and an estimated duration from the cluster's recent run durations.
+
+With RUNS_TABLE set, every run writes a run record plus per-service timings
+(describe latency, update latency and, when the run waits for services to be
+running, time to steady state) to that table; scripts/run-history.py reports
+wake-up percentiles and the slowest tenants across runs.
 """
 
+import asyncio
 import json
 import logging
 import os
+import random
+import ssl
+import statistics
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
+from decimal import Decimal
+from urllib.parse import urlsplit
 
 import boto3
+from boto3.dynamodb.conditions import Key
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 logger = logging.getLogger()
@@ -23,21 +63,93 @@ DYNAMO_TABLE = os.environ["DYNAMO_TABLE"]
 SNS_TOPIC_ARN = os.environ["SNS_TOPIC_ARN"]
 TTL_DAYS = 90
 
-ecs = boto3.client("ecs")
+# Parallel update_service calls (ECS throttles UpdateService per account)
+UPDATE_CONCURRENCY = int(os.environ.get("UPDATE_CONCURRENCY", "10"))
+# Attempts per update_service call when throttled, and backoff bounds (seconds)
+UPDATE_MAX_ATTEMPTS = int(os.environ.get("UPDATE_MAX_ATTEMPTS", "6"))
+BACKOFF_BASE = 0.5
+BACKOFF_MAX = 8.0
+
+DESCRIBE_BATCH_SIZE = 10  # describe_services limit
+BATCH_GET_SIZE = 100  # BatchGetItem limit
+BATCH_GET_MAX_ATTEMPTS = 5
+
+# Staggered start: tag holding a service's tier (lower wakes first) and defaults
+PRIORITY_TAG = os.environ.get("PRIORITY_TAG", "scheduler-priority")
+DEFAULT_PRIORITY = 100
+WAVE_MAX_TASKS = int(os.environ.get("WAVE_MAX_TASKS", "20"))
+WAVE_TIMEOUT_SECONDS = int(os.environ.get("WAVE_TIMEOUT_SECONDS", "300"))
+WAVE_POLL_SECONDS = int(os.environ.get("WAVE_POLL_SECONDS", "10"))
+# Lambda time kept back for releasing the remaining waves and notifying
+TIME_RESERVE_SECONDS = 30
+
+# Warm-up defaults (override per run with the event's "warm_up" object)
+WARM_UP_BASE_URL = os.environ.get("WARM_UP_BASE_URL", "")  # ALB endpoint, e.g. https://dev-alb-123.eu-west-1.elb.amazonaws.com
+WARM_UP_HOST_TEMPLATE = os.environ.get("WARM_UP_HOST_TEMPLATE", "{tenant}.wp{cluster}.kimmyai.io")
+WARM_UP_PATHS = ["/", "/wp-sitemap.xml"]
+WARM_UP_ROUNDS = 3
+WARM_UP_CONCURRENCY = 20
+WARM_UP_TIMEOUT_SECONDS = 15
+WARM_UP_MAX_BODY_BYTES = 2 * 1024 * 1024
+# Service tags: tenant hostname (if it does not follow the template) and extra comma-separated paths
+WARM_HOST_TAG = "scheduler-warm-host"
+WARM_PATHS_TAG = "scheduler-warm-paths"
+
+# Idle stop: window and request threshold (override per run in the event)
+IDLE_MINUTES = int(os.environ.get("IDLE_MINUTES", "60"))
+IDLE_MAX_REQUESTS = int(os.environ.get("IDLE_MAX_REQUESTS", "0"))
+METRIC_QUERIES_PER_CALL = 500  # GetMetricData limit
+TARGET_GROUPS_PER_CALL = 20
+# Service tag that opts a service out of idle stops ("true")
+IDLE_EXEMPT_TAG = "scheduler-keep-alive"
+
+# Run history table (optional): run records and per-service timings, keyed by
+# cluster_name and sk = "run#{kind}#{started}#{run_id}" / "svc#{kind}#{started}#{service}"
+RUNS_TABLE = os.environ.get("RUNS_TABLE", "")
+# Recent runs of the same kind used for plan estimates
+RUN_HISTORY_SIZE = 10
+# Plan estimate without history: seconds per describe batch and per update_service call
+DEFAULT_DESCRIBE_SECONDS = 0.3
+DEFAULT_UPDATE_SECONDS = 0.5
+
+ACTION_LABELS = {"stop": "STOPPED", "start": "STARTED", "stop_idle": "STOPPED IDLE"}
+
+THROTTLING_ERRORS = {
+    "ThrottlingException",
+    "Throttling",
+    "TooManyRequestsException",
+    "RequestLimitExceeded",
+    "ProvisionedThroughputExceededException",
+}
+
+ecs = boto3.client("ecs", config=Config(max_pool_connections=max(UPDATE_CONCURRENCY, 10)))
 dynamodb = boto3.resource("dynamodb")
 sns = boto3.client("sns")
+cloudwatch = boto3.client("cloudwatch", endpoint_url=os.environ.get("CLOUDWATCH_ENDPOINT_URL") or None)
+elbv2 = boto3.client("elbv2")
 table = dynamodb.Table(DYNAMO_TABLE)
+runs_table = dynamodb.Table(RUNS_TABLE) if RUNS_TABLE else None
+
+# Per-service timings of the current run, keyed by service ARN (reset by each run)
+service_timings = {}
 
 SAST = timezone(timedelta(hours=2))
 
 
 def handler(event, context):
     """Lambda entry point. Expects event with action, cluster_name, region, service_prefixes."""
-    action = event["action"]  # "stop" or "start"
+    action = event["action"]  # "stop", "start" or "stop_idle"
     cluster_name = event["cluster_name"]
     region = event.get("region", os.environ.get("AWS_REGION", "eu-west-1"))
     service_prefixes = event.get("service_prefixes", [])
 
+    if action == "plan":
+        planned = event.get("plan_action", "stop")
+        if planned not in ACTION_LABELS:
+            raise ValueError(f"Unknown plan_action: {planned}")
+    elif action not in ACTION_LABELS:
+        raise ValueError(f"Unknown action: {action}")
+
     logger.info("Action=%s cluster=%s region=%s prefixes=%s",
                 action, cluster_name, region, service_prefixes)
 
@@ -50,39 +162,70 @@ def handler(event, context):
         logger.info("Filtered to %d services matching prefixes: %s",
                     len(service_arns), service_prefixes)
 
+    if action == "plan":
+        return {"statusCode": 200, "body": json.dumps(plan_run(event, cluster_name, service_arns), default=str)}
+
     if not service_arns:
         if action == "stop":
             send_notification(action, cluster_name, [], [], "No services found in cluster")
         return {"statusCode": 200, "body": "No services found"}
 
-    succeeded = []
-    failed = []
-
-    for arn in service_arns:
-        try:
-            if action == "stop":
-                stop_service(cluster_name, arn)
-            elif action == "start":
-                start_service(cluster_name, arn)
-            else:
-                raise ValueError(f"Unknown action: {action}")
-            succeeded.append(arn)
-        except Exception:
-            logger.exception("Failed to %s service %s", action, arn)
-            failed.append(arn)
+    waves = None
+    warm_results = None
+    warm_up = warm_up_settings(event.get("warm_up"), cluster_name)
+    service_timings.clear()
+    run_started_at = datetime.now(timezone.utc)
+    run_started = time.monotonic()
+    if action == "stop_idle":
+        response = stop_idle_services(
+            cluster_name,
+            service_arns,
+            idle_minutes=int(event.get("idle_minutes", IDLE_MINUTES)),
+            max_requests=int(event.get("idle_max_requests", IDLE_MAX_REQUESTS)),
+        )
+        result = json.loads(response["body"])
+        record_run(cluster_name, "stop_idle", run_started_at, time.monotonic() - run_started,
+                   len(service_arns), result["succeeded"], result["failed"], context)
+        return response
+    if action == "stop":
+        succeeded, failed = stop_services(cluster_name, service_arns)
+    elif event.get("mode") == "staggered":
+        succeeded, failed, waves, warm_results = start_services_staggered(
+            cluster_name,
+            service_arns,
+            wave_max_tasks=int(event.get("wave_max_tasks", WAVE_MAX_TASKS)),
+            wave_timeout=int(event.get("wave_timeout_seconds", WAVE_TIMEOUT_SECONDS)),
+            target_seconds=event.get("target_seconds"),
+            context=context,
+            warm_up=warm_up,
+        )
+    else:
+        succeeded, failed, warm_results = start_services(
+            cluster_name, service_arns, warm_up, context,
+            wait=bool(event.get("wait_for_steady_state")),
+        )
 
     # Send notifications for both stop and start actions
-    send_notification(action, cluster_name, succeeded, failed)
+    sections = []
+    if waves is not None:
+        sections.append(format_waves(waves, event.get("target_seconds")))
+    if warm_results is not None:
+        sections.append(format_warm_up(warm_results))
+    send_notification(action, cluster_name, succeeded, failed, "\n\n".join(sections) or None)
+    record_run(cluster_name, run_kind(action, event), run_started_at, time.monotonic() - run_started,
+               len(service_arns), len(succeeded), len(failed), context)
 
-    return {
-        "statusCode": 200,
-        "body": json.dumps({
-            "action": action,
-            "cluster": cluster_name,
-            "succeeded": len(succeeded),
-            "failed": len(failed),
-        }),
+    body = {
+        "action": action,
+        "cluster": cluster_name,
+        "succeeded": len(succeeded),
+        "failed": len(failed),
     }
+    if waves is not None:
+        body["waves"] = waves
+    if warm_results is not None:
+        body["warm_up"] = summarize_warm_up(warm_results)
+    return {"statusCode": 200, "body": json.dumps(body)}
 
 
 def list_all_services(cluster_name):
@@ -113,76 +256,980 @@ def filter_services_by_prefix(service_arns, prefixes):
     return filtered
 
 
-def stop_service(cluster_name, service_arn):
-    """Save current desired_count to DynamoDB, then set to 0."""
-    desc = ecs.describe_services(cluster=cluster_name, services=[service_arn])
-    service = desc["services"][0]
-    current_count = service["desiredCount"]
-    service_name = service["serviceName"]
+def describe_services(cluster_name, service_arns, include_tags=False):
+    """Describe services 10 at a time.
 
-    if current_count == 0:
-        logger.info("Service %s already at 0, skipping", service_name)
-        return
+    Returns (services keyed by ARN, ARNs that could not be described).
+    """
+    extra = {"include": ["TAGS"]} if include_tags else {}
+    services = {}
+    failed = []
+    for start in range(0, len(service_arns), DESCRIBE_BATCH_SIZE):
+        chunk = service_arns[start:start + DESCRIBE_BATCH_SIZE]
+        call_started = time.monotonic()
+        try:
+            desc = call_with_backoff(ecs.describe_services, cluster=cluster_name, services=chunk, **extra)
+        except ClientError:
+            logger.exception("describe_services failed for %d services", len(chunk))
+            failed.extend(chunk)
+            continue
+        describe_ms = elapsed_ms(call_started)
+        for arn in chunk:
+            service_timings.setdefault(arn, {}).setdefault("describe_ms", describe_ms)
+        for service in desc.get("services", []):
+            services[service["serviceArn"]] = service
+        for failure in desc.get("failures", []):
+            logger.error("Could not describe %s: %s", failure.get("arn"), failure.get("reason"))
+        failed.extend(arn for arn in chunk if arn not in services)
+    return services, failed
 
-    # Save state to DynamoDB
-    ttl = int(time.time()) + (TTL_DAYS * 86400)
-    table.put_item(Item={
-        "service_arn": service_arn,
-        "cluster_name": cluster_name,
-        "service_name": service_name,
-        "desired_count": current_count,
-        "stopped_at": datetime.now(SAST).isoformat(),
-        "ttl": ttl,
-    })
-    logger.info("Saved state for %s: desired_count=%d", service_name, current_count)
-
-    # Set desired count to 0
-    ecs.update_service(
-        cluster=cluster_name,
-        service=service_arn,
-        desiredCount=0,
-    )
-    logger.info("Stopped service %s (was %d)", service_name, current_count)
 
+def stop_services(cluster_name, service_arns, services=None):
+    """Save desired counts to DynamoDB, then set every running service to 0.
 
-def start_service(cluster_name, service_arn):
-    """Read saved desired_count from DynamoDB and restore. Defaults to 1."""
-    desc = ecs.describe_services(cluster=cluster_name, services=[service_arn])
-    service = desc["services"][0]
-    service_name = service["serviceName"]
+    services (keyed by ARN, described with tags) skips describing them again.
+    Returns (succeeded ARNs, failed ARNs). Services already at 0 count as succeeded.
+    """
+    succeeded, failed, running = plan_stop(cluster_name, service_arns, services)
+
+    # Save state before touching any service, so a failed run can still be restored
+    try:
+        save_states(cluster_name, running)
+    except ClientError:
+        logger.exception("Failed to save state for %d services, not stopping them", len(running))
+        return succeeded, failed + [service["serviceArn"] for service in running]
+
+    updates = [(service, 0) for service in running]
+    stopped, update_failed = update_services(cluster_name, updates)
+    return succeeded + stopped, failed + update_failed
+
+
+def plan_stop(cluster_name, service_arns, services=None):
+    """Work out which services to stop.
+
+    services (keyed by ARN, described with tags) skips describing them again.
+    Returns (ARNs already at 0, ARNs that could not be described, running services).
+    """
+    if services is None:
+        services, failed = describe_services(cluster_name, service_arns, include_tags=True)
+    else:
+        failed = [arn for arn in service_arns if arn not in services]
+
+    running = []
+    stopped = []
+    for arn in service_arns:
+        service = services.get(arn)
+        if service is None:
+            continue
+        if service["desiredCount"] == 0:
+            logger.info("Service %s already at 0, skipping", service["serviceName"])
+            stopped.append(arn)
+        else:
+            running.append(service)
+    return stopped, failed, running
+
+
+def stop_idle_services(cluster_name, service_arns, idle_minutes, max_requests):
+    """Stop running services that served at most max_requests in the last idle_minutes.
+
+    Services without a load balancer, deployed within the window, or tagged
+    scheduler-keep-alive=true are left alone. Idle services go through
+    stop_services, so their desired counts are saved for the next start.
+    Notifies only when something was stopped or failed.
+    """
+    # A metrics or state read failure raises before anything is stopped
+    services, failed, candidates, idle_requests = find_idle_services(
+        cluster_name, service_arns, idle_minutes, max_requests)
+    idle = [service["serviceArn"] for service, _ in idle_requests]
+
+    body = {
+        "action": "stop_idle",
+        "cluster": cluster_name,
+        "checked": len(candidates),
+        "idle": len(idle),
+    }
+    if not idle and not failed:
+        logger.info("No idle services in %s", cluster_name)
+        body.update(succeeded=0, failed=0)
+        return {"statusCode": 200, "body": json.dumps(body)}
+
+    succeeded, stop_failed = stop_services(cluster_name, idle, services) if idle else ([], [])
+    failed += stop_failed
+    send_notification("stop_idle", cluster_name, succeeded, failed,
+                      f"Idle: at most {max_requests} requests in the last {idle_minutes} minutes "
+                      f"({len(idle)} of {len(candidates)} running services with a load balancer)")
+    body.update(succeeded=len(succeeded), failed=len(failed))
+    return {"statusCode": 200, "body": json.dumps(body)}
 
-    if service["desiredCount"] > 0:
-        logger.info("Service %s already running (count=%d), skipping",
-                     service_name, service["desiredCount"])
-        return
 
-    # Read saved state
-    restore_count = 1
+def find_idle_services(cluster_name, service_arns, idle_minutes, max_requests):
+    """Find running services that served at most max_requests in the last idle_minutes.
+
+    Returns (described services keyed by ARN, ARNs that could not be described,
+    candidate services, [(idle service, requests)]).
+    """
+    now = datetime.now(timezone.utc)
+    services, failed = describe_services(cluster_name, service_arns, include_tags=True)
+    running = [arn for arn, service in services.items() if service["desiredCount"] > 0]
+    states = load_states(running)
+    candidates = idle_candidates(services.values(), now - timedelta(minutes=idle_minutes), states)
+    target_groups = sorted({arn for service in candidates for arn in service_target_groups(service)})
+    counts = request_counts(target_groups, now, idle_minutes)
+
+    idle = []
+    for service in candidates:
+        requests = sum(counts.get(arn, 0) for arn in service_target_groups(service))
+        logger.info("Service %s served %d requests in %d minutes", service["serviceName"], requests, idle_minutes)
+        if requests <= max_requests:
+            idle.append((service, requests))
+    return services, failed, candidates, idle
+
+
+def idle_candidates(services, window_start, states):
+    """Running services behind a load balancer that have been up for the whole window.
+
+    states holds the saved state of each service (see load_states).
+    """
+    candidates = []
+    for service in services:
+        name = service["serviceName"]
+        tags = {tag.get("key"): tag.get("value", "") for tag in service.get("tags", [])}
+        if service["desiredCount"] == 0:
+            continue
+        if tags.get(IDLE_EXEMPT_TAG, "").lower() == "true":
+            logger.info("Service %s is tagged %s, skipping", name, IDLE_EXEMPT_TAG)
+            continue
+        if not service_target_groups(service):
+            logger.info("Service %s has no load balancer, skipping", name)
+            continue
+        up_since = last_scaled_up(service, states.get(service["serviceArn"], {}))
+        if up_since is not None and up_since > window_start:
+            logger.info("Service %s has been up since %s, inside the idle window, skipping", name, up_since)
+            continue
+        candidates.append(service)
+    return candidates
+
+
+def last_scaled_up(service, state):
+    """When the service last went up: newest of the scheduler's saved start, deployments and start events.
+
+    update_service with only a desired count creates no deployment, so a
+    service woken by the scheduler is only visible through the saved
+    started_at or its "has started N tasks" events.
+    """
+    times = [deployment["createdAt"] for deployment in service.get("deployments", []) if deployment.get("createdAt")]
+    times += [event["createdAt"] for event in service.get("events", [])
+              if event.get("createdAt") and "has started" in event.get("message", "")]
+    if state.get("started_at"):
+        times.append(datetime.fromisoformat(state["started_at"]))
+    return max(times, default=None)
+
+
+def service_target_groups(service):
+    """Target group ARNs the service registers with."""
+    return [lb["targetGroupArn"] for lb in service.get("loadBalancers", []) if lb.get("targetGroupArn")]
+
+
+def request_counts(target_group_arns, end, minutes):
+    """Sum of ALB RequestCount per target group ARN over the `minutes` before `end`.
+
+    RequestCount is published per (LoadBalancer, TargetGroup), so each target
+    group is resolved to its load balancers first. Up to 500 queries go in each
+    GetMetricData call; target groups with no datapoints served no requests.
+    """
+    queries = []
+    for arn, load_balancer_arns in target_group_load_balancers(target_group_arns).items():
+        for load_balancer_arn in load_balancer_arns:
+            queries.append((arn, {
+                "Id": f"q{len(queries)}",
+                "MetricStat": {
+                    "Metric": {
+                        "Namespace": "AWS/ApplicationELB",
+                        "MetricName": "RequestCount",
+                        "Dimensions": [
+                            {"Name": "TargetGroup", "Value": arn.split(":")[-1]},
+                            {"Name": "LoadBalancer", "Value": load_balancer_arn.split(":")[-1].removeprefix("loadbalancer/")},
+                        ],
+                    },
+                    "Period": 60,
+                    "Stat": "Sum",
+                },
+                "ReturnData": True,
+            }))
+
+    counts = {arn: 0 for arn in target_group_arns}
+    start = end - timedelta(minutes=minutes)
+    for offset in range(0, len(queries), METRIC_QUERIES_PER_CALL):
+        chunk = queries[offset:offset + METRIC_QUERIES_PER_CALL]
+        arn_by_id = {query["Id"]: arn for arn, query in chunk}
+        kwargs = {"MetricDataQueries": [query for _, query in chunk], "StartTime": start, "EndTime": end}
+        while True:
+            response = call_with_backoff(cloudwatch.get_metric_data, **kwargs)
+            for result in response.get("MetricDataResults", []):
+                counts[arn_by_id[result["Id"]]] += int(sum(result.get("Values", [])))
+            if not response.get("NextToken"):
+                break
+            kwargs["NextToken"] = response["NextToken"]
+    return counts
+
+
+def target_group_load_balancers(target_group_arns):
+    """Load balancer ARNs of each target group, described 20 at a time."""
+    load_balancers = {}
+    for offset in range(0, len(target_group_arns), TARGET_GROUPS_PER_CALL):
+        chunk = target_group_arns[offset:offset + TARGET_GROUPS_PER_CALL]
+        response = call_with_backoff(elbv2.describe_target_groups, TargetGroupArns=chunk)
+        for target_group in response.get("TargetGroups", []):
+            load_balancers[target_group["TargetGroupArn"]] = target_group.get("LoadBalancerArns", [])
+    return load_balancers
+
+
+def start_services(cluster_name, service_arns, warm_up=None, context=None, wait=False):
+    """Restore every stopped service to its saved desired count (default 1).
+
+    With wait, waits for the started services to be running (timing each one's
+    time to steady state). With warm_up settings, also warms the running ones.
+
+    Returns (succeeded ARNs, failed ARNs, warm-up results or None). Services
+    already running count as succeeded.
+    """
+    succeeded, failed, restores = plan_start(cluster_name, service_arns)
+    updates = [(service, count) for service, count, _ in restores]
+    started, update_failed = update_services(cluster_name, updates)
+    save_started(cluster_name, restores, started)
+
+    warm_results = None
+    if wait or warm_up is not None:
+        timeout = WAVE_TIMEOUT_SECONDS
+        remaining = remaining_seconds(context)
+        if remaining is not None:
+            reserve = warm_up["timeout_seconds"] * warm_up["rounds"] if warm_up is not None else 0
+            timeout = min(timeout, remaining - TIME_RESERVE_SECONDS - reserve)
+        not_running = wait_for_running(cluster_name, started, timeout)
+        if warm_up is not None:
+            running = [service for service, _ in updates if service["serviceArn"] in started
+                       and service["serviceArn"] not in not_running]
+            warm_results = warm_services(cluster_name, running, warm_up)
+    return succeeded + started, failed + update_failed, warm_results
+
+
+def start_services_staggered(cluster_name, service_arns, wave_max_tasks, wave_timeout,
+                             target_seconds=None, context=None, warm_up=None):
+    """Restore stopped services in waves, waiting for each wave to be running.
+
+    Services are ordered by priority tier (lower first); a wave holds services of
+    one tier up to wave_max_tasks tasks (a bigger service gets a wave of its own).
+    A wave that is not running within wave_timeout seconds is logged and the next
+    wave launches anyway. If the Lambda runs short of time, the remaining waves
+    are launched together without waiting. With warm_up settings, each wave's
+    running services are warmed before the next wave launches.
+
+    Returns (succeeded ARNs, failed ARNs, per-wave timings, warm-up results or None).
+    """
+    started_at = time.monotonic()
+    succeeded, failed, restores = plan_start(cluster_name, service_arns)
+    waves = plan_waves(restores, wave_max_tasks)
+    logger.info("Starting %d services in %d waves (max %d tasks per wave)",
+                len(restores), len(waves), wave_max_tasks)
+
+    timings = []
+    warm_results = [] if warm_up is not None else None
+    for number, wave in enumerate(waves, start=1):
+        remaining = remaining_seconds(context)
+        if remaining is not None and remaining < TIME_RESERVE_SECONDS + WAVE_POLL_SECONDS:
+            rest = [restore for later in waves[number - 1:] for restore in later]
+            logger.warning("%.0fs left, launching the last %d services without waiting", remaining, len(rest))
+            started, update_failed = update_services(cluster_name, [(service, count) for service, count, _ in rest])
+            save_started(cluster_name, rest, started)
+            succeeded += started
+            failed += update_failed
+            timings.append(wave_timing(number, rest, started_at, time.monotonic(), None, [], waited=False))
+            break
+
+        wave_started = time.monotonic()
+        started, update_failed = update_services(cluster_name, [(service, count) for service, count, _ in wave])
+        save_started(cluster_name, wave, started)
+        succeeded += started
+        failed += update_failed
+
+        timeout = wave_timeout
+        if remaining is not None:
+            timeout = min(timeout, remaining - TIME_RESERVE_SECONDS)
+        not_running = wait_for_running(cluster_name, started, timeout)
+        timing = wave_timing(number, wave, started_at, wave_started, time.monotonic(), not_running)
+        if warm_up is not None:
+            warm_started = time.monotonic()
+            running = [service for service, _, _ in wave if service["serviceArn"] in started
+                       and service["serviceArn"] not in not_running]
+            warm_results += warm_services(cluster_name, running, warm_up)
+            timing["warm_seconds"] = round(time.monotonic() - warm_started, 1)
+        timings.append(timing)
+        logger.info("Wave timing: %s", json.dumps(timing))
+
+    total = round(time.monotonic() - started_at, 1)
+    if target_seconds is not None and total > float(target_seconds):
+        logger.warning("Staggered start took %.1fs, over the %ss target", total, target_seconds)
+    else:
+        logger.info("Staggered start took %.1fs", total)
+    return succeeded, failed, timings, warm_results
+
+
+def plan_start(cluster_name, service_arns):
+    """Work out which services to start, with their saved counts and priorities.
+
+    Returns (ARNs already running, ARNs that could not be described,
+    [(service, restore_count, priority)] for stopped services).
+    """
+    services, failed = describe_services(cluster_name, service_arns, include_tags=True)
+
+    stopped = []
+    succeeded = []
+    for arn in service_arns:
+        service = services.get(arn)
+        if service is None:
+            continue
+        if service["desiredCount"] > 0:
+            logger.info("Service %s already running (count=%d), skipping",
+                        service["serviceName"], service["desiredCount"])
+            succeeded.append(arn)
+        else:
+            stopped.append(service)
+
     try:
-        response = table.get_item(Key={"service_arn": service_arn})
-        if "Item" in response:
-            restore_count = int(response["Item"]["desired_count"])
-            logger.info("Restoring %s to saved count %d", service_name, restore_count)
+        saved_states = load_states([service["serviceArn"] for service in stopped])
+    except ClientError:
+        logger.exception("DynamoDB read failed, defaulting all services to 1")
+        saved_states = {}
+
+    restores = []
+    for service in stopped:
+        state = saved_states.get(service["serviceArn"])
+        if state is None:
+            logger.info("No saved state for %s, defaulting to 1", service["serviceName"])
+            restore_count = 1
+            priority = service_priority(service)
+        else:
+            logger.info("Restoring %s to saved count %d", service["serviceName"], state["desired_count"])
+            restore_count = state["desired_count"]
+            priority = state.get("priority", service_priority(service))
+        restores.append((service, max(restore_count, 1), priority))
+    return succeeded, failed, restores
+
+
+def plan_waves(restores, wave_max_tasks):
+    """Group (service, count, priority) restores into waves by tier and task budget."""
+    waves = []
+    wave = []
+    wave_tasks = 0
+    wave_priority = None
+    for restore in sorted(restores, key=lambda restore: (restore[2], restore[0]["serviceName"])):
+        _, count, priority = restore
+        if wave and (priority != wave_priority or wave_tasks + count > wave_max_tasks):
+            waves.append(wave)
+            wave, wave_tasks = [], 0
+        wave.append(restore)
+        wave_tasks += count
+        wave_priority = priority
+    if wave:
+        waves.append(wave)
+    return waves
+
+
+def wait_for_running(cluster_name, service_arns, timeout):
+    """Poll until every service runs its desired count with nothing pending.
+
+    Returns the ARNs still not running when the timeout passes.
+    """
+    deadline = time.monotonic() + max(timeout, 0)
+    waiting = list(service_arns)
+    while waiting:
+        services, _ = describe_services(cluster_name, waiting)
+        still_waiting = [
+            arn for arn in waiting
+            if arn not in services
+            or services[arn]["runningCount"] < services[arn]["desiredCount"]
+            or services[arn]["pendingCount"] > 0
+        ]
+        for arn in set(waiting) - set(still_waiting):
+            timing = service_timings.setdefault(arn, {})
+            if "updated_at" in timing:
+                timing["steady_ms"] = elapsed_ms(timing["updated_at"])
+        waiting = still_waiting
+        if not waiting or time.monotonic() + WAVE_POLL_SECONDS > deadline:
+            break
+        time.sleep(WAVE_POLL_SECONDS)
+    if waiting:
+        logger.warning("%d services not running after %ds: %s", len(waiting), timeout,
+                       ", ".join(arn.split("/")[-1] for arn in waiting))
+        for arn in waiting:
+            service_timings.setdefault(arn, {})["timed_out"] = True
+    return waiting
+
+
+def wave_timing(number, wave, started_at, wave_started, wave_running, not_running, waited=True):
+    """Timing summary of one wave (seconds are relative to the start of the run)."""
+    return {
+        "wave": number,
+        "priority": min(priority for _, _, priority in wave),
+        "services": len(wave),
+        "tasks": sum(count for _, count, _ in wave),
+        "launched_at": round(wave_started - started_at, 1),
+        "running_after": round(wave_running - wave_started, 1) if wave_running is not None else None,
+        "not_running": [arn.split("/")[-1] for arn in not_running],
+        "waited": waited,
+    }
+
+
+def format_waves(waves, target_seconds=None):
+    """Per-wave timing lines for the SNS notification."""
+    lines = ["Waves:"]
+    for wave in waves:
+        running = f"running after {wave['running_after']}s" if wave["waited"] else "not waited on"
+        lines.append(
+            f"  {wave['wave']}. priority {wave['priority']}: {wave['services']} services / "
+            f"{wave['tasks']} tasks, launched at {wave['launched_at']}s, {running}"
+        )
+        if wave["not_running"]:
+            lines.append(f"     not running in time: {', '.join(wave['not_running'])}")
+    if waves:
+        last = waves[-1]
+        total = last["launched_at"] + (last["running_after"] or 0)
+        if last["waited"]:
+            line = f"Cluster warm after {total:.1f}s"
         else:
-            logger.info("No saved state for %s, defaulting to 1", service_name)
+            line = f"Ran short of time; remaining services launched at {total:.1f}s"
+        if target_seconds is not None:
+            line += f" (target {target_seconds}s{', EXCEEDED' if total > float(target_seconds) else ''})"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def service_priority(service):
+    """Priority tier from the service's scheduler-priority tag (DEFAULT_PRIORITY if absent or invalid)."""
+    for tag in service.get("tags", []):
+        if tag.get("key") == PRIORITY_TAG:
+            try:
+                return int(tag["value"])
+            except (KeyError, ValueError):
+                logger.warning("Invalid %s tag on %s: %r", PRIORITY_TAG, service["serviceName"], tag.get("value"))
+    return DEFAULT_PRIORITY
+
+
+def remaining_seconds(context):
+    """Seconds left in the Lambda invocation, or None outside Lambda."""
+    if context is None or not hasattr(context, "get_remaining_time_in_millis"):
+        return None
+    return context.get_remaining_time_in_millis() / 1000
+
+
+def warm_up_settings(option, cluster_name):
+    """Warm-up settings from the event's "warm_up" option (None when warm-up is off).
+
+    option is true (use the defaults) or an object overriding base_url,
+    host_template, paths, rounds, concurrency and timeout_seconds.
+    """
+    if not option:
+        return None
+    overrides = {key: value for key, value in option.items() if value is not None} if isinstance(option, dict) else {}
+    settings = {
+        "base_url": overrides.get("base_url", WARM_UP_BASE_URL),
+        "host_template": overrides.get("host_template", WARM_UP_HOST_TEMPLATE),
+        "paths": list(overrides.get("paths", WARM_UP_PATHS)),
+        "rounds": max(int(overrides.get("rounds", WARM_UP_ROUNDS)), 2),
+        "concurrency": int(overrides.get("concurrency", WARM_UP_CONCURRENCY)),
+        "timeout_seconds": float(overrides.get("timeout_seconds", WARM_UP_TIMEOUT_SECONDS)),
+        "cluster": cluster_name,
+    }
+    if not settings["base_url"]:
+        logger.warning("Warm-up requested but no base_url/WARM_UP_BASE_URL is set, skipping it")
+        return None
+    return settings
+
+
+def warm_targets(services, settings):
+    """(service name, host, paths) to warm for each service with a resolvable hostname."""
+    targets = []
+    for service in services:
+        tags = {tag.get("key"): tag.get("value", "") for tag in service.get("tags", [])}
+        host = tags.get(WARM_HOST_TAG)
+        if not host:
+            tenant = tenant_name(service["serviceName"], settings["cluster"])
+            if tenant is None:
+                logger.info("No tenant hostname for %s, not warming it", service["serviceName"])
+                continue
+            host = settings["host_template"].format(tenant=tenant, cluster=settings["cluster"])
+        paths = list(settings["paths"])
+        for path in tags.get(WARM_PATHS_TAG, "").split(","):
+            path = path.strip()
+            if path and path not in paths:
+                paths.append(path if path.startswith("/") else "/" + path)
+        targets.append((service["serviceName"], host, paths))
+    return targets
+
+
+def tenant_name(service_name, cluster_name):
+    """Tenant from a "{cluster}-{tenant}-service" name, or None for other services."""
+    prefix = f"{cluster_name}-"
+    suffix = "-service"
+    if service_name.startswith(prefix) and service_name.endswith(suffix):
+        return service_name[len(prefix):-len(suffix)] or None
+    return None
+
+
+def warm_services(cluster_name, services, settings):
+    """Warm the given running services and return one result per URL."""
+    targets = warm_targets(services, settings)
+    if not targets:
+        return []
+    started = time.monotonic()
+    results = asyncio.run(warm_urls(targets, settings))
+    logger.info("Warmed %d URLs on %d sites in %.1fs", len(results), len(targets), time.monotonic() - started)
+    return results
+
+
+async def warm_urls(targets, settings):
+    """Request every URL `rounds` times, at most `concurrency` requests in flight.
+
+    Each URL's rounds run in order (the first is the cold request, the last
+    shows the warmed TTFB); different URLs run concurrently.
+    """
+    semaphore = asyncio.Semaphore(settings["concurrency"])
+
+    async def warm(service_name, host, path):
+        ttfbs = []
+        status = None
+        error = None
+        for _ in range(settings["rounds"]):
+            async with semaphore:
+                try:
+                    status, ttfb = await fetch_ttfb(settings["base_url"], host, path, settings["timeout_seconds"])
+                    ttfbs.append(ttfb)
+                except (OSError, asyncio.TimeoutError, ValueError) as e:
+                    error = f"{type(e).__name__}: {e}"
+                    break
+        return {
+            "service": service_name,
+            "host": host,
+            "path": path,
+            "status": status,
+            "cold_ms": round(ttfbs[0] * 1000) if ttfbs else None,
+            "warm_ms": round(ttfbs[-1] * 1000) if len(ttfbs) > 1 else None,
+            "error": error,
+        }
+
+    return await asyncio.gather(*(
+        warm(service_name, host, path) for service_name, host, paths in targets for path in paths
+    ))
+
+
+async def fetch_ttfb(base_url, host, path, timeout):
+    """GET a tenant path through the ALB (TLS SNI and Host set to the tenant's hostname).
+
+    Returns (HTTP status, seconds from connecting to the first response byte);
+    the body is read (up to WARM_UP_MAX_BODY_BYTES) so the request completes.
+    """
+    base = urlsplit(base_url)
+    secure = base.scheme == "https"
+    port = base.port or (443 if secure else 80)
+    context = ssl.create_default_context() if secure else None
+
+    start = time.perf_counter()
+    reader, writer = await asyncio.wait_for(
+        asyncio.open_connection(base.hostname, port, ssl=context, server_hostname=host if secure else None),
+        timeout,
+    )
+    try:
+        writer.write((
+            f"GET {path} HTTP/1.1\r\n"
+            f"Host: {host}\r\n"
+            "User-Agent: bbws-ecs-scheduler-warmup\r\n"
+            "Accept: text/html,application/xml;q=0.9,*/*;q=0.8\r\n"
+            "Accept-Encoding: gzip\r\n"
+            "Connection: close\r\n\r\n"
+        ).encode())
+        await writer.drain()
+        status_line = await asyncio.wait_for(reader.readline(), timeout)
+        ttfb = time.perf_counter() - start
+        if not status_line:
+            raise ConnectionError("connection closed before a response")
+        parts = status_line.split()
+        if len(parts) < 2 or not parts[0].startswith(b"HTTP/") or not parts[1].isdigit():
+            raise ValueError(f"malformed status line {status_line[:80]!r}")
+        status = int(parts[1])
+
+        received = 0
+        while received < WARM_UP_MAX_BODY_BYTES:
+            chunk = await asyncio.wait_for(reader.read(65536), timeout)
+            if not chunk:
+                break
+            received += len(chunk)
+        return status, ttfb
+    finally:
+        writer.close()
+
+
+def summarize_warm_up(results):
+    """Aggregate warm-up results: URL counts and TTFB percentiles before/after warming."""
+    cold = [result["cold_ms"] for result in results if result["cold_ms"] is not None]
+    warm = [result["warm_ms"] for result in results if result["warm_ms"] is not None]
+    return {
+        "sites": len({result["host"] for result in results}),
+        "urls": len(results),
+        "errors": sum(1 for result in results if result["error"] or (result["status"] or 0) >= 500),
+        "cold_p50_ms": percentile(cold, 50),
+        "cold_p95_ms": percentile(cold, 95),
+        "warm_p50_ms": percentile(warm, 50),
+        "warm_p95_ms": percentile(warm, 95),
+    }
+
+
+def percentile(values, pct):
+    """Interpolated percentile of a list of milliseconds (None if empty)."""
+    if not values:
+        return None
+    if len(values) == 1:
+        return values[0]
+    return round(statistics.quantiles(values, n=100, method="inclusive")[pct - 1])
+
+
+def format_warm_up(results):
+    """Warm-up lines for the SNS notification: overall TTFB and each site's slowest URL."""
+    summary = summarize_warm_up(results)
+    lines = [
+        f"Warm-up: {summary['urls']} URLs on {summary['sites']} sites, {summary['errors']} errors",
+        f"  TTFB p50: {summary['cold_p50_ms']} ms cold -> {summary['warm_p50_ms']} ms warm",
+        f"  TTFB p95: {summary['cold_p95_ms']} ms cold -> {summary['warm_p95_ms']} ms warm",
+    ]
+    by_host = {}
+    for result in results:
+        by_host.setdefault(result["host"], []).append(result)
+    for host, host_results in sorted(by_host.items()):
+        failed = [result for result in host_results if result["error"]]
+        timed_results = [result for result in host_results if result["cold_ms"] is not None]
+        if timed_results:
+            slowest = max(timed_results, key=lambda result: result["cold_ms"])
+            lines.append(
+                f"  - {host}: slowest {slowest['path']} {slowest['cold_ms']} -> {slowest['warm_ms']} ms"
+                f" (HTTP {slowest['status']})"
+            )
+        for result in failed:
+            lines.append(f"  - {host}{result['path']}: {result['error']}")
+    return "\n".join(lines)
+
+
+def plan_run(event, cluster_name, service_arns):
+    """Work out what a stop, start or stop_idle run would change, without changing anything.
+
+    Uses the same planning helpers as the runs (plan_stop, plan_start,
+    find_idle_services), so each service is described once. Returns the plan:
+    per-service desired-count changes, services left as they are, ARNs that
+    could not be described, and the estimated duration.
+    """
+    planned = event.get("plan_action", "stop")
+    changes = []
+    unchanged = []
+    extra = {}
+    if planned == "stop":
+        stopped, failed, running = plan_stop(cluster_name, service_arns)
+        changes = [planned_change(service, 0) for service in running]
+        unchanged = [arn.split("/")[-1] for arn in stopped]
+    elif planned == "stop_idle":
+        idle_minutes = int(event.get("idle_minutes", IDLE_MINUTES))
+        max_requests = int(event.get("idle_max_requests", IDLE_MAX_REQUESTS))
+        _, failed, candidates, idle = find_idle_services(cluster_name, service_arns, idle_minutes, max_requests)
+        idle_arns = {service["serviceArn"] for service, _ in idle}
+        for service, requests in idle:
+            changes.append({**planned_change(service, 0), "requests": requests})
+        unchanged = [service["serviceName"] for service in candidates if service["serviceArn"] not in idle_arns]
+        extra = {"idle_minutes": idle_minutes, "idle_max_requests": max_requests, "checked": len(candidates)}
+    else:
+        running, failed, restores = plan_start(cluster_name, service_arns)
+        changes = [planned_change(service, count, priority) for service, count, priority in restores]
+        unchanged = [arn.split("/")[-1] for arn in running]
+        if event.get("mode") == "staggered":
+            waves = plan_waves(restores, int(event.get("wave_max_tasks", WAVE_MAX_TASKS)))
+            extra = {"waves": [[service["serviceName"] for service, _, _ in wave] for wave in waves]}
+
+    plan = {
+        "action": "plan",
+        "plan_action": planned,
+        "cluster": cluster_name,
+        "service_prefixes": event.get("service_prefixes", []),
+        "matched": len(service_arns),
+        "changes": changes,
+        "unchanged": unchanged,
+        "undescribed": failed,
+        "task_delta": sum(change["to"] - change["from"] for change in changes),
+        "estimate": estimate_duration(cluster_name, run_kind(planned, event), len(service_arns), len(changes)),
+    }
+    plan.update(extra)
+    logger.info("Plan for %s on %s: %d changes, %d unchanged, %d undescribed",
+                planned, cluster_name, len(changes), len(unchanged), len(failed))
+    return plan
+
+
+def planned_change(service, desired_count, priority=None):
+    """One service's desired-count change in a plan."""
+    change = {
+        "service": service["serviceName"],
+        "from": service["desiredCount"],
+        "to": desired_count,
+    }
+    if priority is not None:
+        change["priority"] = priority
+    return change
+
+
+def run_kind(action, event):
+    """Run history key for an action: staggered starts take far longer than plain ones."""
+    if action == "start" and event.get("mode") == "staggered":
+        return "start_staggered"
+    return action
+
+
+def estimate_duration(cluster_name, kind, service_count, change_count):
+    """Estimated seconds for a run over service_count services, change_count of which change.
+
+    Uses the median seconds per service of the cluster's recent runs of the
+    same kind; without history, falls back to per-call defaults.
+    """
+    if change_count == 0:
+        return {"seconds": 0, "basis": "no changes", "runs": 0}
+    try:
+        runs = load_run_history(cluster_name, kind)
     except ClientError:
-        logger.exception("DynamoDB read failed for %s, defaulting to 1", service_name)
+        logger.exception("Could not read run history for %s %s", cluster_name, kind)
+        runs = []
+    rates = [run["seconds"] / run["services"] for run in runs if run["services"]]
+    if rates:
+        return {
+            "seconds": round(statistics.median(rates) * service_count, 1),
+            "basis": "history",
+            "runs": len(rates),
+        }
+    describe_calls = -(-service_count // DESCRIBE_BATCH_SIZE)
+    update_rounds = -(-change_count // UPDATE_CONCURRENCY)
+    return {
+        "seconds": round(describe_calls * DEFAULT_DESCRIBE_SECONDS + update_rounds * DEFAULT_UPDATE_SECONDS, 1),
+        "basis": "default",
+        "runs": 0,
+    }
+
 
-    if restore_count < 1:
-        restore_count = 1
+def record_run(cluster_name, kind, started_at, seconds, service_count, succeeded, failed, context=None):
+    """Write the run record and its per-service timings to the run history table.
 
-    ecs.update_service(
-        cluster=cluster_name,
-        service=service_arn,
-        desiredCount=restore_count,
+    Does nothing without RUNS_TABLE; a failed write is logged, never raised.
+    """
+    if runs_table is None or not service_count:
+        return
+    started = started_at.strftime("%Y-%m-%dT%H:%M:%SZ")
+    run_id = getattr(context, "aws_request_id", None) or f"{int(started_at.timestamp())}"
+    ttl = int(time.time()) + (TTL_DAYS * 86400)
+    try:
+        with runs_table.batch_writer() as batch:
+            batch.put_item(Item={
+                "cluster_name": cluster_name,
+                "sk": f"run#{kind}#{started}#{run_id}",
+                "run_id": run_id,
+                "kind": kind,
+                "started_at": started,
+                "seconds": Decimal(str(round(seconds, 1))),
+                "services": service_count,
+                "succeeded": succeeded,
+                "failed": failed,
+                "ttl": ttl,
+            })
+            for arn, timing in service_timings.items():
+                if "update_ms" not in timing:
+                    continue  # described only: nothing was changed
+                item = {
+                    "cluster_name": cluster_name,
+                    "sk": f"svc#{kind}#{started}#{arn.split('/')[-1]}",
+                    "run_id": run_id,
+                    "kind": kind,
+                    "started_at": started,
+                    "service_name": arn.split("/")[-1],
+                    "ttl": ttl,
+                }
+                for field in ("describe_ms", "update_ms", "steady_ms", "desired_count", "timed_out"):
+                    if field in timing:
+                        item[field] = timing[field]
+                batch.put_item(Item=item)
+        logger.info("Recorded %s run %s with %d service timings", kind, run_id,
+                    sum(1 for timing in service_timings.values() if "update_ms" in timing))
+    except ClientError:
+        logger.exception("Failed to record %s run history for %s", kind, cluster_name)
+
+
+def load_run_history(cluster_name, kind):
+    """The cluster's last RUN_HISTORY_SIZE runs of a kind: [{"seconds", "services", "started_at"}]."""
+    if runs_table is None:
+        return []
+    response = runs_table.query(
+        KeyConditionExpression=Key("cluster_name").eq(cluster_name) & Key("sk").begins_with(f"run#{kind}#"),
+        ScanIndexForward=False,
+        Limit=RUN_HISTORY_SIZE,
     )
-    logger.info("Started service %s with desired_count=%d", service_name, restore_count)
+    return [
+        {"seconds": float(item["seconds"]), "services": int(item["services"]), "started_at": item["started_at"]}
+        for item in response.get("Items", [])
+    ]
+
+
+def elapsed_ms(since):
+    """Milliseconds since a time.monotonic() reading."""
+    return int((time.monotonic() - since) * 1000)
+
+
+def save_states(cluster_name, services):
+    """Save each service's desired_count with BatchWriteItem (unprocessed items are retried)."""
+    ttl = int(time.time()) + (TTL_DAYS * 86400)
+    stopped_at = datetime.now(SAST).isoformat()
+    with table.batch_writer() as batch:
+        for service in services:
+            batch.put_item(Item={
+                "service_arn": service["serviceArn"],
+                "cluster_name": cluster_name,
+                "service_name": service["serviceName"],
+                "desired_count": service["desiredCount"],
+                "priority": service_priority(service),
+                "stopped_at": stopped_at,
+                "ttl": ttl,
+            })
+    logger.info("Saved state for %d services", len(services))
+
+
+def save_started(cluster_name, restores, started_arns):
+    """Record when the scheduler started each service, for stop_idle's up-since check.
+
+    Rewrites each started service's state with its restored count and priority
+    plus started_at; a failed write is logged, never raised.
+    """
+    started_arns = set(started_arns)
+    started_at = datetime.now(timezone.utc).isoformat()
+    ttl = int(time.time()) + (TTL_DAYS * 86400)
+    try:
+        with table.batch_writer() as batch:
+            for service, count, priority in restores:
+                if service["serviceArn"] not in started_arns:
+                    continue
+                batch.put_item(Item={
+                    "service_arn": service["serviceArn"],
+                    "cluster_name": cluster_name,
+                    "service_name": service["serviceName"],
+                    "desired_count": count,
+                    "priority": priority,
+                    "started_at": started_at,
+                    "ttl": ttl,
+                })
+    except ClientError:
+        logger.exception("Failed to record start time for %d services", len(started_arns))
+
+
+def load_states(service_arns):
+    """Read saved desired_counts and priorities with BatchGetItem, retrying UnprocessedKeys.
+
+    Returns {"desired_count", "priority", "started_at"} keyed by service ARN
+    (ARNs without saved state are absent; priority is absent for state saved
+    before tiers, started_at unless the scheduler started the service).
+    """
+    states = {}
+    for start in range(0, len(service_arns), BATCH_GET_SIZE):
+        chunk = service_arns[start:start + BATCH_GET_SIZE]
+        request = {DYNAMO_TABLE: {
+            "Keys": [{"service_arn": arn} for arn in chunk],
+            "ProjectionExpression": "#arn, #count, #priority, #started",
+            "ExpressionAttributeNames": {
+                "#arn": "service_arn",
+                "#count": "desired_count",
+                "#priority": "priority",
+                "#started": "started_at",
+            },
+        }}
+        for attempt in range(BATCH_GET_MAX_ATTEMPTS):
+            if attempt:
+                time.sleep(backoff_delay(attempt))
+            response = dynamodb.batch_get_item(RequestItems=request)
+            for item in response.get("Responses", {}).get(DYNAMO_TABLE, []):
+                state = {"desired_count": int(item["desired_count"])}
+                if "priority" in item:
+                    state["priority"] = int(item["priority"])
+                if "started_at" in item:
+                    state["started_at"] = item["started_at"]
+                states[item["service_arn"]] = state
+            request = response.get("UnprocessedKeys") or {}
+            if not request:
+                break
+        else:
+            missing = len(request[DYNAMO_TABLE]["Keys"])
+            logger.error("%d saved states still unprocessed, those services default to 1", missing)
+    return states
+
+
+def update_services(cluster_name, updates):
+    """Set desired counts in a bounded thread pool.
+
+    updates is a list of (service, desired_count). Returns (succeeded ARNs, failed ARNs)
+    in input order.
+    """
+    if not updates:
+        return [], []
+
+    def update(service, desired_count):
+        call_started = time.monotonic()
+        call_with_backoff(
+            ecs.update_service,
+            cluster=cluster_name,
+            service=service["serviceArn"],
+            desiredCount=desired_count,
+        )
+        service_timings.setdefault(service["serviceArn"], {}).update(
+            update_ms=elapsed_ms(call_started),
+            updated_at=time.monotonic(),
+            desired_count=desired_count,
+        )
+        logger.info("Updated service %s: desired_count %d -> %d",
+                    service["serviceName"], service["desiredCount"], desired_count)
+
+    succeeded = []
+    failed = []
+    with ThreadPoolExecutor(max_workers=min(UPDATE_CONCURRENCY, len(updates))) as pool:
+        futures = [(service, pool.submit(update, service, count)) for service, count in updates]
+        for service, future in futures:
+            try:
+                future.result()
+                succeeded.append(service["serviceArn"])
+            except Exception:
+                logger.exception("Failed to update service %s", service["serviceName"])
+                failed.append(service["serviceArn"])
+    return succeeded, failed
+
+
+def call_with_backoff(operation, **kwargs):
+    """Call an AWS operation, retrying throttling errors with jittered exponential backoff."""
+    for attempt in range(UPDATE_MAX_ATTEMPTS):
+        try:
+            return operation(**kwargs)
+        except ClientError as e:
+            code = e.response.get("Error", {}).get("Code")
+            if code not in THROTTLING_ERRORS or attempt == UPDATE_MAX_ATTEMPTS - 1:
+                raise
+            delay = backoff_delay(attempt + 1)
+            logger.warning("%s throttled (%s), retrying in %.2fs", operation.__name__, code, delay)
+            time.sleep(delay)
+
+
+def backoff_delay(attempt):
+    """Jittered exponential backoff for the given retry attempt (1 = first retry)."""
+    ceiling = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** (attempt - 1))
+    return random.uniform(ceiling / 2, ceiling)
 
 
 def send_notification(action, cluster_name, succeeded, failed, extra_message=None):
     """Send SNS notification summarizing the action."""
     now_sast = datetime.now(SAST).strftime("%Y-%m-%d %H:%M SAST")
-    action_label = "STOPPED" if action == "stop" else "STARTED"
+    action_label = ACTION_LABELS[action]
 
     subject = f"ECS Scheduler: {action_label} {cluster_name} ({len(succeeded)} services)"
 
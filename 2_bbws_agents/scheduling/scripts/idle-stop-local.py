@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Run the stop_idle action offline against a local stand-in for AWS.
+
+Creates a cluster of ALB-backed tenant services in moto, deployed a day ago,
+and publishes RequestCount datapoints for the busy ones into the stand-in
+CloudWatch. The last --woken services start stopped and are woken with
+{"action": "start"} (as the morning start would) before the handler runs
+{"action": "stop_idle"}; they have no traffic but have not been up for the
+window, so only the remaining idle services are stopped.
+
+Usage:
+    python scripts/idle-stop-local.py --services 20 --busy 5 --woken 3 --idle-minutes 60
+"""
+
+import argparse
+import importlib
+import json
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+
+import boto3
+from moto import mock_aws
+from moto.core import DEFAULT_ACCOUNT_ID
+from moto.ecs.models import ecs_backends
+
+CLUSTER = "dev"
+TABLE = "ecs-scheduler-local-state"
+REGION = "eu-west-1"
+
+
+def create_environment(service_count, busy_count, woken_count, idle_minutes):
+    """Create the state table, topic, ALB, one target group and service per tenant, and traffic."""
+    boto3.client("dynamodb", region_name=REGION).create_table(
+        TableName=TABLE,
+        KeySchema=[{"AttributeName": "service_arn", "KeyType": "HASH"}],
+        AttributeDefinitions=[{"AttributeName": "service_arn", "AttributeType": "S"}],
+        BillingMode="PAY_PER_REQUEST",
+    )
+    topic_arn = boto3.client("sns", region_name=REGION).create_topic(Name="ecs-scheduler-local")["TopicArn"]
+
+    ec2 = boto3.client("ec2", region_name=REGION)
+    vpc_id = ec2.create_vpc(CidrBlock="10.0.0.0/16")["Vpc"]["VpcId"]
+    subnets = [
+        ec2.create_subnet(VpcId=vpc_id, CidrBlock=f"10.0.{i}.0/24", AvailabilityZone=f"{REGION}{zone}")["Subnet"]["SubnetId"]
+        for i, zone in enumerate("ab")
+    ]
+    elbv2 = boto3.client("elbv2", region_name=REGION)
+    load_balancer_arn = elbv2.create_load_balancer(Name=f"{CLUSTER}-alb", Subnets=subnets)["LoadBalancers"][0]["LoadBalancerArn"]
+
+    ecs = boto3.client("ecs", region_name=REGION)
+    ecs.create_cluster(clusterName=CLUSTER)
+    ecs.register_task_definition(family="tenant", containerDefinitions=[{"name": "web", "image": "wordpress", "memory": 512}])
+
+    cloudwatch = boto3.client("cloudwatch", region_name=REGION)
+    now = datetime.now(timezone.utc)
+    for i in range(service_count):
+        tenant = f"tenant{i:03d}"
+        target_group_arn = elbv2.create_target_group(
+            Name=f"{CLUSTER}-{tenant}-tg", Protocol="HTTP", Port=80, VpcId=vpc_id, TargetType="ip",
+        )["TargetGroups"][0]["TargetGroupArn"]
+        elbv2.create_listener(
+            LoadBalancerArn=load_balancer_arn, Protocol="HTTP", Port=8000 + i,
+            DefaultActions=[{"Type": "forward", "TargetGroupArn": target_group_arn}],
+        )
+        ecs.create_service(
+            cluster=CLUSTER,
+            serviceName=f"{CLUSTER}-{tenant}-service",
+            taskDefinition="tenant",
+            desiredCount=0 if i >= service_count - woken_count else 1,
+            loadBalancers=[{"targetGroupArn": target_group_arn, "containerName": "web", "containerPort": 80}],
+        )
+        if i < busy_count:
+            cloudwatch.put_metric_data(Namespace="AWS/ApplicationELB", MetricData=[{
+                "MetricName": "RequestCount",
+                "Dimensions": [
+                    {"Name": "TargetGroup", "Value": target_group_arn.split(":")[-1]},
+                    {"Name": "LoadBalancer", "Value": load_balancer_arn.split(":")[-1].removeprefix("loadbalancer/")},
+                ],
+                "Timestamp": now - timedelta(minutes=idle_minutes // 2),
+                "Value": 12,
+                "Unit": "Count",
+            }])
+
+    # moto stamps deployments with the creation time; these tenants were deployed a day ago
+    deployed = now - timedelta(days=1)
+    for service in ecs_backends[DEFAULT_ACCOUNT_ID][REGION].services.values():
+        for deployment in service.deployments:
+            deployment["createdAt"] = deployed
+    return topic_arn
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--services", type=int, default=20, help="Tenant services in the cluster")
+    parser.add_argument("--busy", type=int, default=5, help="Services that received requests in the window")
+    parser.add_argument("--woken", type=int, default=3, help="Idle services woken by a start just before the check")
+    parser.add_argument("--idle-minutes", type=int, default=60, help="Idle window")
+    args = parser.parse_args()
+
+    os.environ.setdefault("AWS_ACCESS_KEY_ID", "testing")
+    os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "testing")
+    os.environ["AWS_DEFAULT_REGION"] = REGION
+    os.environ["DYNAMO_TABLE"] = TABLE
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "lambda"))
+
+    with mock_aws():
+        os.environ["SNS_TOPIC_ARN"] = create_environment(args.services, args.busy, args.woken, args.idle_minutes)
+        scheduler = importlib.import_module("ecs_scheduler")
+
+        scheduler.handler({"action": "start", "cluster_name": CLUSTER, "region": REGION}, None)
+        response = scheduler.handler({"action": "stop_idle", "cluster_name": CLUSTER, "region": REGION,
+                                      "idle_minutes": args.idle_minutes}, None)
+        print(json.dumps(json.loads(response["body"]), indent=2))
+
+        services, _ = scheduler.describe_services(CLUSTER, scheduler.list_all_services(CLUSTER))
+        for service in sorted(services.values(), key=lambda service: service["serviceName"]):
+            state = "running" if service["desiredCount"] else "stopped"
+            print(f"  {service['serviceName']:<28}{state}")
+
+
+if __name__ == "__main__":
+    main()
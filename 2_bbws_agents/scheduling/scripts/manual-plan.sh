@@ -0,0 +1,44 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+# Dry run: show what a stop, start or stop_idle run would change (nothing is changed)
+# Usage: ./manual-plan.sh [dev|sit] [stop|start|stop_idle]
+
+ENV="${1:-dev}"
+PLAN_ACTION="${2:-stop}"
+
+case "$ENV" in
+  dev)
+    PROFILE="dev"
+    CLUSTER="dev"
+    FUNCTION="dev-ecs-scheduler"
+    REGION="eu-west-1"
+    ;;
+  sit)
+    PROFILE="Tebogo-sit"
+    CLUSTER="sit"
+    FUNCTION="sit-ecs-scheduler"
+    REGION="eu-west-1"
+    ;;
+  *)
+    echo "Usage: $0 [dev|sit] [stop|start|stop_idle]"
+    exit 1
+    ;;
+esac
+
+echo "Planning ${PLAN_ACTION} for ECS services in ${ENV} cluster (${CLUSTER})..."
+echo "Profile: ${PROFILE}"
+echo ""
+
+PAYLOAD="{\"action\": \"plan\", \"plan_action\": \"${PLAN_ACTION}\", \"cluster_name\": \"${CLUSTER}\", \"region\": \"${REGION}\"}"
+
+aws lambda invoke \
+  --function-name "$FUNCTION" \
+  --payload "$PAYLOAD" \
+  --cli-binary-format raw-in-base64-out \
+  --profile "$PROFILE" \
+  --region "$REGION" \
+  /dev/stdout
+
+echo ""
+echo "Plan returned above; nothing was changed."
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Report ECS scheduler run history: wake-up percentiles and the slowest tenants.
+
+Reads the run records and per-service timings the scheduler writes to its
+run history table (terraform output runs_table_name) and prints, for the
+chosen run kind and period:
+- each run's duration and outcome
+- p50/p95 describe latency, update latency and time to steady state
+- the tenants with the slowest median time to steady state
+
+Usage:
+    python scripts/run-history.py dev --days 14
+    python scripts/run-history.py sit --kind start_staggered --top 20 --json
+"""
+
+import argparse
+import json
+import statistics
+import sys
+from datetime import datetime, timedelta, timezone
+
+import boto3
+from boto3.dynamodb.conditions import Key
+
+ENVIRONMENTS = {
+    "dev": {"profile": "dev", "cluster": "dev", "table": "dev-ecs-scheduler-dev-runs", "region": "eu-west-1"},
+    "sit": {"profile": "Tebogo-sit", "cluster": "sit", "table": "sit-ecs-scheduler-sit-runs", "region": "eu-west-1"},
+}
+TIMING_FIELDS = ("describe_ms", "update_ms", "steady_ms")
+
+
+def query_items(table, cluster_name, prefix, since):
+    """All items of the cluster whose sort key starts with prefix and was written since `since`."""
+    condition = Key("cluster_name").eq(cluster_name) & Key("sk").between(f"{prefix}{since}", f"{prefix}~")
+    kwargs = {"KeyConditionExpression": condition}
+    items = []
+    while True:
+        response = table.query(**kwargs)
+        items.extend(response.get("Items", []))
+        if "LastEvaluatedKey" not in response:
+            return items
+        kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+
+def percentile(values, pct):
+    """Interpolated percentile of a list (None if empty)."""
+    if not values:
+        return None
+    if len(values) == 1:
+        return round(values[0])
+    return round(statistics.quantiles(values, n=100, method="inclusive")[pct - 1])
+
+
+def build_report(runs, timings, top):
+    """Summarize runs and per-service timings."""
+    summary = {}
+    for field in TIMING_FIELDS:
+        values = [float(item[field]) for item in timings if field in item]
+        summary[field] = {"count": len(values), "p50": percentile(values, 50), "p95": percentile(values, 95)}
+
+    by_service = {}
+    for item in timings:
+        by_service.setdefault(item["service_name"], []).append(item)
+    tenants = []
+    for name, items in by_service.items():
+        steady = [float(item["steady_ms"]) for item in items if "steady_ms" in item]
+        tenants.append({
+            "service": name,
+            "runs": len(items),
+            "steady_p50_ms": percentile(steady, 50),
+            "steady_max_ms": round(max(steady)) if steady else None,
+            "timed_out": sum(1 for item in items if item.get("timed_out")),
+            "desired_count": int(items[-1].get("desired_count", 0)),
+        })
+    tenants.sort(key=lambda tenant: (tenant["timed_out"], tenant["steady_p50_ms"] or 0), reverse=True)
+
+    return {
+        "runs": [
+            {
+                "started_at": run["started_at"],
+                "seconds": float(run["seconds"]),
+                "services": int(run["services"]),
+                "succeeded": int(run["succeeded"]),
+                "failed": int(run["failed"]),
+            }
+            for run in runs
+        ],
+        "timings": summary,
+        "slowest": tenants[:top],
+    }
+
+
+def print_report(report, cluster_name, kind, days):
+    """Print the report as text."""
+    print(f"ECS scheduler run history - cluster {cluster_name}, {kind}, last {days} days")
+    print("")
+    print(f"{'STARTED (UTC)':<22}{'SECONDS':>9}{'SERVICES':>10}{'OK':>6}{'FAILED':>8}")
+    for run in report["runs"]:
+        print(f"{run['started_at']:<22}{run['seconds']:>9.1f}{run['services']:>10}"
+              f"{run['succeeded']:>6}{run['failed']:>8}")
+    if not report["runs"]:
+        print("  (no runs)")
+
+    print("")
+    print(f"{'TIMING':<16}{'SAMPLES':>9}{'P50 MS':>10}{'P95 MS':>10}")
+    for field, stats in report["timings"].items():
+        print(f"{field:<16}{stats['count']:>9}{str(stats['p50']):>10}{str(stats['p95']):>10}")
+
+    print("")
+    print("Slowest tenants (median time to steady state):")
+    print(f"{'SERVICE':<40}{'RUNS':>6}{'P50 MS':>10}{'MAX MS':>10}{'TIMEOUTS':>10}{'TASKS':>7}")
+    for tenant in report["slowest"]:
+        print(f"{tenant['service']:<40}{tenant['runs']:>6}{str(tenant['steady_p50_ms']):>10}"
+              f"{str(tenant['steady_max_ms']):>10}{tenant['timed_out']:>10}{tenant['desired_count']:>7}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("env", choices=sorted(ENVIRONMENTS), help="Environment")
+    parser.add_argument("--kind", default="start",
+                        choices=["start", "start_staggered", "stop", "stop_idle"], help="Run kind")
+    parser.add_argument("--days", type=int, default=14, help="How far back to look")
+    parser.add_argument("--top", type=int, default=10, help="Slowest tenants to list")
+    parser.add_argument("--table", help="Run history table (default: the environment's)")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    env = ENVIRONMENTS[args.env]
+    session = boto3.Session(profile_name=env["profile"], region_name=env["region"])
+    table = session.resource("dynamodb").Table(args.table or env["table"])
+    since = (datetime.now(timezone.utc) - timedelta(days=args.days)).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    runs = query_items(table, env["cluster"], f"run#{args.kind}#", since)
+    timings = query_items(table, env["cluster"], f"svc#{args.kind}#", since)
+    report = build_report(runs, timings, args.top)
+
+    if args.json:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        print_report(report, env["cluster"], args.kind, args.days)
+
+
+if __name__ == "__main__":
+    main()
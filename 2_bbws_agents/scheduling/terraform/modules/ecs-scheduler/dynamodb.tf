@@ -15,3 +15,27 @@ resource "aws_dynamodb_table" "state" {
 
   tags = local.default_tags
 }
+
+resource "aws_dynamodb_table" "runs" {
+  name         = "${local.prefix}-runs"
+  billing_mode = "PAY_PER_REQUEST"
+  hash_key     = "cluster_name"
+  range_key    = "sk"
+
+  attribute {
+    name = "cluster_name"
+    type = "S"
+  }
+
+  attribute {
+    name = "sk"
+    type = "S"
+  }
+
+  ttl {
+    attribute_name = "ttl"
+    enabled        = true
+  }
+
+  tags = local.default_tags
+}
@@ -14,6 +14,15 @@ resource "aws_cloudwatch_event_rule" "start" {
   tags                = local.default_tags
 }
 
+resource "aws_cloudwatch_event_rule" "stop_idle" {
+  count               = var.idle_stop_cron == null ? 0 : 1
+  name                = "${local.prefix}-stop-idle"
+  description         = "Stop ECS services with no ALB requests in the last ${var.idle_minutes} minutes"
+  schedule_expression = var.idle_stop_cron
+  state               = var.enabled ? "ENABLED" : "DISABLED"
+  tags                = local.default_tags
+}
+
 resource "aws_cloudwatch_event_target" "stop" {
   rule = aws_cloudwatch_event_rule.stop.name
   arn  = aws_lambda_function.ecs_scheduler.arn
@@ -31,10 +40,31 @@ resource "aws_cloudwatch_event_target" "start" {
   arn  = aws_lambda_function.ecs_scheduler.arn
 
   input = jsonencode({
-    action           = "start"
-    cluster_name     = var.cluster_name
-    region           = var.region
-    service_prefixes = var.service_prefixes
+    action                = "start"
+    cluster_name          = var.cluster_name
+    region                = var.region
+    service_prefixes      = var.service_prefixes
+    mode                  = var.start_mode
+    wave_max_tasks        = var.wave_max_tasks
+    wave_timeout_seconds  = var.wave_timeout_seconds
+    target_seconds        = var.warm_target_seconds
+    warm_up               = var.warm_up
+    wait_for_steady_state = var.wait_for_steady_state
+  })
+}
+
+resource "aws_cloudwatch_event_target" "stop_idle" {
+  count = var.idle_stop_cron == null ? 0 : 1
+  rule  = aws_cloudwatch_event_rule.stop_idle[0].name
+  arn   = aws_lambda_function.ecs_scheduler.arn
+
+  input = jsonencode({
+    action            = "stop_idle"
+    cluster_name      = var.cluster_name
+    region            = var.region
+    service_prefixes  = var.service_prefixes
+    idle_minutes      = var.idle_minutes
+    idle_max_requests = var.idle_max_requests
   })
 }
 
@@ -53,3 +83,12 @@ resource "aws_lambda_permission" "allow_eventbridge_start" {
   principal     = "events.amazonaws.com"
   source_arn    = aws_cloudwatch_event_rule.start.arn
 }
+
+resource "aws_lambda_permission" "allow_eventbridge_stop_idle" {
+  count         = var.idle_stop_cron == null ? 0 : 1
+  statement_id  = "AllowEventBridgeStopIdle"
+  action        = "lambda:InvokeFunction"
+  function_name = aws_lambda_function.ecs_scheduler.function_name
+  principal     = "events.amazonaws.com"
+  source_arn    = aws_cloudwatch_event_rule.stop_idle[0].arn
+}
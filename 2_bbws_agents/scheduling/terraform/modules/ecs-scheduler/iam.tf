@@ -32,10 +32,33 @@ data "aws_iam_policy_document" "lambda_permissions" {
     actions = [
       "dynamodb:GetItem",
       "dynamodb:PutItem",
+      "dynamodb:BatchGetItem",
+      "dynamodb:BatchWriteItem",
     ]
     resources = [aws_dynamodb_table.state.arn]
   }
 
+  # Run history: run records and per-service timings
+  statement {
+    sid = "RunHistory"
+    actions = [
+      "dynamodb:PutItem",
+      "dynamodb:BatchWriteItem",
+      "dynamodb:Query",
+    ]
+    resources = [aws_dynamodb_table.runs.arn]
+  }
+
+  # Idle stop: ALB request metrics per target group
+  statement {
+    sid = "IdleMetrics"
+    actions = [
+      "cloudwatch:GetMetricData",
+      "elasticloadbalancing:DescribeTargetGroups",
+    ]
+    resources = ["*"]
+  }
+
   # SNS permissions
   statement {
     sid       = "SNSPublish"
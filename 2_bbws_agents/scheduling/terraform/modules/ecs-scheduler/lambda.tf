@@ -16,8 +16,10 @@ resource "aws_lambda_function" "ecs_scheduler" {
 
   environment {
     variables = {
-      DYNAMO_TABLE  = aws_dynamodb_table.state.name
-      SNS_TOPIC_ARN = aws_sns_topic.notifications.arn
+      DYNAMO_TABLE       = aws_dynamodb_table.state.name
+      SNS_TOPIC_ARN      = aws_sns_topic.notifications.arn
+      UPDATE_CONCURRENCY = tostring(var.update_concurrency)
+      RUNS_TABLE         = aws_dynamodb_table.runs.name
     }
   }
 
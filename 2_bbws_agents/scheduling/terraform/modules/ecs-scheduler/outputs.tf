@@ -18,11 +18,21 @@ output "start_rule_arn" {
   value       = aws_cloudwatch_event_rule.start.arn
 }
 
+output "stop_idle_rule_arn" {
+  description = "ARN of the EventBridge idle stop rule (null when idle stops are off)"
+  value       = one(aws_cloudwatch_event_rule.stop_idle[*].arn)
+}
+
 output "dynamodb_table_name" {
   description = "Name of the DynamoDB state table"
   value       = aws_dynamodb_table.state.name
 }
 
+output "runs_table_name" {
+  description = "Name of the DynamoDB run history table"
+  value       = aws_dynamodb_table.runs.name
+}
+
 output "sns_topic_arn" {
   description = "ARN of the SNS notification topic"
   value       = aws_sns_topic.notifications.arn
@@ -31,6 +31,24 @@ variable "start_cron" {
   default     = "cron(0 5 ? * MON-FRI *)"
 }
 
+variable "idle_stop_cron" {
+  description = "Cron expression for stopping idle services (UTC); null disables idle stops"
+  type        = string
+  default     = null
+}
+
+variable "idle_minutes" {
+  description = "Idle stop: minutes without ALB requests before a service is stopped"
+  type        = number
+  default     = 60
+}
+
+variable "idle_max_requests" {
+  description = "Idle stop: most requests in the window for a service to still count as idle"
+  type        = number
+  default     = 0
+}
+
 variable "enabled" {
   description = "Enable or disable the schedule rules without destroying resources"
   type        = bool
@@ -43,6 +61,60 @@ variable "lambda_timeout" {
   default     = 300
 }
 
+variable "update_concurrency" {
+  description = "Maximum parallel ECS update_service calls per run"
+  type        = number
+  default     = 10
+}
+
+variable "start_mode" {
+  description = "Start mode: \"all\" restores every service at once, \"staggered\" restores them in priority waves (set lambda_timeout to 900)"
+  type        = string
+  default     = "all"
+
+  validation {
+    condition     = contains(["all", "staggered"], var.start_mode)
+    error_message = "start_mode must be \"all\" or \"staggered\"."
+  }
+}
+
+variable "wave_max_tasks" {
+  description = "Staggered start: maximum tasks launched per wave"
+  type        = number
+  default     = 20
+}
+
+variable "wave_timeout_seconds" {
+  description = "Staggered start: seconds to wait for a wave's tasks to run before launching the next"
+  type        = number
+  default     = 300
+}
+
+variable "warm_target_seconds" {
+  description = "Staggered start: target seconds for the whole cluster to be running (reported in the notification)"
+  type        = number
+  default     = null
+}
+
+variable "wait_for_steady_state" {
+  description = "Start (all mode): wait for services to be running so each one's time to steady state is recorded (runs take longer; size lambda_timeout for it)"
+  type        = bool
+  default     = false
+}
+
+variable "warm_up" {
+  description = "Start: request each tenant's pages through the ALB once its service is running (null disables warm-up)"
+  type = object({
+    base_url        = string
+    host_template   = optional(string)
+    paths           = optional(list(string))
+    rounds          = optional(number)
+    concurrency     = optional(number)
+    timeout_seconds = optional(number)
+  })
+  default = null
+}
+
 variable "service_prefixes" {
   description = "List of service name prefixes to include. Empty list means all services."
   type        = list(string)
@@ -0,0 +1,143 @@
+"""
+Shared fixtures for the ECS scheduler tests.
+
+The Lambda module reads its table and topic names at import, so the
+environment is set before it is imported; every test that touches AWS runs
+inside moto with fresh tables, topic and cluster (requires boto3, moto and pytest).
+"""
+
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+
+import boto3
+import pytest
+from moto import mock_aws
+from moto.core import DEFAULT_ACCOUNT_ID
+from moto.ecs.models import ecs_backends
+
+REGION = "eu-west-1"
+CLUSTER = "dev"
+STATE_TABLE = "ecs-scheduler-test-state"
+RUNS_TABLE = "ecs-scheduler-test-runs"
+TOPIC_NAME = "ecs-scheduler-test"
+
+os.environ.setdefault("AWS_ACCESS_KEY_ID", "testing")
+os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "testing")
+os.environ["AWS_DEFAULT_REGION"] = REGION
+os.environ["DYNAMO_TABLE"] = STATE_TABLE
+os.environ["RUNS_TABLE"] = RUNS_TABLE
+os.environ["SNS_TOPIC_ARN"] = f"arn:aws:sns:{REGION}:{DEFAULT_ACCOUNT_ID}:{TOPIC_NAME}"
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "lambda"))
+
+import ecs_scheduler  # noqa: E402
+
+
+@pytest.fixture
+def scheduler(monkeypatch):
+    """The scheduler module with no waiting between polls or retries."""
+    monkeypatch.setattr(ecs_scheduler, "WAVE_POLL_SECONDS", 0)
+    monkeypatch.setattr(ecs_scheduler, "backoff_delay", lambda attempt: 0)
+    ecs_scheduler.service_timings.clear()
+    return ecs_scheduler
+
+
+@pytest.fixture
+def aws(scheduler):
+    """moto with the state and run history tables, the topic and an empty cluster."""
+    with mock_aws():
+        dynamodb = boto3.client("dynamodb", region_name=REGION)
+        dynamodb.create_table(
+            TableName=STATE_TABLE,
+            KeySchema=[{"AttributeName": "service_arn", "KeyType": "HASH"}],
+            AttributeDefinitions=[{"AttributeName": "service_arn", "AttributeType": "S"}],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        dynamodb.create_table(
+            TableName=RUNS_TABLE,
+            KeySchema=[
+                {"AttributeName": "cluster_name", "KeyType": "HASH"},
+                {"AttributeName": "sk", "KeyType": "RANGE"},
+            ],
+            AttributeDefinitions=[
+                {"AttributeName": "cluster_name", "AttributeType": "S"},
+                {"AttributeName": "sk", "AttributeType": "S"},
+            ],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        boto3.client("sns", region_name=REGION).create_topic(Name=TOPIC_NAME)
+        ecs = boto3.client("ecs", region_name=REGION)
+        ecs.create_cluster(clusterName=CLUSTER)
+        ecs.register_task_definition(
+            family="tenant",
+            containerDefinitions=[{"name": "web", "image": "wordpress", "memory": 512}],
+        )
+        yield ecs
+
+
+@pytest.fixture
+def create_service(aws):
+    """Create a service in the test cluster and return its ARN."""
+    def create(name, desired_count=1, tags=None, load_balancers=None):
+        kwargs = {"tags": tags} if tags else {}
+        if load_balancers:
+            kwargs["loadBalancers"] = load_balancers
+        service = aws.create_service(
+            cluster=CLUSTER,
+            serviceName=name,
+            taskDefinition="tenant",
+            desiredCount=desired_count,
+            **kwargs,
+        )
+        return service["service"]["serviceArn"]
+
+    return create
+
+
+@pytest.fixture
+def desired_counts(aws):
+    """Current desired count of every service in the test cluster, by name."""
+    def counts():
+        arns = aws.list_services(cluster=CLUSTER)["serviceArns"]
+        services = []
+        for start in range(0, len(arns), 10):
+            services += aws.describe_services(cluster=CLUSTER, services=arns[start:start + 10])["services"]
+        return {service["serviceName"]: service["desiredCount"] for service in services}
+
+    return counts
+
+
+@pytest.fixture
+def tasks_run_instantly(scheduler, monkeypatch):
+    """Report every service as running its desired count (moto never starts tasks)."""
+    describe = scheduler.describe_services
+
+    def describe_running(cluster_name, service_arns, include_tags=False):
+        services, failed = describe(cluster_name, service_arns, include_tags)
+        for service in services.values():
+            service["runningCount"] = service["desiredCount"]
+            service["pendingCount"] = 0
+        return services, failed
+
+    monkeypatch.setattr(scheduler, "describe_services", describe_running)
+
+
+def backdate_deployments(minutes):
+    """Move every moto service's deployments `minutes` into the past."""
+    created = datetime.now(timezone.utc) - timedelta(minutes=minutes)
+    for service in ecs_backends[DEFAULT_ACCOUNT_ID][REGION].services.values():
+        for deployment in service.deployments:
+            deployment["createdAt"] = created
+            deployment["updatedAt"] = created
+
+
+class FakeContext:
+    """Lambda context with a fixed amount of time left."""
+
+    aws_request_id = "test-request"
+
+    def __init__(self, remaining_seconds=900):
+        self.remaining_seconds = remaining_seconds
+
+    def get_remaining_time_in_millis(self):
+        return int(self.remaining_seconds * 1000)
@@ -0,0 +1,226 @@
+"""Tests for the stop_idle action: request metrics, the up-since guard and exemptions."""
+
+import json
+from datetime import datetime, timedelta, timezone
+
+import boto3
+import pytest
+
+from conftest import CLUSTER, REGION, backdate_deployments
+
+
+@pytest.fixture
+def alb(aws):
+    """An ALB in moto; returns a factory creating a target group and returning (tg ARN, publish(requests))."""
+    ec2 = boto3.client("ec2", region_name=REGION)
+    vpc_id = ec2.create_vpc(CidrBlock="10.0.0.0/16")["Vpc"]["VpcId"]
+    subnets = [
+        ec2.create_subnet(VpcId=vpc_id, CidrBlock=f"10.0.{i}.0/24", AvailabilityZone=f"{REGION}{zone}")["Subnet"]["SubnetId"]
+        for i, zone in enumerate("ab")
+    ]
+    elbv2 = boto3.client("elbv2", region_name=REGION)
+    load_balancer_arn = elbv2.create_load_balancer(Name="dev-alb", Subnets=subnets)["LoadBalancers"][0]["LoadBalancerArn"]
+    cloudwatch = boto3.client("cloudwatch", region_name=REGION)
+    ports = iter(range(8000, 9000))
+
+    def target_group(name):
+        arn = elbv2.create_target_group(
+            Name=name, Protocol="HTTP", Port=80, VpcId=vpc_id, TargetType="ip",
+        )["TargetGroups"][0]["TargetGroupArn"]
+        elbv2.create_listener(LoadBalancerArn=load_balancer_arn, Protocol="HTTP", Port=next(ports),
+                              DefaultActions=[{"Type": "forward", "TargetGroupArn": arn}])
+
+        def publish(requests, minutes_ago=10):
+            cloudwatch.put_metric_data(Namespace="AWS/ApplicationELB", MetricData=[{
+                "MetricName": "RequestCount",
+                "Dimensions": [
+                    {"Name": "TargetGroup", "Value": arn.split(":")[-1]},
+                    {"Name": "LoadBalancer", "Value": load_balancer_arn.split(":")[-1].removeprefix("loadbalancer/")},
+                ],
+                "Timestamp": datetime.now(timezone.utc) - timedelta(minutes=minutes_ago),
+                "Value": requests,
+                "Unit": "Count",
+            }])
+
+        return arn, publish
+
+    return target_group
+
+
+@pytest.fixture
+def tenant(create_service, alb):
+    """Create an ALB-backed tenant service; returns the traffic publisher for its target group."""
+    def create(name, desired_count=1, tags=None):
+        arn, publish = alb(f"{name}-tg")
+        create_service(f"{CLUSTER}-{name}-service", desired_count=desired_count, tags=tags,
+                       load_balancers=[{"targetGroupArn": arn, "containerName": "web", "containerPort": 80}])
+        return publish
+
+    return create
+
+
+def stop_idle(scheduler, **extra):
+    event = {"action": "stop_idle", "cluster_name": CLUSTER, "idle_minutes": 60, **extra}
+    return json.loads(scheduler.handler(event, None)["body"])
+
+
+class TestStopIdle:
+    """Tests for the stop_idle action."""
+
+    def test_stops_only_idle_services(self, scheduler, tenant, create_service, desired_counts):
+        """Test busy services and services without a load balancer keep running."""
+        tenant("busy")(25)
+        tenant("quiet")
+        tenant("old-traffic")(40, minutes_ago=120)
+        create_service(f"{CLUSTER}-worker-service")
+        backdate_deployments(minutes=24 * 60)
+
+        body = stop_idle(scheduler)
+
+        assert (body["checked"], body["idle"], body["succeeded"]) == (3, 2, 2)
+        assert desired_counts() == {
+            f"{CLUSTER}-busy-service": 1,
+            f"{CLUSTER}-quiet-service": 0,
+            f"{CLUSTER}-old-traffic-service": 0,
+            f"{CLUSTER}-worker-service": 1,
+        }
+
+    def test_idle_max_requests_threshold(self, scheduler, tenant, desired_counts):
+        """Test services at or below idle_max_requests count as idle."""
+        tenant("trickle")(3)
+        tenant("busy")(4)
+        backdate_deployments(minutes=24 * 60)
+
+        stop_idle(scheduler, idle_max_requests=3)
+
+        assert desired_counts() == {f"{CLUSTER}-trickle-service": 0, f"{CLUSTER}-busy-service": 1}
+
+    def test_service_started_by_start_is_not_stopped_inside_the_window(self, scheduler, tenant, desired_counts, aws):
+        """Test a service the scheduler just woke is not stopped before it has been up for idle_minutes.
+
+        update_service with a desired count creates no deployment, so only the
+        start time saved by the start shows the service has just come up.
+        """
+        tenant("woken", desired_count=0)
+        tenant("quiet")
+        backdate_deployments(minutes=24 * 60)
+
+        scheduler.handler({"action": "start", "cluster_name": CLUSTER}, None)
+        woken = aws.describe_services(cluster=CLUSTER, services=[f"{CLUSTER}-woken-service"])["services"][0]
+        assert max(d["createdAt"] for d in woken["deployments"]) < datetime.now(timezone.utc) - timedelta(hours=1)
+
+        body = stop_idle(scheduler)
+
+        assert (body["checked"], body["idle"]) == (1, 1)
+        assert desired_counts() == {f"{CLUSTER}-woken-service": 1, f"{CLUSTER}-quiet-service": 0}
+
+    def test_recent_deployment_is_not_stopped(self, scheduler, tenant, desired_counts):
+        """Test a service deployed inside the window is left alone."""
+        tenant("fresh")
+
+        assert stop_idle(scheduler)["checked"] == 0
+        assert desired_counts() == {f"{CLUSTER}-fresh-service": 1}
+
+    def test_keep_alive_tag_exempts(self, scheduler, tenant, desired_counts):
+        """Test scheduler-keep-alive=true services are never stopped."""
+        tenant("demo", tags=[{"key": scheduler.IDLE_EXEMPT_TAG, "value": "true"}])
+        backdate_deployments(minutes=24 * 60)
+
+        assert stop_idle(scheduler)["checked"] == 0
+        assert desired_counts() == {f"{CLUSTER}-demo-service": 1}
+
+    def test_stopped_state_restored_by_next_start(self, scheduler, tenant, desired_counts):
+        """Test idle stops save the desired count like stop does."""
+        tenant("quiet", desired_count=3)
+        backdate_deployments(minutes=24 * 60)
+
+        stop_idle(scheduler)
+        scheduler.handler({"action": "start", "cluster_name": CLUSTER}, None)
+
+        assert desired_counts() == {f"{CLUSTER}-quiet-service": 3}
+
+    def test_services_described_once(self, scheduler, tenant, monkeypatch):
+        """Test the idle check and the stop share one describe of each service."""
+        for name in ("a", "b", "c"):
+            tenant(name)
+        backdate_deployments(minutes=24 * 60)
+        described = []
+        describe = scheduler.describe_services
+
+        def counting(cluster_name, service_arns, include_tags=False):
+            described.extend(service_arns)
+            return describe(cluster_name, service_arns, include_tags)
+
+        monkeypatch.setattr(scheduler, "describe_services", counting)
+
+        assert stop_idle(scheduler)["succeeded"] == 3
+        assert len(described) == 3
+
+
+class TestLastScaledUp:
+    """Tests for last_scaled_up."""
+
+    def test_newest_of_deployment_event_and_saved_start(self, scheduler):
+        """Test the newest of deployments, "has started" events and the saved start time wins."""
+        day = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        service = {
+            "deployments": [{"createdAt": day}],
+            "events": [
+                {"createdAt": day + timedelta(hours=3), "message": "(service a) has reached a steady state."},
+                {"createdAt": day + timedelta(hours=2), "message": "(service a) has started 1 tasks: (task 1)."},
+            ],
+        }
+
+        assert scheduler.last_scaled_up(service, {}) == day + timedelta(hours=2)
+        state = {"started_at": (day + timedelta(hours=5)).isoformat()}
+        assert scheduler.last_scaled_up(service, state) == day + timedelta(hours=5)
+        assert scheduler.last_scaled_up({}, {}) is None
+
+
+class TestRequestCounts:
+    """Tests for request_counts."""
+
+    def test_queries_go_500_per_call_and_follow_next_token(self, scheduler, monkeypatch):
+        """Test 1,200 target groups take three chunks, each paginated, and values are summed."""
+        target_groups = [f"arn:aws:elasticloadbalancing:eu-west-1:1:targetgroup/tg{i}/{i}" for i in range(1200)]
+        lb = "arn:aws:elasticloadbalancing:eu-west-1:1:loadbalancer/app/dev-alb/1"
+        monkeypatch.setattr(scheduler, "target_group_load_balancers", lambda arns: {arn: [lb] for arn in arns})
+        calls = []
+
+        class FakeCloudWatch:
+            def get_metric_data(self, **kwargs):
+                calls.append((len(kwargs["MetricDataQueries"]), kwargs.get("NextToken")))
+                ids = [query["Id"] for query in kwargs["MetricDataQueries"]]
+                if "NextToken" not in kwargs:
+                    return {"MetricDataResults": [{"Id": i, "Values": [1.0]} for i in ids], "NextToken": "more"}
+                return {"MetricDataResults": [{"Id": ids[0], "Values": [2.0, 3.0]}]}
+
+        monkeypatch.setattr(scheduler, "cloudwatch", FakeCloudWatch())
+
+        counts = scheduler.request_counts(target_groups, datetime.now(timezone.utc), 60)
+
+        assert calls == [(500, None), (500, "more"), (500, None), (500, "more"), (200, None), (200, "more")]
+        assert counts[target_groups[0]] == 6
+        assert counts[target_groups[1]] == 1
+        assert counts[target_groups[500]] == 6
+        assert sum(counts.values()) == 1200 + 3 * 5
+
+    def test_dimensions(self, scheduler, monkeypatch):
+        """Test RequestCount is queried by TargetGroup and LoadBalancer dimension values."""
+        tg = "arn:aws:elasticloadbalancing:eu-west-1:1:targetgroup/dev-a-tg/abc"
+        lb = "arn:aws:elasticloadbalancing:eu-west-1:1:loadbalancer/app/dev-alb/def"
+        monkeypatch.setattr(scheduler, "target_group_load_balancers", lambda arns: {tg: [lb]})
+        queries = []
+
+        class FakeCloudWatch:
+            def get_metric_data(self, **kwargs):
+                queries.extend(kwargs["MetricDataQueries"])
+                return {"MetricDataResults": []}
+
+        monkeypatch.setattr(scheduler, "cloudwatch", FakeCloudWatch())
+
+        assert scheduler.request_counts([tg], datetime.now(timezone.utc), 30) == {tg: 0}
+        assert queries[0]["MetricStat"]["Metric"]["Dimensions"] == [
+            {"Name": "TargetGroup", "Value": "targetgroup/dev-a-tg/abc"},
+            {"Name": "LoadBalancer", "Value": "app/dev-alb/def"},
+        ]
@@ -0,0 +1,126 @@
+"""Tests for the plan action and its duration estimate."""
+
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from conftest import CLUSTER
+
+
+def plan(scheduler, **extra):
+    event = {"action": "plan", "cluster_name": CLUSTER, **extra}
+    return json.loads(scheduler.handler(event, None)["body"])
+
+
+@pytest.fixture
+def count_describes(scheduler, monkeypatch):
+    """ARNs passed to describe_services, in call order."""
+    described = []
+    describe = scheduler.describe_services
+
+    def counting(cluster_name, service_arns, include_tags=False):
+        described.extend(service_arns)
+        return describe(cluster_name, service_arns, include_tags)
+
+    monkeypatch.setattr(scheduler, "describe_services", counting)
+    return described
+
+
+class TestPlan:
+    """Tests for the plan action."""
+
+    def test_stop_plan_changes_nothing(self, scheduler, create_service, desired_counts, count_describes):
+        """Test a stop plan lists the changes, describes each service once and leaves the cluster alone."""
+        create_service(f"{CLUSTER}-a-service", desired_count=2)
+        create_service(f"{CLUSTER}-b-service", desired_count=0)
+
+        body = plan(scheduler, plan_action="stop")
+
+        assert body["changes"] == [{"service": f"{CLUSTER}-a-service", "from": 2, "to": 0}]
+        assert body["unchanged"] == [f"{CLUSTER}-b-service"]
+        assert body["task_delta"] == -2
+        assert len(count_describes) == 2
+        assert desired_counts() == {f"{CLUSTER}-a-service": 2, f"{CLUSTER}-b-service": 0}
+
+    def test_start_plan_uses_saved_counts_and_waves(self, scheduler, create_service, desired_counts):
+        """Test a staggered start plan shows saved counts, tiers and waves."""
+        create_service(f"{CLUSTER}-a-service", desired_count=3)
+        create_service(f"{CLUSTER}-b-service", desired_count=1,
+                       tags=[{"key": scheduler.PRIORITY_TAG, "value": "1"}])
+        scheduler.handler({"action": "stop", "cluster_name": CLUSTER}, None)
+
+        body = plan(scheduler, plan_action="start", mode="staggered", wave_max_tasks=2)
+
+        assert sorted(body["changes"], key=lambda change: change["service"]) == [
+            {"service": f"{CLUSTER}-a-service", "from": 0, "to": 3, "priority": 100},
+            {"service": f"{CLUSTER}-b-service", "from": 0, "to": 1, "priority": 1},
+        ]
+        assert body["waves"] == [[f"{CLUSTER}-b-service"], [f"{CLUSTER}-a-service"]]
+        assert set(desired_counts().values()) == {0}
+
+    def test_stop_idle_plan_describes_once(self, scheduler, create_service, count_describes):
+        """Test a stop_idle plan describes each service once."""
+        create_service(f"{CLUSTER}-a-service")
+        create_service(f"{CLUSTER}-b-service")
+
+        body = plan(scheduler, plan_action="stop_idle")
+
+        assert body["changes"] == []
+        assert body["checked"] == 0
+        assert len(count_describes) == 2
+
+    def test_prefixes_scope_the_plan(self, scheduler, create_service):
+        """Test service_prefixes limit what the plan covers."""
+        create_service(f"{CLUSTER}-a-service")
+        create_service(f"{CLUSTER}-b-service")
+
+        body = plan(scheduler, plan_action="stop", service_prefixes=[f"{CLUSTER}-b"])
+
+        assert body["matched"] == 1
+        assert [change["service"] for change in body["changes"]] == [f"{CLUSTER}-b-service"]
+
+    def test_unknown_plan_action_raises(self, scheduler):
+        """Test an unknown plan_action is rejected."""
+        with pytest.raises(ValueError):
+            plan(scheduler, plan_action="restart")
+
+
+class TestEstimateDuration:
+    """Tests for estimate_duration."""
+
+    def test_no_changes(self, scheduler, aws):
+        """Test nothing to change takes no time."""
+        assert scheduler.estimate_duration(CLUSTER, "stop", 10, 0) == {"seconds": 0, "basis": "no changes", "runs": 0}
+
+    def test_default_without_history(self, scheduler, aws, monkeypatch):
+        """Test without history the estimate comes from describe batches and update rounds."""
+        monkeypatch.setattr(scheduler, "UPDATE_CONCURRENCY", 10)
+
+        estimate = scheduler.estimate_duration(CLUSTER, "stop", 25, 15)
+
+        seconds = 3 * scheduler.DEFAULT_DESCRIBE_SECONDS + 2 * scheduler.DEFAULT_UPDATE_SECONDS
+        assert estimate == {"seconds": round(seconds, 1), "basis": "default", "runs": 0}
+
+    def test_median_rate_from_history(self, scheduler, aws):
+        """Test the median seconds per service of recent runs of the same kind is used."""
+        started = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        for seconds, services in [(10, 10), (40, 10), (30, 10)]:
+            scheduler.record_run(CLUSTER, "start", started, seconds, services, services, 0)
+            started = started.replace(hour=started.hour + 1)
+        scheduler.record_run(CLUSTER, "stop", started, 999, 10, 10, 0)
+
+        estimate = scheduler.estimate_duration(CLUSTER, "start", 20, 5)
+
+        assert estimate == {"seconds": 60.0, "basis": "history", "runs": 3}
+
+    def test_history_read_failure_falls_back(self, scheduler, aws, monkeypatch):
+        """Test an unreadable history table falls back to the default estimate."""
+        from botocore.exceptions import ClientError
+
+        def failing(cluster_name, kind):
+            raise ClientError({"Error": {"Code": "AccessDeniedException", "Message": "no"}}, "Query")
+
+        monkeypatch.setattr(scheduler, "load_run_history", failing)
+
+        assert scheduler.estimate_duration(CLUSTER, "start", 10, 10)["basis"] == "default"
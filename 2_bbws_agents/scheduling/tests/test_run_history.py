@@ -0,0 +1,157 @@
+"""Tests for the run history items and scripts/run-history.py, which reads them."""
+
+import importlib.util
+import os
+from datetime import datetime, timezone
+
+import boto3
+import pytest
+
+from conftest import CLUSTER, REGION, RUNS_TABLE, FakeContext
+
+SCRIPT = os.path.join(os.path.dirname(__file__), "..", "scripts", "run-history.py")
+
+
+@pytest.fixture(scope="module")
+def run_history():
+    """scripts/run-history.py as a module (its name is not importable)."""
+    spec = importlib.util.spec_from_file_location("run_history", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def runs(aws):
+    """The run history table."""
+    return boto3.resource("dynamodb", region_name=REGION).Table(RUNS_TABLE)
+
+
+def items(table, prefix):
+    response = table.scan()
+    return sorted((item for item in response["Items"] if item["sk"].startswith(prefix)),
+                  key=lambda item: item["sk"])
+
+
+class TestRecordRun:
+    """Tests for the items record_run writes."""
+
+    def test_stop_writes_run_and_changed_services(self, scheduler, create_service, runs):
+        """Test a stop writes one run item and one timing item per service it changed."""
+        create_service(f"{CLUSTER}-a-service", desired_count=2)
+        create_service(f"{CLUSTER}-b-service", desired_count=0)
+
+        scheduler.handler({"action": "stop", "cluster_name": CLUSTER}, FakeContext())
+
+        [run] = items(runs, "run#")
+        started = run["started_at"]
+        assert datetime.strptime(started, "%Y-%m-%dT%H:%M:%SZ")
+        assert run["sk"] == f"run#stop#{started}#test-request"
+        assert run["run_id"] == "test-request"
+        assert run["kind"] == "stop"
+        assert (run["services"], run["succeeded"], run["failed"]) == (2, 2, 0)
+        assert run["seconds"] >= 0
+        assert run["ttl"] > datetime.now(timezone.utc).timestamp()
+
+        [timing] = items(runs, "svc#")
+        assert timing["sk"] == f"svc#stop#{started}#{CLUSTER}-a-service"
+        assert timing["service_name"] == f"{CLUSTER}-a-service"
+        assert (timing["run_id"], timing["kind"], timing["started_at"]) == ("test-request", "stop", started)
+        assert {"describe_ms", "update_ms"} <= set(timing)
+        assert "steady_ms" not in timing
+
+    def test_start_waiting_records_steady_state(self, scheduler, create_service, runs, tasks_run_instantly):
+        """Test a start that waits for steady state records steady_ms and the desired count."""
+        create_service(f"{CLUSTER}-a-service", desired_count=2)
+        scheduler.handler({"action": "stop", "cluster_name": CLUSTER}, None)
+
+        scheduler.handler({"action": "start", "cluster_name": CLUSTER, "wait_for_steady_state": True},
+                          FakeContext())
+
+        [timing] = items(runs, "svc#start#")
+        assert timing["desired_count"] == 2
+        assert timing["steady_ms"] >= 0
+        assert "timed_out" not in timing
+
+    def test_staggered_start_kind(self, scheduler, create_service, runs, tasks_run_instantly):
+        """Test staggered starts are recorded under their own kind."""
+        create_service(f"{CLUSTER}-a-service")
+        scheduler.handler({"action": "stop", "cluster_name": CLUSTER}, None)
+
+        scheduler.handler({"action": "start", "cluster_name": CLUSTER, "mode": "staggered"}, FakeContext())
+
+        assert [item["kind"] for item in items(runs, "run#start")] == ["start_staggered"]
+        assert len(items(runs, "svc#start_staggered#")) == 1
+
+    def test_without_runs_table_nothing_is_written(self, scheduler, create_service, runs, monkeypatch):
+        """Test no run history is written when RUNS_TABLE is not set."""
+        monkeypatch.setattr(scheduler, "runs_table", None)
+        create_service(f"{CLUSTER}-a-service")
+
+        scheduler.handler({"action": "stop", "cluster_name": CLUSTER}, None)
+
+        assert runs.scan()["Items"] == []
+        assert scheduler.load_run_history(CLUSTER, "stop") == []
+
+    def test_load_run_history_newest_first_and_limited(self, scheduler, runs, monkeypatch):
+        """Test load_run_history returns the newest RUN_HISTORY_SIZE runs of one kind."""
+        monkeypatch.setattr(scheduler, "RUN_HISTORY_SIZE", 3)
+        for hour in range(5):
+            started = datetime(2026, 1, 1, hour, tzinfo=timezone.utc)
+            scheduler.record_run(CLUSTER, "start", started, hour, 10, 10, 0)
+        scheduler.record_run(CLUSTER, "start_staggered", datetime(2026, 1, 2, tzinfo=timezone.utc), 1, 10, 10, 0)
+
+        history = scheduler.load_run_history(CLUSTER, "start")
+
+        assert [run["started_at"] for run in history] == [
+            "2026-01-01T04:00:00Z", "2026-01-01T03:00:00Z", "2026-01-01T02:00:00Z",
+        ]
+        assert history[0] == {"seconds": 4.0, "services": 10, "started_at": "2026-01-01T04:00:00Z"}
+
+
+class TestRunHistoryReport:
+    """Tests for scripts/run-history.py against items the scheduler wrote."""
+
+    def test_report_from_recorded_runs(self, scheduler, create_service, runs, tasks_run_instantly, run_history):
+        """Test the report reads the runs and timings a waiting start records."""
+        create_service(f"{CLUSTER}-a-service", desired_count=2)
+        create_service(f"{CLUSTER}-b-service", desired_count=1)
+        scheduler.handler({"action": "stop", "cluster_name": CLUSTER}, None)
+        scheduler.handler({"action": "start", "cluster_name": CLUSTER, "wait_for_steady_state": True},
+                          FakeContext())
+
+        since = "2000-01-01T00:00:00Z"
+        report = run_history.build_report(
+            run_history.query_items(runs, CLUSTER, "run#start#", since),
+            run_history.query_items(runs, CLUSTER, "svc#start#", since),
+            top=1,
+        )
+
+        [run] = report["runs"]
+        assert (run["services"], run["succeeded"], run["failed"]) == (2, 2, 0)
+        assert {field: stats["count"] for field, stats in report["timings"].items()} == {
+            "describe_ms": 2, "update_ms": 2, "steady_ms": 2,
+        }
+        assert len(report["slowest"]) == 1
+        assert report["slowest"][0]["timed_out"] == 0
+
+    def test_query_items_since_excludes_older_runs(self, scheduler, runs, run_history):
+        """Test query_items only returns items started since the cut-off."""
+        for day in (1, 5):
+            scheduler.record_run(CLUSTER, "stop", datetime(2026, 1, day, tzinfo=timezone.utc), 1, 1, 1, 0)
+
+        found = run_history.query_items(runs, CLUSTER, "run#stop#", "2026-01-03T00:00:00Z")
+
+        assert [item["started_at"] for item in found] == ["2026-01-05T00:00:00Z"]
+
+    def test_build_report_ranks_timeouts_first(self, run_history):
+        """Test tenants that timed out rank above slower ones that did not."""
+        timings = [
+            {"service_name": "slow", "steady_ms": 90000, "desired_count": 1},
+            {"service_name": "stuck", "steady_ms": 1000, "timed_out": True, "desired_count": 2},
+        ]
+
+        report = run_history.build_report([], timings, top=10)
+
+        assert [tenant["service"] for tenant in report["slowest"]] == ["stuck", "slow"]
+        assert report["timings"]["steady_ms"] == {"count": 2, "p50": 45500, "p95": 85550}
@@ -0,0 +1,147 @@
+"""Tests for the staggered start: wave planning, waiting and the Lambda time reserve."""
+
+import json
+
+from conftest import CLUSTER, FakeContext
+
+
+def restore(name, count=1, priority=100):
+    return ({"serviceName": name, "serviceArn": f"arn:{name}"}, count, priority)
+
+
+def names(waves):
+    return [[service["serviceName"] for service, _, _ in wave] for wave in waves]
+
+
+class TestPlanWaves:
+    """Tests for plan_waves."""
+
+    def test_lower_priority_tiers_wake_first(self, scheduler):
+        """Test tiers are never mixed in a wave and run lowest first."""
+        waves = scheduler.plan_waves([restore("c", priority=200), restore("a", priority=10), restore("b")], 20)
+
+        assert names(waves) == [["a"], ["b"], ["c"]]
+
+    def test_waves_respect_the_task_budget(self, scheduler):
+        """Test a tier is split so no wave exceeds wave_max_tasks."""
+        waves = scheduler.plan_waves([restore(name, count=2) for name in "abcde"], 5)
+
+        assert names(waves) == [["a", "b"], ["c", "d"], ["e"]]
+        assert all(sum(count for _, count, _ in wave) <= 5 for wave in waves)
+
+    def test_big_service_gets_its_own_wave(self, scheduler):
+        """Test a service bigger than the budget still launches, alone."""
+        waves = scheduler.plan_waves([restore("a"), restore("big", count=8), restore("c")], 4)
+
+        assert names(waves) == [["a"], ["big"], ["c"]]
+
+    def test_no_restores_no_waves(self, scheduler):
+        """Test nothing to start plans no waves."""
+        assert scheduler.plan_waves([], 10) == []
+
+
+class TestServicePriority:
+    """Tests for service_priority."""
+
+    def test_tag_sets_priority(self, scheduler):
+        """Test the scheduler-priority tag is read as an int."""
+        service = {"serviceName": "s", "tags": [{"key": scheduler.PRIORITY_TAG, "value": "5"}]}
+
+        assert scheduler.service_priority(service) == 5
+
+    def test_missing_or_invalid_tag_uses_default(self, scheduler):
+        """Test services without a valid tag get DEFAULT_PRIORITY."""
+        invalid = {"serviceName": "s", "tags": [{"key": scheduler.PRIORITY_TAG, "value": "high"}]}
+
+        assert scheduler.service_priority({"serviceName": "s"}) == scheduler.DEFAULT_PRIORITY
+        assert scheduler.service_priority(invalid) == scheduler.DEFAULT_PRIORITY
+
+
+class TestWaitForRunning:
+    """Tests for wait_for_running."""
+
+    def test_returns_once_everything_runs(self, scheduler, monkeypatch):
+        """Test polling stops when every service runs its desired count with nothing pending."""
+        polls = iter([
+            {"a": {"runningCount": 0, "desiredCount": 1, "pendingCount": 1}},
+            {"a": {"runningCount": 1, "desiredCount": 1, "pendingCount": 0}},
+        ])
+        calls = []
+
+        def describe(cluster_name, arns, include_tags=False):
+            calls.append(list(arns))
+            return next(polls), []
+
+        monkeypatch.setattr(scheduler, "describe_services", describe)
+
+        assert scheduler.wait_for_running(CLUSTER, ["a"], timeout=60) == []
+        assert len(calls) == 2
+
+    def test_returns_services_still_pending_at_the_deadline(self, scheduler, monkeypatch):
+        """Test services not running when the deadline passes are returned."""
+        clock = iter(range(0, 1000, 10))
+        monkeypatch.setattr(scheduler.time, "monotonic", lambda: next(clock))
+        monkeypatch.setattr(scheduler, "WAVE_POLL_SECONDS", 10)
+        monkeypatch.setattr(scheduler.time, "sleep", lambda seconds: None)
+        monkeypatch.setattr(scheduler, "describe_services", lambda cluster_name, arns, include_tags=False: ({
+            "a": {"runningCount": 1, "desiredCount": 1, "pendingCount": 0},
+            "b": {"runningCount": 0, "desiredCount": 2, "pendingCount": 2},
+        }, []))
+
+        assert scheduler.wait_for_running(CLUSTER, ["a", "b"], timeout=30) == ["b"]
+
+    def test_non_positive_timeout_polls_once(self, scheduler, monkeypatch):
+        """Test a timeout already used up by the time reserve checks once and returns."""
+        calls = []
+
+        def describe(cluster_name, arns, include_tags=False):
+            calls.append(arns)
+            return {}, list(arns)
+
+        monkeypatch.setattr(scheduler, "describe_services", describe)
+
+        assert scheduler.wait_for_running(CLUSTER, ["a"], timeout=-5) == ["a"]
+        assert len(calls) == 1
+
+
+class TestStaggeredStart:
+    """Tests for the staggered start action."""
+
+    def event(self, **extra):
+        return {"action": "start", "cluster_name": CLUSTER, "mode": "staggered", **extra}
+
+    def test_waves_by_priority_tag(self, scheduler, create_service, desired_counts, tasks_run_instantly):
+        """Test services start in tier order and every service is restored."""
+        create_service(f"{CLUSTER}-web-service", desired_count=0)
+        create_service(f"{CLUSTER}-db-service", desired_count=0,
+                       tags=[{"key": scheduler.PRIORITY_TAG, "value": "1"}])
+
+        body = json.loads(scheduler.handler(self.event(wave_max_tasks=5), FakeContext())["body"])
+
+        assert [wave["priority"] for wave in body["waves"]] == [1, 100]
+        assert all(wave["waited"] and wave["not_running"] == [] for wave in body["waves"])
+        assert set(desired_counts().values()) == {1}
+
+    def test_saved_priority_survives_stop(self, scheduler, create_service, tasks_run_instantly):
+        """Test the tier saved at stop orders the next start."""
+        create_service(f"{CLUSTER}-a-service", tags=[{"key": scheduler.PRIORITY_TAG, "value": "300"}])
+        create_service(f"{CLUSTER}-b-service")
+        scheduler.handler({"action": "stop", "cluster_name": CLUSTER}, None)
+
+        body = json.loads(scheduler.handler(self.event(), FakeContext())["body"])
+
+        assert [wave["priority"] for wave in body["waves"]] == [100, 300]
+
+    def test_low_remaining_time_launches_the_rest_without_waiting(
+            self, scheduler, create_service, desired_counts, tasks_run_instantly):
+        """Test that inside the time reserve the remaining waves launch together, unwaited."""
+        for name in "abc":
+            create_service(f"{CLUSTER}-{name}-service", desired_count=0)
+        context = FakeContext(remaining_seconds=scheduler.TIME_RESERVE_SECONDS - 1)
+
+        body = json.loads(scheduler.handler(self.event(wave_max_tasks=1), context)["body"])
+
+        assert len(body["waves"]) == 1
+        assert body["waves"][0]["services"] == 3
+        assert body["waves"][0]["waited"] is False
+        assert set(desired_counts().values()) == {1}
@@ -0,0 +1,134 @@
+"""Tests for the stop and start actions, describe batching and throttling backoff."""
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+from botocore.exceptions import ClientError
+
+import ecs_scheduler
+from conftest import CLUSTER
+
+
+def throttled(code="ThrottlingException"):
+    return ClientError({"Error": {"Code": code, "Message": "slow down"}}, "UpdateService")
+
+
+class TestDescribeServices:
+    """Tests for describe_services."""
+
+    def test_describes_ten_at_a_time(self, scheduler, create_service, monkeypatch):
+        """Test 23 services take three DescribeServices calls of at most 10."""
+        arns = [create_service(f"{CLUSTER}-t{i:02d}-service") for i in range(23)]
+        calls = []
+        describe = scheduler.ecs.describe_services
+
+        def counting(**kwargs):
+            calls.append(len(kwargs["services"]))
+            return describe(**kwargs)
+
+        monkeypatch.setattr(scheduler.ecs, "describe_services", counting)
+
+        services, failed = scheduler.describe_services(CLUSTER, arns)
+
+        assert calls == [10, 10, 3]
+        assert set(services) == set(arns)
+        assert failed == []
+
+    def test_missing_services_are_failed(self, scheduler, create_service):
+        """Test ARNs ECS cannot describe are returned as failed."""
+        arn = create_service(f"{CLUSTER}-a-service")
+        missing = arn.replace("-a-service", "-gone-service")
+
+        services, failed = scheduler.describe_services(CLUSTER, [arn, missing])
+
+        assert list(services) == [arn]
+        assert failed == [missing]
+
+
+class TestCallWithBackoff:
+    """Tests for call_with_backoff."""
+
+    def test_retries_throttling_then_succeeds(self, scheduler):
+        """Test throttling errors are retried until the call succeeds."""
+        operation = MagicMock(__name__="update_service", side_effect=[throttled(), throttled(), {"ok": True}])
+
+        assert scheduler.call_with_backoff(operation, service="s") == {"ok": True}
+        assert operation.call_count == 3
+
+    def test_other_errors_raise_immediately(self, scheduler):
+        """Test non-throttling errors are not retried."""
+        operation = MagicMock(__name__="update_service", side_effect=throttled("ServiceNotFoundException"))
+
+        with pytest.raises(ClientError):
+            scheduler.call_with_backoff(operation)
+        assert operation.call_count == 1
+
+    def test_gives_up_after_max_attempts(self, scheduler):
+        """Test a call throttled on every attempt raises after UPDATE_MAX_ATTEMPTS."""
+        operation = MagicMock(__name__="update_service", side_effect=throttled())
+
+        with pytest.raises(ClientError):
+            scheduler.call_with_backoff(operation)
+        assert operation.call_count == scheduler.UPDATE_MAX_ATTEMPTS
+
+    def test_backoff_delay_is_bounded(self):
+        """Test the jittered delay stays within half and all of the capped exponential."""
+        for attempt in range(1, 10):
+            ceiling = min(ecs_scheduler.BACKOFF_MAX, ecs_scheduler.BACKOFF_BASE * 2 ** (attempt - 1))
+            assert ceiling / 2 <= ecs_scheduler.backoff_delay(attempt) <= ceiling
+
+
+class TestStopAndStart:
+    """Tests for the stop and start actions."""
+
+    def test_stop_saves_counts_and_start_restores_them(self, scheduler, create_service, desired_counts):
+        """Test stop zeroes services after saving counts, and start restores the saved counts."""
+        create_service(f"{CLUSTER}-a-service", desired_count=2)
+        create_service(f"{CLUSTER}-b-service", desired_count=1)
+        create_service(f"{CLUSTER}-c-service", desired_count=0)
+
+        stop = json.loads(scheduler.handler({"action": "stop", "cluster_name": CLUSTER}, None)["body"])
+        assert stop == {"action": "stop", "cluster": CLUSTER, "succeeded": 3, "failed": 0}
+        assert set(desired_counts().values()) == {0}
+
+        start = json.loads(scheduler.handler({"action": "start", "cluster_name": CLUSTER}, None)["body"])
+        assert start["succeeded"] == 3
+        assert desired_counts() == {
+            f"{CLUSTER}-a-service": 2,
+            f"{CLUSTER}-b-service": 1,
+            # No saved state: defaults to 1
+            f"{CLUSTER}-c-service": 1,
+        }
+
+    def test_service_prefixes_limit_the_run(self, scheduler, create_service, desired_counts):
+        """Test only services matching service_prefixes are stopped."""
+        create_service(f"{CLUSTER}-a-service")
+        create_service(f"{CLUSTER}-b-service")
+
+        scheduler.handler({"action": "stop", "cluster_name": CLUSTER, "service_prefixes": [f"{CLUSTER}-a"]}, None)
+
+        assert desired_counts() == {f"{CLUSTER}-a-service": 0, f"{CLUSTER}-b-service": 1}
+
+    def test_failed_update_is_reported(self, scheduler, create_service, desired_counts, monkeypatch):
+        """Test a service whose update fails is counted as failed and the rest still stop."""
+        create_service(f"{CLUSTER}-a-service")
+        bad = create_service(f"{CLUSTER}-b-service")
+        update = scheduler.ecs.update_service
+
+        def failing(**kwargs):
+            if kwargs["service"] == bad:
+                raise throttled("AccessDeniedException")
+            return update(**kwargs)
+
+        monkeypatch.setattr(scheduler.ecs, "update_service", failing)
+
+        body = json.loads(scheduler.handler({"action": "stop", "cluster_name": CLUSTER}, None)["body"])
+
+        assert (body["succeeded"], body["failed"]) == (1, 1)
+        assert desired_counts() == {f"{CLUSTER}-a-service": 0, f"{CLUSTER}-b-service": 1}
+
+    def test_unknown_action_raises(self, scheduler):
+        """Test unknown actions are rejected before any AWS call."""
+        with pytest.raises(ValueError):
+            scheduler.handler({"action": "restart", "cluster_name": CLUSTER}, None)
@@ -0,0 +1,183 @@
+"""Tests for the post-start warm-up: the asyncio HTTP client, targets and TTFB summaries."""
+
+import asyncio
+
+import pytest
+
+from conftest import CLUSTER
+
+
+def serve(response, delay=0.0, keep_open=False):
+    """Run fetch_ttfb-style tests against a local server sending `response` bytes."""
+    requests = []
+
+    async def handle(reader, writer):
+        requests.append(await reader.readuntil(b"\r\n\r\n"))
+        await asyncio.sleep(delay)
+        writer.write(response)
+        await writer.drain()
+        if keep_open:
+            await asyncio.sleep(5)
+        writer.close()
+
+    async def run(test):
+        server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            return await test(f"http://127.0.0.1:{port}")
+        finally:
+            server.close()
+
+    return run, requests
+
+
+class TestFetchTtfb:
+    """Tests for fetch_ttfb."""
+
+    def test_status_and_host_header(self, scheduler):
+        """Test the tenant host is sent and the status parsed from the status line."""
+        run, requests = serve(b"HTTP/1.1 404 Not Found\r\nContent-Length: 0\r\n\r\n")
+
+        status, ttfb = asyncio.run(run(lambda url: scheduler.fetch_ttfb(url, "acme.wpdev.kimmyai.io", "/shop", 5)))
+
+        assert status == 404
+        assert ttfb >= 0
+        assert requests[0].startswith(b"GET /shop HTTP/1.1\r\n")
+        assert b"\r\nHost: acme.wpdev.kimmyai.io\r\n" in requests[0]
+
+    def test_chunked_body_is_drained(self, scheduler):
+        """Test a chunked response is read to the end and only the first byte is timed."""
+        body = b"".join(b"%x\r\n%s\r\n" % (len(chunk), chunk) for chunk in [b"a" * 3000, b"b" * 5000]) + b"0\r\n\r\n"
+        run, _ = serve(b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n" + body, delay=0.2)
+
+        status, ttfb = asyncio.run(run(lambda url: scheduler.fetch_ttfb(url, "acme", "/", 5)))
+
+        assert status == 200
+        assert ttfb >= 0.2
+
+    def test_body_read_stops_at_the_cap(self, scheduler, monkeypatch):
+        """Test a body larger than WARM_UP_MAX_BODY_BYTES does not keep the request open."""
+        monkeypatch.setattr(scheduler, "WARM_UP_MAX_BODY_BYTES", 1024)
+        run, _ = serve(b"HTTP/1.1 200 OK\r\n\r\n" + b"x" * 200_000, keep_open=True)
+
+        status, _ = asyncio.run(run(lambda url: scheduler.fetch_ttfb(url, "acme", "/", 2)))
+
+        assert status == 200
+
+    @pytest.mark.parametrize("response", [b"garbage\r\n", b"HTTP/1.1 OK\r\n", b"SSH-2.0-OpenSSH\r\n"])
+    def test_malformed_status_line(self, scheduler, response):
+        """Test a response that is not HTTP raises ValueError."""
+        run, _ = serve(response)
+
+        with pytest.raises(ValueError):
+            asyncio.run(run(lambda url: scheduler.fetch_ttfb(url, "acme", "/", 5)))
+
+    def test_closed_without_response(self, scheduler):
+        """Test a connection closed before any response raises ConnectionError."""
+        run, _ = serve(b"")
+
+        with pytest.raises(ConnectionError):
+            asyncio.run(run(lambda url: scheduler.fetch_ttfb(url, "acme", "/", 5)))
+
+    def test_slow_first_byte_times_out(self, scheduler):
+        """Test the timeout covers waiting for the first byte."""
+        run, _ = serve(b"HTTP/1.1 200 OK\r\n\r\n", delay=1)
+
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(run(lambda url: scheduler.fetch_ttfb(url, "acme", "/", 0.2)))
+
+
+class TestWarmUrls:
+    """Tests for warm_urls."""
+
+    def test_cold_and_warm_ttfb_per_url(self, scheduler):
+        """Test each URL is requested `rounds` times and errors are captured, not raised."""
+        run, requests = serve(b"HTTP/1.1 200 OK\r\n\r\nok")
+        settings = {"rounds": 3, "concurrency": 2, "timeout_seconds": 5}
+
+        async def warm(url):
+            return await scheduler.warm_urls([("dev-a-service", "a", ["/", "/about"])], {**settings, "base_url": url})
+
+        results = asyncio.run(run(warm))
+
+        assert len(requests) == 6
+        assert [(result["path"], result["status"], result["error"]) for result in results] == [
+            ("/", 200, None), ("/about", 200, None),
+        ]
+        assert all(result["cold_ms"] is not None and result["warm_ms"] is not None for result in results)
+
+    def test_connection_errors_are_recorded(self, scheduler):
+        """Test an unreachable ALB yields an error result instead of an exception."""
+        settings = {"base_url": "http://127.0.0.1:1", "rounds": 2, "concurrency": 1, "timeout_seconds": 1}
+
+        results = asyncio.run(scheduler.warm_urls([("s", "a", ["/"])], settings))
+
+        assert results[0]["error"].startswith("ConnectionRefusedError")
+        assert results[0]["cold_ms"] is None
+
+
+class TestWarmTargets:
+    """Tests for warm-up settings and per-service targets."""
+
+    def test_settings_need_a_base_url(self, scheduler, monkeypatch):
+        """Test warm-up is off without a base URL and defaults fill the rest."""
+        monkeypatch.setattr(scheduler, "WARM_UP_BASE_URL", "")
+
+        assert scheduler.warm_up_settings(True, CLUSTER) is None
+        assert scheduler.warm_up_settings(None, CLUSTER) is None
+        settings = scheduler.warm_up_settings({"base_url": "https://alb", "rounds": None, "paths": ["/x"]}, CLUSTER)
+        assert settings["rounds"] == scheduler.WARM_UP_ROUNDS
+        assert settings["paths"] == ["/x"]
+
+    def test_host_from_service_name_or_tag(self, scheduler):
+        """Test hosts come from {cluster}-{tenant}-service, the warm-host tag wins, other services are skipped."""
+        settings = scheduler.warm_up_settings({"base_url": "https://alb"}, CLUSTER)
+        services = [
+            {"serviceName": f"{CLUSTER}-acme-service",
+             "tags": [{"key": scheduler.WARM_PATHS_TAG, "value": "shop, /contact,/"}]},
+            {"serviceName": f"{CLUSTER}-odd-service",
+             "tags": [{"key": scheduler.WARM_HOST_TAG, "value": "www.odd.example"}]},
+            {"serviceName": "monitoring"},
+        ]
+
+        targets = scheduler.warm_targets(services, settings)
+
+        assert targets == [
+            (f"{CLUSTER}-acme-service", "acme.wpdev.kimmyai.io", ["/", "/wp-sitemap.xml", "/shop", "/contact"]),
+            (f"{CLUSTER}-odd-service", "www.odd.example", ["/", "/wp-sitemap.xml"]),
+        ]
+
+
+class TestWarmUpSummary:
+    """Tests for the warm-up summary in the run body and notification."""
+
+    def results(self):
+        return [
+            {"service": "s", "host": "a", "path": "/", "status": 200, "cold_ms": 900, "warm_ms": 90, "error": None},
+            {"service": "s", "host": "a", "path": "/shop", "status": 502, "cold_ms": 300, "warm_ms": 30,
+             "error": None},
+            {"service": "t", "host": "b", "path": "/", "status": None, "cold_ms": None, "warm_ms": None,
+             "error": "TimeoutError: "},
+        ]
+
+    def test_summary(self, scheduler):
+        """Test 5xx and failed requests count as errors and percentiles skip missing timings."""
+        summary = scheduler.summarize_warm_up(self.results())
+
+        assert summary["sites"] == 2
+        assert summary["urls"] == 3
+        assert summary["errors"] == 2
+        assert summary["cold_p50_ms"] == 600
+        assert summary["warm_p95_ms"] == 87
+
+    def test_format(self, scheduler):
+        """Test the notification lists each site's slowest URL and every failure."""
+        text = scheduler.format_warm_up(self.results())
+
+        assert "  - a: slowest / 900 -> 90 ms (HTTP 200)" in text
+        assert "  - b/: TimeoutError: " in text
+
+    def test_percentile_edges(self, scheduler):
+        """Test empty and single-value percentiles."""
+        assert scheduler.percentile([], 50) is None
+        assert scheduler.percentile([42], 95) == 42
@@ -11,10 +11,10 @@ import os
 import uuid
 from datetime import datetime
 from typing import Dict, Any
-import boto3
 from src.models.requests import CreateOrderRequest
 from src.models.responses import CreateOrderResponse
 from src.services.sqs_service import SQSService
+from src.utils.aws_clients import get_client
 
 
 # Configure logging
@@ -22,7 +22,7 @@ logger = logging.getLogger()
 logger.setLevel(os.environ.get('LOG_LEVEL', 'INFO'))
 
 # Initialize SQS client outside handler for reuse (Lambda container reuse optimization)
-sqs_client = boto3.client('sqs')
+sqs_client = get_client('sqs')
 sqs_queue_url = os.environ.get('SQS_QUEUE_URL', '')
 sqs_service = SQSService(sqs_client, sqs_queue_url)
 
@@ -5,12 +5,17 @@ Implements DynamoDB single-table design patterns with tenant isolation.
 """
 import logging
 from typing import Optional, Dict, Any
-from decimal import Decimal
 
-from src.models import Order, OrderItem, Campaign, BillingAddress, PaymentDetails
+from pydantic import ValidationError
+
+from src.codec import codec_for
+from src.models import Order
 
 logger = logging.getLogger(__name__)
 
+# Compiled once per container (Order, OrderItem, Campaign, BillingAddress, PaymentDetails)
+ORDER_CODEC = codec_for(Order)
+
 
 class OrderDAO:
     """
@@ -20,16 +25,28 @@ class OrderDAO:
     Primary Key Structure: PK=TENANT#{tenantId}, SK=ORDER#{orderId}
     """
 
-    def __init__(self, dynamodb_client, table_name: str):
+    def __init__(
+        self,
+        dynamodb_client,
+        table_name: str,
+        trusted_reads: bool = False,
+        verify_every: int = 0
+    ):
         """
         Initialize OrderDAO with DynamoDB client.
 
         Args:
             dynamodb_client: boto3 DynamoDB client
             table_name: DynamoDB table name
+            trusted_reads: Hydrate orders without re-running model validators
+                (items in this table were validated by OrderCreatorRecord on write)
+            verify_every: With trusted_reads, fully validate 1 in N reads (0 = never)
         """
         self.dynamodb = dynamodb_client
         self.table_name = table_name
+        self.trusted_reads = trusted_reads
+        self.verify_every = verify_every
+        self._reads = 0
 
     def get_order(self, tenant_id: str, order_id: str) -> Optional[Order]:
         """
@@ -65,7 +82,7 @@ class OrderDAO:
 
             # Deserialize DynamoDB item to Order object
             order_dict = self._deserialize_item(response['Item'])
-            order = Order(**order_dict)
+            order = self._hydrate(order_dict)
 
             logger.info(f"Order retrieved successfully: orderId={order_id}, status={order.status}")
             return order
@@ -74,11 +91,38 @@ class OrderDAO:
             logger.error(f"Error getting order: {str(e)}", exc_info=True)
             raise
 
+    def _hydrate(self, order_dict: Dict[str, Any]) -> Order:
+        """
+        Build an Order from a deserialized item.
+
+        Validates with the full model unless trusted reads are enabled; in
+        trusted mode every verify_every-th read is still validated and any
+        validation error is raised as on the untrusted path.
+
+        Args:
+            order_dict: Dictionary from _deserialize_item
+
+        Returns:
+            Order object
+        """
+        if not self.trusted_reads:
+            return Order(**order_dict)
+
+        self._reads += 1
+        if self.verify_every and self._reads % self.verify_every == 0:
+            try:
+                return Order(**order_dict)
+            except ValidationError:
+                logger.error(f"Trusted read failed verification: orderId={order_dict.get('id')}")
+                raise
+
+        return Order.from_trusted(order_dict)
+
     def _deserialize_item(self, item: Dict[str, Any]) -> Dict[str, Any]:
         """
         Deserialize DynamoDB item to dictionary compatible with Pydantic models.
 
-        Converts DynamoDB type-annotated format to plain Python types.
+        Uses the Order codec compiled at import time; table and GSI keys are dropped.
 
         Args:
             item: DynamoDB item with type annotations
@@ -86,33 +130,4 @@ class OrderDAO:
         Returns:
             Dictionary with plain Python types
         """
-        def deserialize_value(value: Dict[str, Any]) -> Any:
-            """Deserialize a single DynamoDB value."""
-            if 'S' in value:
-                return value['S']
-            elif 'N' in value:
-                # Convert to Decimal for monetary values
-                return Decimal(value['N'])
-            elif 'BOOL' in value:
-                return value['BOOL']
-            elif 'NULL' in value:
-                return None
-            elif 'L' in value:
-                # List
-                return [deserialize_value(v) for v in value['L']]
-            elif 'M' in value:
-                # Map (nested object)
-                return {k: deserialize_value(v) for k, v in value['M'].items()}
-            else:
-                logger.warning(f"Unknown DynamoDB type: {value}")
-                return value
-
-        # Deserialize all attributes
-        result = {}
-        for key, value in item.items():
-            # Skip internal DynamoDB keys
-            if key in ['PK', 'SK', 'entityType', 'GSI1_PK', 'GSI1_SK', 'GSI2_PK', 'GSI2_SK']:
-                continue
-            result[key] = deserialize_value(value)
-
-        return result
+        return ORDER_CODEC.decode(item)
@@ -6,7 +6,7 @@ Main Order entity with Activatable Entity Pattern and embedded Campaign.
 from pydantic import BaseModel, Field, EmailStr
 from decimal import Decimal
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Type, TypeVar
 from enum import Enum
 
 from .order_item import OrderItem
@@ -15,6 +15,14 @@ from .billing_address import BillingAddress
 from .payment_details import PaymentDetails
 
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def _construct(model: Type[ModelT], data: Dict[str, Any]) -> ModelT:
+    """Build a model without validation, keeping only its declared fields."""
+    return model.construct(**{name: data[name] for name in model.__fields__ if name in data})
+
+
 class OrderStatus(str, Enum):
     """Order status enumeration."""
     PENDING = "pending"
@@ -65,6 +73,30 @@ class Order(BaseModel):
     lastUpdatedBy: str = Field(..., description="User/system identifier who last updated")
     active: bool = Field(default=True, description="Soft delete flag (true = active, false = deleted)")
 
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "Order":
+        """
+        Hydrate an Order from data that was validated when it was written.
+
+        Skips all validators (email, amounts, nested models) and only builds
+        the nested model instances. Use for items read back from our own table.
+
+        Args:
+            data: Model-ready dict (e.g., from the Order codec)
+
+        Returns:
+            Order instance built without validation
+        """
+        values = dict(data)
+        values['items'] = [_construct(OrderItem, item) for item in values.get('items') or []]
+        if values.get('campaign') is not None:
+            values['campaign'] = _construct(Campaign, values['campaign'])
+        if values.get('billingAddress') is not None:
+            values['billingAddress'] = _construct(BillingAddress, values['billingAddress'])
+        if values.get('paymentDetails') is not None:
+            values['paymentDetails'] = _construct(PaymentDetails, values['paymentDetails'])
+        return _construct(cls, values)
+
     class Config:
         """Pydantic configuration."""
         json_encoders = {
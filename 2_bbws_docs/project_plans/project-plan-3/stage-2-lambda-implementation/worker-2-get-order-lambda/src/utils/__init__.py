@@ -0,0 +1,5 @@
+"""Utilities for Order Lambda."""
+
+from .aws_clients import client_metrics, get_client, get_resource
+
+__all__ = ['client_metrics', 'get_client', 'get_resource']
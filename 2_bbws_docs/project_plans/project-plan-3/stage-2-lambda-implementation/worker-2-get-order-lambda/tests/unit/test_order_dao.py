@@ -6,6 +6,7 @@ Tests the Data Access Object layer with mocked DynamoDB client.
 import pytest
 from unittest.mock import Mock, MagicMock
 from decimal import Decimal
+from pydantic import ValidationError
 
 from src.dao.order_dao import OrderDAO
 from src.models import Order
@@ -123,3 +124,54 @@ class TestOrderDAO:
         assert 'PK' not in result
         assert 'SK' not in result
         assert 'GSI1_PK' not in result
+
+
+class TestOrderDAOTrustedReads:
+    """Test suite for trusted (validation-free) hydration."""
+
+    def test_trusted_get_order_matches_validated(self, sample_dynamodb_item):
+        """Trusted hydration yields the same order as full validation."""
+        mock_dynamodb = Mock()
+        mock_dynamodb.get_item.return_value = {'Item': sample_dynamodb_item}
+        validated = OrderDAO(mock_dynamodb, 'test-table').get_order('tenant_1', 'order_1')
+
+        trusted = OrderDAO(mock_dynamodb, 'test-table', trusted_reads=True).get_order('tenant_1', 'order_1')
+
+        assert isinstance(trusted, Order)
+        assert trusted.dict() == validated.dict()
+        assert trusted.items[0].subtotal == Decimal('239.99')
+        assert trusted.campaign.code == 'SUMMER2025'
+
+    def test_trusted_read_skips_validation(self, sample_dynamodb_item):
+        """Trusted hydration does not run model validators."""
+        sample_dynamodb_item['customerEmail'] = {'S': 'not-an-email'}
+        mock_dynamodb = Mock()
+        mock_dynamodb.get_item.return_value = {'Item': sample_dynamodb_item}
+        dao = OrderDAO(mock_dynamodb, 'test-table', trusted_reads=True)
+
+        order = dao.get_order('tenant_1', 'order_1')
+
+        assert order.customerEmail == 'not-an-email'
+
+    def test_trusted_read_ignores_unknown_attributes(self, sample_dynamodb_item):
+        """Attributes outside the model are not exposed on trusted orders."""
+        sample_dynamodb_item['pdfUrl'] = {'S': 's3://bucket/invoice.pdf'}
+        mock_dynamodb = Mock()
+        mock_dynamodb.get_item.return_value = {'Item': sample_dynamodb_item}
+        dao = OrderDAO(mock_dynamodb, 'test-table', trusted_reads=True)
+
+        order = dao.get_order('tenant_1', 'order_1')
+
+        assert 'pdfUrl' not in order.dict()
+
+    def test_verify_every_validates_sampled_reads(self, sample_dynamodb_item):
+        """Every Nth trusted read is fully validated."""
+        sample_dynamodb_item['customerEmail'] = {'S': 'not-an-email'}
+        mock_dynamodb = Mock()
+        mock_dynamodb.get_item.return_value = {'Item': sample_dynamodb_item}
+        dao = OrderDAO(mock_dynamodb, 'test-table', trusted_reads=True, verify_every=2)
+
+        dao.get_order('tenant_1', 'order_1')
+
+        with pytest.raises(ValidationError):
+            dao.get_order('tenant_1', 'order_1')
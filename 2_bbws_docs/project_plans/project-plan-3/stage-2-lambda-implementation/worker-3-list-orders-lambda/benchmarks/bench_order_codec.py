@@ -0,0 +1,177 @@
+"""
+Benchmark: compiled Order codec vs. the recursive per-DAO deserializer.
+
+Decodes a list_orders page (default 100 orders) with nested items, campaign
+and billing address, and reports the time per page for:
+
+- legacy: the recursive if/elif deserializer previously in OrderDAO
+- codec:  src.codec compiled decoder
+
+With --hydrate, the codec output is also turned into Order models, comparing
+full Pydantic validation against Order.from_trusted (trusted reads).
+
+Usage (from the worker directory):
+    python -m benchmarks.bench_order_codec --orders 100 --items 5 --repeat 50
+"""
+import argparse
+import gc
+import statistics
+import time
+from decimal import Decimal
+from typing import Any, Callable, Dict, List
+
+from src.codec import codec_for
+from src.models import Order
+
+KEYS = ['PK', 'SK', 'entityType', 'GSI1_PK', 'GSI1_SK', 'GSI2_PK', 'GSI2_SK']
+
+
+def legacy_deserialize_item(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Deserializer as it was implemented in OrderDAO._deserialize_item."""
+    def deserialize_value(value: Dict[str, Any]) -> Any:
+        if 'S' in value:
+            return value['S']
+        elif 'N' in value:
+            return Decimal(value['N'])
+        elif 'BOOL' in value:
+            return value['BOOL']
+        elif 'NULL' in value:
+            return None
+        elif 'L' in value:
+            return [deserialize_value(v) for v in value['L']]
+        elif 'M' in value:
+            return {k: deserialize_value(v) for k, v in value['M'].items()}
+        else:
+            return value
+
+    result = {}
+    for key, value in item.items():
+        if key in KEYS:
+            continue
+        result[key] = deserialize_value(value)
+    return result
+
+
+def build_item(index: int, item_count: int) -> Dict[str, Any]:
+    """Build one DynamoDB order item in the format written by OrderCreatorRecord."""
+    order_id = f"order_{index:08d}"
+    timestamp = "2025-12-19T10:30:00Z"
+    items = []
+    for line in range(item_count):
+        items.append({'M': {
+            'id': {'S': f"item_{index:08d}_{line}"},
+            'productId': {'S': "prod_550e8400-e29b-41d4-a716-446655440000"},
+            'productName': {'S': "WordPress Professional Plan"},
+            'quantity': {'N': '1'},
+            'unitPrice': {'N': '299.99'},
+            'discount': {'N': '60.00'},
+            'subtotal': {'N': '239.99'},
+            'dateCreated': {'S': timestamp},
+            'dateLastUpdated': {'S': timestamp},
+            'lastUpdatedBy': {'S': 'system'},
+            'active': {'BOOL': True},
+        }})
+
+    subtotal = Decimal('239.99') * item_count
+    return {
+        'PK': {'S': 'TENANT#tenant_bench'},
+        'SK': {'S': f'ORDER#{order_id}'},
+        'entityType': {'S': 'ORDER'},
+        'id': {'S': order_id},
+        'orderNumber': {'S': f'ORD-20251219-{index:05d}'},
+        'tenantId': {'S': 'tenant_bench'},
+        'customerEmail': {'S': 'customer@example.com'},
+        'items': {'L': items},
+        'subtotal': {'N': str(subtotal)},
+        'tax': {'N': '35.99'},
+        'total': {'N': str(subtotal + Decimal('35.99'))},
+        'currency': {'S': 'ZAR'},
+        'status': {'S': 'PENDING_PAYMENT'},
+        'campaign': {'M': {
+            'id': {'S': 'camp_770e8400'},
+            'code': {'S': 'SUMMER2025'},
+            'description': {'S': 'Summer 2025 Special Offer'},
+            'discountPercentage': {'N': '20.0'},
+            'productId': {'S': 'prod_550e8400'},
+            'termsConditionsLink': {'S': 'https://kimmyai.io/terms/campaigns/summer2025'},
+            'fromDate': {'S': '2025-06-01'},
+            'toDate': {'S': '2025-08-31'},
+            'isValid': {'BOOL': True},
+            'dateCreated': {'S': timestamp},
+            'dateLastUpdated': {'S': timestamp},
+            'lastUpdatedBy': {'S': 'admin@kimmyai.io'},
+            'active': {'BOOL': True},
+        }},
+        'billingAddress': {'M': {
+            'street': {'S': '123 Main Street'},
+            'city': {'S': 'Cape Town'},
+            'province': {'S': 'Western Cape'},
+            'postalCode': {'S': '8001'},
+            'country': {'S': 'ZA'},
+        }},
+        'paymentMethod': {'S': 'payfast'},
+        'paymentDetails': {'NULL': True},
+        'dateCreated': {'S': timestamp},
+        'dateLastUpdated': {'S': timestamp},
+        'lastUpdatedBy': {'S': 'customer@example.com'},
+        'active': {'BOOL': True},
+        'GSI1_PK': {'S': 'TENANT#tenant_bench'},
+        'GSI1_SK': {'S': f'{timestamp}#{order_id}'},
+        'GSI2_PK': {'S': f'ORDER#{order_id}'},
+        'GSI2_SK': {'S': 'METADATA'},
+    }
+
+
+def time_page(decode: Callable[[Dict[str, Any]], Dict[str, Any]], page: List[Dict[str, Any]]) -> float:
+    """Return the time to decode one page in milliseconds."""
+    start = time.perf_counter()
+    for item in page:
+        decode(item)
+    return (time.perf_counter() - start) * 1000
+
+
+def main() -> None:
+    """Run the benchmark and print a summary table."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--orders', type=int, default=100, help='Orders per page (default 100)')
+    parser.add_argument('--items', type=int, default=5, help='Line items per order (default 5)')
+    parser.add_argument('--repeat', type=int, default=50, help='Pages to decode per variant (default 50)')
+    parser.add_argument('--hydrate', action='store_true', help='Also compare validated vs trusted Order hydration')
+    args = parser.parse_args()
+
+    page = [build_item(i, args.items) for i in range(args.orders)]
+    codec = codec_for(Order)
+
+    # Both variants must produce identical dicts
+    assert [codec.decode(i) for i in page] == [legacy_deserialize_item(i) for i in page]
+
+    variants = {'legacy': legacy_deserialize_item, 'codec': codec.decode}
+    if args.hydrate:
+        variants['validate'] = lambda item: Order(**codec.decode(item))
+        variants['trusted'] = lambda item: Order.from_trusted(codec.decode(item))
+    results: Dict[str, List[float]] = {name: [] for name in variants}
+
+    # Interleave the variants so both see the same machine noise
+    gc.disable()
+    try:
+        for _ in range(args.repeat):
+            for name, decode in variants.items():
+                results[name].append(time_page(decode, page))
+    finally:
+        gc.enable()
+
+    print(f"Page: {args.orders} orders x {args.items} items, {args.repeat} runs")
+    print(f"{'variant':<10}{'min ms':>10}{'median ms':>12}{'p95 ms':>10}")
+    for name, samples in results.items():
+        p95 = sorted(samples)[max(int(len(samples) * 0.95) - 1, 0)]
+        print(f"{name:<10}{min(samples):>10.3f}{statistics.median(samples):>12.3f}{p95:>10.3f}")
+
+    speedup = statistics.median(results['legacy']) / statistics.median(results['codec'])
+    print(f"codec speedup over legacy: {speedup:.2f}x")
+    if args.hydrate:
+        speedup = statistics.median(results['validate']) / statistics.median(results['trusted'])
+        print(f"trusted speedup over validate: {speedup:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,6 @@
+"""
+DynamoDB codec shared by the Order Lambda workers.
+"""
+from .dynamodb_codec import ItemCodec, KEY_ATTRIBUTES, codec_for, encode_value, int_or_float
+
+__all__ = ["ItemCodec", "KEY_ATTRIBUTES", "codec_for", "encode_value", "int_or_float"]
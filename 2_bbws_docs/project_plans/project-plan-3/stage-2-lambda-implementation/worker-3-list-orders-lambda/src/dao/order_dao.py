@@ -5,32 +5,63 @@ Implements DynamoDB single-table design patterns with tenant isolation.
 """
 import json
 import logging
-from typing import Optional, Dict, Any
-from decimal import Decimal
+from typing import Optional, Dict, Any, Iterator, List
 
-from src.models import Order, OrderItem, Campaign, BillingAddress, PaymentDetails
+from pydantic import ValidationError
+
+from src.codec import codec_for
+from src.models import Order
 
 logger = logging.getLogger(__name__)
 
+# Compiled once per container (Order, OrderItem, Campaign, BillingAddress, PaymentDetails)
+ORDER_CODEC = codec_for(Order)
+
+# GSI1: GSI1_PK=TENANT#{tenantId}, GSI1_SK={dateCreated}#{orderId}
+DATE_INDEX_NAME = 'OrdersByDateIndex'
+# GSI3 (every order item, no other entities): GSI3_PK=TENANT#{tenantId}#STATUS#{STATUS}, GSI3_SK={dateCreated}#{orderId}
+# The status segment is upper case whichever case the writer stores status in
+STATUS_INDEX_NAME = 'OrdersByStatusIndex'
+
+# Sorts after '#' and every ISO 8601 character, so a date_to bound includes
+# all orders created on/at that date or timestamp
+_RANGE_END = '~'
+
 
 class OrderDAO:
     """
     Data Access Object for Order operations.
 
-    Implements Access Pattern AP1: Get specific order for a tenant.
+    Implements Access Patterns:
+    - AP1: Get specific order for a tenant
+    - AP2: List all orders for a tenant
+    - AP3: List orders for a tenant by date range (GSI1)
+    - AP5: List orders for a tenant by status and date range (GSI3)
     Primary Key Structure: PK=TENANT#{tenantId}, SK=ORDER#{orderId}
     """
 
-    def __init__(self, dynamodb_client, table_name: str):
+    def __init__(
+        self,
+        dynamodb_client,
+        table_name: str,
+        trusted_reads: bool = False,
+        verify_every: int = 0
+    ):
         """
         Initialize OrderDAO with DynamoDB client.
 
         Args:
             dynamodb_client: boto3 DynamoDB client
             table_name: DynamoDB table name
+            trusted_reads: Hydrate orders without re-running model validators
+                (items in this table were validated by OrderCreatorRecord on write)
+            verify_every: With trusted_reads, fully validate 1 in N reads (0 = never)
         """
         self.dynamodb = dynamodb_client
         self.table_name = table_name
+        self.trusted_reads = trusted_reads
+        self.verify_every = verify_every
+        self._reads = 0
 
     def get_order(self, tenant_id: str, order_id: str) -> Optional[Order]:
         """
@@ -66,7 +97,7 @@ class OrderDAO:
 
             # Deserialize DynamoDB item to Order object
             order_dict = self._deserialize_item(response['Item'])
-            order = Order(**order_dict)
+            order = self._hydrate(order_dict)
 
             logger.info(f"Order retrieved successfully: orderId={order_id}, status={order.status}")
             return order
@@ -79,19 +110,31 @@ class OrderDAO:
         self,
         tenant_id: str,
         page_size: int = 50,
-        start_at: Optional[str] = None
+        start_at: Optional[str] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        status: Optional[str] = None
     ) -> Dict[str, Any]:
         """
-        Find all orders for a tenant with pagination (AP2).
+        Find orders for a tenant with pagination (AP2, AP3, AP5).
 
-        Implements Access Pattern AP2: List all orders for a tenant
+        Without filters implements Access Pattern AP2: List all orders for a tenant
         Query: PK=TENANT#{tenantId} AND SK begins_with ORDER#
+
+        With date_from/date_to and/or status the filters become key conditions
+        on an index, so only matching orders are read (newest first):
+        - AP3: GSI1 (OrdersByDateIndex) GSI1_PK=TENANT#{tenantId}, GSI1_SK in range
+        - AP5: GSI3 (OrdersByStatusIndex) GSI3_PK=TENANT#{tenantId}#STATUS#{STATUS}, GSI3_SK in range
+
         Uses pagination with Limit and ExclusiveStartKey.
 
         Args:
             tenant_id: Tenant identifier
             page_size: Number of items to return (1-100, default 50)
             start_at: Pagination token from previous response (optional)
+            date_from: Inclusive lower bound on dateCreated, ISO 8601 (optional)
+            date_to: Inclusive upper bound on dateCreated, ISO 8601 (optional)
+            status: Order status, any case (optional)
 
         Returns:
             Dictionary with:
@@ -106,16 +149,19 @@ class OrderDAO:
             logger.info(f"Finding orders for tenant: tenantId={tenant_id}, pageSize={page_size}, startAt={start_at}")
 
             # Build query parameters
-            query_params = {
-                'TableName': self.table_name,
-                'KeyConditionExpression': 'PK = :pk AND begins_with(SK, :sk_prefix)',
-                'ExpressionAttributeValues': {
-                    ':pk': {'S': f'TENANT#{tenant_id}'},
-                    ':sk_prefix': {'S': 'ORDER#'}
-                },
-                'Limit': page_size,
-                'ScanIndexForward': False  # Sort by SK descending (newest first)
-            }
+            if date_from or date_to or status:
+                query_params = self._build_index_query(tenant_id, date_from, date_to, status)
+            else:
+                query_params = {
+                    'TableName': self.table_name,
+                    'KeyConditionExpression': 'PK = :pk AND begins_with(SK, :sk_prefix)',
+                    'ExpressionAttributeValues': {
+                        ':pk': {'S': f'TENANT#{tenant_id}'},
+                        ':sk_prefix': {'S': 'ORDER#'}
+                    }
+                }
+            query_params['Limit'] = page_size
+            query_params['ScanIndexForward'] = False  # Sort by SK descending (newest first)
 
             # Add exclusive start key if provided (for pagination continuation)
             if start_at:
@@ -128,7 +174,7 @@ class OrderDAO:
             orders = []
             for item in response.get('Items', []):
                 order_dict = self._deserialize_item(item)
-                order = Order(**order_dict)
+                order = self._hydrate(order_dict)
                 orders.append(order)
 
             # Determine pagination continuation token
@@ -153,11 +199,108 @@ class OrderDAO:
             logger.error(f"Error finding orders for tenant: {str(e)}", exc_info=True)
             raise
 
+    def _build_index_query(
+        self,
+        tenant_id: str,
+        date_from: Optional[str],
+        date_to: Optional[str],
+        status: Optional[str]
+    ) -> Dict[str, Any]:
+        """
+        Build a GSI query with the date range as a sort key condition.
+
+        Args:
+            tenant_id: Tenant identifier
+            date_from: Inclusive lower bound on dateCreated (optional)
+            date_to: Inclusive upper bound on dateCreated (optional)
+            status: Order status, any case (optional, selects the status index)
+
+        Returns:
+            Query parameters without Limit/ExclusiveStartKey
+        """
+        if status:
+            index_name, pk_name, sk_name = STATUS_INDEX_NAME, 'GSI3_PK', 'GSI3_SK'
+            pk_value = f'TENANT#{tenant_id}#STATUS#{status.upper()}'
+        else:
+            index_name, pk_name, sk_name = DATE_INDEX_NAME, 'GSI1_PK', 'GSI1_SK'
+            pk_value = f'TENANT#{tenant_id}'
+
+        key_condition = f'{pk_name} = :pk'
+        values = {':pk': {'S': pk_value}}
+
+        if date_from and date_to:
+            key_condition += f' AND {sk_name} BETWEEN :from AND :to'
+        elif date_from:
+            key_condition += f' AND {sk_name} >= :from'
+        elif date_to:
+            key_condition += f' AND {sk_name} <= :to'
+        if date_from:
+            values[':from'] = {'S': date_from}
+        if date_to:
+            values[':to'] = {'S': f'{date_to}{_RANGE_END}'}
+
+        return {
+            'TableName': self.table_name,
+            'IndexName': index_name,
+            'KeyConditionExpression': key_condition,
+            'ExpressionAttributeValues': values
+        }
+
+    def iter_pages_by_tenant_id(self, tenant_id: str, page_size: int = 100) -> Iterator[List[Order]]:
+        """
+        Iterate over all orders for a tenant one page at a time (AP2).
+
+        Follows the pagination tokens of find_by_tenant_id internally, so only
+        the current page is held in memory.
+
+        Args:
+            tenant_id: Tenant identifier
+            page_size: DynamoDB query Limit per page
+
+        Yields:
+            List[Order] for each page (newest first)
+        """
+        start_at = None
+        while True:
+            result = self.find_by_tenant_id(tenant_id, page_size, start_at)
+            if result['items']:
+                yield result['items']
+            if not result['moreAvailable']:
+                return
+            start_at = result['startAt']
+
+    def _hydrate(self, order_dict: Dict[str, Any]) -> Order:
+        """
+        Build an Order from a deserialized item.
+
+        Validates with the full model unless trusted reads are enabled; in
+        trusted mode every verify_every-th read is still validated and any
+        validation error is raised as on the untrusted path.
+
+        Args:
+            order_dict: Dictionary from _deserialize_item
+
+        Returns:
+            Order object
+        """
+        if not self.trusted_reads:
+            return Order(**order_dict)
+
+        self._reads += 1
+        if self.verify_every and self._reads % self.verify_every == 0:
+            try:
+                return Order(**order_dict)
+            except ValidationError:
+                logger.error(f"Trusted read failed verification: orderId={order_dict.get('id')}")
+                raise
+
+        return Order.from_trusted(order_dict)
+
     def _deserialize_item(self, item: Dict[str, Any]) -> Dict[str, Any]:
         """
         Deserialize DynamoDB item to dictionary compatible with Pydantic models.
 
-        Converts DynamoDB type-annotated format to plain Python types.
+        Uses the Order codec compiled at import time; table and GSI keys are dropped.
 
         Args:
             item: DynamoDB item with type annotations
@@ -165,33 +308,4 @@ class OrderDAO:
         Returns:
             Dictionary with plain Python types
         """
-        def deserialize_value(value: Dict[str, Any]) -> Any:
-            """Deserialize a single DynamoDB value."""
-            if 'S' in value:
-                return value['S']
-            elif 'N' in value:
-                # Convert to Decimal for monetary values
-                return Decimal(value['N'])
-            elif 'BOOL' in value:
-                return value['BOOL']
-            elif 'NULL' in value:
-                return None
-            elif 'L' in value:
-                # List
-                return [deserialize_value(v) for v in value['L']]
-            elif 'M' in value:
-                # Map (nested object)
-                return {k: deserialize_value(v) for k, v in value['M'].items()}
-            else:
-                logger.warning(f"Unknown DynamoDB type: {value}")
-                return value
-
-        # Deserialize all attributes
-        result = {}
-        for key, value in item.items():
-            # Skip internal DynamoDB keys
-            if key in ['PK', 'SK', 'entityType', 'GSI1_PK', 'GSI1_SK', 'GSI2_PK', 'GSI2_SK']:
-                continue
-            result[key] = deserialize_value(value)
-
-        return result
+        return ORDER_CODEC.decode(item)
@@ -0,0 +1,154 @@
+"""
+Lambda handler for GET /v1.0/tenants/{tenantId}/orders/export.
+
+Starts an export of a tenant's full order history to S3 as NDJSON and returns
+202 with the export's object key and presigned download URL. The export itself
+runs in a second, asynchronous invocation of this function, so it is bounded by
+the Lambda timeout rather than API Gateway's 29 second integration timeout.
+"""
+import json
+import logging
+import os
+from typing import Dict, Any
+
+from src.dao.order_dao import OrderDAO
+from src.services.order_export_service import OrderExportService
+from src.utils.aws_clients import get_client
+
+# Configure logging
+logger = logging.getLogger()
+logger.setLevel(os.environ.get('LOG_LEVEL', 'INFO'))
+
+# Initialize AWS clients (outside handler for connection reuse)
+dynamodb_client = get_client('dynamodb')
+s3_client = get_client('s3')
+lambda_client = get_client('lambda')
+table_name = os.environ.get('DYNAMODB_TABLE_NAME', 'bbws-customer-portal-orders-dev')
+export_bucket_name = os.environ.get('EXPORT_BUCKET_NAME', 'bbws-customer-portal-exports-dev')
+
+# Orders were validated on write; skip re-validation on read, verifying 1 in N
+trusted_reads = os.environ.get('TRUSTED_READS', 'true').lower() == 'true'
+trusted_reads_verify_every = int(os.environ.get('TRUSTED_READS_VERIFY_EVERY', '100'))
+
+# Initialize DAO and export service
+order_dao = OrderDAO(dynamodb_client, table_name, trusted_reads, trusted_reads_verify_every)
+export_service = OrderExportService(s3_client, export_bucket_name)
+
+# Export constants
+EXPORT_PAGE_SIZE = int(os.environ.get('EXPORT_PAGE_SIZE', '500'))
+EXPORT_URL_EXPIRY = int(os.environ.get('EXPORT_URL_EXPIRY', '3600'))
+
+# Function invoked asynchronously to run the export (default: this function)
+EXPORT_FUNCTION_NAME = os.environ.get('EXPORT_FUNCTION_NAME', os.environ.get('AWS_LAMBDA_FUNCTION_NAME', ''))
+
+
+def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    """
+    Lambda handler for GET /v1.0/tenants/{tenantId}/orders/export.
+
+    Picks the export's object key and invokes this function asynchronously
+    (InvocationType=Event) with an exportJob event to write it; the client
+    polls the returned URL until the object exists.
+
+    Args:
+        event: API Gateway event containing:
+            - pathParameters.tenantId: Tenant identifier
+            or an exportJob event (see _run_export)
+        context: Lambda context object
+
+    Returns:
+        API Gateway response with:
+            - 202: Export started; object key and presigned URL
+            - 400: Bad request (missing tenantId)
+            - 500: Internal server error
+    """
+    if 'exportJob' in event:
+        return _run_export(event['exportJob'])
+
+    try:
+        logger.info(f"Processing export_orders request: {json.dumps(event)}")
+
+        path_parameters = event.get('pathParameters', {})
+        if not path_parameters:
+            logger.error("Missing pathParameters in event")
+            return _build_response(400, {'error': 'Bad Request', 'message': 'Missing path parameters'})
+
+        tenant_id = path_parameters.get('tenantId')
+        if not tenant_id:
+            logger.error("Missing tenantId in pathParameters")
+            return _build_response(400, {'error': 'Bad Request', 'message': 'Missing tenantId'})
+
+        key = export_service.export_key(tenant_id)
+        lambda_client.invoke(
+            FunctionName=EXPORT_FUNCTION_NAME,
+            InvocationType='Event',
+            Payload=json.dumps({'exportJob': {'tenantId': tenant_id, 'key': key}}).encode('utf-8')
+        )
+
+        logger.info(f"Order export started: tenantId={tenant_id}, key={key}")
+
+        return _build_response(202, {
+            'success': True,
+            'data': {
+                'status': 'started',
+                'url': export_service.presigned_url(key, EXPORT_URL_EXPIRY),
+                'key': key,
+                'format': 'ndjson',
+                'expiresIn': EXPORT_URL_EXPIRY
+            }
+        })
+
+    except Exception as e:
+        logger.error(f"Internal error: {str(e)}", exc_info=True)
+        return _build_response(500, {
+            'error': 'Internal Server Error',
+            'message': 'An unexpected error occurred'
+        })
+
+
+def _run_export(job: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Write an export started by lambda_handler.
+
+    Pages through all orders for the tenant internally and streams them to S3
+    as NDJSON (one order per line). Errors are raised so Lambda retries the
+    asynchronous invocation; a retry rewrites the same key.
+
+    Args:
+        job: exportJob from the asynchronous event:
+            - tenantId: Tenant identifier
+            - key: Object key chosen by lambda_handler
+
+    Returns:
+        Object key and order count
+    """
+    tenant_id = job['tenantId']
+    pages = order_dao.iter_pages_by_tenant_id(tenant_id, EXPORT_PAGE_SIZE)
+    result = export_service.export(tenant_id, pages, EXPORT_URL_EXPIRY, key=job['key'])
+
+    logger.info(f"Orders exported successfully: tenantId={tenant_id}, count={result['count']}")
+
+    return {'key': result['key'], 'count': result['count']}
+
+
+def _build_response(status_code: int, body: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build API Gateway response with CORS headers.
+
+    Args:
+        status_code: HTTP status code
+        body: Response body dictionary
+
+    Returns:
+        API Gateway response object
+    """
+    return {
+        'statusCode': status_code,
+        'headers': {
+            'Content-Type': 'application/json',
+            'Access-Control-Allow-Origin': '*',
+            'Access-Control-Allow-Headers': 'Content-Type,Authorization',
+            'Access-Control-Allow-Methods': 'GET,OPTIONS'
+        },
+        'body': json.dumps(body)
+    }
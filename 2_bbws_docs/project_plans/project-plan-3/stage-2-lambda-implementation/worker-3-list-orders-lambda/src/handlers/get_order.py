@@ -7,20 +7,24 @@ import json
 import logging
 import os
 from typing import Dict, Any
-import boto3
 
 from src.dao.order_dao import OrderDAO
+from src.utils.aws_clients import get_client
 
 # Configure logging
 logger = logging.getLogger()
 logger.setLevel(os.environ.get('LOG_LEVEL', 'INFO'))
 
 # Initialize AWS clients (outside handler for connection reuse)
-dynamodb_client = boto3.client('dynamodb')
+dynamodb_client = get_client('dynamodb')
 table_name = os.environ.get('DYNAMODB_TABLE_NAME', 'bbws-customer-portal-orders-dev')
 
+# Orders were validated on write; skip re-validation on read, verifying 1 in N
+trusted_reads = os.environ.get('TRUSTED_READS', 'true').lower() == 'true'
+trusted_reads_verify_every = int(os.environ.get('TRUSTED_READS_VERIFY_EVERY', '100'))
+
 # Initialize DAO
-order_dao = OrderDAO(dynamodb_client, table_name)
+order_dao = OrderDAO(dynamodb_client, table_name, trusted_reads, trusted_reads_verify_every)
 
 
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
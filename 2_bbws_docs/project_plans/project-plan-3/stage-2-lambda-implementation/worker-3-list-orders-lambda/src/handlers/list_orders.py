@@ -6,21 +6,31 @@ Implements list_orders functionality with pagination and tenant isolation.
 import json
 import logging
 import os
-from typing import Dict, Any
-import boto3
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, Any, Optional
 
 from src.dao.order_dao import OrderDAO
+from src.models import OrderStatus
+from src.utils.aws_clients import get_client
 
 # Configure logging
 logger = logging.getLogger()
 logger.setLevel(os.environ.get('LOG_LEVEL', 'INFO'))
 
 # Initialize AWS clients (outside handler for connection reuse)
-dynamodb_client = boto3.client('dynamodb')
+dynamodb_client = get_client('dynamodb')
 table_name = os.environ.get('DYNAMODB_TABLE_NAME', 'bbws-customer-portal-orders-dev')
 
+# Orders were validated on write; skip re-validation on read, verifying 1 in N
+trusted_reads = os.environ.get('TRUSTED_READS', 'true').lower() == 'true'
+trusted_reads_verify_every = int(os.environ.get('TRUSTED_READS_VERIFY_EVERY', '100'))
+
 # Initialize DAO
-order_dao = OrderDAO(dynamodb_client, table_name)
+order_dao = OrderDAO(dynamodb_client, table_name, trusted_reads, trusted_reads_verify_every)
+
+# Upper-cased order statuses, as in the status index key
+STATUS_KEYS = {status.value.upper() for status in OrderStatus}
 
 # Pagination constants
 DEFAULT_PAGE_SIZE = 50
@@ -39,6 +49,9 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             - pathParameters.tenantId: Tenant identifier
             - queryStringParameters.pageSize: Number of items to return (optional, default 50, max 100)
             - queryStringParameters.startAt: Pagination token for continuation (optional)
+            - queryStringParameters.from: Created on/after, ISO 8601 UTC date or timestamp (optional)
+            - queryStringParameters.to: Created on/before, ISO 8601 UTC date or timestamp (optional)
+            - queryStringParameters.status: Order status, any case (optional)
         context: Lambda context object
 
     Returns:
@@ -93,10 +106,29 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         # Parse startAt (pagination token)
         start_at = query_parameters.get('startAt')
 
-        logger.info(f"Fetching orders: tenantId={tenant_id}, pageSize={page_size}, startAt={start_at}")
-
-        # Query DynamoDB using tenant query (PK=TENANT#{tenantId}, SK begins_with ORDER#)
-        result = order_dao.find_by_tenant_id(tenant_id, page_size, start_at)
+        # Parse date range and status filters
+        date_from = _parse_date(query_parameters.get('from'), 'from')
+        date_to = _parse_date(query_parameters.get('to'), 'to')
+        # A date-only 'to' covers the whole day, so compare on the shorter precision
+        if date_from and date_to and date_from[:len(date_to)] > date_to:
+            logger.error(f"Invalid date range: from={date_from}, to={date_to}")
+            return _build_response(400, {'error': 'Bad Request', 'message': 'from must not be after to'})
+
+        # Status is matched case-insensitively: the order writers store it in different cases
+        status = query_parameters.get('status')
+        if status is not None and status.upper() not in STATUS_KEYS:
+            logger.error(f"Invalid status: {status}")
+            return _build_response(400, {'error': 'Bad Request', 'message': f'Invalid status: {status}'})
+
+        logger.info(f"Fetching orders: tenantId={tenant_id}, pageSize={page_size}, startAt={start_at}, "
+                    f"from={date_from}, to={date_to}, status={status}")
+
+        # Query DynamoDB: base table (PK=TENANT#{tenantId}, SK begins_with ORDER#) or,
+        # with filters, the date (GSI1) / status (GSI3) index with a key range on dateCreated
+        filters = {'date_from': date_from, 'date_to': date_to, 'status': status}
+        result = order_dao.find_by_tenant_id(
+            tenant_id, page_size, start_at, **{k: v for k, v in filters.items() if v}
+        )
 
         # Convert Order objects to dicts for JSON response
         items_dicts = [order.dict() for order in result['items']]
@@ -127,6 +159,29 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         })
 
 
+def _parse_date(value: Optional[str], name: str) -> Optional[str]:
+    """
+    Validate an ISO 8601 date or timestamp query parameter.
+
+    Args:
+        value: Raw query string value
+        name: Parameter name (for the error message)
+
+    Returns:
+        The value unchanged (it is compared against GSI sort keys as a string), or None
+
+    Raises:
+        ValueError: If the value is not ISO 8601
+    """
+    if not value:
+        return None
+    try:
+        datetime.fromisoformat(value)
+    except ValueError:
+        raise ValueError(f'{name} must be an ISO 8601 date or timestamp')
+    return value
+
+
 def _build_response(status_code: int, body: Dict[str, Any]) -> Dict[str, Any]:
     """
     Build API Gateway response with CORS headers.
@@ -146,5 +201,12 @@ def _build_response(status_code: int, body: Dict[str, Any]) -> Dict[str, Any]:
             'Access-Control-Allow-Headers': 'Content-Type,Authorization',
             'Access-Control-Allow-Methods': 'GET,OPTIONS'
         },
-        'body': json.dumps(body)
+        'body': json.dumps(body, default=_json_default)
     }
+
+
+def _json_default(value: Any) -> Any:
+    """Encode amounts as numbers, as Order's json_encoders do (order.dict() keeps Decimals)."""
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f'Object of type {value.__class__.__name__} is not JSON serializable')
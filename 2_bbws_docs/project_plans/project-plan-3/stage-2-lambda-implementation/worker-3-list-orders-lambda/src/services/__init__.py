@@ -0,0 +1,6 @@
+"""
+Service layer for Order Lambda.
+"""
+from .order_export_service import OrderExportService
+
+__all__ = ["OrderExportService"]
@@ -0,0 +1,190 @@
+"""
+OrderExportService - Streams a tenant's order history to S3 as NDJSON.
+
+Orders are paged from DynamoDB, serialised one line per order and uploaded
+with S3 multipart upload, so memory is bounded by one DynamoDB page plus one
+upload part regardless of how many orders the tenant has.
+"""
+import logging
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+from src.models import Order
+
+logger = logging.getLogger(__name__)
+
+# S3 minimum size for every multipart part except the last one
+MIN_PART_SIZE = 5 * 1024 * 1024
+
+
+class OrderExportService:
+    """
+    Service for exporting orders to S3 as newline-delimited JSON.
+
+    Attributes:
+        s3_client: Boto3 S3 client
+        bucket_name: S3 bucket for exports
+        part_size: Bytes buffered before a multipart part is uploaded
+    """
+
+    def __init__(self, s3_client, bucket_name: str, part_size: int = MIN_PART_SIZE):
+        """
+        Initialize OrderExportService.
+
+        Args:
+            s3_client: Boto3 S3 client
+            bucket_name: S3 bucket name
+            part_size: Multipart part size in bytes (minimum 5 MiB)
+        """
+        self.s3_client = s3_client
+        self.bucket_name = bucket_name
+        self.part_size = max(part_size, MIN_PART_SIZE)
+
+    def export(
+        self,
+        tenant_id: str,
+        pages: Iterable[List[Order]],
+        url_expiry: int = 3600,
+        key: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Write all orders to S3 as NDJSON and return a presigned download URL.
+
+        The multipart upload is only started once the first part is full;
+        smaller exports are written with a single put_object.
+
+        Args:
+            tenant_id: Tenant identifier
+            pages: Iterable of order pages (e.g., OrderDAO.iter_pages_by_tenant_id)
+            url_expiry: Presigned URL lifetime in seconds
+            key: Object key (default: a new export_key for the tenant)
+
+        Returns:
+            Dictionary with key, url, count and expiresIn
+
+        Raises:
+            Exception: If the upload fails (the multipart upload is aborted)
+        """
+        key = key or self.export_key(tenant_id)
+
+        logger.info(f"Exporting orders: tenantId={tenant_id}, bucket={self.bucket_name}, key={key}")
+
+        buffer = bytearray()
+        upload_id: Optional[str] = None
+        parts: List[Dict[str, Any]] = []
+        count = 0
+
+        try:
+            for page in pages:
+                for order in page:
+                    buffer += order.json().encode('utf-8')
+                    buffer += b'\n'
+                count += len(page)
+
+                if len(buffer) >= self.part_size:
+                    if upload_id is None:
+                        upload_id = self._start_upload(key, tenant_id)
+                    self._upload_part(key, upload_id, parts, bytes(buffer))
+                    buffer.clear()
+
+            if upload_id is None:
+                self.s3_client.put_object(
+                    Bucket=self.bucket_name,
+                    Key=key,
+                    Body=bytes(buffer),
+                    **self._object_args(tenant_id)
+                )
+            else:
+                if buffer:
+                    self._upload_part(key, upload_id, parts, bytes(buffer))
+                self.s3_client.complete_multipart_upload(
+                    Bucket=self.bucket_name,
+                    Key=key,
+                    UploadId=upload_id,
+                    MultipartUpload={'Parts': parts}
+                )
+
+        except Exception as e:
+            logger.error(f"Error exporting orders: {str(e)}", exc_info=True)
+            if upload_id is not None:
+                self.s3_client.abort_multipart_upload(Bucket=self.bucket_name, Key=key, UploadId=upload_id)
+            raise
+
+        url = self.presigned_url(key, url_expiry)
+
+        logger.info(f"Orders exported: tenantId={tenant_id}, count={count}, parts={len(parts) or 1}")
+
+        return {
+            'key': key,
+            'url': url,
+            'count': count,
+            'expiresIn': url_expiry
+        }
+
+    @staticmethod
+    def export_key(tenant_id: str) -> str:
+        """
+        Build the object key for a new export.
+
+        Args:
+            tenant_id: Tenant identifier
+
+        Returns:
+            Key under exports/{tenantId}/, unique to the second
+        """
+        timestamp = datetime.utcnow().strftime('%Y%m%dT%H%M%SZ')
+        return f"exports/{tenant_id}/orders-{timestamp}.ndjson"
+
+    def presigned_url(self, key: str, url_expiry: int = 3600) -> str:
+        """
+        Presign a download URL for an export.
+
+        The object only exists once the export has completed (a multipart
+        upload is invisible until CompleteMultipartUpload), so the URL returns
+        an error until then.
+
+        Args:
+            key: Object key
+            url_expiry: URL lifetime in seconds
+
+        Returns:
+            Presigned GET URL
+        """
+        return self.s3_client.generate_presigned_url(
+            'get_object',
+            Params={'Bucket': self.bucket_name, 'Key': key},
+            ExpiresIn=url_expiry
+        )
+
+    def _start_upload(self, key: str, tenant_id: str) -> str:
+        """Create the multipart upload and return its UploadId."""
+        response = self.s3_client.create_multipart_upload(
+            Bucket=self.bucket_name,
+            Key=key,
+            **self._object_args(tenant_id)
+        )
+        return response['UploadId']
+
+    def _upload_part(self, key: str, upload_id: str, parts: List[Dict[str, Any]], body: bytes) -> None:
+        """Upload the next part and record its ETag."""
+        part_number = len(parts) + 1
+        response = self.s3_client.upload_part(
+            Bucket=self.bucket_name,
+            Key=key,
+            UploadId=upload_id,
+            PartNumber=part_number,
+            Body=body
+        )
+        parts.append({'ETag': response['ETag'], 'PartNumber': part_number})
+
+    @staticmethod
+    def _object_args(tenant_id: str) -> Dict[str, Any]:
+        """Common object settings for exports."""
+        return {
+            'ContentType': 'application/x-ndjson',
+            'ServerSideEncryption': 'AES256',
+            'Metadata': {
+                'tenant-id': tenant_id,
+                'document-type': 'order-export'
+            }
+        }
@@ -0,0 +1,163 @@
+"""
+Integration test for the status filter across order writers.
+
+An order whose status is changed by the update_order Lambda (worker-4, which
+stores lower-case statuses) must be found by list_orders with ?status=.
+"""
+import functools
+import importlib
+import json
+import os
+import sys
+from unittest.mock import patch
+
+import boto3
+import pytest
+from moto import mock_dynamodb
+
+from src.dao.order_dao import OrderDAO
+from src.handlers.list_orders import lambda_handler
+
+TABLE_NAME = 'test-orders-table'
+TENANT_ID = 'tenant_123'
+ORDER_ID = 'order_456'
+UPDATE_ORDER_LAMBDA = os.path.join(
+    os.path.dirname(__file__), '..', '..', '..', 'worker-4-update-order-lambda'
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _import_update_order_dao():
+    """Import worker-4's src.dao.order_dao alongside this worker's own src package (once: pydantic
+    rejects a second definition of the same validators)."""
+    own_modules = {name: module for name, module in sys.modules.items()
+                   if name == 'src' or name.startswith('src.')}
+    for name in own_modules:
+        del sys.modules[name]
+    sys.path.insert(0, os.path.abspath(UPDATE_ORDER_LAMBDA))
+    try:
+        return importlib.import_module('src.dao.order_dao')
+    finally:
+        sys.path.pop(0)
+        for name in [name for name in sys.modules if name == 'src' or name.startswith('src.')]:
+            del sys.modules[name]
+        sys.modules.update(own_modules)
+
+
+@pytest.fixture
+def dynamodb():
+    """Orders table with the date (GSI1) and status (GSI3) indexes and one pending order."""
+    with mock_dynamodb():
+        client = boto3.client('dynamodb', region_name='af-south-1')
+        client.create_table(
+            TableName=TABLE_NAME,
+            KeySchema=[
+                {'AttributeName': 'PK', 'KeyType': 'HASH'},
+                {'AttributeName': 'SK', 'KeyType': 'RANGE'}
+            ],
+            AttributeDefinitions=[
+                {'AttributeName': name, 'AttributeType': 'S'}
+                for name in ('PK', 'SK', 'GSI1_PK', 'GSI1_SK', 'GSI3_PK', 'GSI3_SK')
+            ],
+            GlobalSecondaryIndexes=[
+                {
+                    'IndexName': index_name,
+                    'KeySchema': [
+                        {'AttributeName': f'{prefix}_PK', 'KeyType': 'HASH'},
+                        {'AttributeName': f'{prefix}_SK', 'KeyType': 'RANGE'}
+                    ],
+                    'Projection': {'ProjectionType': 'ALL'}
+                }
+                for index_name, prefix in (('OrdersByDateIndex', 'GSI1'), ('OrdersByStatusIndex', 'GSI3'))
+            ],
+            BillingMode='PAY_PER_REQUEST'
+        )
+
+        # As written by OrderCreatorRecord (worker-5)
+        date_created = '2025-12-30T10:00:00Z'
+        client.put_item(TableName=TABLE_NAME, Item={
+            'PK': {'S': f'TENANT#{TENANT_ID}'},
+            'SK': {'S': f'ORDER#{ORDER_ID}'},
+            'GSI1_PK': {'S': f'TENANT#{TENANT_ID}'},
+            'GSI1_SK': {'S': f'{date_created}#{ORDER_ID}'},
+            'GSI3_PK': {'S': f'TENANT#{TENANT_ID}#STATUS#PENDING'},
+            'GSI3_SK': {'S': f'{date_created}#{ORDER_ID}'},
+            'id': {'S': ORDER_ID},
+            'orderNumber': {'S': 'ORD-20251230-0001'},
+            'tenantId': {'S': TENANT_ID},
+            'customerEmail': {'S': 'test@example.com'},
+            'items': {'L': [{'M': {
+                'id': {'S': 'item_789'},
+                'productId': {'S': 'prod_001'},
+                'productName': {'S': 'Test Product'},
+                'quantity': {'N': '1'},
+                'unitPrice': {'N': '90.00'},
+                'discount': {'N': '0.00'},
+                'subtotal': {'N': '90.00'},
+                'dateCreated': {'S': date_created},
+                'dateLastUpdated': {'S': date_created},
+                'lastUpdatedBy': {'S': 'system'},
+                'active': {'BOOL': True}
+            }}]},
+            'subtotal': {'N': '90.00'},
+            'tax': {'N': '13.50'},
+            'shipping': {'N': '0.00'},
+            'total': {'N': '103.50'},
+            'currency': {'S': 'ZAR'},
+            'status': {'S': 'pending'},
+            'billingAddress': {'M': {
+                'street': {'S': '123 Test St'},
+                'city': {'S': 'Test City'},
+                'province': {'S': 'Test Province'},
+                'postalCode': {'S': '1234'},
+                'country': {'S': 'ZA'}
+            }},
+            'paymentMethod': {'S': 'payfast'},
+            'dateCreated': {'S': date_created},
+            'dateLastUpdated': {'S': date_created},
+            'lastUpdatedBy': {'S': 'system'},
+            'active': {'BOOL': True}
+        })
+        yield client
+
+
+def _list_orders(dynamodb, **query):
+    event = {'pathParameters': {'tenantId': TENANT_ID}, 'queryStringParameters': query}
+    with patch('src.handlers.list_orders.order_dao', OrderDAO(dynamodb, TABLE_NAME)):
+        return lambda_handler(event, None)
+
+
+class TestStatusIndexIntegration:
+    """Orders updated by update_order are listed by status."""
+
+    @pytest.mark.parametrize('status', ['paid', 'PAID'])
+    def test_order_paid_by_update_order_is_listed(self, dynamodb, status):
+        """An order update_order set to paid is found by status in either case."""
+        update_order_dao = _import_update_order_dao()
+        update_order_dao.OrderDAO(dynamodb, TABLE_NAME).update_order(
+            tenant_id=TENANT_ID,
+            order_id=ORDER_ID,
+            updates={'status': 'paid'},
+            expected_last_updated='2025-12-30T10:00:00Z',
+            updated_by='payfast-webhook'
+        )
+
+        response = _list_orders(dynamodb, status=status, **{'from': '2025-12-23'})
+
+        assert response['statusCode'] == 200
+        items = json.loads(response['body'])['data']['items']
+        assert [(item['id'], item['status']) for item in items] == [(ORDER_ID, 'PAID')]
+
+    def test_order_no_longer_listed_under_old_status(self, dynamodb):
+        """After the update the order leaves the pending partition."""
+        assert len(json.loads(_list_orders(dynamodb, status='pending')['body'])['data']['items']) == 1
+
+        _import_update_order_dao().OrderDAO(dynamodb, TABLE_NAME).update_order(
+            tenant_id=TENANT_ID,
+            order_id=ORDER_ID,
+            updates={'status': 'paid'},
+            expected_last_updated='2025-12-30T10:00:00Z',
+            updated_by='payfast-webhook'
+        )
+
+        assert json.loads(_list_orders(dynamodb, status='pending')['body'])['data']['items'] == []
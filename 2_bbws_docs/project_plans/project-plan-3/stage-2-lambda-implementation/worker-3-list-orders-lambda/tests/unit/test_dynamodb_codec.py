@@ -0,0 +1,91 @@
+"""
+Unit tests for the compiled DynamoDB codec.
+"""
+import pytest
+from decimal import Decimal
+
+from src.codec import codec_for, encode_value, int_or_float
+from src.models import Order
+
+
+class TestItemCodec:
+    """Test suite for ItemCodec."""
+
+    def test_decode_order_item(self, sample_dynamodb_item, sample_order_data):
+        """Decoded item matches the model-ready order dict."""
+        codec = codec_for(Order)
+
+        result = codec.decode(sample_dynamodb_item)
+
+        assert result == sample_order_data
+
+    def test_decode_skips_key_attributes(self, sample_dynamodb_item):
+        """Table and GSI keys are not part of the decoded dict."""
+        result = codec_for(Order).decode(sample_dynamodb_item)
+
+        for key in ['PK', 'SK', 'entityType', 'GSI1_PK', 'GSI1_SK', 'GSI2_PK', 'GSI2_SK']:
+            assert key not in result
+
+    def test_decode_typed_fields(self, sample_dynamodb_item):
+        """Numbers decode to the model's field types."""
+        result = codec_for(Order).decode(sample_dynamodb_item)
+
+        assert isinstance(result['total'], Decimal)
+        assert result['items'][0]['quantity'] == 1
+        assert isinstance(result['items'][0]['quantity'], int)
+        assert result['campaign']['discountPercentage'] == Decimal('20.0')
+        assert result['paymentDetails'] is None
+
+    def test_decode_unknown_attribute_generically(self, sample_dynamodb_item):
+        """Attributes outside the schema are still decoded."""
+        sample_dynamodb_item['pdfUrl'] = {'S': 's3://bucket/invoice.pdf'}
+        sample_dynamodb_item['extras'] = {'M': {'count': {'N': '3'}, 'tags': {'L': [{'S': 'a'}]}}}
+
+        result = codec_for(Order).decode(sample_dynamodb_item)
+
+        assert result['pdfUrl'] == 's3://bucket/invoice.pdf'
+        assert result['extras'] == {'count': Decimal('3'), 'tags': ['a']}
+
+    def test_decode_falls_back_on_unexpected_type(self, sample_dynamodb_item):
+        """A value stored under an unexpected descriptor is decoded generically."""
+        sample_dynamodb_item['total'] = {'S': '275.98'}
+
+        result = codec_for(Order).decode(sample_dynamodb_item)
+
+        assert result['total'] == '275.98'
+
+    def test_decoded_dict_builds_model(self, sample_dynamodb_item):
+        """Decoded dict is accepted by the Order model."""
+        order = Order(**codec_for(Order).decode(sample_dynamodb_item))
+
+        assert order.items[0].subtotal == Decimal('239.99')
+        assert order.billingAddress.city == 'Cape Town'
+
+    def test_codec_is_cached(self):
+        """Codecs are compiled once per model."""
+        assert codec_for(Order) is codec_for(Order)
+        assert codec_for(Order, number=int_or_float) is not codec_for(Order)
+
+    def test_encode_round_trip(self, sample_dynamodb_item):
+        """Encoding a decoded item restores the attribute values."""
+        codec = codec_for(Order, skip=frozenset())
+
+        encoded = codec.encode(codec.decode(sample_dynamodb_item))
+
+        assert encoded['items'] == sample_dynamodb_item['items']
+        assert encoded['campaign'] == sample_dynamodb_item['campaign']
+        assert encoded['GSI1_SK'] == sample_dynamodb_item['GSI1_SK']
+
+    @pytest.mark.parametrize('value,expected', [
+        ('text', {'S': 'text'}),
+        (True, {'BOOL': True}),
+        (42, {'N': '42'}),
+        (3.14, {'N': '3.14'}),
+        (Decimal('275.98'), {'N': '275.98'}),
+        (None, {'NULL': True}),
+        (['a'], {'L': [{'S': 'a'}]}),
+        ({'k': 1}, {'M': {'k': {'N': '1'}}}),
+    ])
+    def test_encode_value(self, value, expected):
+        """Python values encode to DynamoDB attribute values."""
+        assert encode_value(value) == expected
@@ -0,0 +1,87 @@
+"""
+Unit tests for export_orders Lambda handler.
+"""
+import json
+from unittest.mock import patch
+
+import pytest
+
+from src.handlers.export_orders import lambda_handler
+
+
+class TestExportOrdersHandler:
+    """Test suite for export_orders Lambda handler."""
+
+    def test_export_orders_started(self):
+        """Test the request starts an asynchronous export and returns 202 with its location."""
+        event = {"pathParameters": {"tenantId": "tenant_1"}}
+        key = 'exports/tenant_1/orders-20251219T103000Z.ndjson'
+
+        with patch('src.handlers.export_orders.order_dao') as mock_dao, \
+                patch('src.handlers.export_orders.export_service') as mock_service, \
+                patch('src.handlers.export_orders.lambda_client') as mock_lambda, \
+                patch('src.handlers.export_orders.EXPORT_FUNCTION_NAME', 'export-orders'):
+            mock_service.export_key.return_value = key
+            mock_service.presigned_url.return_value = 'https://exports.s3.amazonaws.com/presigned'
+
+            response = lambda_handler(event, None)
+
+        assert response['statusCode'] == 202
+        body = json.loads(response['body'])
+        assert body['success'] is True
+        assert body['data']['status'] == 'started'
+        assert body['data']['key'] == key
+        assert body['data']['url'] == 'https://exports.s3.amazonaws.com/presigned'
+        assert body['data']['format'] == 'ndjson'
+        mock_service.presigned_url.assert_called_once_with(key, 3600)
+
+        invoke_args = mock_lambda.invoke.call_args.kwargs
+        assert invoke_args['FunctionName'] == 'export-orders'
+        assert invoke_args['InvocationType'] == 'Event'
+        assert json.loads(invoke_args['Payload']) == {'exportJob': {'tenantId': 'tenant_1', 'key': key}}
+        mock_dao.iter_pages_by_tenant_id.assert_not_called()
+        mock_service.export.assert_not_called()
+
+    def test_export_job_writes_export(self):
+        """Test the asynchronous invocation streams the tenant's orders to the chosen key."""
+        key = 'exports/tenant_1/orders-20251219T103000Z.ndjson'
+        event = {'exportJob': {'tenantId': 'tenant_1', 'key': key}}
+
+        with patch('src.handlers.export_orders.order_dao') as mock_dao, \
+                patch('src.handlers.export_orders.export_service') as mock_service:
+            mock_service.export.return_value = {'key': key, 'url': 'https://presigned', 'count': 50000, 'expiresIn': 3600}
+
+            result = lambda_handler(event, None)
+
+        assert result == {'key': key, 'count': 50000}
+        assert mock_dao.iter_pages_by_tenant_id.call_args.args[0] == 'tenant_1'
+        assert mock_service.export.call_args.kwargs['key'] == key
+
+    def test_export_job_failure_raises(self):
+        """Test a failed export is raised so Lambda retries the asynchronous invocation."""
+        event = {'exportJob': {'tenantId': 'tenant_1', 'key': 'exports/tenant_1/orders.ndjson'}}
+
+        with patch('src.handlers.export_orders.order_dao'), \
+                patch('src.handlers.export_orders.export_service') as mock_service:
+            mock_service.export.side_effect = Exception('S3 error')
+
+            with pytest.raises(Exception, match='S3 error'):
+                lambda_handler(event, None)
+
+    def test_export_orders_missing_tenant_id(self):
+        """Test missing tenantId returns 400."""
+        response = lambda_handler({"pathParameters": {}}, None)
+
+        assert response['statusCode'] == 400
+
+    def test_export_orders_failure(self):
+        """Test a failure to start the export returns 500."""
+        event = {"pathParameters": {"tenantId": "tenant_1"}}
+
+        with patch('src.handlers.export_orders.export_service'), \
+                patch('src.handlers.export_orders.lambda_client') as mock_lambda:
+            mock_lambda.invoke.side_effect = Exception('Lambda error')
+
+            response = lambda_handler(event, None)
+
+        assert response['statusCode'] == 500
@@ -345,3 +345,75 @@ class TestListOrdersHandler:
             100,
             None
         )
+
+
+class TestListOrdersHandlerFilters:
+    """Test suite for from/to/status query parameters."""
+
+    EMPTY_RESULT = {'items': [], 'startAt': None, 'moreAvailable': False}
+
+    def _event(self, **query):
+        return {
+            "pathParameters": {"tenantId": "tenant_1"},
+            "queryStringParameters": query
+        }
+
+    def test_filters_passed_to_dao(self):
+        """Date range and status are forwarded to the DAO."""
+        event = self._event(**{'from': '2025-12-12', 'to': '2025-12-19', 'status': 'PAID'})
+
+        with patch('src.handlers.list_orders.order_dao') as mock_dao:
+            mock_dao.find_by_tenant_id.return_value = self.EMPTY_RESULT
+            response = lambda_handler(event, None)
+
+        assert response['statusCode'] == 200
+        mock_dao.find_by_tenant_id.assert_called_once_with(
+            'tenant_1', 50, None,
+            date_from='2025-12-12', date_to='2025-12-19', status='PAID'
+        )
+
+    def test_only_given_filters_passed(self):
+        """Omitted filters are not sent to the DAO."""
+        event = self._event(status='PAID')
+
+        with patch('src.handlers.list_orders.order_dao') as mock_dao:
+            mock_dao.find_by_tenant_id.return_value = self.EMPTY_RESULT
+            lambda_handler(event, None)
+
+        mock_dao.find_by_tenant_id.assert_called_once_with('tenant_1', 50, None, status='PAID')
+
+    def test_status_any_case(self):
+        """Status is accepted in the lower case the update and PDF workers store."""
+        event = self._event(status='paid')
+
+        with patch('src.handlers.list_orders.order_dao') as mock_dao:
+            mock_dao.find_by_tenant_id.return_value = self.EMPTY_RESULT
+            response = lambda_handler(event, None)
+
+        assert response['statusCode'] == 200
+        mock_dao.find_by_tenant_id.assert_called_once_with('tenant_1', 50, None, status='paid')
+
+    def test_timestamp_from_same_day_as_date_to(self):
+        """A timestamp 'from' on the same day as a date-only 'to' is valid."""
+        event = self._event(**{'from': '2025-12-19T08:00:00Z', 'to': '2025-12-19'})
+
+        with patch('src.handlers.list_orders.order_dao') as mock_dao:
+            mock_dao.find_by_tenant_id.return_value = self.EMPTY_RESULT
+            response = lambda_handler(event, None)
+
+        assert response['statusCode'] == 200
+
+    @pytest.mark.parametrize('query, message', [
+        ({'from': '19/12/2025'}, 'from must be an ISO 8601 date or timestamp'),
+        ({'to': 'yesterday'}, 'to must be an ISO 8601 date or timestamp'),
+        ({'from': '2025-12-20', 'to': '2025-12-19'}, 'from must not be after to'),
+        ({'status': 'SHIPPED'}, 'Invalid status: SHIPPED'),
+    ])
+    def test_invalid_filters(self, query, message):
+        """Invalid filters return 400 without querying DynamoDB."""
+        with patch('src.handlers.list_orders.order_dao') as mock_dao:
+            response = lambda_handler(self._event(**query), None)
+
+        assert response['statusCode'] == 400
+        assert json.loads(response['body'])['message'] == message
+        mock_dao.find_by_tenant_id.assert_not_called()
@@ -3,9 +3,11 @@ Unit tests for OrderDAO.
 
 Tests the Data Access Object layer with mocked DynamoDB client.
 """
+import json
 import pytest
 from unittest.mock import Mock, MagicMock
 from decimal import Decimal
+from pydantic import ValidationError
 
 from src.dao.order_dao import OrderDAO
 from src.models import Order
@@ -266,3 +268,178 @@ class TestOrderDAO:
         assert 'PK' not in result
         assert 'SK' not in result
         assert 'GSI1_PK' not in result
+
+
+class TestOrderDAOTrustedReads:
+    """Test suite for trusted (validation-free) hydration."""
+
+    def test_trusted_get_order_matches_validated(self, sample_dynamodb_item):
+        """Trusted hydration yields the same order as full validation."""
+        mock_dynamodb = Mock()
+        mock_dynamodb.get_item.return_value = {'Item': sample_dynamodb_item}
+        validated = OrderDAO(mock_dynamodb, 'test-table').get_order('tenant_1', 'order_1')
+
+        trusted = OrderDAO(mock_dynamodb, 'test-table', trusted_reads=True).get_order('tenant_1', 'order_1')
+
+        assert isinstance(trusted, Order)
+        assert trusted.dict() == validated.dict()
+        assert trusted.items[0].subtotal == Decimal('239.99')
+        assert trusted.campaign.code == 'SUMMER2025'
+
+    def test_trusted_read_skips_validation(self, sample_dynamodb_item):
+        """Trusted hydration does not run model validators."""
+        sample_dynamodb_item['customerEmail'] = {'S': 'not-an-email'}
+        mock_dynamodb = Mock()
+        mock_dynamodb.get_item.return_value = {'Item': sample_dynamodb_item}
+        dao = OrderDAO(mock_dynamodb, 'test-table', trusted_reads=True)
+
+        order = dao.get_order('tenant_1', 'order_1')
+
+        assert order.customerEmail == 'not-an-email'
+
+    def test_trusted_read_ignores_unknown_attributes(self, sample_dynamodb_item):
+        """Attributes outside the model are not exposed on trusted orders."""
+        sample_dynamodb_item['pdfUrl'] = {'S': 's3://bucket/invoice.pdf'}
+        mock_dynamodb = Mock()
+        mock_dynamodb.get_item.return_value = {'Item': sample_dynamodb_item}
+        dao = OrderDAO(mock_dynamodb, 'test-table', trusted_reads=True)
+
+        order = dao.get_order('tenant_1', 'order_1')
+
+        assert 'pdfUrl' not in order.dict()
+
+    def test_verify_every_validates_sampled_reads(self, sample_dynamodb_item):
+        """Every Nth trusted read is fully validated."""
+        sample_dynamodb_item['customerEmail'] = {'S': 'not-an-email'}
+        mock_dynamodb = Mock()
+        mock_dynamodb.get_item.return_value = {'Item': sample_dynamodb_item}
+        dao = OrderDAO(mock_dynamodb, 'test-table', trusted_reads=True, verify_every=2)
+
+        dao.get_order('tenant_1', 'order_1')
+
+        with pytest.raises(ValidationError):
+            dao.get_order('tenant_1', 'order_1')
+
+
+class TestOrderDAOPageIterator:
+    """Test suite for iterating all tenant orders page by page."""
+
+    def test_iter_pages_follows_pagination(self, sample_dynamodb_item):
+        """Pages are fetched until LastEvaluatedKey is absent."""
+        last_key = {'PK': {'S': 'TENANT#tenant_1'}, 'SK': {'S': 'ORDER#order_1'}}
+        mock_dynamodb = Mock()
+        mock_dynamodb.query.side_effect = [
+            {'Items': [sample_dynamodb_item], 'LastEvaluatedKey': last_key},
+            {'Items': [sample_dynamodb_item, sample_dynamodb_item]},
+        ]
+        dao = OrderDAO(mock_dynamodb, 'test-table')
+
+        pages = list(dao.iter_pages_by_tenant_id('tenant_1', page_size=500))
+
+        assert [len(page) for page in pages] == [1, 2]
+        assert mock_dynamodb.query.call_count == 2
+        assert mock_dynamodb.query.call_args_list[0].kwargs['Limit'] == 500
+        assert mock_dynamodb.query.call_args_list[1].kwargs['ExclusiveStartKey'] == last_key
+
+    def test_iter_pages_empty_tenant(self):
+        """A tenant without orders yields no pages."""
+        mock_dynamodb = Mock()
+        mock_dynamodb.query.return_value = {'Items': []}
+        dao = OrderDAO(mock_dynamodb, 'test-table')
+
+        assert list(dao.iter_pages_by_tenant_id('tenant_1')) == []
+
+
+class TestOrderDAOIndexQueries:
+    """Test suite for date range (GSI1) and status (GSI3) queries."""
+
+    def test_no_filters_queries_base_table(self):
+        """Without filters the base table partition is queried."""
+        mock_dynamodb = Mock()
+        mock_dynamodb.query.return_value = {'Items': []}
+        dao = OrderDAO(mock_dynamodb, 'test-table')
+
+        dao.find_by_tenant_id('tenant_1', 50)
+
+        call_args = mock_dynamodb.query.call_args[1]
+        assert 'IndexName' not in call_args
+        assert call_args['KeyConditionExpression'] == 'PK = :pk AND begins_with(SK, :sk_prefix)'
+
+    def test_date_range_queries_date_index(self, sample_dynamodb_item):
+        """from/to become a BETWEEN key condition on GSI1."""
+        mock_dynamodb = Mock()
+        mock_dynamodb.query.return_value = {'Items': [sample_dynamodb_item]}
+        dao = OrderDAO(mock_dynamodb, 'test-table')
+
+        result = dao.find_by_tenant_id('tenant_1', 50, date_from='2025-12-12', date_to='2025-12-19')
+
+        assert len(result['items']) == 1
+        call_args = mock_dynamodb.query.call_args[1]
+        assert call_args['IndexName'] == 'OrdersByDateIndex'
+        assert call_args['KeyConditionExpression'] == 'GSI1_PK = :pk AND GSI1_SK BETWEEN :from AND :to'
+        assert call_args['ExpressionAttributeValues'] == {
+            ':pk': {'S': 'TENANT#tenant_1'},
+            ':from': {'S': '2025-12-12'},
+            ':to': {'S': '2025-12-19~'}
+        }
+        assert call_args['Limit'] == 50
+        assert call_args['ScanIndexForward'] is False
+
+    def test_date_to_bound_includes_whole_day(self):
+        """A date-only upper bound sorts after every order key on that day."""
+        created_sk = '2025-12-19T23:59:59Z#order_zz'
+
+        assert '2025-12-19' < created_sk < '2025-12-19~'
+        assert '2025-12-20T00:00:00Z#order_aa' > '2025-12-19~'
+
+    def test_date_from_only(self):
+        """An open-ended range uses >= on the sort key."""
+        mock_dynamodb = Mock()
+        mock_dynamodb.query.return_value = {'Items': []}
+        dao = OrderDAO(mock_dynamodb, 'test-table')
+
+        dao.find_by_tenant_id('tenant_1', 50, date_from='2025-12-12')
+
+        call_args = mock_dynamodb.query.call_args[1]
+        assert call_args['KeyConditionExpression'] == 'GSI1_PK = :pk AND GSI1_SK >= :from'
+        assert ':to' not in call_args['ExpressionAttributeValues']
+
+    def test_status_queries_status_index(self):
+        """status selects the status index partition."""
+        mock_dynamodb = Mock()
+        mock_dynamodb.query.return_value = {'Items': []}
+        dao = OrderDAO(mock_dynamodb, 'test-table')
+
+        dao.find_by_tenant_id('tenant_1', 20, date_to='2025-12-19', status='PAID')
+
+        call_args = mock_dynamodb.query.call_args[1]
+        assert call_args['IndexName'] == 'OrdersByStatusIndex'
+        assert call_args['KeyConditionExpression'] == 'GSI3_PK = :pk AND GSI3_SK <= :to'
+        assert call_args['ExpressionAttributeValues'][':pk'] == {'S': 'TENANT#tenant_1#STATUS#PAID'}
+        assert 'FilterExpression' not in call_args
+
+    def test_status_key_is_upper_case(self):
+        """Any case of a status reads the same upper-cased status partition."""
+        mock_dynamodb = Mock()
+        mock_dynamodb.query.return_value = {'Items': []}
+        dao = OrderDAO(mock_dynamodb, 'test-table')
+
+        dao.find_by_tenant_id('tenant_1', 20, status='paid')
+
+        assert mock_dynamodb.query.call_args[1]['ExpressionAttributeValues'][':pk'] == {
+            'S': 'TENANT#tenant_1#STATUS#PAID'
+        }
+
+    def test_index_query_continuation(self):
+        """The pagination token is passed through as ExclusiveStartKey on the index."""
+        start_key = {
+            'PK': {'S': 'TENANT#tenant_1'}, 'SK': {'S': 'ORDER#order_1'},
+            'GSI3_PK': {'S': 'TENANT#tenant_1#STATUS#PAID'}, 'GSI3_SK': {'S': '2025-12-19T10:30:00Z#order_1'}
+        }
+        mock_dynamodb = Mock()
+        mock_dynamodb.query.return_value = {'Items': []}
+        dao = OrderDAO(mock_dynamodb, 'test-table')
+
+        dao.find_by_tenant_id('tenant_1', 50, json.dumps(start_key), status='PAID')
+
+        assert mock_dynamodb.query.call_args[1]['ExclusiveStartKey'] == start_key
@@ -0,0 +1,115 @@
+"""
+Unit tests for OrderExportService.
+
+Tests NDJSON streaming to S3 with a mocked S3 client.
+"""
+import json
+import pytest
+from unittest.mock import Mock
+
+from src.models import Order
+from src.services.order_export_service import OrderExportService, MIN_PART_SIZE
+
+
+def _mock_s3() -> Mock:
+    s3 = Mock()
+    s3.create_multipart_upload.return_value = {'UploadId': 'upload-1'}
+    s3.upload_part.side_effect = lambda **kwargs: {'ETag': f"etag-{kwargs['PartNumber']}"}
+    s3.generate_presigned_url.return_value = 'https://exports.s3.amazonaws.com/presigned'
+    return s3
+
+
+class TestOrderExportService:
+    """Test suite for OrderExportService."""
+
+    def test_small_export_uses_put_object(self, sample_order_data):
+        """Exports smaller than one part are written with a single put_object."""
+        s3 = _mock_s3()
+        service = OrderExportService(s3, 'exports')
+        pages = [[Order(**sample_order_data)], [Order(**sample_order_data)]]
+
+        result = service.export('tenant_1', iter(pages), url_expiry=600)
+
+        assert result['count'] == 2
+        assert result['url'] == 'https://exports.s3.amazonaws.com/presigned'
+        assert result['expiresIn'] == 600
+        assert result['key'].startswith('exports/tenant_1/orders-')
+        assert result['key'].endswith('.ndjson')
+        s3.create_multipart_upload.assert_not_called()
+
+        body = s3.put_object.call_args.kwargs['Body']
+        lines = body.decode('utf-8').splitlines()
+        assert len(lines) == 2
+        assert json.loads(lines[0])['id'] == sample_order_data['id']
+        assert json.loads(lines[0])['total'] == 275.98
+        assert s3.put_object.call_args.kwargs['ContentType'] == 'application/x-ndjson'
+
+    def test_large_export_uses_multipart_upload(self, sample_order_data):
+        """Pages are flushed as multipart parts once the part size is reached."""
+        s3 = _mock_s3()
+        service = OrderExportService(s3, 'exports')
+        order = Order(**sample_order_data)
+        line_size = len(order.json()) + 1
+        orders_per_part = MIN_PART_SIZE // line_size + 1
+        pages = [[order] * orders_per_part, [order] * orders_per_part, [order]]
+
+        result = service.export('tenant_1', iter(pages))
+
+        assert result['count'] == 2 * orders_per_part + 1
+        s3.put_object.assert_not_called()
+        assert s3.upload_part.call_count == 3
+        assert [c.kwargs['PartNumber'] for c in s3.upload_part.call_args_list] == [1, 2, 3]
+        s3.complete_multipart_upload.assert_called_once()
+        parts = s3.complete_multipart_upload.call_args.kwargs['MultipartUpload']['Parts']
+        assert parts == [
+            {'ETag': 'etag-1', 'PartNumber': 1},
+            {'ETag': 'etag-2', 'PartNumber': 2},
+            {'ETag': 'etag-3', 'PartNumber': 3},
+        ]
+
+    def test_export_aborts_multipart_on_error(self, sample_order_data):
+        """A failure after the upload started aborts the multipart upload."""
+        s3 = _mock_s3()
+        service = OrderExportService(s3, 'exports')
+        order = Order(**sample_order_data)
+        orders_per_part = MIN_PART_SIZE // (len(order.json()) + 1) + 1
+
+        def pages():
+            yield [order] * orders_per_part
+            raise Exception('DynamoDB error')
+
+        with pytest.raises(Exception, match='DynamoDB error'):
+            service.export('tenant_1', pages())
+
+        s3.abort_multipart_upload.assert_called_once()
+        s3.complete_multipart_upload.assert_not_called()
+
+    def test_empty_export(self):
+        """A tenant without orders gets an empty export file."""
+        s3 = _mock_s3()
+        service = OrderExportService(s3, 'exports')
+
+        result = service.export('tenant_1', iter([]))
+
+        assert result['count'] == 0
+        assert s3.put_object.call_args.kwargs['Body'] == b''
+
+    def test_part_size_has_s3_minimum(self):
+        """Part size cannot go below the S3 multipart minimum."""
+        service = OrderExportService(Mock(), 'exports', part_size=1024)
+
+        assert service.part_size == MIN_PART_SIZE
+
+    def test_export_to_given_key(self, sample_order_data):
+        """An export started by the handler is written to the key it chose."""
+        s3 = _mock_s3()
+        service = OrderExportService(s3, 'exports')
+        key = 'exports/tenant_1/orders-20251219T103000Z.ndjson'
+
+        result = service.export('tenant_1', iter([[Order(**sample_order_data)]]), key=key)
+
+        assert result['key'] == key
+        assert s3.put_object.call_args.kwargs['Key'] == key
+        s3.generate_presigned_url.assert_called_once_with(
+            'get_object', Params={'Bucket': 'exports', 'Key': key}, ExpiresIn=3600
+        )
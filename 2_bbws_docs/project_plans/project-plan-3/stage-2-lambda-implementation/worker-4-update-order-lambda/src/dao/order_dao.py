@@ -8,15 +8,17 @@ Implements single-table design with the following key structure:
 - GSI1_SK: {dateCreated}#{orderId}
 - GSI2_PK: ORDER#{orderId}
 - GSI2_SK: METADATA
+- GSI3_PK: TENANT#{tenantId}#STATUS#{STATUS} (status upper-cased, as every writer keys it)
+- GSI3_SK: {dateCreated}#{orderId}
 """
 
 import logging
 from datetime import datetime
-from decimal import Decimal
 from typing import Optional, Dict, Any
 
 from botocore.exceptions import ClientError
 
+from src.codec import codec_for
 from src.models.order import Order
 from src.utils.exceptions import (
     OrderNotFoundException,
@@ -26,6 +28,9 @@ from src.utils.exceptions import (
 
 logger = logging.getLogger()
 
+# Compiled once per container (Order, OrderItem, Campaign, BillingAddress, PaymentDetails)
+ORDER_CODEC = codec_for(Order)
+
 
 class OrderDAO:
     """
@@ -130,6 +135,16 @@ class OrderDAO:
                 update_expression_parts.append("#status = :status")
                 expression_attribute_names['#status'] = 'status'
                 expression_attribute_values[':status'] = {'S': updates['status']}
+                # Keep the status index (OrdersByStatusIndex) in step with status: both keys
+                # are written together, GSI3_SK copied from GSI1_SK ({dateCreated}#{orderId}),
+                # so orders written before GSI3 existed are indexed on their first status change.
+                # The key holds the status upper-cased, as the other order writers key it
+                update_expression_parts.append("#gsi3pk = :gsi3pk")
+                update_expression_parts.append("#gsi3sk = #gsi1sk")
+                expression_attribute_names['#gsi3pk'] = 'GSI3_PK'
+                expression_attribute_names['#gsi3sk'] = 'GSI3_SK'
+                expression_attribute_names['#gsi1sk'] = 'GSI1_SK'
+                expression_attribute_values[':gsi3pk'] = {'S': f"TENANT#{tenant_id}#STATUS#{updates['status'].upper()}"}
 
             if 'paymentDetails' in updates:
                 update_expression_parts.append("#paymentDetails = :paymentDetails")
@@ -191,33 +206,7 @@ class OrderDAO:
         Returns:
             Python dictionary
         """
-        result = {}
-
-        for key, value in item.items():
-            # Skip internal keys
-            if key in ['PK', 'SK', 'GSI1_PK', 'GSI1_SK', 'GSI2_PK', 'GSI2_SK']:
-                continue
-
-            result[key] = self._deserialize_value(value)
-
-        return result
-
-    def _deserialize_value(self, value: Dict[str, Any]) -> Any:
-        """Deserialize a single DynamoDB value."""
-        if 'S' in value:
-            return value['S']
-        elif 'N' in value:
-            return Decimal(value['N'])
-        elif 'BOOL' in value:
-            return value['BOOL']
-        elif 'NULL' in value:
-            return None
-        elif 'L' in value:
-            return [self._deserialize_value(v) for v in value['L']]
-        elif 'M' in value:
-            return {k: self._deserialize_value(v) for k, v in value['M'].items()}
-        else:
-            return value
+        return ORDER_CODEC.decode(item)
 
     def _serialize_payment_details(self, payment_details: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -14,12 +14,12 @@ import logging
 import os
 from typing import Dict, Any
 
-import boto3
 from pydantic import ValidationError
 
 from src.dao.order_dao import OrderDAO
 from src.services.order_service import OrderService
 from src.models.requests import UpdateOrderRequest
+from src.utils.aws_clients import get_client
 from src.utils.exceptions import (
     BusinessException,
     OrderNotFoundException,
@@ -33,7 +33,7 @@ from src.utils.logger import configure_logger
 logger = configure_logger(__name__)
 
 # Initialize AWS clients (outside handler for connection reuse)
-dynamodb_client = boto3.client('dynamodb')
+dynamodb_client = get_client('dynamodb')
 table_name = os.environ.get('DYNAMODB_TABLE_NAME', 'bbws-customer-portal-orders-dev')
 
 # Initialize DAO and Service (singleton pattern)
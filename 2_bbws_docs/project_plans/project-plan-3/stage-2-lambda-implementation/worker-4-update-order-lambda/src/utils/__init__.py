@@ -8,6 +8,7 @@ from .exceptions import (
     DatabaseException,
     UnexpectedException
 )
+from .aws_clients import client_metrics, get_client, get_resource
 from .logger import configure_logger
 
 __all__ = [
@@ -18,4 +19,7 @@ __all__ = [
     'DatabaseException',
     'UnexpectedException',
     'configure_logger',
+    'client_metrics',
+    'get_client',
+    'get_resource',
 ]
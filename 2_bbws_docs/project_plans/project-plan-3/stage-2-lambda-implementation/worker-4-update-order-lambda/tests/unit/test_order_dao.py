@@ -162,6 +162,46 @@ class TestOrderDAOUpdateOrder:
 
         mock_dynamodb_client.update_item.assert_called_once()
 
+    def test_update_order_status_moves_status_index_key(self, mock_dynamodb_client):
+        """Test status update rewrites both GSI3 keys so the status index stays current."""
+        mock_dynamodb_client.update_item.side_effect = Exception('stop after request is built')
+        dao = OrderDAO(mock_dynamodb_client, 'test-table')
+
+        with pytest.raises(Exception):
+            dao.update_order(
+                tenant_id='tenant-123',
+                order_id='550e8400-e29b-41d4-a716-446655440000',
+                updates={'status': 'paid'},
+                expected_last_updated='2025-12-30T10:00:00Z',
+                updated_by='user@example.com'
+            )
+
+        call_kwargs = mock_dynamodb_client.update_item.call_args.kwargs
+        assert '#gsi3pk = :gsi3pk' in call_kwargs['UpdateExpression']
+        assert call_kwargs['ExpressionAttributeNames']['#gsi3pk'] == 'GSI3_PK'
+        assert call_kwargs['ExpressionAttributeValues'][':gsi3pk'] == {'S': 'TENANT#tenant-123#STATUS#PAID'}
+        assert '#gsi3sk = #gsi1sk' in call_kwargs['UpdateExpression']
+        assert call_kwargs['ExpressionAttributeNames']['#gsi3sk'] == 'GSI3_SK'
+        assert call_kwargs['ExpressionAttributeNames']['#gsi1sk'] == 'GSI1_SK'
+
+    def test_update_order_without_status_leaves_status_index_keys(self, mock_dynamodb_client):
+        """Test updates that do not change status do not touch the GSI3 keys."""
+        mock_dynamodb_client.update_item.side_effect = Exception('stop after request is built')
+        dao = OrderDAO(mock_dynamodb_client, 'test-table')
+
+        with pytest.raises(Exception):
+            dao.update_order(
+                tenant_id='tenant-123',
+                order_id='550e8400-e29b-41d4-a716-446655440000',
+                updates={'paymentDetails': {'paymentId': 'pay-1'}},
+                expected_last_updated='2025-12-30T10:00:00Z',
+                updated_by='user@example.com'
+            )
+
+        call_kwargs = mock_dynamodb_client.update_item.call_args.kwargs
+        assert 'GSI3_PK' not in call_kwargs['ExpressionAttributeNames'].values()
+        assert 'GSI3_SK' not in call_kwargs['ExpressionAttributeNames'].values()
+
     def test_update_order_with_payment_details(self, mock_dynamodb_client, sample_order):
         """Test order update with payment details."""
         payment_details = {
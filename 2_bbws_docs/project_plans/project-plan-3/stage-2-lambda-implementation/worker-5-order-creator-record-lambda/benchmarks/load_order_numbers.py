@@ -0,0 +1,155 @@
+"""
+Load test: order-number allocation throughput vs. concurrent writers.
+
+Runs against DynamoDB Local (or any DynamoDB endpoint) and compares:
+
+- legacy: one update_item per order on the global PK=COUNTER item
+- block:  OrderNumberAllocator, per-tenant counter, blocks of --block-size
+
+Each writer thread has its own client and allocator, like one warm Lambda
+container. Every run checks that no order number was handed out twice.
+
+DynamoDB Local does not model per-partition throughput limits, so locally the
+gain comes from fewer round trips; on DynamoDB the legacy variant additionally
+throttles once the single COUNTER partition exceeds ~1000 writes/s.
+
+Usage (from the worker directory, DynamoDB Local on port 8000):
+    docker run -p 8000:8000 amazon/dynamodb-local
+    python -m benchmarks.load_order_numbers --writers 1,2,4,8,16 --orders 200
+"""
+import argparse
+import statistics
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Dict, List
+
+import boto3
+
+from src.dao.order_number_allocator import OrderNumberAllocator
+
+
+def create_client(endpoint_url: str):
+    """DynamoDB client for the load test endpoint."""
+    return boto3.client(
+        'dynamodb',
+        endpoint_url=endpoint_url,
+        region_name='af-south-1',
+        aws_access_key_id='local',
+        aws_secret_access_key='local'
+    )
+
+
+def ensure_table(client, table_name: str) -> None:
+    """Create the (PK, SK) test table if it does not exist."""
+    if table_name in client.list_tables()['TableNames']:
+        return
+    client.create_table(
+        TableName=table_name,
+        KeySchema=[
+            {'AttributeName': 'PK', 'KeyType': 'HASH'},
+            {'AttributeName': 'SK', 'KeyType': 'RANGE'}
+        ],
+        AttributeDefinitions=[
+            {'AttributeName': 'PK', 'AttributeType': 'S'},
+            {'AttributeName': 'SK', 'AttributeType': 'S'}
+        ],
+        BillingMode='PAY_PER_REQUEST'
+    )
+    client.get_waiter('table_exists').wait(TableName=table_name)
+
+
+def legacy_allocator(client, table_name: str) -> Callable[[str], str]:
+    """Allocator as previously implemented in OrderDAO.get_next_order_number."""
+    def next_order_number(tenant_id: str) -> str:
+        date_prefix = datetime.utcnow().strftime('%Y%m%d')
+        response = client.update_item(
+            TableName=table_name,
+            Key={
+                'PK': {'S': 'COUNTER'},
+                'SK': {'S': f'ORDER_NUMBER#{tenant_id}#{date_prefix}'}
+            },
+            UpdateExpression='SET #counter = if_not_exists(#counter, :start) + :increment',
+            ExpressionAttributeNames={'#counter': 'counter'},
+            ExpressionAttributeValues={':start': {'N': '0'}, ':increment': {'N': '1'}},
+            ReturnValues='UPDATED_NEW'
+        )
+        return f"ORD-{date_prefix}-{int(response['Attributes']['counter']['N']):05d}"
+    return next_order_number
+
+
+def run(args, variant: str, writers: int, run_id: int) -> Dict[str, float]:
+    """Run one variant with N concurrent writers and return its metrics."""
+    tenants = [f'tenant_load_{run_id}_{t}' for t in range(args.tenants)]
+    latencies: List[float] = []
+    numbers: List[str] = []
+    lock = threading.Lock()
+    barrier = threading.Barrier(writers + 1)
+
+    def writer(index: int) -> None:
+        client = create_client(args.endpoint_url)
+        if variant == 'legacy':
+            allocate = legacy_allocator(client, args.table)
+        else:
+            allocate = OrderNumberAllocator(
+                client, args.table, args.block_size, legacy_counter_pk=None
+            ).next_order_number
+        local_latencies, local_numbers = [], []
+        barrier.wait()
+        for i in range(args.orders):
+            tenant_id = tenants[(index + i) % len(tenants)]
+            start = time.perf_counter()
+            number = allocate(tenant_id)
+            local_latencies.append((time.perf_counter() - start) * 1000)
+            local_numbers.append(f'{tenant_id}/{number}')
+        with lock:
+            latencies.extend(local_latencies)
+            numbers.extend(local_numbers)
+
+    threads = [threading.Thread(target=writer, args=(i,)) for i in range(writers)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    duplicates = len(numbers) - len(set(numbers))
+    if duplicates:
+        raise AssertionError(f'{variant}: {duplicates} duplicate order numbers with {writers} writers')
+
+    latencies.sort()
+    return {
+        'throughput': len(numbers) / elapsed,
+        'p50': statistics.median(latencies),
+        'p99': latencies[max(int(len(latencies) * 0.99) - 1, 0)]
+    }
+
+
+def main() -> None:
+    """Run every variant for each writer count and print a summary table."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--endpoint-url', default='http://localhost:8000', help='DynamoDB endpoint')
+    parser.add_argument('--table', default='bbws-order-number-loadtest', help='Table name (created if missing)')
+    parser.add_argument('--writers', default='1,2,4,8,16', help='Comma-separated concurrent writer counts')
+    parser.add_argument('--orders', type=int, default=200, help='Order numbers per writer (default 200)')
+    parser.add_argument('--tenants', type=int, default=1, help='Tenants spread across writers (default 1)')
+    parser.add_argument('--block-size', type=int, default=50, help='Allocator block size (default 50)')
+    args = parser.parse_args()
+
+    ensure_table(create_client(args.endpoint_url), args.table)
+
+    print(f"{args.orders} order numbers per writer, {args.tenants} tenant(s), block size {args.block_size}")
+    print(f"{'variant':<8}{'writers':>8}{'orders/s':>12}{'p50 ms':>10}{'p99 ms':>10}")
+    run_id = int(time.time())
+    for writers in [int(w) for w in args.writers.split(',')]:
+        for variant in ('legacy', 'block'):
+            run_id += 1
+            result = run(args, variant, writers, run_id)
+            print(f"{variant:<8}{writers:>8}{result['throughput']:>12.0f}"
+                  f"{result['p50']:>10.3f}{result['p99']:>10.3f}")
+
+
+if __name__ == '__main__':
+    main()
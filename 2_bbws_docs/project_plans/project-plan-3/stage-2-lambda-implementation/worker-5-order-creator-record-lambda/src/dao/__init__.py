@@ -3,5 +3,6 @@ Data Access Objects for Order Lambda service.
 """
 
 from .order_dao import OrderDAO
+from .order_number_allocator import OrderNumberAllocator
 
-__all__ = ['OrderDAO']
+__all__ = ['OrderDAO', 'OrderNumberAllocator']
@@ -3,15 +3,22 @@ Order Data Access Object for DynamoDB operations.
 """
 
 import logging
-from typing import Optional
-from datetime import datetime
+from typing import List, Optional
 
 from botocore.exceptions import ClientError
 
+from ..codec import codec_for, int_or_float
 from ..models.order import Order
+from .order_number_allocator import OrderNumberAllocator
 
 logger = logging.getLogger()
 
+# Orders per TransactWriteItems call (DynamoDB allows up to 100 actions / 4 MB)
+TRANSACT_CHUNK_SIZE = 25
+
+# Compiled once per container; Order amounts are floats in this service
+ORDER_CODEC = codec_for(Order, number=int_or_float)
+
 
 class OrderDAO:
     """
@@ -22,25 +29,25 @@ class OrderDAO:
     - AP2: List all orders for a tenant (PK query)
     - AP3: List orders by date (GSI1 query)
     - AP4: Get order by ID (GSI2 query)
-    - AP5: List orders by status (PK query + filter)
+    - AP5: List orders by status and date (GSI3 query, OrdersByStatusIndex)
 
     Attributes:
         dynamodb_client: Boto3 DynamoDB client
         table_name: DynamoDB table name
     """
 
-    def __init__(self, dynamodb_client, table_name: str):
+    def __init__(self, dynamodb_client, table_name: str, order_number_block_size: int = 1):
         """
         Initialize OrderDAO.
 
         Args:
             dynamodb_client: Boto3 DynamoDB client
             table_name: DynamoDB table name
+            order_number_block_size: Order numbers reserved per counter update
         """
         self.dynamodb = dynamodb_client
         self.table_name = table_name
-        self.counter_pk = "COUNTER"
-        self.counter_sk = "ORDER_NUMBER"
+        self.order_numbers = OrderNumberAllocator(dynamodb_client, table_name, order_number_block_size)
 
     def create_order(self, order: Order) -> Order:
         """
@@ -78,12 +85,107 @@ class OrderDAO:
                 logger.error(f"Failed to create order: {str(e)}")
                 raise
 
+    def create_orders(self, orders: List[Order]) -> List[Optional[Exception]]:
+        """
+        Create a batch of orders with TransactWriteItems.
+
+        Each order keeps the create_order guard (attribute_not_exists on PK/SK).
+        Orders are written in chunks of TRANSACT_CHUNK_SIZE; when a transaction
+        is cancelled, orders that already exist are reported as duplicates and
+        the remaining orders of the chunk are written again.
+
+        Args:
+            orders: Order objects to create
+
+        Returns:
+            One entry per order: None if created, ValueError if the order already
+            exists, or the exception that prevented the write
+        """
+        results: List[Optional[Exception]] = [None] * len(orders)
+        seen = set()
+        pending = []
+
+        for index, order in enumerate(orders):
+            # A transaction may not touch the same item twice (SQS redelivery in one batch)
+            key = (order.tenantId, order.id)
+            if key in seen:
+                results[index] = ValueError(f"Order with ID {order.id} already exists")
+                continue
+            seen.add(key)
+            pending.append(index)
+
+        for start in range(0, len(pending), TRANSACT_CHUNK_SIZE):
+            self._transact_create(orders, pending[start:start + TRANSACT_CHUNK_SIZE], results)
+
+        return results
+
+    def _transact_create(
+        self,
+        orders: List[Order],
+        indexes: List[int],
+        results: List[Optional[Exception]]
+    ) -> None:
+        """
+        Write one chunk of orders in a transaction, recording per-order results.
+
+        Args:
+            orders: All orders of the batch
+            indexes: Positions in orders to write in this transaction
+            results: Per-order results, updated in place
+        """
+        while indexes:
+            try:
+                self.dynamodb.transact_write_items(
+                    TransactItems=[
+                        {
+                            'Put': {
+                                'TableName': self.table_name,
+                                'Item': self._serialize_item(orders[i].to_dynamodb_item()),
+                                'ConditionExpression': 'attribute_not_exists(PK) AND attribute_not_exists(SK)'
+                            }
+                        }
+                        for i in indexes
+                    ]
+                )
+                logger.info(f"Created {len(indexes)} orders in one transaction")
+                return
+
+            except ClientError as e:
+                if e.response['Error']['Code'] != 'TransactionCanceledException':
+                    logger.error(f"Failed to create orders: {str(e)}")
+                    for i in indexes:
+                        results[i] = e
+                    return
+
+                reasons = e.response.get('CancellationReasons', [])
+                retry = []
+                for i, reason in zip(indexes, reasons):
+                    code = reason.get('Code', 'None')
+                    if code == 'None':
+                        retry.append(i)
+                    elif code == 'ConditionalCheckFailed':
+                        logger.error(f"Order already exists: {orders[i].id}")
+                        results[i] = ValueError(f"Order with ID {orders[i].id} already exists")
+                    else:
+                        logger.error(f"Failed to create order {orders[i].id}: {code}")
+                        results[i] = e
+
+                if len(retry) == len(indexes) or len(reasons) != len(indexes):
+                    # No order to blame; fail the chunk so SQS retries it
+                    logger.error(f"Failed to create orders: {str(e)}")
+                    for i in indexes:
+                        results[i] = e
+                    return
+
+                indexes = retry
+
     def get_next_order_number(self, tenant_id: str) -> str:
         """
-        Generate next order number using atomic counter pattern.
+        Generate next order number from the tenant's block-reserved counter.
 
-        This uses DynamoDB's atomic counter to ensure unique sequential order numbers
-        per tenant. Format: ORD-{YYYYMMDD}-{sequence}
+        Sequence numbers are reserved in blocks on a per-tenant counter item
+        (see OrderNumberAllocator), so most calls need no DynamoDB round trip.
+        Format: ORD-{YYYYMMDD}-{sequence}
 
         Args:
             tenant_id: Tenant identifier
@@ -94,43 +196,31 @@ class OrderDAO:
         Raises:
             ClientError: If DynamoDB operation fails
         """
-        try:
-            # Generate date prefix
-            date_prefix = datetime.utcnow().strftime('%Y%m%d')
+        order_number = self.order_numbers.next_order_number(tenant_id)
 
-            # Atomic counter key
-            counter_sk = f"{self.counter_sk}#{tenant_id}#{date_prefix}"
+        logger.info(f"Generated order number: {order_number} for tenant: {tenant_id}")
+        return order_number
 
-            # Update counter atomically
-            response = self.dynamodb.update_item(
-                TableName=self.table_name,
-                Key={
-                    'PK': {'S': self.counter_pk},
-                    'SK': {'S': counter_sk}
-                },
-                UpdateExpression='SET #counter = if_not_exists(#counter, :start) + :increment',
-                ExpressionAttributeNames={
-                    '#counter': 'counter'
-                },
-                ExpressionAttributeValues={
-                    ':start': {'N': '0'},
-                    ':increment': {'N': '1'}
-                },
-                ReturnValues='UPDATED_NEW'
-            )
+    def get_next_order_numbers(self, tenant_id: str, count: int) -> List[str]:
+        """
+        Generate order numbers for a batch of orders of one tenant.
 
-            # Extract counter value
-            counter_value = int(response['Attributes']['counter']['N'])
+        Needs at most one counter update for the whole batch.
 
-            # Format order number: ORD-YYYYMMDD-NNNNN
-            order_number = f"ORD-{date_prefix}-{counter_value:05d}"
+        Args:
+            tenant_id: Tenant identifier
+            count: Number of order numbers needed
 
-            logger.info(f"Generated order number: {order_number} for tenant: {tenant_id}")
-            return order_number
+        Returns:
+            Increasing order number strings
 
-        except ClientError as e:
-            logger.error(f"Failed to generate order number: {str(e)}")
-            raise
+        Raises:
+            ClientError: If DynamoDB operation fails
+        """
+        order_numbers = self.order_numbers.next_order_numbers(tenant_id, count)
+
+        logger.info(f"Generated {count} order numbers for tenant: {tenant_id}")
+        return order_numbers
 
     def get_order(self, tenant_id: str, order_id: str) -> Optional[Order]:
         """
@@ -180,51 +270,7 @@ class OrderDAO:
         Returns:
             DynamoDB formatted dictionary
         """
-        serialized = {}
-
-        for key, value in item.items():
-            if value is None:
-                serialized[key] = {'NULL': True}
-            elif isinstance(value, str):
-                serialized[key] = {'S': value}
-            elif isinstance(value, bool):
-                serialized[key] = {'BOOL': value}
-            elif isinstance(value, (int, float)):
-                serialized[key] = {'N': str(value)}
-            elif isinstance(value, list):
-                serialized[key] = {'L': [self._serialize_value(v) for v in value]}
-            elif isinstance(value, dict):
-                serialized[key] = {'M': self._serialize_item(value)}
-            else:
-                # Default to string
-                serialized[key] = {'S': str(value)}
-
-        return serialized
-
-    def _serialize_value(self, value):
-        """
-        Serialize a single value to DynamoDB format.
-
-        Args:
-            value: Value to serialize
-
-        Returns:
-            DynamoDB formatted value
-        """
-        if value is None:
-            return {'NULL': True}
-        elif isinstance(value, str):
-            return {'S': value}
-        elif isinstance(value, bool):
-            return {'BOOL': value}
-        elif isinstance(value, (int, float)):
-            return {'N': str(value)}
-        elif isinstance(value, list):
-            return {'L': [self._serialize_value(v) for v in value]}
-        elif isinstance(value, dict):
-            return {'M': self._serialize_item(value)}
-        else:
-            return {'S': str(value)}
+        return ORDER_CODEC.encode(item)
 
     def _deserialize_item(self, item: dict) -> dict:
         """
@@ -236,51 +282,4 @@ class OrderDAO:
         Returns:
             Python dictionary
         """
-        deserialized = {}
-
-        for key, value in item.items():
-            if 'S' in value:
-                deserialized[key] = value['S']
-            elif 'N' in value:
-                # Try int first, fall back to float
-                try:
-                    deserialized[key] = int(value['N'])
-                except ValueError:
-                    deserialized[key] = float(value['N'])
-            elif 'BOOL' in value:
-                deserialized[key] = value['BOOL']
-            elif 'NULL' in value:
-                deserialized[key] = None
-            elif 'L' in value:
-                deserialized[key] = [self._deserialize_value(v) for v in value['L']]
-            elif 'M' in value:
-                deserialized[key] = self._deserialize_item(value['M'])
-
-        return deserialized
-
-    def _deserialize_value(self, value: dict):
-        """
-        Deserialize a single DynamoDB value.
-
-        Args:
-            value: DynamoDB formatted value
-
-        Returns:
-            Python value
-        """
-        if 'S' in value:
-            return value['S']
-        elif 'N' in value:
-            try:
-                return int(value['N'])
-            except ValueError:
-                return float(value['N'])
-        elif 'BOOL' in value:
-            return value['BOOL']
-        elif 'NULL' in value:
-            return None
-        elif 'L' in value:
-            return [self._deserialize_value(v) for v in value['L']]
-        elif 'M' in value:
-            return self._deserialize_item(value['M'])
-        return None
+        return ORDER_CODEC.decode(item)
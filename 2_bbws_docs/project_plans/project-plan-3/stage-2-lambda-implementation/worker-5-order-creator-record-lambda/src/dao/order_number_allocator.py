@@ -0,0 +1,182 @@
+"""
+Order number allocator backed by per-tenant DynamoDB counters.
+
+Reserves blocks of sequence numbers with one atomic update and hands them out
+from the warm Lambda container, instead of one update_item per order against
+a single global COUNTER partition.
+"""
+
+import logging
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from botocore.exceptions import ClientError
+
+logger = logging.getLogger()
+
+# Counter that held every tenant's daily sequence before per-tenant counters
+LEGACY_COUNTER_PK = "COUNTER"
+
+
+class OrderNumberAllocator:
+    """
+    Allocates ORD-{YYYYMMDD}-{NNNNN} order numbers per tenant and day.
+
+    Counter item: PK=COUNTER#TENANT#{tenantId}, SK=ORDER_NUMBER#{YYYYMMDD}.
+    Each reservation adds block_size (or a whole batch, if larger) to the
+    counter and owns the returned range, so numbers are unique across containers and increase within a
+    container. Numbers of a block not used before the container is recycled
+    are skipped (gaps are allowed, duplicates are not).
+
+    Attributes:
+        dynamodb: Boto3 DynamoDB client
+        table_name: DynamoDB table name
+        block_size: Sequence numbers reserved per DynamoDB update
+    """
+
+    def __init__(
+        self,
+        dynamodb_client,
+        table_name: str,
+        block_size: int = 50,
+        legacy_counter_pk: Optional[str] = LEGACY_COUNTER_PK
+    ):
+        """
+        Initialize OrderNumberAllocator.
+
+        Args:
+            dynamodb_client: Boto3 DynamoDB client
+            table_name: DynamoDB table name
+            block_size: Sequence numbers reserved per update (1 = no batching)
+            legacy_counter_pk: PK of the pre-sharding counter used to seed a new
+                tenant/day counter so numbers already issued that day are not
+                reused (None to disable)
+        """
+        if block_size < 1:
+            raise ValueError("block_size must be at least 1")
+
+        self.dynamodb = dynamodb_client
+        self.table_name = table_name
+        self.block_size = block_size
+        self.legacy_counter_pk = legacy_counter_pk
+        # (tenant_id, date_prefix) -> [next, last] of the reserved block
+        self._blocks: Dict[Tuple[str, str], list] = {}
+        self._lock = threading.Lock()
+
+    def next_order_number(self, tenant_id: str) -> str:
+        """
+        Return the next order number for a tenant.
+
+        Args:
+            tenant_id: Tenant identifier
+
+        Returns:
+            Order number string (e.g., "ORD-20251230-00001")
+
+        Raises:
+            ClientError: If DynamoDB operation fails
+        """
+        return self.next_order_numbers(tenant_id, 1)[0]
+
+    def next_order_numbers(self, tenant_id: str, count: int) -> List[str]:
+        """
+        Return the next count order numbers for a tenant.
+
+        Uses what is left of the container's block and reserves at most one
+        new block (of at least count numbers) for the remainder.
+
+        Args:
+            tenant_id: Tenant identifier
+            count: Number of order numbers needed
+
+        Returns:
+            Increasing order number strings
+
+        Raises:
+            ClientError: If DynamoDB operation fails
+        """
+        date_prefix = datetime.utcnow().strftime('%Y%m%d')
+        key = (tenant_id, date_prefix)
+        sequences: List[int] = []
+
+        with self._lock:
+            block = self._blocks.get(key)
+            if block is not None:
+                taken = min(count, block[1] - block[0] + 1)
+                sequences.extend(range(block[0], block[0] + taken))
+                block[0] += taken
+
+            missing = count - len(sequences)
+            if missing:
+                block = self._reserve_block(tenant_id, date_prefix, max(self.block_size, missing))
+                # Blocks for previous days are never used again
+                self._blocks = {k: v for k, v in self._blocks.items() if k[1] == date_prefix}
+                self._blocks[key] = block
+                sequences.extend(range(block[0], block[0] + missing))
+                block[0] += missing
+
+        return [f"ORD-{date_prefix}-{sequence:05d}" for sequence in sequences]
+
+    def _reserve_block(self, tenant_id: str, date_prefix: str, size: int) -> list:
+        """
+        Atomically reserve the next size numbers for a tenant and day.
+
+        Args:
+            tenant_id: Tenant identifier
+            date_prefix: Date as YYYYMMDD
+            size: Numbers to reserve
+
+        Returns:
+            [first, last] sequence numbers of the reserved block
+        """
+        start = self._legacy_counter(tenant_id, date_prefix)
+
+        try:
+            response = self.dynamodb.update_item(
+                TableName=self.table_name,
+                Key={
+                    'PK': {'S': f'COUNTER#TENANT#{tenant_id}'},
+                    'SK': {'S': f'ORDER_NUMBER#{date_prefix}'}
+                },
+                UpdateExpression='SET #counter = if_not_exists(#counter, :start) + :block',
+                ExpressionAttributeNames={
+                    '#counter': 'counter'
+                },
+                ExpressionAttributeValues={
+                    ':start': {'N': str(start)},
+                    ':block': {'N': str(size)}
+                },
+                ReturnValues='UPDATED_NEW'
+            )
+        except ClientError as e:
+            logger.error(f"Failed to reserve order numbers for tenant {tenant_id}: {str(e)}")
+            raise
+
+        last = int(response['Attributes']['counter']['N'])
+        first = last - size + 1
+
+        logger.info(f"Reserved order numbers {first}-{last} for tenant: {tenant_id}, date: {date_prefix}")
+        return [first, last]
+
+    def _legacy_counter(self, tenant_id: str, date_prefix: str) -> int:
+        """
+        Read the legacy global counter for a tenant and day (0 if absent).
+
+        Only used as the initial value of a new per-tenant counter, so it is
+        read once per tenant/day per container.
+        """
+        if self.legacy_counter_pk is None or (tenant_id, date_prefix) in self._blocks:
+            return 0
+
+        response = self.dynamodb.get_item(
+            TableName=self.table_name,
+            Key={
+                'PK': {'S': self.legacy_counter_pk},
+                'SK': {'S': f'ORDER_NUMBER#{tenant_id}#{date_prefix}'}
+            },
+            ProjectionExpression='#counter',
+            ExpressionAttributeNames={'#counter': 'counter'}
+        )
+        item = response.get('Item')
+        return int(item['counter']['N']) if item else 0
@@ -11,11 +11,11 @@ Target: DynamoDB (bbws-customer-portal-orders-{env})
 import json
 import logging
 import os
-from typing import Dict, Any, List
+from collections import Counter
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 import uuid
 
-import boto3
 from pydantic import ValidationError
 
 from ..dao.order_dao import OrderDAO
@@ -25,19 +25,31 @@ from ..models.order_item import OrderItem
 from ..models.campaign import Campaign
 from ..models.billing_address import BillingAddress
 from ..models.payment_details import PaymentDetails
+from ..utils.aws_clients import get_client
+from ..utils.sqs_batch_runner import SQSBatchRunner
 
 # Configure logging
 logger = logging.getLogger()
 logger.setLevel(os.environ.get('LOG_LEVEL', 'INFO'))
 
 # Initialize AWS clients (outside handler for connection reuse)
-dynamodb_client = boto3.client('dynamodb')
+dynamodb_client = get_client('dynamodb')
 table_name = os.environ.get('DYNAMODB_TABLE_NAME', 'bbws-customer-portal-orders-dev')
 
+# Order numbers are reserved in blocks per tenant and handed out from this container
+order_number_block_size = int(os.environ.get('ORDER_NUMBER_BLOCK_SIZE', '50'))
+
+# Write each SQS batch with one order-number allocation and TransactWriteItems
+# ('false' processes records one at a time)
+batch_write_mode = os.environ.get('BATCH_WRITE_MODE', 'true').lower() == 'true'
+
 # Initialize DAO and Services
-order_dao = OrderDAO(dynamodb_client, table_name)
+order_dao = OrderDAO(dynamodb_client, table_name, order_number_block_size)
 cart_service = CartService(cart_api_url=os.environ.get('CART_LAMBDA_API_URL'))
 
+# Records of a batch are processed concurrently (SQS_BATCH_MAX_WORKERS, SQS_RECORD_TIMEOUT_SECONDS)
+batch_runner = SQSBatchRunner.from_env()
+
 
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
@@ -72,12 +84,123 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     logger.info(f"Processing SQS batch with {len(event.get('Records', []))} messages")
 
-    batch_item_failures = []
+    records = event.get('Records', [])
+    if batch_write_mode:
+        batch_item_failures = process_batch(records, context)
+    else:
+        batch_item_failures = process_records_individually(records, context)
+
+    # Log summary
+    total_messages = len(records)
+    failed_messages = len(batch_item_failures)
+    successful_messages = total_messages - failed_messages
+
+    logger.info(
+        f"Batch processing complete. "
+        f"Total: {total_messages}, "
+        f"Successful: {successful_messages}, "
+        f"Failed: {failed_messages}"
+    )
 
-    # Process each message in the batch
-    for record in event.get('Records', []):
+    # Return partial batch failures for SQS retry
+    return {"batchItemFailures": batch_item_failures}
+
+
+def process_batch(records: List[Dict[str, Any]], context: Any = None) -> List[Dict[str, str]]:
+    """
+    Create the orders of an SQS batch with batched DynamoDB writes.
+
+    Steps:
+    1. Parse and validate every message and fetch its cart (concurrently)
+    2. Allocate order numbers per tenant for the whole batch
+    3. Build Order objects
+    4. Write all orders with TransactWriteItems (OrderDAO.create_orders)
+
+    DynamoDB round trips per batch drop from one counter update and one
+    put_item per message to about one transaction (plus a counter update
+    when a tenant's reserved block runs out).
+
+    Args:
+        records: SQS records
+        context: Lambda context (used for the invocation deadline)
+
+    Returns:
+        batchItemFailures entries for records that should be retried
+    """
+    # 1. Validate messages and fetch carts
+    # message_id -> (message_body, cart_data); written from the runner's threads
+    prepared_by_id: Dict[str, Tuple[Dict[str, Any], Dict[str, Any]]] = {}
+
+    def prepare_record(record: Dict[str, Any]) -> None:
+        message_id = record.get('messageId')
+        try:
+            message_body = json.loads(record['body'])
+            logger.info(f"Processing message {message_id}: orderId={message_body.get('orderId')}")
+            prepared_by_id[message_id] = (message_body, prepare_order_message(message_body))
+        except Exception as e:
+            if _is_retryable(message_id, e):
+                raise
+
+    batch_item_failures = batch_runner.run(records, prepare_record, context)
+
+    # Keep record order; records the runner gave up on are already in batch_item_failures
+    failed_ids = {failure['itemIdentifier'] for failure in batch_item_failures}
+    prepared: List[Tuple[str, Dict[str, Any], Dict[str, Any]]] = [
+        (record.get('messageId'), *prepared_by_id[record.get('messageId')])
+        for record in records
+        if record.get('messageId') in prepared_by_id and record.get('messageId') not in failed_ids
+    ]
+
+    # 2. Allocate order numbers, one call per tenant
+    order_numbers: Dict[str, Any] = {}
+    allocation_errors: Dict[str, Exception] = {}
+    for tenant_id, count in Counter(message['tenantId'] for _, message, _ in prepared).items():
+        try:
+            order_numbers[tenant_id] = iter(order_dao.get_next_order_numbers(tenant_id, count))
+        except Exception as e:
+            allocation_errors[tenant_id] = e
+
+    # 3. Build orders
+    built: List[Tuple[str, Order]] = []
+    for message_id, message_body, cart_data in prepared:
+        tenant_id = message_body['tenantId']
+        try:
+            if tenant_id in allocation_errors:
+                raise allocation_errors[tenant_id]
+            order = build_order(message_body, cart_data, next(order_numbers[tenant_id]))
+            built.append((message_id, order))
+        except Exception as e:
+            if _is_retryable(message_id, e):
+                batch_item_failures.append({"itemIdentifier": message_id})
+
+    # 4. Write orders in transactions
+    results = order_dao.create_orders([order for _, order in built]) if built else []
+    for (message_id, order), error in zip(built, results):
+        if error is None:
+            logger.info(
+                f"Successfully created order: {order.id} "
+                f"(orderNumber: {order.orderNumber}) "
+                f"for tenant: {order.tenantId}"
+            )
+        elif _is_retryable(message_id, error):
+            batch_item_failures.append({"itemIdentifier": message_id})
+
+    return batch_item_failures
+
+
+def process_records_individually(records: List[Dict[str, Any]], context: Any = None) -> List[Dict[str, str]]:
+    """
+    Create the orders of an SQS batch record by record (concurrently).
+
+    Args:
+        records: SQS records
+        context: Lambda context (used for the invocation deadline)
+
+    Returns:
+        batchItemFailures entries for records that should be retried
+    """
+    def process_record(record: Dict[str, Any]) -> None:
         message_id = record.get('messageId')
-        receipt_handle = record.get('receiptHandle')
 
         try:
             # Parse SQS message body
@@ -96,50 +219,42 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 f"for tenant: {created_order.tenantId}"
             )
 
-        except ValidationError as e:
-            # Pydantic validation error - invalid message format
-            logger.error(
-                f"Validation error for message {message_id}: {str(e)}",
-                exc_info=True
-            )
-            # Add to failures for retry
-            batch_item_failures.append({"itemIdentifier": message_id})
+        except Exception as e:
+            if _is_retryable(message_id, e):
+                raise
 
-        except ValueError as e:
-            # Business logic error (e.g., duplicate order)
-            logger.error(
-                f"Business logic error for message {message_id}: {str(e)}",
-                exc_info=True
-            )
-            # If duplicate, don't retry (idempotent)
-            if "already exists" in str(e):
-                logger.warning(f"Order already exists, skipping retry for message {message_id}")
-            else:
-                # Other business errors should retry
-                batch_item_failures.append({"itemIdentifier": message_id})
+    return batch_runner.run(records, process_record, context)
 
-        except Exception as e:
-            # Unexpected error - add to failures for retry
-            logger.error(
-                f"Unexpected error processing message {message_id}: {str(e)}",
-                exc_info=True
-            )
-            batch_item_failures.append({"itemIdentifier": message_id})
 
-    # Log summary
-    total_messages = len(event.get('Records', []))
-    failed_messages = len(batch_item_failures)
-    successful_messages = total_messages - failed_messages
+def _is_retryable(message_id: Optional[str], error: Exception) -> bool:
+    """
+    Log a per-record error and decide whether SQS should retry the record.
 
-    logger.info(
-        f"Batch processing complete. "
-        f"Total: {total_messages}, "
-        f"Successful: {successful_messages}, "
-        f"Failed: {failed_messages}"
-    )
+    Args:
+        message_id: SQS message ID
+        error: Exception raised for the record
 
-    # Return partial batch failures for SQS retry
-    return {"batchItemFailures": batch_item_failures}
+    Returns:
+        True if the record belongs in batchItemFailures
+    """
+    if isinstance(error, ValidationError):
+        # Pydantic validation error - invalid message format
+        logger.error(f"Validation error for message {message_id}: {str(error)}", exc_info=error)
+        return True
+
+    if isinstance(error, ValueError):
+        # Business logic error (e.g., duplicate order)
+        logger.error(f"Business logic error for message {message_id}: {str(error)}", exc_info=error)
+        # If duplicate, don't retry (idempotent)
+        if "already exists" in str(error):
+            logger.warning(f"Order already exists, skipping retry for message {message_id}")
+            return False
+        # Other business errors should retry
+        return True
+
+    # Unexpected error - add to failures for retry
+    logger.error(f"Unexpected error processing message {message_id}: {str(error)}", exc_info=error)
+    return True
 
 
 def process_order_message(message: Dict[str, Any]) -> Order:
@@ -163,14 +278,35 @@ def process_order_message(message: Dict[str, Any]) -> Order:
         ValidationError: If message data is invalid
         ValueError: If business logic validation fails
     """
+    cart_data = prepare_order_message(message)
+
+    # Generate order number from the tenant's reserved block (atomic counter)
+    order_number = order_dao.get_next_order_number(message['tenantId'])
+
+    logger.info(f"Generated order number: {order_number}")
+
+    return build_order(message, cart_data, order_number)
+
+
+def prepare_order_message(message: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Validate an order message and fetch its cart.
+
+    Args:
+        message: SQS message body
+
+    Returns:
+        Cart data for the order
+
+    Raises:
+        ValueError: If required fields are missing or the cart is invalid
+    """
     # Extract required fields
     order_id = message.get('orderId')
     tenant_id = message.get('tenantId')
     customer_email = message.get('customerEmail')
     cart_id = message.get('cartId')
-    campaign_code = message.get('campaignCode')  # Optional
     billing_address_data = message.get('billingAddress')
-    payment_method = message.get('paymentMethod', 'payfast')
 
     # Validate required fields
     if not all([order_id, tenant_id, customer_email, cart_id, billing_address_data]):
@@ -189,10 +325,30 @@ def process_order_message(message: Dict[str, Any]) -> Order:
 
     logger.info(f"Cart fetched: {len(cart_data['items'])} items, total: {cart_data['total']}")
 
-    # Generate order number using atomic counter
-    order_number = order_dao.get_next_order_number(tenant_id)
+    return cart_data
 
-    logger.info(f"Generated order number: {order_number}")
+
+def build_order(message: Dict[str, Any], cart_data: Dict[str, Any], order_number: str) -> Order:
+    """
+    Create the Order object for a validated message.
+
+    Args:
+        message: SQS message body
+        cart_data: Cart data from prepare_order_message
+        order_number: Allocated order number
+
+    Returns:
+        Order object ready for DynamoDB
+
+    Raises:
+        ValidationError: If order data is invalid
+    """
+    order_id = message['orderId']
+    tenant_id = message['tenantId']
+    customer_email = message['customerEmail']
+    campaign_code = message.get('campaignCode')  # Optional
+    billing_address_data = message['billingAddress']
+    payment_method = message.get('paymentMethod', 'payfast')
 
     # Convert cart items to OrderItem objects
     now = datetime.utcnow().isoformat() + "Z"
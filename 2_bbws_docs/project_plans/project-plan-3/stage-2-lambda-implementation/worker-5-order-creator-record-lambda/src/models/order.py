@@ -131,7 +131,9 @@ class Order(BaseModel):
             'GSI1_PK': f'TENANT#{self.tenantId}',
             'GSI1_SK': f'{self.dateCreated}#{self.id}',
             'GSI2_PK': f'ORDER#{self.id}',
-            'GSI2_SK': 'METADATA'
+            'GSI2_SK': 'METADATA',
+            'GSI3_PK': f'TENANT#{self.tenantId}#STATUS#{self.status.upper()}',
+            'GSI3_SK': f'{self.dateCreated}#{self.id}'
         }
 
         # Add optional fields
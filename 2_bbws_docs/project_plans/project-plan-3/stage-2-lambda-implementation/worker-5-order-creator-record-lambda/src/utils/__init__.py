@@ -1,3 +1,8 @@
 """
 Utilities for Order Lambda service.
 """
+
+from .aws_clients import client_metrics, get_client, get_resource
+from .sqs_batch_runner import SQSBatchRunner
+
+__all__ = ['SQSBatchRunner', 'client_metrics', 'get_client', 'get_resource']
@@ -9,10 +9,18 @@ from pydantic import ValidationError
 
 from src.handlers.order_creator_record import lambda_handler, process_order_message
 from src.models.order import Order
+from src.utils.sqs_batch_runner import SQSBatchRunner
 
 
 class TestLambdaHandler:
-    """Test Lambda handler."""
+    """Test Lambda handler (one record at a time)."""
+
+    @pytest.fixture(autouse=True)
+    def record_mode(self):
+        """Process records individually and in order (BATCH_WRITE_MODE=false, SQS_BATCH_MAX_WORKERS=1)."""
+        with patch('src.handlers.order_creator_record.batch_write_mode', False), \
+                patch('src.handlers.order_creator_record.batch_runner', SQSBatchRunner(max_workers=1)):
+            yield
 
     @patch('src.handlers.order_creator_record.order_dao')
     @patch('src.handlers.order_creator_record.cart_service')
@@ -167,6 +175,133 @@ class TestLambdaHandler:
         assert result['batchItemFailures'][0]['itemIdentifier'] == 'msg-1'
 
 
+class TestLambdaHandlerBatchMode:
+    """Test Lambda handler batch-write pipeline."""
+
+    @pytest.fixture(autouse=True)
+    def batch_mode(self):
+        """Write each SQS batch in one transaction (BATCH_WRITE_MODE=true)."""
+        with patch('src.handlers.order_creator_record.batch_write_mode', True):
+            yield
+
+    def _event(self, messages):
+        return {
+            'Records': [
+                {'messageId': f'msg-{i}', 'receiptHandle': f'receipt-{i}', 'body': json.dumps(message)}
+                for i, message in enumerate(messages)
+            ]
+        }
+
+    def _message(self, sample_sqs_message, order_id, tenant_id=None):
+        message = dict(sample_sqs_message, orderId=order_id)
+        if tenant_id:
+            message['tenantId'] = tenant_id
+        return message
+
+    @patch('src.handlers.order_creator_record.order_dao')
+    @patch('src.handlers.order_creator_record.cart_service')
+    def test_batch_allocates_and_writes_once(self, mock_cart_service, mock_order_dao, sample_sqs_message, sample_cart_data):
+        """Order numbers are allocated per tenant and orders written in one call."""
+        mock_cart_service.get_cart.return_value = sample_cart_data
+        mock_cart_service.validate_cart.return_value = True
+        tenant_id = sample_sqs_message['tenantId']
+        mock_order_dao.get_next_order_numbers.side_effect = lambda tenant, count: [
+            f"ORD-20251230-{n:05d}" for n in range(1, count + 1)
+        ]
+        mock_order_dao.create_orders.side_effect = lambda orders: [None] * len(orders)
+
+        event = self._event([self._message(sample_sqs_message, f'order_{i}') for i in range(10)])
+        result = lambda_handler(event, None)
+
+        assert result['batchItemFailures'] == []
+        mock_order_dao.get_next_order_numbers.assert_called_once_with(tenant_id, 10)
+        mock_order_dao.create_orders.assert_called_once()
+        orders = mock_order_dao.create_orders.call_args.args[0]
+        assert [o.orderNumber for o in orders] == [f"ORD-20251230-{n:05d}" for n in range(1, 11)]
+        mock_order_dao.get_next_order_number.assert_not_called()
+        mock_order_dao.create_order.assert_not_called()
+
+    @patch('src.handlers.order_creator_record.order_dao')
+    @patch('src.handlers.order_creator_record.cart_service')
+    def test_batch_one_allocation_per_tenant(self, mock_cart_service, mock_order_dao, sample_sqs_message, sample_cart_data):
+        """Messages for different tenants allocate from their own counters."""
+        mock_cart_service.get_cart.return_value = sample_cart_data
+        mock_cart_service.validate_cart.return_value = True
+        mock_order_dao.get_next_order_numbers.side_effect = lambda tenant, count: ["ORD-20251230-00001"] * count
+        mock_order_dao.create_orders.side_effect = lambda orders: [None] * len(orders)
+
+        event = self._event([
+            self._message(sample_sqs_message, 'order_1', 'tenant_a'),
+            self._message(sample_sqs_message, 'order_2', 'tenant_b'),
+            self._message(sample_sqs_message, 'order_3', 'tenant_a'),
+        ])
+        lambda_handler(event, None)
+
+        calls = sorted(c.args for c in mock_order_dao.get_next_order_numbers.call_args_list)
+        assert calls == [('tenant_a', 2), ('tenant_b', 1)]
+
+    @patch('src.handlers.order_creator_record.order_dao')
+    @patch('src.handlers.order_creator_record.cart_service')
+    def test_batch_per_record_failures(self, mock_cart_service, mock_order_dao, sample_sqs_message, sample_cart_data):
+        """Write results map back to batchItemFailures per record."""
+        mock_cart_service.get_cart.return_value = sample_cart_data
+        mock_cart_service.validate_cart.return_value = True
+        mock_order_dao.get_next_order_numbers.side_effect = lambda tenant, count: ["ORD-20251230-00001"] * count
+        mock_order_dao.create_orders.return_value = [
+            None,
+            ValueError("Order with ID order_1 already exists"),  # duplicate: not retried
+            Exception("TransactionConflict"),                     # retried
+        ]
+
+        event = self._event([self._message(sample_sqs_message, f'order_{i}') for i in range(3)])
+        result = lambda_handler(event, None)
+
+        assert result['batchItemFailures'] == [{'itemIdentifier': 'msg-2'}]
+
+    @patch('src.handlers.order_creator_record.order_dao')
+    @patch('src.handlers.order_creator_record.cart_service')
+    def test_batch_invalid_message_does_not_block_batch(self, mock_cart_service, mock_order_dao, sample_sqs_message, sample_cart_data):
+        """A record failing validation is reported; the rest are still written."""
+        mock_cart_service.get_cart.return_value = sample_cart_data
+        mock_cart_service.validate_cart.return_value = True
+        mock_order_dao.get_next_order_numbers.side_effect = lambda tenant, count: ["ORD-20251230-00001"] * count
+        mock_order_dao.create_orders.side_effect = lambda orders: [None] * len(orders)
+
+        invalid = dict(sample_sqs_message)
+        del invalid['cartId']
+        event = self._event([self._message(sample_sqs_message, 'order_0'), invalid])
+        event['Records'].append({'messageId': 'msg-2', 'receiptHandle': 'receipt-2', 'body': 'not json'})
+        result = lambda_handler(event, None)
+
+        assert result['batchItemFailures'] == [{'itemIdentifier': 'msg-1'}, {'itemIdentifier': 'msg-2'}]
+        assert len(mock_order_dao.create_orders.call_args.args[0]) == 1
+
+    @patch('src.handlers.order_creator_record.order_dao')
+    @patch('src.handlers.order_creator_record.cart_service')
+    def test_batch_allocation_failure_fails_tenant_records(self, mock_cart_service, mock_order_dao, sample_sqs_message, sample_cart_data):
+        """If a tenant's counter update fails, only that tenant's records are retried."""
+        mock_cart_service.get_cart.return_value = sample_cart_data
+        mock_cart_service.validate_cart.return_value = True
+
+        def allocate(tenant, count):
+            if tenant == 'tenant_b':
+                raise Exception("ProvisionedThroughputExceededException")
+            return ["ORD-20251230-00001"] * count
+
+        mock_order_dao.get_next_order_numbers.side_effect = allocate
+        mock_order_dao.create_orders.side_effect = lambda orders: [None] * len(orders)
+
+        event = self._event([
+            self._message(sample_sqs_message, 'order_1', 'tenant_a'),
+            self._message(sample_sqs_message, 'order_2', 'tenant_b'),
+        ])
+        result = lambda_handler(event, None)
+
+        assert result['batchItemFailures'] == [{'itemIdentifier': 'msg-1'}]
+        orders = mock_order_dao.create_orders.call_args.args[0]
+        assert [o.tenantId for o in orders] == ['tenant_a']
+
+
 class TestProcessOrderMessage:
     """Test process_order_message function."""
 
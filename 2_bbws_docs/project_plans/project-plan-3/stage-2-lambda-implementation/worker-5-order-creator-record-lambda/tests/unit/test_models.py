@@ -224,6 +224,8 @@ class TestOrder:
         assert item['GSI1_SK'] == f"{order.dateCreated}#{order.id}"
         assert item['GSI2_PK'] == f"ORDER#{order.id}"
         assert item['GSI2_SK'] == 'METADATA'
+        assert item['GSI3_PK'] == f"TENANT#{order.tenantId}#STATUS#{order.status.upper()}"
+        assert item['GSI3_SK'] == item['GSI1_SK']
 
         # Check attributes
         assert item['orderNumber'] == order.orderNumber
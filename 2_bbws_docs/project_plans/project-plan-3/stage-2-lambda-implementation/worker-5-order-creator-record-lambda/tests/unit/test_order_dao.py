@@ -68,7 +68,8 @@ class TestOrderDAO:
 
     def test_get_next_order_number(self, order_dao, mock_dynamodb_client, sample_tenant_id):
         """Test generating next order number."""
-        # Mock update_item response
+        # No legacy global counter; mock update_item response
+        mock_dynamodb_client.get_item.return_value = {}
         mock_dynamodb_client.update_item.return_value = {
             'Attributes': {
                 'counter': {'N': '42'}
@@ -80,7 +81,7 @@ class TestOrderDAO:
         # Verify order number format: ORD-YYYYMMDD-NNNNN
         assert order_number.startswith("ORD-")
         assert order_number.endswith("-00042")
-        assert len(order_number) == 19  # ORD-YYYYMMDD-NNNNN
+        assert len(order_number) == 18  # ORD-YYYYMMDD-NNNNN
 
         # Verify atomic counter update
         mock_dynamodb_client.update_item.assert_called_once()
@@ -90,6 +91,7 @@ class TestOrderDAO:
 
     def test_get_next_order_number_dynamodb_error(self, order_dao, mock_dynamodb_client, sample_tenant_id):
         """Test error handling when generating order number."""
+        mock_dynamodb_client.get_item.return_value = {}
         mock_dynamodb_client.update_item.side_effect = ClientError(
             {'Error': {'Code': 'InternalServerError'}},
             'UpdateItem'
@@ -206,3 +208,97 @@ class TestOrderDAO:
         assert result['null_field'] is None
         assert result['list_field'] == ['a', 'b']
         assert result['dict_field'] == {'nested': 'value'}
+
+
+class TestOrderDAOCreateOrders:
+    """Test OrderDAO.create_orders (TransactWriteItems)."""
+
+    def _orders(self, sample_order_data, count):
+        return [Order(**dict(sample_order_data, id=f"order_{i}")) for i in range(count)]
+
+    def _cancelled(self, codes):
+        return ClientError(
+            {
+                'Error': {'Code': 'TransactionCanceledException', 'Message': 'Transaction cancelled'},
+                'CancellationReasons': [{'Code': code} for code in codes]
+            },
+            'TransactWriteItems'
+        )
+
+    def test_create_orders_single_transaction(self, sample_order_data):
+        """A batch is written in one guarded transaction."""
+        mock_dynamodb = Mock()
+        dao = OrderDAO(mock_dynamodb, 'test-table')
+
+        results = dao.create_orders(self._orders(sample_order_data, 10))
+
+        assert results == [None] * 10
+        mock_dynamodb.transact_write_items.assert_called_once()
+        items = mock_dynamodb.transact_write_items.call_args.kwargs['TransactItems']
+        assert len(items) == 10
+        assert all('attribute_not_exists(PK)' in i['Put']['ConditionExpression'] for i in items)
+        assert items[0]['Put']['Item']['SK'] == {'S': 'ORDER#order_0'}
+
+    def test_create_orders_chunks(self, sample_order_data):
+        """Large batches are split into TRANSACT_CHUNK_SIZE transactions."""
+        mock_dynamodb = Mock()
+        dao = OrderDAO(mock_dynamodb, 'test-table')
+
+        dao.create_orders(self._orders(sample_order_data, 30))
+
+        sizes = [len(c.kwargs['TransactItems']) for c in mock_dynamodb.transact_write_items.call_args_list]
+        assert sizes == [25, 5]
+
+    def test_create_orders_duplicate_retries_rest(self, sample_order_data):
+        """An existing order is reported as duplicate and the others are rewritten."""
+        mock_dynamodb = Mock()
+        mock_dynamodb.transact_write_items.side_effect = [
+            self._cancelled(['None', 'ConditionalCheckFailed', 'None']),
+            {}
+        ]
+        dao = OrderDAO(mock_dynamodb, 'test-table')
+
+        results = dao.create_orders(self._orders(sample_order_data, 3))
+
+        assert results[0] is None and results[2] is None
+        assert isinstance(results[1], ValueError)
+        assert "already exists" in str(results[1])
+        retry_items = mock_dynamodb.transact_write_items.call_args_list[1].kwargs['TransactItems']
+        assert [i['Put']['Item']['id']['S'] for i in retry_items] == ['order_0', 'order_2']
+
+    def test_create_orders_conflict_fails_item(self, sample_order_data):
+        """Items cancelled for other reasons are returned as errors for retry."""
+        mock_dynamodb = Mock()
+        mock_dynamodb.transact_write_items.side_effect = [
+            self._cancelled(['TransactionConflict', 'None']),
+            {}
+        ]
+        dao = OrderDAO(mock_dynamodb, 'test-table')
+
+        results = dao.create_orders(self._orders(sample_order_data, 2))
+
+        assert isinstance(results[0], ClientError)
+        assert results[1] is None
+
+    def test_create_orders_same_order_twice_in_batch(self, sample_order_data):
+        """A redelivered message in the same batch is a duplicate, not a transaction error."""
+        mock_dynamodb = Mock()
+        dao = OrderDAO(mock_dynamodb, 'test-table')
+        order = Order(**sample_order_data)
+
+        results = dao.create_orders([order, order])
+
+        assert results[0] is None
+        assert isinstance(results[1], ValueError)
+        assert len(mock_dynamodb.transact_write_items.call_args.kwargs['TransactItems']) == 1
+
+    def test_create_orders_dynamodb_error(self, sample_order_data):
+        """A failed transaction fails every order in the chunk."""
+        mock_dynamodb = Mock()
+        error = ClientError({'Error': {'Code': 'ThrottlingException'}}, 'TransactWriteItems')
+        mock_dynamodb.transact_write_items.side_effect = error
+        dao = OrderDAO(mock_dynamodb, 'test-table')
+
+        results = dao.create_orders(self._orders(sample_order_data, 2))
+
+        assert results == [error, error]
@@ -0,0 +1,160 @@
+"""
+Unit tests for OrderNumberAllocator.
+"""
+
+import threading
+from datetime import datetime
+
+import pytest
+from unittest.mock import Mock, patch
+from botocore.exceptions import ClientError
+
+from src.dao.order_number_allocator import OrderNumberAllocator
+
+
+class FakeCounterTable:
+    """Minimal in-memory stand-in for the counter update_item/get_item calls."""
+
+    def __init__(self, legacy=None):
+        self.counters = {}
+        self.legacy = legacy or {}
+        self.updates = 0
+        self._lock = threading.Lock()
+
+    def update_item(self, **kwargs):
+        key = (kwargs['Key']['PK']['S'], kwargs['Key']['SK']['S'])
+        values = kwargs['ExpressionAttributeValues']
+        with self._lock:
+            self.updates += 1
+            current = self.counters.get(key, int(values[':start']['N']))
+            self.counters[key] = current + int(values[':block']['N'])
+            return {'Attributes': {'counter': {'N': str(self.counters[key])}}}
+
+    def get_item(self, **kwargs):
+        key = (kwargs['Key']['PK']['S'], kwargs['Key']['SK']['S'])
+        if key in self.legacy:
+            return {'Item': {'counter': {'N': str(self.legacy[key])}}}
+        return {}
+
+
+class TestOrderNumberAllocator:
+    """Test OrderNumberAllocator."""
+
+    def test_block_served_from_container(self):
+        """One counter update serves a whole block of order numbers."""
+        table = FakeCounterTable()
+        allocator = OrderNumberAllocator(table, 'test-table', block_size=50)
+
+        numbers = [allocator.next_order_number('tenant_1') for _ in range(120)]
+
+        date_prefix = datetime.utcnow().strftime('%Y%m%d')
+        assert numbers[0] == f"ORD-{date_prefix}-00001"
+        assert numbers[-1] == f"ORD-{date_prefix}-00120"
+        assert numbers == sorted(numbers)
+        assert table.updates == 3
+
+    def test_counter_is_per_tenant(self):
+        """Each tenant has its own counter partition and sequence."""
+        table = FakeCounterTable()
+        allocator = OrderNumberAllocator(table, 'test-table', block_size=10)
+
+        assert allocator.next_order_number('tenant_1').endswith('-00001')
+        assert allocator.next_order_number('tenant_2').endswith('-00001')
+        assert allocator.next_order_number('tenant_1').endswith('-00002')
+
+        partitions = {pk for pk, _ in table.counters}
+        assert partitions == {'COUNTER#TENANT#tenant_1', 'COUNTER#TENANT#tenant_2'}
+
+    def test_containers_never_share_numbers(self):
+        """Allocators in separate containers get disjoint blocks."""
+        table = FakeCounterTable()
+        containers = [OrderNumberAllocator(table, 'test-table', block_size=5) for _ in range(4)]
+
+        numbers = [c.next_order_number('tenant_1') for _ in range(12) for c in containers]
+
+        assert len(set(numbers)) == len(numbers) == 48
+
+    def test_concurrent_threads_get_unique_numbers(self):
+        """Threads sharing one allocator never get the same number."""
+        table = FakeCounterTable()
+        allocator = OrderNumberAllocator(table, 'test-table', block_size=7)
+        numbers = []
+
+        def worker():
+            for _ in range(50):
+                numbers.append(allocator.next_order_number('tenant_1'))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(set(numbers)) == 400
+
+    def test_new_counter_seeded_from_legacy_counter(self):
+        """Numbers already issued today by the global counter are not reused."""
+        date_prefix = datetime.utcnow().strftime('%Y%m%d')
+        table = FakeCounterTable(legacy={('COUNTER', f'ORDER_NUMBER#tenant_1#{date_prefix}'): 42})
+        allocator = OrderNumberAllocator(table, 'test-table', block_size=10)
+
+        assert allocator.next_order_number('tenant_1') == f"ORD-{date_prefix}-00043"
+
+    def test_new_day_starts_new_counter(self):
+        """The sequence restarts on a new day and old blocks are dropped."""
+        table = FakeCounterTable()
+        allocator = OrderNumberAllocator(table, 'test-table', block_size=10)
+
+        with patch('src.dao.order_number_allocator.datetime') as mock_datetime:
+            mock_datetime.utcnow.return_value = datetime(2025, 12, 30, 23, 59)
+            assert allocator.next_order_number('tenant_1') == "ORD-20251230-00001"
+            mock_datetime.utcnow.return_value = datetime(2025, 12, 31, 0, 1)
+            assert allocator.next_order_number('tenant_1') == "ORD-20251231-00001"
+
+        assert list(allocator._blocks) == [('tenant_1', '20251231')]
+
+    def test_update_uses_atomic_block_increment(self):
+        """The reservation is a single atomic update of block_size."""
+        mock_dynamodb = Mock()
+        mock_dynamodb.get_item.return_value = {}
+        mock_dynamodb.update_item.return_value = {'Attributes': {'counter': {'N': '50'}}}
+        allocator = OrderNumberAllocator(mock_dynamodb, 'test-table', block_size=50)
+
+        allocator.next_order_number('tenant_1')
+
+        call_kwargs = mock_dynamodb.update_item.call_args.kwargs
+        assert call_kwargs['Key']['PK'] == {'S': 'COUNTER#TENANT#tenant_1'}
+        assert call_kwargs['ExpressionAttributeValues'][':block'] == {'N': '50'}
+        assert 'if_not_exists' in call_kwargs['UpdateExpression']
+
+    def test_dynamodb_error_propagates(self):
+        """DynamoDB errors are raised and no numbers are handed out."""
+        mock_dynamodb = Mock()
+        mock_dynamodb.get_item.return_value = {}
+        mock_dynamodb.update_item.side_effect = ClientError(
+            {'Error': {'Code': 'ProvisionedThroughputExceededException'}},
+            'UpdateItem'
+        )
+        allocator = OrderNumberAllocator(mock_dynamodb, 'test-table')
+
+        with pytest.raises(ClientError):
+            allocator.next_order_number('tenant_1')
+
+        assert allocator._blocks == {}
+
+    def test_invalid_block_size(self):
+        """Block size must be positive."""
+        with pytest.raises(ValueError):
+            OrderNumberAllocator(Mock(), 'test-table', block_size=0)
+
+    def test_batch_allocation_single_update(self):
+        """A batch larger than the block reserves one block covering the batch."""
+        table = FakeCounterTable()
+        allocator = OrderNumberAllocator(table, 'test-table', block_size=5)
+
+        first = allocator.next_order_numbers('tenant_1', 3)
+        second = allocator.next_order_numbers('tenant_1', 10)
+
+        assert [n[-5:] for n in first + second] == [f"{n:05d}" for n in range(1, 14)]
+        # Block of 5 (3 used), then one block of 8 for the remaining 8 of the batch
+        assert table.updates == 2
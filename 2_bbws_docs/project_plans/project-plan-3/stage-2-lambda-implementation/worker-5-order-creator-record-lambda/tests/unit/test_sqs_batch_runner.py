@@ -0,0 +1,168 @@
+"""
+Unit tests for SQSBatchRunner.
+"""
+
+import threading
+import time
+
+import pytest
+from unittest.mock import Mock
+
+from src.utils.sqs_batch_runner import SQSBatchRunner
+
+
+def make_records(count):
+    """Build SQS records with message IDs msg-0..msg-{count-1}."""
+    return [{'messageId': f'msg-{i}', 'body': str(i)} for i in range(count)]
+
+
+class FakeContext:
+    """Lambda context with a fixed remaining time."""
+
+    def __init__(self, remaining_ms):
+        self.remaining_ms = remaining_ms
+
+    def get_remaining_time_in_millis(self):
+        return self.remaining_ms
+
+
+class TestSQSBatchRunner:
+    """Tests for SQSBatchRunner."""
+
+    def test_empty_batch(self):
+        """Test no records gives no failures."""
+        process = Mock()
+
+        assert SQSBatchRunner().run([], process) == []
+        process.assert_not_called()
+
+    def test_all_records_processed(self):
+        """Test every record is passed to the function once."""
+        seen = []
+        lock = threading.Lock()
+
+        def process(record):
+            with lock:
+                seen.append(record['messageId'])
+
+        failures = SQSBatchRunner(max_workers=4).run(make_records(10), process)
+
+        assert failures == []
+        assert sorted(seen) == sorted(f'msg-{i}' for i in range(10))
+
+    def test_records_run_concurrently(self):
+        """Test a batch takes about as long as its slowest record."""
+        records = make_records(8)
+
+        start = time.monotonic()
+        failures = SQSBatchRunner(max_workers=8).run(records, lambda record: time.sleep(0.2))
+        elapsed = time.monotonic() - start
+
+        assert failures == []
+        assert elapsed < 0.2 * len(records) / 2
+
+    def test_failures_in_record_order(self):
+        """Test failed records are reported once each, in record order."""
+        def process(record):
+            index = int(record['body'])
+            # Later records fail first
+            time.sleep(0.01 * (10 - index))
+            if index % 3 == 0:
+                raise ValueError(f"bad record {index}")
+
+        failures = SQSBatchRunner(max_workers=5).run(make_records(10), process)
+
+        assert failures == [
+            {'itemIdentifier': 'msg-0'},
+            {'itemIdentifier': 'msg-3'},
+            {'itemIdentifier': 'msg-6'},
+            {'itemIdentifier': 'msg-9'}
+        ]
+
+    def test_serial_runner(self):
+        """Test max_workers=1 processes records in order on the calling thread."""
+        seen = []
+
+        def process(record):
+            seen.append((record['messageId'], threading.current_thread()))
+            if record['messageId'] == 'msg-1':
+                raise RuntimeError("boom")
+
+        failures = SQSBatchRunner(max_workers=1).run(make_records(3), process)
+
+        assert failures == [{'itemIdentifier': 'msg-1'}]
+        assert [message_id for message_id, _ in seen] == ['msg-0', 'msg-1', 'msg-2']
+        assert all(thread is threading.current_thread() for _, thread in seen)
+
+    def test_record_timeout(self):
+        """Test a slow record is reported as failed without waiting for it."""
+        release = threading.Event()
+
+        def process(record):
+            if record['messageId'] == 'msg-1':
+                release.wait(5)
+
+        runner = SQSBatchRunner(max_workers=2, record_timeout=0.2)
+
+        start = time.monotonic()
+        failures = runner.run(make_records(3), process)
+        elapsed = time.monotonic() - start
+        release.set()
+
+        assert failures == [{'itemIdentifier': 'msg-1'}]
+        assert elapsed < 2
+
+    def test_lambda_deadline(self, monkeypatch):
+        """Test unfinished records fail shortly before the Lambda deadline."""
+        monkeypatch.setattr('src.utils.sqs_batch_runner.DEADLINE_MARGIN_SECONDS', 0.0)
+        release = threading.Event()
+
+        def process(record):
+            if record['messageId'] != 'msg-0':
+                release.wait(5)
+
+        runner = SQSBatchRunner(max_workers=2)
+
+        start = time.monotonic()
+        failures = runner.run(make_records(4), process, FakeContext(300))
+        elapsed = time.monotonic() - start
+        release.set()
+
+        # msg-1 was running and msg-2/msg-3 never started
+        assert failures == [
+            {'itemIdentifier': 'msg-1'},
+            {'itemIdentifier': 'msg-2'},
+            {'itemIdentifier': 'msg-3'}
+        ]
+        assert elapsed < 2
+
+    def test_serial_runner_skips_records_after_deadline(self, monkeypatch):
+        """Test the serial runner does not start records after the deadline."""
+        monkeypatch.setattr('src.utils.sqs_batch_runner.DEADLINE_MARGIN_SECONDS', 0.0)
+        process = Mock()
+
+        failures = SQSBatchRunner(max_workers=1).run(make_records(2), process, FakeContext(0))
+
+        assert failures == [{'itemIdentifier': 'msg-0'}, {'itemIdentifier': 'msg-1'}]
+        process.assert_not_called()
+
+    def test_mock_context_has_no_deadline(self):
+        """Test a context without a numeric remaining time is ignored."""
+        failures = SQSBatchRunner(max_workers=2).run(make_records(2), lambda record: None, Mock())
+
+        assert failures == []
+
+    def test_invalid_max_workers(self):
+        """Test max_workers must be positive."""
+        with pytest.raises(ValueError, match="max_workers"):
+            SQSBatchRunner(max_workers=0)
+
+    def test_from_env(self, monkeypatch):
+        """Test settings are read from the environment."""
+        monkeypatch.setenv('SQS_BATCH_MAX_WORKERS', '6')
+        monkeypatch.setenv('SQS_RECORD_TIMEOUT_SECONDS', '0')
+
+        runner = SQSBatchRunner.from_env()
+
+        assert runner.max_workers == 6
+        assert runner.record_timeout is None
@@ -0,0 +1,151 @@
+"""
+Benchmark: invoice PDF generation throughput and peak memory.
+
+Generates invoices for orders with 1, 10 and 200 line items and compares:
+
+- uncached:   a new PDFService (and InvoiceLayout) per invoice, i.e. styles,
+              table styles and static blocks rebuilt for every invoice as
+              before the layout was cached
+- cached:     one PDFService per container (what the handler does)
+- background: cached, with the page background drawn from a form XObject
+
+Throughput is measured without tracing; peak memory is measured separately
+with tracemalloc (Python allocations during one invoice).
+
+Usage (from the worker directory):
+    python -m benchmarks.pdf_generation --lines 1,10,200 --seconds 3
+"""
+import argparse
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Callable, Dict, List
+
+from src.models.billing_address import BillingAddress
+from src.models.order import Order
+from src.models.order_item import OrderItem
+from src.models.payment_details import PaymentDetails
+from src.services.pdf_service import PDFService
+
+
+def build_order(lines: int) -> Order:
+    """Paid order with the given number of line items."""
+    items = [
+        OrderItem(
+            productId=f"prod-{i}",
+            productName=f"Premium WordPress Theme {i}",
+            productSku=f"WP-THEME-{i:03d}",
+            quantity=1 + i % 3,
+            unitPrice=99.00,
+            currency="ZAR",
+            subtotal=99.00 * (1 + i % 3),
+            taxRate=0.15,
+            taxAmount=14.85 * (1 + i % 3),
+            total=113.85 * (1 + i % 3)
+        )
+        for i in range(lines)
+    ]
+    subtotal = sum(item.subtotal for item in items)
+    tax = sum(item.taxAmount for item in items)
+    return Order(
+        id="550e8400-e29b-41d4-a716-446655440000",
+        orderNumber="ORD-2025-00001",
+        tenantId="tenant-bench",
+        customerId="cust-bench",
+        customerEmail="customer@example.com",
+        customerName="John Doe",
+        status="paid",
+        items=items,
+        subtotal=subtotal,
+        taxAmount=tax,
+        shippingAmount=0.00,
+        discountAmount=0.00,
+        total=subtotal + tax,
+        currency="ZAR",
+        billingAddress=BillingAddress(
+            fullName="John Doe",
+            addressLine1="123 Main Street",
+            city="Cape Town",
+            stateProvince="Western Cape",
+            postalCode="8001",
+            country="ZA"
+        ),
+        paymentDetails=PaymentDetails(
+            method="credit_card",
+            transactionId="txn-bench",
+            paidAt=datetime(2025, 12, 30, 12, 0, 0),
+            amount=subtotal + tax,
+            currency="ZAR",
+            status="completed"
+        ),
+        isActive=True,
+        dateCreated=datetime(2025, 12, 30, 10, 30, 0),
+        dateLastUpdated=datetime(2025, 12, 30, 10, 30, 0)
+    )
+
+
+def variants(company_name: str) -> Dict[str, Callable[[Order], bytes]]:
+    """Invoice generators to compare."""
+    cached = PDFService(company_name=company_name)
+    background = PDFService(company_name=company_name, cache_background=True)
+    return {
+        'uncached': lambda order: PDFService(company_name=company_name).generate_invoice_pdf(order),
+        'cached': cached.generate_invoice_pdf,
+        'background': background.generate_invoice_pdf
+    }
+
+
+def throughput(generate: Callable[[Order], bytes], order: Order, seconds: float) -> Dict[str, float]:
+    """Invoices per second over roughly the given duration (after one warm-up)."""
+    size = len(generate(order))
+    count = 0
+    start = time.perf_counter()
+    while True:
+        generate(order)
+        count += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= seconds:
+            break
+    return {'per_second': count / elapsed, 'ms': elapsed / count * 1000, 'bytes': size}
+
+
+def peak_memory(generate: Callable[[Order], bytes], order: Order) -> float:
+    """Peak traced Python memory (KiB) while generating one invoice."""
+    generate(order)
+    tracemalloc.start()
+    try:
+        generate(order)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 1024
+
+
+def main() -> None:
+    """Run every variant for each order size and print a summary table."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--lines', default='1,10,200', help='Comma-separated line item counts')
+    parser.add_argument('--seconds', type=float, default=3.0, help='Duration per variant and size (default 3)')
+    parser.add_argument('--company-name', default='BBWS', help='Invoice company name')
+    args = parser.parse_args()
+
+    generators = variants(args.company_name)
+    rows: List[str] = []
+
+    for lines in [int(value) for value in args.lines.split(',')]:
+        order = build_order(lines)
+        for name, generate in generators.items():
+            result = throughput(generate, order, args.seconds)
+            peak_kib = peak_memory(generate, order)
+            rows.append(
+                f"{lines:>6} {name:>11} {result['per_second']:>10.1f} {result['ms']:>9.2f} "
+                f"{peak_kib:>10.0f} {result['bytes'] / 1024:>9.1f}"
+            )
+
+    print(f"{'lines':>6} {'variant':>11} {'invoice/s':>10} {'ms/inv':>9} {'peak KiB':>10} {'PDF KiB':>9}")
+    for row in rows:
+        print(row)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,122 @@
+"""
+Benchmark: peak RSS of generating and uploading a 1,000-line statement.
+
+Compares the PDF_UPLOAD_MODE paths of the handler:
+
+- buffer:  generate_invoice_pdf() bytes, then one PutObject
+- stream:  ReportLab writes into MultipartPDFUpload (S3 multipart parts)
+- spooled: ReportLab writes into SpooledPDFUpload (/tmp file, managed transfer)
+
+Peak RSS only ever grows, so every mode runs in its own Python process.
+Uploads go to a local client that reads and discards request bodies, so the
+numbers show the Lambda's own memory and no network is needed.
+
+Usage (from the worker directory):
+    python -m benchmarks.pdf_upload_memory --lines 1000
+"""
+import argparse
+import resource
+import subprocess
+import sys
+import time
+from typing import Any, Dict
+
+from benchmarks.pdf_generation import build_order
+
+MODES = ('buffer', 'stream', 'spooled')
+
+
+class DiscardingS3Client:
+    """S3 client stand-in that consumes upload bodies like botocore and keeps nothing."""
+
+    def __init__(self):
+        self.bytes_received = 0
+
+    def _consume(self, body) -> None:
+        if hasattr(body, 'read'):
+            while True:
+                chunk = body.read(1024 * 1024)
+                if not chunk:
+                    break
+                self.bytes_received += len(chunk)
+        else:
+            self.bytes_received += len(body)
+
+    def put_object(self, Body, **kwargs) -> Dict[str, Any]:
+        self._consume(Body)
+        return {'ETag': '"put"'}
+
+    def create_multipart_upload(self, **kwargs) -> Dict[str, Any]:
+        return {'UploadId': 'benchmark'}
+
+    def upload_part(self, Body, PartNumber, **kwargs) -> Dict[str, Any]:
+        self._consume(Body)
+        return {'ETag': f'"part-{PartNumber}"'}
+
+    def complete_multipart_upload(self, **kwargs) -> Dict[str, Any]:
+        return {}
+
+    def abort_multipart_upload(self, **kwargs) -> Dict[str, Any]:
+        return {}
+
+    def upload_fileobj(self, Fileobj, Bucket, Key, ExtraArgs=None) -> None:
+        self._consume(Fileobj)
+
+
+def max_rss_mib() -> float:
+    """Peak resident set size of this process in MiB (Linux reports KiB)."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_mode(mode: str, lines: int) -> None:
+    """Generate and upload one statement, then print 'baseline peak seconds bytes'."""
+    from src.services.pdf_service import PDFService
+    from src.services.s3_service import S3Service
+
+    s3_client = DiscardingS3Client()
+    s3_service = S3Service(s3_client, 'benchmark-bucket')
+    pdf_service = PDFService(company_name='BBWS')
+    order = build_order(lines)
+    baseline = max_rss_mib()
+
+    start = time.perf_counter()
+    if mode == 'buffer':
+        pdf_bytes = pdf_service.generate_invoice_pdf(order)
+        s3_service.upload_pdf(pdf_bytes, order.tenantId, order.id)
+        del pdf_bytes
+    else:
+        with s3_service.open_pdf_upload(order.tenantId, order.id, spooled=mode == 'spooled') as upload:
+            pdf_service.write_invoice_pdf(order, upload)
+    elapsed = time.perf_counter() - start
+
+    print(f"{baseline:.1f} {max_rss_mib():.1f} {elapsed:.3f} {s3_client.bytes_received}")
+
+
+def main() -> None:
+    """Run each mode in a fresh process and print a summary table."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--lines', type=int, default=1000, help='Statement line items (default 1000)')
+    parser.add_argument('--mode', choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        run_mode(args.mode, args.lines)
+        return
+
+    print(f"{'mode':>8} {'base MiB':>9} {'peak MiB':>9} {'delta MiB':>10} {'seconds':>8} {'PDF KiB':>9}")
+    for mode in MODES:
+        output = subprocess.run(
+            [sys.executable, '-m', 'benchmarks.pdf_upload_memory', '--mode', mode, '--lines', str(args.lines)],
+            check=True,
+            capture_output=True,
+            text=True
+        ).stdout.split()
+        baseline, peak, seconds, size = float(output[0]), float(output[1]), float(output[2]), int(output[3])
+        print(
+            f"{mode:>8} {baseline:>9.1f} {peak:>9.1f} {peak - baseline:>10.1f} "
+            f"{seconds:>8.2f} {size / 1024:>9.1f}"
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,435 @@
+"""
+Schema-aware DynamoDB codec for Order entities.
+
+Field decoders are compiled once from the Pydantic models (Order, OrderItem,
+BillingAddress, PaymentDetails, Campaign) when the codec is built, so decoding
+an item is a single pass of dictionary lookups that produces model-ready dicts
+instead of a recursive walk over type descriptors for every value.
+"""
+import json
+import logging
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Callable, Dict, FrozenSet, Tuple, Type
+
+from pydantic import BaseModel
+from pydantic.fields import SHAPE_LIST, SHAPE_SINGLETON
+
+logger = logging.getLogger(__name__)
+
+# Table keys and GSI keys are storage details, never model attributes
+KEY_ATTRIBUTES = frozenset([
+    'PK', 'SK', 'entityType',
+    'GSI1_PK', 'GSI1_SK', 'GSI2_PK', 'GSI2_SK', 'GSI3_PK', 'GSI3_SK',
+    'GSI1PK', 'GSI1SK', 'GSI2PK', 'GSI2SK',
+])
+
+Decoder = Callable[[Any], Any]
+
+_STRING_TYPES = (str, Enum, datetime, date)
+
+
+def int_or_float(raw: str) -> Any:
+    """Convert a DynamoDB number string to int, falling back to float."""
+    try:
+        return int(raw)
+    except ValueError:
+        return float(raw)
+
+
+def _to_int(raw: str) -> Any:
+    """Convert a DynamoDB number string for an int field."""
+    try:
+        return int(raw)
+    except ValueError:
+        return Decimal(raw)
+
+
+class ItemCodec:
+    """
+    Compiled encoder/decoder for one Pydantic model.
+
+    A decode function is generated from the model fields (keyed by the
+    attribute name stored in DynamoDB, i.e. the field alias), with a compiled
+    codec per nested model. Attributes that are not part of the model are
+    decoded generically so that callers still see them.
+
+    Attributes:
+        model: Pydantic model class the codec was compiled from
+        number: Converter for numbers on attributes without a schema type
+        decode: Generated decoder: DynamoDB item with type descriptors ->
+            dict with plain Python types ready for the model
+    """
+
+    def __init__(
+        self,
+        model: Type[BaseModel],
+        number: Callable[[str], Any] = Decimal,
+        skip: FrozenSet[str] = KEY_ATTRIBUTES
+    ):
+        """
+        Compile decoders for every field of the model.
+
+        Args:
+            model: Pydantic model class
+            number: Converter for untyped DynamoDB numbers (default Decimal)
+            skip: Attribute names dropped from decoded items
+        """
+        self.model = model
+        self.number = number
+        self.skip = skip
+
+        self._generic_decoders: Dict[str, Decoder] = {
+            'S': _identity,
+            'N': number,
+            'BOOL': _identity,
+            'NULL': lambda raw: None,
+            'B': _identity,
+            'L': lambda raw: [self.decode_value(v) for v in raw],
+            'M': lambda raw: {k: self.decode_value(v) for k, v in raw.items()},
+            'SS': set,
+            'NS': lambda raw: {number(v) for v in raw},
+            'BS': set,
+        }
+
+        self._specs: Dict[str, tuple] = {
+            field.alias: self._field_spec(field) for field in model.__fields__.values()
+        }
+        self._normalizers: Dict[str, Decoder] = {
+            name: self._normalizer(spec) for name, spec in self._specs.items()
+        }
+        self.decode: Callable[[Dict[str, Any]], Dict[str, Any]] = self._generate_decoder()
+
+    # ------------------------------------------------------------------
+    # Decoding (low-level client attribute values)
+    # ------------------------------------------------------------------
+
+    def decode_value(self, value: Dict[str, Any]) -> Any:
+        """
+        Decode a single attribute value without schema information.
+
+        Args:
+            value: DynamoDB attribute value (e.g., {'S': 'abc'})
+
+        Returns:
+            Plain Python value
+        """
+        for tag, raw in value.items():
+            convert = self._generic_decoders.get(tag)
+            if convert is None:
+                break
+            return convert(raw)
+
+        logger.warning(f"Unknown DynamoDB type: {value}")
+        return value
+
+    # ------------------------------------------------------------------
+    # Normalising (items already deserialized by the boto3 resource API)
+    # ------------------------------------------------------------------
+
+    def normalize(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Convert a resource-API item (Decimal numbers) into a model-ready dict.
+
+        Args:
+            item: Item returned by boto3.resource('dynamodb').Table(...)
+
+        Returns:
+            Dictionary with numbers converted to the model's field types
+        """
+        normalizers = self._normalizers
+        skip = self.skip
+        result = {}
+
+        for name, value in item.items():
+            normalizer = normalizers.get(name)
+            if normalizer is None:
+                if name in skip:
+                    continue
+                normalizer = self.normalize_value
+            result[name] = normalizer(value)
+
+        return result
+
+    def normalize_value(self, value: Any) -> Any:
+        """Normalise a resource-API value without schema information."""
+        if isinstance(value, Decimal):
+            return self.number(str(value))
+        if isinstance(value, dict):
+            return {k: self.normalize_value(v) for k, v in value.items()}
+        if isinstance(value, list):
+            return [self.normalize_value(v) for v in value]
+        return value
+
+    # ------------------------------------------------------------------
+    # Encoding
+    # ------------------------------------------------------------------
+
+    def encode(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Encode a Python dict into a DynamoDB item.
+
+        Args:
+            data: Plain dictionary (e.g., Order.to_dynamodb_item())
+
+        Returns:
+            DynamoDB item with type descriptors
+        """
+        return {key: encode_value(value) for key, value in data.items()}
+
+    # ------------------------------------------------------------------
+    # Compilation
+    # ------------------------------------------------------------------
+
+    def _field_spec(self, field) -> tuple:
+        """Describe how a Pydantic field is stored."""
+        if field.shape == SHAPE_SINGLETON:
+            return self._type_spec(field.type_)
+        if field.shape == SHAPE_LIST:
+            return ('list', self._type_spec(field.type_))
+        return ('generic',)
+
+    def _type_spec(self, type_: Any) -> tuple:
+        """Describe how a single field type is stored."""
+        if isinstance(type_, type):
+            if issubclass(type_, BaseModel):
+                return ('model', codec_for(type_, self.number, self.skip))
+            if issubclass(type_, bool):
+                return ('scalar', 'BOOL', None)
+            if issubclass(type_, _STRING_TYPES):
+                return ('scalar', 'S', None)
+            if issubclass(type_, Decimal):
+                return ('scalar', 'N', Decimal)
+            if issubclass(type_, float):
+                return ('scalar', 'N', float)
+            if issubclass(type_, int):
+                return ('scalar', 'N', _to_int)
+        return ('generic',)
+
+    def _decoder(self, spec: tuple) -> Decoder:
+        """Build a standalone decoder for one attribute value."""
+        kind = spec[0]
+        fallback = self.decode_value
+
+        if kind == 'scalar':
+            _, tag, convert = spec
+            convert = convert or _identity
+
+            def decode(value):
+                try:
+                    raw = value[tag]
+                except KeyError:
+                    return fallback(value)
+                return convert(raw)
+
+            return decode
+
+        if kind == 'model':
+            decode_map = spec[1].decode
+
+            def decode(value):
+                attributes = value.get('M')
+                if attributes is not None:
+                    return decode_map(attributes)
+                return self._decode_legacy(value)
+
+            return decode
+
+        if kind == 'list':
+            element_spec = spec[1]
+            element = self._decoder(element_spec)
+            decode_map = element_spec[1].decode if element_spec[0] == 'model' else None
+
+            def decode(value):
+                elements = value.get('L')
+                if elements is None:
+                    return self._decode_legacy(value)
+                if decode_map is not None:
+                    try:
+                        return [decode_map(e['M']) for e in elements]
+                    except KeyError:
+                        pass
+                return [element(e) for e in elements]
+
+            return decode
+
+        return fallback
+
+    def _decode_legacy(self, value: Dict[str, Any]) -> Any:
+        """Decode a nested object written as a JSON string by older writers."""
+        if 'S' in value:
+            return json.loads(value['S'])
+        return self.decode_value(value)
+
+    def _generate_decoder(self) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Generate the item decoder as a single flat function.
+
+        Scalar fields are inlined (one dict lookup plus conversion), so the
+        only calls per item are for nested models, lists and numbers.
+        """
+        namespace: Dict[str, Any] = {
+            'fallback': self.decode_value,
+            'known': frozenset(self._specs) | self.skip,
+        }
+        lines = [
+            'def decode(item):',
+            '    result = {}',
+        ]
+
+        for index, (name, spec) in enumerate(self._specs.items()):
+            key = repr(name)
+            lines.append(f'    v = item.get({key})')
+            lines.append('    if v is not None:')
+
+            if spec[0] == 'scalar':
+                _, tag, convert = spec
+                expression = f'v[{tag!r}]'
+                if convert is not None:
+                    namespace[f'convert_{index}'] = convert
+                    expression = f'convert_{index}({expression})'
+                lines.append('        try:')
+                lines.append(f'            result[{key}] = {expression}')
+                lines.append('        except KeyError:')
+                lines.append(f'            result[{key}] = fallback(v)')
+            else:
+                namespace[f'decode_{index}'] = self._decoder(spec)
+                lines.append(f'        result[{key}] = decode_{index}(v)')
+
+        lines.append('    if len(item) > len(result):')
+        lines.append('        for name in item.keys() - known:')
+        lines.append('            result[name] = fallback(item[name])')
+        lines.append('    return result')
+
+        exec(compile('\n'.join(lines), f'<codec {self.model.__name__}>', 'exec'), namespace)
+        return namespace['decode']
+
+    def _normalizer(self, spec: tuple) -> Decoder:
+        """Build the normaliser for resource-API values of one attribute."""
+        kind = spec[0]
+
+        if kind == 'scalar':
+            convert = spec[2]
+            if convert is float:
+                return _number_normalizer(float)
+            if convert is _to_int:
+                return _number_normalizer(int)
+            return _identity
+
+        if kind == 'model':
+            normalize_map = spec[1].normalize
+
+            def normalize(value):
+                if isinstance(value, dict):
+                    return normalize_map(value)
+                return value
+
+            return normalize
+
+        if kind == 'list':
+            element = self._normalizer(spec[1])
+
+            def normalize(value):
+                if isinstance(value, list):
+                    return [element(v) for v in value]
+                return value
+
+            return normalize
+
+        return self.normalize_value
+
+
+def _identity(value: Any) -> Any:
+    """Return the value unchanged."""
+    return value
+
+
+def _number_normalizer(convert: Callable[[Any], Any]) -> Decoder:
+    """Normaliser converting resource-API Decimals for float/int fields."""
+    def normalize(value):
+        if isinstance(value, Decimal):
+            return convert(value)
+        return value
+
+    return normalize
+
+
+def _encode_number(value: Any) -> Dict[str, str]:
+    return {'N': str(value)}
+
+
+_ENCODERS: Dict[type, Callable[[Any], Dict[str, Any]]] = {
+    str: lambda v: {'S': v},
+    bool: lambda v: {'BOOL': v},
+    int: _encode_number,
+    float: _encode_number,
+    Decimal: _encode_number,
+    type(None): lambda v: {'NULL': True},
+    list: lambda v: {'L': [encode_value(e) for e in v]},
+    tuple: lambda v: {'L': [encode_value(e) for e in v]},
+    dict: lambda v: {'M': {k: encode_value(e) for k, e in v.items()}},
+    bytes: lambda v: {'B': v},
+}
+
+
+def encode_value(value: Any) -> Dict[str, Any]:
+    """
+    Encode a single Python value as a DynamoDB attribute value.
+
+    Args:
+        value: Python value
+
+    Returns:
+        DynamoDB attribute value (e.g., {'N': '42'})
+    """
+    encoder = _ENCODERS.get(type(value))
+    if encoder is not None:
+        return encoder(value)
+
+    if isinstance(value, Enum):
+        return encode_value(value.value)
+    if isinstance(value, str):
+        return {'S': str(value)}
+    if isinstance(value, BaseModel):
+        return encode_value(value.dict(by_alias=True))
+    if isinstance(value, (datetime, date)):
+        return {'S': value.isoformat()}
+    if isinstance(value, (int, float, Decimal)):
+        return _encode_number(value)
+    if isinstance(value, dict):
+        return _ENCODERS[dict](value)
+    if isinstance(value, (list, tuple)):
+        return _ENCODERS[list](value)
+
+    # Default to string
+    return {'S': str(value)}
+
+
+_CODECS: Dict[Tuple[Type[BaseModel], Callable[[str], Any], FrozenSet[str]], ItemCodec] = {}
+
+
+def codec_for(
+    model: Type[BaseModel],
+    number: Callable[[str], Any] = Decimal,
+    skip: FrozenSet[str] = KEY_ATTRIBUTES
+) -> ItemCodec:
+    """
+    Get the compiled codec for a model, building it on first use.
+
+    Call this at module level so compilation happens during Lambda init.
+
+    Args:
+        model: Pydantic model class
+        number: Converter for untyped DynamoDB numbers (default Decimal)
+        skip: Attribute names dropped from decoded items
+
+    Returns:
+        Compiled ItemCodec
+    """
+    key = (model, number, skip)
+    codec = _CODECS.get(key)
+    if codec is None:
+        codec = ItemCodec(model, number, skip)
+        _CODECS[key] = codec
+    return codec
@@ -4,13 +4,33 @@ OrderDAO - Data Access Object for Order DynamoDB operations.
 Implements DynamoDB single-table design with tenant isolation.
 """
 
+import json
 import logging
-from typing import Optional
+import time
+from typing import Any, Dict, Iterator, Optional
 from datetime import datetime
+from botocore.exceptions import ClientError
+from src.codec import codec_for, int_or_float
 from src.models.order import Order
 
 logger = logging.getLogger(__name__)
 
+# Compiled once per container; Order amounts are floats in this service
+ORDER_CODEC = codec_for(Order, number=int_or_float)
+
+# GSI1: GSI1_PK=TENANT#{tenantId}, GSI1_SK={dateCreated}#{orderId}
+DATE_INDEX_NAME = 'OrdersByDateIndex'
+
+# Sorts after '#' and every ISO 8601 character, so a date_to bound includes
+# all orders created on/at that date or timestamp
+_RANGE_END = '~'
+
+# Item holding the reconciliation sweep position between runs
+RECONCILIATION_CURSOR_KEY = {
+    'PK': {'S': 'PDF_RECONCILIATION'},
+    'SK': {'S': 'CURSOR'}
+}
+
 
 class OrderDAO:
     """
@@ -23,6 +43,8 @@ class OrderDAO:
     - GSI1_SK: {dateCreated}#{orderId} (for date-based sorting)
     - GSI2_PK: ORDER#{orderId}
     - GSI2_SK: METADATA (for admin cross-tenant lookup)
+    - GSI3_PK: TENANT#{tenantId}#STATUS#{STATUS} (status upper-cased)
+    - GSI3_SK: {dateCreated}#{orderId} (for status + date range queries)
 
     Attributes:
         dynamodb_client: Boto3 DynamoDB client
@@ -115,6 +137,314 @@ class OrderDAO:
             logger.error(f"Error updating order: {str(e)}", exc_info=True)
             raise
 
+    def iter_orders_by_date(
+        self,
+        tenant_id: str,
+        date_from: str,
+        date_to: str,
+        page_size: int = 100
+    ) -> Iterator[Order]:
+        """
+        Iterate over a tenant's orders created in a date range (GSI1).
+
+        Follows LastEvaluatedKey internally, so only one page is held in
+        memory. Run one iterator per sub-range to query in parallel.
+
+        Args:
+            tenant_id: Tenant identifier
+            date_from: Inclusive lower bound on dateCreated (ISO 8601 prefix)
+            date_to: Inclusive upper bound on dateCreated (ISO 8601 prefix)
+            page_size: DynamoDB query Limit per page
+
+        Yields:
+            Order objects (oldest first)
+
+        Raises:
+            Exception: If DynamoDB operation fails
+        """
+        params = {
+            'TableName': self.table_name,
+            'IndexName': DATE_INDEX_NAME,
+            'KeyConditionExpression': 'GSI1_PK = :pk AND GSI1_SK BETWEEN :from AND :to',
+            'ExpressionAttributeValues': {
+                ':pk': {'S': f'TENANT#{tenant_id}'},
+                ':from': {'S': date_from},
+                ':to': {'S': f'{date_to}{_RANGE_END}'}
+            },
+            'Limit': page_size
+        }
+
+        while True:
+            response = self.dynamodb.query(**params)
+            for item in response.get('Items', []):
+                yield Order.parse_obj(self._deserialize_item(item))
+
+            if 'LastEvaluatedKey' not in response:
+                return
+            params['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+    def claim_pdf_generation(
+        self,
+        tenant_id: str,
+        order_id: str,
+        content_hash: str,
+        claim_token: str,
+        lease_seconds: int
+    ) -> bool:
+        """
+        Claim PDF generation for an order with a conditional update.
+
+        The claim succeeds only if no PDF was recorded for this content hash
+        and no other invocation holds an unexpired claim, so concurrent
+        deliveries of the same order never render the invoice twice.
+
+        Args:
+            tenant_id: Tenant identifier
+            order_id: Order identifier
+            content_hash: Hash of the order content to be invoiced
+            claim_token: Unique token of this invocation
+            lease_seconds: Seconds before an abandoned claim can be taken over
+
+        Returns:
+            True if claimed, False if the PDF is already generated or being generated
+
+        Raises:
+            ClientError: If DynamoDB operation fails
+        """
+        now = int(time.time())
+        try:
+            self.dynamodb.update_item(
+                TableName=self.table_name,
+                Key=self._key(tenant_id, order_id),
+                UpdateExpression='SET pdfClaimToken = :token, pdfClaimExpiresAt = :expires',
+                ConditionExpression=(
+                    'attribute_exists(PK) '
+                    'AND (attribute_not_exists(pdfContentHash) OR pdfContentHash <> :hash) '
+                    'AND (attribute_not_exists(pdfClaimExpiresAt) OR pdfClaimExpiresAt < :now)'
+                ),
+                ExpressionAttributeValues={
+                    ':token': {'S': claim_token},
+                    ':expires': {'N': str(now + lease_seconds)},
+                    ':hash': {'S': content_hash},
+                    ':now': {'N': str(now)}
+                }
+            )
+            logger.info(f"PDF generation claimed: orderId={order_id}")
+            return True
+
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                logger.info(f"PDF generation not claimed (done or in progress): orderId={order_id}")
+                return False
+            logger.error(f"Error claiming PDF generation: {str(e)}")
+            raise
+
+    def record_pdf(
+        self,
+        tenant_id: str,
+        order_id: str,
+        pdf_url: str,
+        content_hash: str,
+        etag: Optional[str],
+        claim_token: str
+    ) -> bool:
+        """
+        Record the uploaded PDF on the order and release the claim.
+
+        Only the other PDF attributes are written (no full item put), so
+        concurrent order updates are not overwritten.
+
+        Args:
+            tenant_id: Tenant identifier
+            order_id: Order identifier
+            pdf_url: S3 URL of the PDF
+            content_hash: Hash of the invoiced order content
+            etag: S3 ETag of the PDF (None if the upload did not return one)
+            claim_token: Token the generation was claimed with
+
+        Returns:
+            True if recorded, False if the claim was lost (lease expired and taken over)
+
+        Raises:
+            ClientError: If DynamoDB operation fails
+        """
+        update = 'SET pdfUrl = :url, pdfContentHash = :hash, dateLastUpdated = :updated'
+        remove = 'REMOVE pdfClaimToken, pdfClaimExpiresAt'
+        values = {
+            ':url': {'S': pdf_url},
+            ':hash': {'S': content_hash},
+            ':updated': {'S': datetime.utcnow().isoformat()},
+            ':token': {'S': claim_token}
+        }
+        if etag:
+            update += ', pdfETag = :etag'
+            values[':etag'] = {'S': etag}
+        else:
+            remove += ', pdfETag'
+
+        try:
+            self.dynamodb.update_item(
+                TableName=self.table_name,
+                Key=self._key(tenant_id, order_id),
+                UpdateExpression=f'{update} {remove}',
+                ConditionExpression='pdfClaimToken = :token',
+                ExpressionAttributeValues=values
+            )
+            logger.info(f"PDF recorded: orderId={order_id}, hash={content_hash}")
+            return True
+
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                logger.warning(f"PDF claim lost before recording: orderId={order_id}")
+                return False
+            logger.error(f"Error recording PDF: {str(e)}")
+            raise
+
+    def release_pdf_claim(self, tenant_id: str, order_id: str, claim_token: str) -> None:
+        """
+        Release a PDF generation claim after a failure (best effort).
+
+        Lets the SQS retry claim the order without waiting for the lease.
+
+        Args:
+            tenant_id: Tenant identifier
+            order_id: Order identifier
+            claim_token: Token the generation was claimed with
+        """
+        try:
+            self.dynamodb.update_item(
+                TableName=self.table_name,
+                Key=self._key(tenant_id, order_id),
+                UpdateExpression='REMOVE pdfClaimToken, pdfClaimExpiresAt',
+                ConditionExpression='pdfClaimToken = :token',
+                ExpressionAttributeValues={':token': {'S': claim_token}}
+            )
+        except Exception as e:
+            # The lease expires on its own
+            logger.warning(f"Could not release PDF claim for {order_id}: {str(e)}")
+
+    def clear_pdf_record(self, tenant_id: str, order_id: str, content_hash: str) -> bool:
+        """
+        Forget the recorded PDF so the next delivery regenerates it.
+
+        Conditional on the recorded hash, so a PDF recorded in the meantime
+        is kept.
+
+        Args:
+            tenant_id: Tenant identifier
+            order_id: Order identifier
+            content_hash: Hash recorded when the sweep read the order
+
+        Returns:
+            True if cleared, False if the record changed in the meantime
+
+        Raises:
+            ClientError: If DynamoDB operation fails
+        """
+        try:
+            self.dynamodb.update_item(
+                TableName=self.table_name,
+                Key=self._key(tenant_id, order_id),
+                UpdateExpression='REMOVE pdfContentHash, pdfETag',
+                ConditionExpression='pdfContentHash = :hash',
+                ExpressionAttributeValues={':hash': {'S': content_hash}}
+            )
+            logger.info(f"PDF record cleared: orderId={order_id}")
+            return True
+
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                return False
+            logger.error(f"Error clearing PDF record: {str(e)}")
+            raise
+
+    def scan_pdf_records(
+        self,
+        start_key: Optional[Dict[str, Any]] = None,
+        page_size: int = 100
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Scan orders with a recorded PDF (reconciliation sweep).
+
+        Yields one page at a time so the sweep can stop between pages and
+        continue from LastEvaluatedKey in its next run.
+
+        Args:
+            start_key: ExclusiveStartKey to continue a previous sweep
+            page_size: Items evaluated per Scan call
+
+        Yields:
+            Dictionaries with 'records' (tenantId, id, pdfContentHash, pdfETag)
+            and 'lastEvaluatedKey' (None after the last page)
+
+        Raises:
+            ClientError: If DynamoDB operation fails
+        """
+        params = {
+            'TableName': self.table_name,
+            'FilterExpression': 'begins_with(SK, :order) AND attribute_exists(pdfContentHash)',
+            'ProjectionExpression': 'tenantId, #id, pdfContentHash, pdfETag',
+            'ExpressionAttributeNames': {'#id': 'id'},
+            'ExpressionAttributeValues': {':order': {'S': 'ORDER#'}},
+            'Limit': page_size
+        }
+        if start_key:
+            params['ExclusiveStartKey'] = start_key
+
+        while True:
+            response = self.dynamodb.scan(**params)
+            records = [
+                {name: value['S'] for name, value in item.items() if 'S' in value}
+                for item in response.get('Items', [])
+            ]
+            last_key = response.get('LastEvaluatedKey')
+            yield {'records': records, 'lastEvaluatedKey': last_key}
+
+            if not last_key:
+                return
+            params['ExclusiveStartKey'] = last_key
+
+    def get_reconciliation_cursor(self) -> Optional[Dict[str, Any]]:
+        """
+        Get the position where the last reconciliation sweep stopped.
+
+        Returns:
+            ExclusiveStartKey for the next Scan, or None to start from the beginning
+        """
+        response = self.dynamodb.get_item(TableName=self.table_name, Key=RECONCILIATION_CURSOR_KEY)
+        item = response.get('Item')
+        if not item or 'startKey' not in item:
+            return None
+        return json.loads(item['startKey']['S'])
+
+    def save_reconciliation_cursor(self, start_key: Optional[Dict[str, Any]]) -> None:
+        """
+        Save where the reconciliation sweep stopped (None once it completed).
+
+        Args:
+            start_key: LastEvaluatedKey of the last processed page, or None
+        """
+        if start_key is None:
+            self.dynamodb.delete_item(TableName=self.table_name, Key=RECONCILIATION_CURSOR_KEY)
+            return
+
+        self.dynamodb.put_item(
+            TableName=self.table_name,
+            Item={
+                **RECONCILIATION_CURSOR_KEY,
+                'startKey': {'S': json.dumps(start_key)},
+                'dateLastUpdated': {'S': datetime.utcnow().isoformat()}
+            }
+        )
+
+    @staticmethod
+    def _key(tenant_id: str, order_id: str) -> Dict[str, Dict[str, str]]:
+        """Primary key of an order item."""
+        return {
+            'PK': {'S': f'TENANT#{tenant_id}'},
+            'SK': {'S': f'ORDER#{order_id}'}
+        }
+
     def _serialize_order(self, order: Order) -> dict:
         """
         Serialize Order model to DynamoDB item format.
@@ -139,6 +469,8 @@ class OrderDAO:
             'GSI1_SK': {'S': f'{order.dateCreated.isoformat()}#{order.id}'},
             'GSI2_PK': {'S': f'ORDER#{order.id}'},
             'GSI2_SK': {'S': 'METADATA'},
+            'GSI3_PK': {'S': f'TENANT#{order.tenantId}#STATUS#{order.status.upper()}'},
+            'GSI3_SK': {'S': f'{order.dateCreated.isoformat()}#{order.id}'},
 
             # Order attributes
             'id': {'S': order.id},
@@ -164,6 +496,10 @@ class OrderDAO:
             item['customerName'] = {'S': order.customerName}
         if order.pdfUrl:
             item['pdfUrl'] = {'S': order.pdfUrl}
+        if order.pdfContentHash:
+            item['pdfContentHash'] = {'S': order.pdfContentHash}
+        if order.pdfETag:
+            item['pdfETag'] = {'S': order.pdfETag}
         if order.notes:
             item['notes'] = {'S': order.notes}
         if order.dateCompleted:
@@ -190,55 +526,13 @@ class OrderDAO:
         """
         Deserialize DynamoDB item to dictionary suitable for Order model.
 
+        Nested objects may be maps or JSON strings; both are handled by the
+        compiled Order codec.
+
         Args:
             item: DynamoDB item
 
         Returns:
             Dictionary with order data
         """
-        import json
-
-        order_data = {
-            'id': item['id']['S'],
-            'orderNumber': item['orderNumber']['S'],
-            'tenantId': item['tenantId']['S'],
-            'customerEmail': item['customerEmail']['S'],
-            'status': item['status']['S'],
-            'subtotal': float(item['subtotal']['N']),
-            'taxAmount': float(item['taxAmount']['N']),
-            'shippingAmount': float(item['shippingAmount']['N']),
-            'discountAmount': float(item['discountAmount']['N']),
-            'total': float(item['total']['N']),
-            'currency': item['currency']['S'],
-            'isActive': item['isActive']['BOOL'],
-            'dateCreated': item['dateCreated']['S'],
-            'dateLastUpdated': item['dateLastUpdated']['S'],
-        }
-
-        # Optional simple fields
-        if 'customerId' in item:
-            order_data['customerId'] = item['customerId']['S']
-        if 'customerName' in item:
-            order_data['customerName'] = item['customerName']['S']
-        if 'pdfUrl' in item:
-            order_data['pdfUrl'] = item['pdfUrl']['S']
-        if 'notes' in item:
-            order_data['notes'] = item['notes']['S']
-        if 'dateCompleted' in item:
-            order_data['dateCompleted'] = item['dateCompleted']['S']
-
-        # Deserialize JSON strings
-        if 'items' in item:
-            order_data['items'] = json.loads(item['items']['S'])
-        if 'billingAddress' in item:
-            order_data['billingAddress'] = json.loads(item['billingAddress']['S'])
-        if 'shippingAddress' in item:
-            order_data['shippingAddress'] = json.loads(item['shippingAddress']['S'])
-        if 'campaign' in item:
-            order_data['campaign'] = json.loads(item['campaign']['S'])
-        if 'paymentDetails' in item:
-            order_data['paymentDetails'] = json.loads(item['paymentDetails']['S'])
-        if 'metadata' in item:
-            order_data['metadata'] = json.loads(item['metadata']['S'])
-
-        return order_data
+        return ORDER_CODEC.decode(item)
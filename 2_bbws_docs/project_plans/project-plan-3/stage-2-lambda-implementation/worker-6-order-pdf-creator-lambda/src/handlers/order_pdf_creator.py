@@ -9,7 +9,7 @@ Event Flow:
 2. Fetch order details from DynamoDB
 3. Generate PDF invoice using ReportLab
 4. Upload PDF to S3 bucket
-5. Update order record with pdfUrl
+5. Record pdfUrl, content hash and ETag on the order item
 
 Timeout: 60s (longer than other Lambdas due to PDF generation)
 """
@@ -17,30 +17,45 @@ Timeout: 60s (longer than other Lambdas due to PDF generation)
 import json
 import logging
 import os
-from typing import Dict, Any, List
-import boto3
+import uuid
+from typing import Dict, Any, List, Optional, Tuple
 from src.dao.order_dao import OrderDAO
 from src.services.pdf_service import PDFService
 from src.services.s3_service import S3Service
+from src.utils.aws_clients import get_client
+from src.utils.sqs_batch_runner import SQSBatchRunner
 
 # Configure logging
 logger = logging.getLogger()
 logger.setLevel(os.environ.get('LOG_LEVEL', 'INFO'))
 
 # Initialize AWS clients (outside handler for connection reuse)
-dynamodb_client = boto3.client('dynamodb')
-s3_client = boto3.client('s3')
+dynamodb_client = get_client('dynamodb')
+s3_client = get_client('s3')
 
 # Environment variables
 DYNAMODB_TABLE_NAME = os.environ.get('DYNAMODB_TABLE_NAME', 'bbws-customer-portal-orders-dev')
 S3_BUCKET_NAME = os.environ.get('S3_ORDERS_BUCKET', 'bbws-orders-dev')
 COMPANY_NAME = os.environ.get('COMPANY_NAME', 'BBWS')
+# Draw the invoice page background from a form XObject reused on every page
+PDF_CACHE_BACKGROUND = os.environ.get('PDF_CACHE_BACKGROUND', 'false').lower() == 'true'
+# How PDFs reach S3: 'stream' (multipart parts while rendering), 'spooled'
+# (temporary file, uploaded when complete) or 'buffer' (bytes + PutObject)
+PDF_UPLOAD_MODE = os.environ.get('PDF_UPLOAD_MODE', 'stream').lower()
+PDF_UPLOAD_PART_SIZE = int(os.environ.get('PDF_UPLOAD_PART_SIZE', str(8 * 1024 * 1024)))
+PDF_SPOOL_MAX_SIZE = int(os.environ.get('PDF_SPOOL_MAX_SIZE', str(16 * 1024 * 1024)))
+# Seconds before an abandoned generation claim can be taken over (at least the function timeout)
+PDF_CLAIM_LEASE_SECONDS = int(os.environ.get('PDF_CLAIM_LEASE_SECONDS', '60'))
 
 # Initialize services
 order_dao = OrderDAO(dynamodb_client, DYNAMODB_TABLE_NAME)
-pdf_service = PDFService(company_name=COMPANY_NAME)
+# PDFService builds invoice styles and static blocks once per container
+pdf_service = PDFService(company_name=COMPANY_NAME, cache_background=PDF_CACHE_BACKGROUND)
 s3_service = S3Service(s3_client, S3_BUCKET_NAME)
 
+# Records of a batch are processed concurrently (SQS_BATCH_MAX_WORKERS, SQS_RECORD_TIMEOUT_SECONDS)
+batch_runner = SQSBatchRunner.from_env()
+
 
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
@@ -71,68 +86,69 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     logger.info(f"OrderPDFCreator invoked with {len(event.get('Records', []))} messages")
 
-    # Track failed messages for partial batch failure
-    failed_message_ids = []
+    # Process SQS messages concurrently; failed messages are retried by SQS
+    batch_item_failures = batch_runner.run(event.get('Records', []), process_record, context)
 
-    # Process each SQS message
-    for record in event.get('Records', []):
-        message_id = record.get('messageId')
+    # Return partial batch failure response
+    # SQS will retry only the failed messages
+    if batch_item_failures:
+        failed_message_ids = [failure['itemIdentifier'] for failure in batch_item_failures]
+        logger.warning(f"Failed to process {len(failed_message_ids)} messages: {failed_message_ids}")
+        return {'batchItemFailures': batch_item_failures}
 
-        try:
-            # Parse message body
-            message_body = json.loads(record['body'])
-            logger.info(f"Processing message {message_id}: {json.dumps(message_body)}")
+    logger.info("All messages processed successfully")
+    return {'batchItemFailures': []}
 
-            # Extract order identifiers
-            order_id = message_body.get('orderId')
-            tenant_id = message_body.get('tenantId')
 
-            if not order_id or not tenant_id:
-                logger.error(f"Missing orderId or tenantId in message {message_id}")
-                failed_message_ids.append(message_id)
-                continue
+def process_record(record: Dict[str, Any]) -> None:
+    """
+    Process one SQS record.
 
-            # Process the order PDF generation
-            process_order_pdf(tenant_id, order_id)
+    Args:
+        record: SQS record with an order creation message body
 
-            logger.info(f"Successfully processed message {message_id}")
+    Raises:
+        ValueError: If orderId or tenantId is missing, or the order is not found
+        Exception: If PDF generation or upload fails
+    """
+    message_id = record.get('messageId')
 
-        except Exception as e:
-            logger.error(
-                f"Error processing message {message_id}: {str(e)}",
-                exc_info=True
-            )
-            # Add to failed messages for retry
-            failed_message_ids.append(message_id)
+    # Parse message body
+    message_body = json.loads(record['body'])
+    logger.info(f"Processing message {message_id}: {json.dumps(message_body)}")
 
-    # Return partial batch failure response
-    # SQS will retry only the failed messages
-    if failed_message_ids:
-        logger.warning(f"Failed to process {len(failed_message_ids)} messages: {failed_message_ids}")
-        return {
-            'batchItemFailures': [
-                {'itemIdentifier': msg_id} for msg_id in failed_message_ids
-            ]
-        }
+    # Extract order identifiers
+    order_id = message_body.get('orderId')
+    tenant_id = message_body.get('tenantId')
 
-    logger.info("All messages processed successfully")
-    return {'batchItemFailures': []}
+    if not order_id or not tenant_id:
+        raise ValueError(f"Missing orderId or tenantId in message {message_id}")
+
+    # Process the order PDF generation
+    process_order_pdf(tenant_id, order_id)
 
+    logger.info(f"Successfully processed message {message_id}")
 
-def process_order_pdf(tenant_id: str, order_id: str) -> None:
+
+def process_order_pdf(tenant_id: str, order_id: str, force: bool = False) -> None:
     """
     Process PDF generation for a single order.
 
     Steps:
     1. Fetch order from DynamoDB
-    2. Check if PDF already exists (idempotency)
-    3. Generate PDF invoice
-    4. Upload to S3
-    5. Update order record with pdfUrl
+    2. Skip if a PDF was recorded for the current order content (idempotency)
+    3. Claim generation with a conditional update (concurrent deliveries)
+    4. Generate PDF invoice and upload to S3
+    5. Record pdfUrl, content hash and ETag on the order
+
+    Idempotency is decided from the order item alone; S3 is only checked by
+    the reconciliation sweep (src/handlers/pdf_reconciliation.py).
 
     Args:
         tenant_id: Tenant identifier
         order_id: Order identifier
+        force: Skip the step 2 check on the (possibly stale) item read; the
+            conditional claim still prevents duplicate generation
 
     Raises:
         ValueError: If order not found
@@ -149,29 +165,63 @@ def process_order_pdf(tenant_id: str, order_id: str) -> None:
         # Let SQS retry
         raise ValueError(f"Order not found: {order_id}")
 
-    # Step 2: Check if PDF already exists (idempotency)
-    if order.pdfUrl:
-        logger.info(f"PDF already exists for order {order_id}: {order.pdfUrl}")
-        # Check if file actually exists in S3
-        if s3_service.check_pdf_exists(tenant_id, order_id):
-            logger.info(f"PDF confirmed in S3, skipping regeneration")
-            return
-        else:
-            logger.warning(f"PDF URL exists but file missing in S3, regenerating")
-
-    # Step 3: Generate PDF invoice
-    logger.info(f"Generating PDF for order {order.orderNumber}")
-    pdf_bytes = pdf_service.generate_invoice_pdf(order)
-    logger.info(f"PDF generated: {len(pdf_bytes)} bytes")
-
-    # Step 4: Upload to S3
-    logger.info(f"Uploading PDF to S3")
-    pdf_url = s3_service.upload_pdf(pdf_bytes, tenant_id, order_id)
-    logger.info(f"PDF uploaded successfully: {pdf_url}")
-
-    # Step 5: Update order record with pdfUrl
-    order.pdfUrl = pdf_url
-    order_dao.update_order(order)
+    # Step 2: Skip if the recorded PDF matches the current order content
+    content_hash = pdf_service.invoice_content_hash(order)
+    if not force and order.pdfUrl and order.pdfContentHash == content_hash:
+        logger.info(f"PDF already generated for order {order_id}: {order.pdfUrl}")
+        return
+
+    # Step 3: Claim generation; another invocation may already have it
+    claim_token = str(uuid.uuid4())
+    if not order_dao.claim_pdf_generation(tenant_id, order_id, content_hash, claim_token, PDF_CLAIM_LEASE_SECONDS):
+        logger.info(f"PDF for order {order_id} generated or in progress elsewhere, skipping")
+        return
+
+    # Step 4: Generate PDF invoice and upload to S3
+    try:
+        logger.info(f"Generating PDF for order {order.orderNumber}")
+        pdf_url, etag = generate_and_upload_pdf(order, tenant_id, order_id)
+        logger.info(f"PDF uploaded successfully: {pdf_url}")
+    except Exception:
+        order_dao.release_pdf_claim(tenant_id, order_id, claim_token)
+        raise
+
+    # Step 5: Record the PDF on the order
+    order_dao.record_pdf(tenant_id, order_id, pdf_url, content_hash, etag, claim_token)
     logger.info(f"Order updated with PDF URL: {order_id}")
 
     logger.info(f"PDF processing complete for order {order_id}")
+
+
+def generate_and_upload_pdf(order, tenant_id: str, order_id: str) -> Tuple[str, Optional[str]]:
+    """
+    Generate the invoice PDF and upload it to S3 (PDF_UPLOAD_MODE).
+
+    In 'stream' and 'spooled' mode ReportLab writes straight into the S3
+    upload, so the PDF is never held as a separate bytes copy; a failure
+    while rendering aborts the upload.
+
+    Args:
+        order: Order to generate the invoice for
+        tenant_id: Tenant identifier
+        order_id: Order identifier
+
+    Returns:
+        Tuple of (S3 URL to uploaded PDF, S3 ETag or None if not returned)
+    """
+    if PDF_UPLOAD_MODE == 'buffer':
+        pdf_bytes = pdf_service.generate_invoice_pdf(order)
+        logger.info(f"PDF generated: {len(pdf_bytes)} bytes")
+        return s3_service.upload_pdf(pdf_bytes, tenant_id, order_id), None
+
+    with s3_service.open_pdf_upload(
+        tenant_id,
+        order_id,
+        spooled=PDF_UPLOAD_MODE == 'spooled',
+        part_size=PDF_UPLOAD_PART_SIZE,
+        spool_max_size=PDF_SPOOL_MAX_SIZE
+    ) as upload:
+        pdf_service.write_invoice_pdf(order, upload)
+
+    logger.info(f"PDF generated and uploaded: {upload.bytes_written} bytes")
+    return upload.url, upload.etag
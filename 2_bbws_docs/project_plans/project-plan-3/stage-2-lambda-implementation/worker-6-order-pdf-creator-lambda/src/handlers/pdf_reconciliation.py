@@ -0,0 +1,105 @@
+"""
+PDF Reconciliation Lambda Handler.
+
+Scheduled (EventBridge) sweep that checks recorded invoice PDFs against S3.
+OrderPDFCreator decides idempotency from the order item alone, so this is
+the only place S3 is asked whether a recorded PDF still exists.
+
+Sweep Flow:
+1. Continue the Scan from the saved cursor (or the event's startKey)
+2. HEAD each recorded PDF
+3. If missing or replaced (ETag differs), clear the record and regenerate
+4. Save the cursor before the Lambda runs out of time
+
+Deployed from the same image with the handler overridden to
+src.handlers.pdf_reconciliation.lambda_handler.
+"""
+
+import logging
+import os
+from typing import Any, Dict
+from src.handlers.order_pdf_creator import order_dao, process_order_pdf, s3_service
+
+logger = logging.getLogger()
+logger.setLevel(os.environ.get('LOG_LEVEL', 'INFO'))
+
+# Items evaluated per Scan page
+RECONCILE_PAGE_SIZE = int(os.environ.get('RECONCILE_PAGE_SIZE', '100'))
+# Stop starting new pages when less time than this remains
+RECONCILE_MIN_REMAINING_MS = int(os.environ.get('RECONCILE_MIN_REMAINING_MS', '15000'))
+
+
+def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    """
+    Lambda handler for the PDF reconciliation sweep.
+
+    Args:
+        event: Scheduled event; an optional startKey overrides the saved cursor
+        context: Lambda context object
+
+    Returns:
+        Dictionary with checked, repaired and failed counts and whether the
+        sweep reached the end of the table
+    """
+    start_key = event.get('startKey') or order_dao.get_reconciliation_cursor()
+    logger.info(f"PDF reconciliation started (resuming={start_key is not None})")
+
+    checked = repaired = failed = 0
+    completed = False
+
+    for page in order_dao.scan_pdf_records(start_key=start_key, page_size=RECONCILE_PAGE_SIZE):
+        for record in page['records']:
+            checked += 1
+            try:
+                if reconcile_record(record):
+                    repaired += 1
+            except Exception as e:
+                failed += 1
+                logger.error(f"Error reconciling order {record.get('id')}: {str(e)}", exc_info=True)
+
+        last_key = page['lastEvaluatedKey']
+        order_dao.save_reconciliation_cursor(last_key)
+
+        if last_key is None:
+            completed = True
+            break
+        if context.get_remaining_time_in_millis() < RECONCILE_MIN_REMAINING_MS:
+            logger.info("Stopping reconciliation sweep before timeout; cursor saved")
+            break
+
+    logger.info(
+        f"PDF reconciliation finished: checked={checked}, repaired={repaired}, "
+        f"failed={failed}, completed={completed}"
+    )
+    return {'checked': checked, 'repaired': repaired, 'failed': failed, 'completed': completed}
+
+
+def reconcile_record(record: Dict[str, str]) -> bool:
+    """
+    Check one recorded PDF and regenerate it if missing or replaced.
+
+    Args:
+        record: Order attributes tenantId, id, pdfContentHash and pdfETag
+
+    Returns:
+        True if the PDF was regenerated, False if it was in order
+    """
+    tenant_id = record['tenantId']
+    order_id = record['id']
+
+    etag = s3_service.get_pdf_etag(tenant_id, order_id)
+    recorded_etag = record.get('pdfETag')
+
+    if etag is not None and (recorded_etag is None or etag == recorded_etag):
+        return False
+
+    logger.warning(
+        f"PDF for order {order_id} {'missing' if etag is None else 'replaced'} in S3, regenerating"
+    )
+
+    # Conditional on the hash read by the scan: a PDF recorded since is kept
+    if not order_dao.clear_pdf_record(tenant_id, order_id, record['pdfContentHash']):
+        return False
+
+    process_order_pdf(tenant_id, order_id, force=True)
+    return True
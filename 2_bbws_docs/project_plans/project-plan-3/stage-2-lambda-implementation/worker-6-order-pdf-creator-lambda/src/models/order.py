@@ -38,6 +38,8 @@ class Order(BaseModel):
         campaign: Campaign information (optional)
         paymentDetails: Payment transaction details (optional)
         pdfUrl: URL to generated PDF invoice (optional)
+        pdfContentHash: Hash of the order content the PDF was generated from (optional)
+        pdfETag: S3 ETag of the uploaded PDF (optional)
         notes: Order notes/comments (optional)
         metadata: Additional metadata (JSON object, optional)
         isActive: Soft delete flag (Activatable Entity Pattern)
@@ -78,6 +80,8 @@ class Order(BaseModel):
 
     # PDF invoice
     pdfUrl: Optional[str] = Field(None, description="PDF invoice URL")
+    pdfContentHash: Optional[str] = Field(None, description="Hash of the invoiced order content")
+    pdfETag: Optional[str] = Field(None, description="S3 ETag of the PDF invoice")
 
     # Additional data
     notes: Optional[str] = Field(None, description="Order notes", max_length=2000)
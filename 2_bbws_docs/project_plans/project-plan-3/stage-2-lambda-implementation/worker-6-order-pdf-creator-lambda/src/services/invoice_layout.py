@@ -0,0 +1,231 @@
+"""
+InvoiceLayout - Precomputed ReportLab styles and static blocks for invoices.
+
+Everything that does not depend on the order (paragraph styles, table styles,
+font metrics, the header and footer blocks) is built once when the layout is
+created, so an invoice only creates its per-order flowables.
+"""
+
+import copy
+import logging
+from typing import Dict, List
+from reportlab.lib import colors
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.units import mm
+from reportlab.pdfbase import pdfmetrics
+from reportlab.platypus import Flowable, Paragraph, Spacer, TableStyle
+
+logger = logging.getLogger(__name__)
+
+# Name of the page background form XObject
+BACKGROUND_FORM_NAME = 'InvoiceBackground'
+
+
+class InvoiceLayout:
+    """
+    Styles, table styles and static blocks of the invoice PDF.
+
+    Static flowables are parsed once and handed out as shallow copies, so
+    documents built at the same time (concurrent SQS records) never share
+    wrap state. With cache_background, static page decoration is drawn once
+    per document as a form XObject and referenced from every page.
+
+    Attributes:
+        company_name: Company name for the invoice header
+        font_name: Regular font for tables
+        bold_font_name: Bold font for table labels and totals
+        cache_background: Draw the page background from a form XObject
+    """
+
+    def __init__(
+        self,
+        company_name: str,
+        font_name: str = 'Helvetica',
+        bold_font_name: str = 'Helvetica-Bold',
+        cache_background: bool = False
+    ):
+        """
+        Initialize InvoiceLayout.
+
+        Args:
+            company_name: Company name for the invoice header
+            font_name: Regular font (standard or registered with pdfmetrics)
+            bold_font_name: Bold font (standard or registered with pdfmetrics)
+            cache_background: Draw page background decoration as a form XObject
+        """
+        self.company_name = company_name
+        self.font_name = font_name
+        self.bold_font_name = bold_font_name
+        self.cache_background = cache_background
+
+        # Load font metrics now instead of during the first invoice
+        for name in (font_name, bold_font_name):
+            pdfmetrics.getFont(name)
+
+        self._build_styles()
+        self._build_table_styles()
+        self._build_static_blocks()
+
+        logger.info(f"Invoice layout built for {company_name} (cache_background={cache_background})")
+
+    def _build_styles(self) -> None:
+        """Build paragraph styles."""
+        styles = getSampleStyleSheet()
+
+        self.header_style = ParagraphStyle(
+            'CustomHeader',
+            parent=styles['Heading1'],
+            fontSize=24,
+            textColor=colors.HexColor('#1a1a1a'),
+            spaceAfter=6 * mm
+        )
+        self.title_style = ParagraphStyle(
+            'InvoiceTitle',
+            parent=styles['Heading2'],
+            fontSize=18,
+            textColor=colors.HexColor('#333333')
+        )
+        self.section_style = styles['Heading3']
+        self.normal_style = styles['Normal']
+        self.footer_style = ParagraphStyle(
+            'Footer',
+            parent=styles['Normal'],
+            fontSize=8,
+            textColor=colors.HexColor('#888888'),
+            alignment=1  # Center alignment
+        )
+
+    def _build_table_styles(self) -> None:
+        """Build table styles (TableStyle objects are only read by Table.setStyle)."""
+        self.order_info_style = TableStyle([
+            ('FONTNAME', (0, 0), (0, -1), self.bold_font_name),
+            ('FONTNAME', (1, 0), (1, -1), self.font_name),
+            ('FONTSIZE', (0, 0), (-1, -1), 10),
+            ('TEXTCOLOR', (0, 0), (0, -1), colors.HexColor('#555555')),
+            ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
+            ('ALIGN', (1, 0), (1, -1), 'LEFT'),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 3),
+        ])
+
+        self.customer_info_style = TableStyle([
+            ('FONTNAME', (0, 0), (0, -1), self.bold_font_name),
+            ('FONTNAME', (1, 0), (1, -1), self.font_name),
+            ('FONTSIZE', (0, 0), (-1, -1), 9),
+            ('TEXTCOLOR', (0, 0), (0, -1), colors.HexColor('#555555')),
+            ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
+            ('ALIGN', (1, 0), (1, -1), 'LEFT'),
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 3),
+        ])
+
+        self.items_style = TableStyle([
+            # Header row
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#f0f0f0')),
+            ('FONTNAME', (0, 0), (-1, 0), self.bold_font_name),
+            ('FONTSIZE', (0, 0), (-1, 0), 9),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.HexColor('#333333')),
+            ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 6),
+
+            # Data rows
+            ('FONTNAME', (0, 1), (-1, -1), self.font_name),
+            ('FONTSIZE', (0, 1), (-1, -1), 8),
+            ('ALIGN', (0, 1), (0, -1), 'LEFT'),
+            ('ALIGN', (1, 1), (-1, -1), 'CENTER'),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+
+            # Grid
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f9f9f9')]),
+        ])
+
+        self.totals_style = TableStyle([
+            ('FONTNAME', (0, 0), (0, -2), self.font_name),
+            ('FONTNAME', (0, -1), (-1, -1), self.bold_font_name),
+            ('FONTSIZE', (0, 0), (-1, -2), 10),
+            ('FONTSIZE', (0, -1), (-1, -1), 12),
+            ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
+            ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
+            ('TEXTCOLOR', (0, -1), (-1, -1), colors.HexColor('#1a1a1a')),
+            ('LINEABOVE', (0, -1), (-1, -1), 2, colors.HexColor('#333333')),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
+        ])
+
+        self.payment_style = TableStyle([
+            ('FONTNAME', (0, 0), (0, -1), self.bold_font_name),
+            ('FONTNAME', (1, 0), (1, -1), self.font_name),
+            ('FONTSIZE', (0, 0), (-1, -1), 9),
+            ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
+            ('ALIGN', (1, 0), (1, -1), 'LEFT'),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 3),
+        ])
+
+    def _build_static_blocks(self) -> None:
+        """Parse the flowables that are the same on every invoice."""
+        self._header: List[Flowable] = [
+            Paragraph(self.company_name, self.header_style),
+            Spacer(1, 3 * mm),
+            Paragraph("ORDER INVOICE", self.title_style),
+            Spacer(1, 6 * mm),
+        ]
+        self._footer: List[Flowable] = [
+            Spacer(1, 10 * mm),
+            Paragraph(
+                "Thank you for your business!<br/>This is a computer-generated invoice.",
+                self.footer_style
+            ),
+        ]
+        self._sections: Dict[str, List[Flowable]] = {
+            title: [Paragraph(f"<b>{title}</b>", self.section_style), Spacer(1, 3 * mm)]
+            for title in ("Customer Information", "Order Items", "Payment Information")
+        }
+
+    def header(self) -> List[Flowable]:
+        """Company name and invoice title."""
+        return [copy.copy(flowable) for flowable in self._header]
+
+    def footer(self) -> List[Flowable]:
+        """Closing note."""
+        return [copy.copy(flowable) for flowable in self._footer]
+
+    def section(self, title: str) -> List[Flowable]:
+        """Section heading ("Customer Information", "Order Items" or "Payment Information")."""
+        return [copy.copy(flowable) for flowable in self._sections[title]]
+
+    def draw_background(self, canvas, doc) -> None:
+        """
+        Page callback drawing the static page decoration.
+
+        The decoration is recorded once per document as a form XObject and
+        placed on every page, so multi-page invoices do not repeat its drawing
+        operations. Does nothing unless cache_background is set.
+
+        Args:
+            canvas: ReportLab canvas of the page
+            doc: Document being built
+        """
+        if not self.cache_background:
+            return
+
+        if not canvas.hasForm(BACKGROUND_FORM_NAME):
+            page_width, page_height = doc.pagesize
+            canvas.beginForm(BACKGROUND_FORM_NAME)
+            canvas.setStrokeColor(colors.HexColor('#dddddd'))
+            canvas.setLineWidth(0.5)
+            canvas.line(
+                doc.leftMargin, page_height - doc.topMargin + 4 * mm,
+                page_width - doc.rightMargin, page_height - doc.topMargin + 4 * mm
+            )
+            canvas.line(
+                doc.leftMargin, doc.bottomMargin - 4 * mm,
+                page_width - doc.rightMargin, doc.bottomMargin - 4 * mm
+            )
+            canvas.setFont(self.font_name, 7)
+            canvas.setFillColor(colors.HexColor('#888888'))
+            canvas.drawCentredString(page_width / 2, doc.bottomMargin - 8 * mm, f"{self.company_name} - Order Invoice")
+            canvas.endForm()
+
+        canvas.saveState()
+        canvas.doForm(BACKGROUND_FORM_NAME)
+        canvas.restoreState()
@@ -4,20 +4,29 @@ PDFService - Service for generating PDF invoices using ReportLab.
 Creates professional PDF invoices with order details, line items, and totals.
 """
 
+import hashlib
 import logging
 from io import BytesIO
 from datetime import datetime
-from typing import Optional
+from typing import BinaryIO, Optional
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.units import mm
-from reportlab.lib import colors
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image
-from reportlab.pdfgen import canvas
+from reportlab.platypus import SimpleDocTemplate, Table, Paragraph, Spacer
 from src.models.order import Order
+from src.services.invoice_layout import InvoiceLayout
 
 logger = logging.getLogger(__name__)
 
+# Order fields shown on the invoice; a change to any of them needs a new PDF
+INVOICE_FIELDS = {
+    'id', 'orderNumber', 'status', 'customerName', 'customerEmail', 'billingAddress',
+    'items', 'subtotal', 'taxAmount', 'shippingAmount', 'discountAmount', 'total',
+    'currency', 'paymentDetails', 'dateCreated'
+}
+
+# Bump when the invoice layout changes so existing PDFs are regenerated
+INVOICE_LAYOUT_VERSION = 1
+
 
 class PDFService:
     """
@@ -30,18 +39,46 @@ class PDFService:
     - Itemized line items table
     - Financial totals (subtotal, tax, shipping, discount, total)
     - Payment status
+
+    Styles and static blocks come from an InvoiceLayout built once per
+    service (the handler creates one service per container).
     """
 
-    def __init__(self, company_name: str = "BBWS", company_logo_url: Optional[str] = None):
+    def __init__(
+        self,
+        company_name: str = "BBWS",
+        company_logo_url: Optional[str] = None,
+        cache_background: bool = False
+    ):
         """
         Initialize PDFService.
 
         Args:
             company_name: Company name for invoice header
             company_logo_url: URL to company logo (optional)
+            cache_background: Draw page background decoration from a form XObject
         """
         self.company_name = company_name
         self.company_logo_url = company_logo_url
+        self.layout = InvoiceLayout(company_name, cache_background=cache_background)
+
+    def invoice_content_hash(self, order: Order) -> str:
+        """
+        Hash of everything the invoice shows for an order.
+
+        Recorded on the order with the uploaded PDF; an unchanged hash means
+        the existing PDF is still correct and need not be generated again.
+
+        Args:
+            order: Order object
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        canonical = order.json(include=INVOICE_FIELDS, sort_keys=True, separators=(',', ':'))
+        digest = hashlib.sha256(f"{INVOICE_LAYOUT_VERSION}|{self.company_name}|".encode('utf-8'))
+        digest.update(canonical.encode('utf-8'))
+        return digest.hexdigest()
 
     def generate_invoice_pdf(self, order: Order) -> bytes:
         """
@@ -53,18 +90,43 @@ class PDFService:
         Returns:
             PDF file as bytes
 
+        Raises:
+            Exception: If PDF generation fails
+        """
+        buffer = BytesIO()
+        self.write_invoice_pdf(order, buffer)
+        pdf_bytes = buffer.getvalue()
+        buffer.close()
+        return pdf_bytes
+
+    def write_invoice_pdf(self, order: Order, output: BinaryIO) -> int:
+        """
+        Generate PDF invoice for an order into a writable binary file.
+
+        Writing into an S3 upload (S3Service.open_pdf_upload) avoids keeping a
+        bytes copy of the PDF next to ReportLab's own output.
+
+        Args:
+            order: Order object with complete order data
+            output: Writable binary file object
+
+        Returns:
+            Number of bytes written
+
         Raises:
             Exception: If PDF generation fails
         """
         try:
             logger.info(f"Generating PDF invoice for order: {order.orderNumber}")
 
-            # Create BytesIO buffer for PDF
-            buffer = BytesIO()
+            layout = self.layout
+
+            # Count bytes through a thin wrapper so any file object works
+            sink = _CountingWriter(output)
 
             # Create PDF document
             doc = SimpleDocTemplate(
-                buffer,
+                sink,
                 pagesize=A4,
                 rightMargin=20 * mm,
                 leftMargin=20 * mm,
@@ -72,30 +134,8 @@ class PDFService:
                 bottomMargin=20 * mm
             )
 
-            # Build PDF content
-            story = []
-            styles = getSampleStyleSheet()
-
-            # Header with company name
-            header_style = ParagraphStyle(
-                'CustomHeader',
-                parent=styles['Heading1'],
-                fontSize=24,
-                textColor=colors.HexColor('#1a1a1a'),
-                spaceAfter=6 * mm
-            )
-            story.append(Paragraph(self.company_name, header_style))
-            story.append(Spacer(1, 3 * mm))
-
-            # Invoice title
-            title_style = ParagraphStyle(
-                'InvoiceTitle',
-                parent=styles['Heading2'],
-                fontSize=18,
-                textColor=colors.HexColor('#333333')
-            )
-            story.append(Paragraph("ORDER INVOICE", title_style))
-            story.append(Spacer(1, 6 * mm))
+            # Build PDF content: static header, then per-order flowables
+            story = layout.header()
 
             # Order information section
             order_info_data = [
@@ -106,22 +146,12 @@ class PDFService:
             ]
 
             order_info_table = Table(order_info_data, colWidths=[45 * mm, 75 * mm])
-            order_info_table.setStyle(TableStyle([
-                ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-                ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
-                ('FONTSIZE', (0, 0), (-1, -1), 10),
-                ('TEXTCOLOR', (0, 0), (0, -1), colors.HexColor('#555555')),
-                ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
-                ('ALIGN', (1, 0), (1, -1), 'LEFT'),
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 3),
-            ]))
+            order_info_table.setStyle(layout.order_info_style)
             story.append(order_info_table)
             story.append(Spacer(1, 8 * mm))
 
             # Customer information section
-            story.append(Paragraph("<b>Customer Information</b>", styles['Heading3']))
-            story.append(Spacer(1, 3 * mm))
+            story.extend(layout.section("Customer Information"))
 
             customer_info_data = [
                 ['Name:', order.customerName or 'N/A'],
@@ -138,29 +168,19 @@ class PDFService:
                 customer_info_data.append(['Billing Address:', '<br/>'.join(address_lines)])
 
             customer_info_table = Table(customer_info_data, colWidths=[45 * mm, 120 * mm])
-            customer_info_table.setStyle(TableStyle([
-                ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-                ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
-                ('FONTSIZE', (0, 0), (-1, -1), 9),
-                ('TEXTCOLOR', (0, 0), (0, -1), colors.HexColor('#555555')),
-                ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
-                ('ALIGN', (1, 0), (1, -1), 'LEFT'),
-                ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 3),
-            ]))
+            customer_info_table.setStyle(layout.customer_info_style)
             story.append(customer_info_table)
             story.append(Spacer(1, 8 * mm))
 
             # Order items section
-            story.append(Paragraph("<b>Order Items</b>", styles['Heading3']))
-            story.append(Spacer(1, 3 * mm))
+            story.extend(layout.section("Order Items"))
 
             # Build items table
             items_data = [['Product', 'SKU', 'Qty', 'Unit Price', 'Subtotal', 'Tax', 'Total']]
 
             for item in order.items:
                 items_data.append([
-                    Paragraph(item.productName, styles['Normal']),
+                    Paragraph(item.productName, layout.normal_style),
                     item.productSku,
                     str(item.quantity),
                     f"{order.currency} {item.unitPrice:.2f}",
@@ -173,26 +193,7 @@ class PDFService:
                 items_data,
                 colWidths=[60 * mm, 30 * mm, 15 * mm, 25 * mm, 25 * mm, 20 * mm, 25 * mm]
             )
-            items_table.setStyle(TableStyle([
-                # Header row
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#f0f0f0')),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 9),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.HexColor('#333333')),
-                ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 6),
-
-                # Data rows
-                ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-                ('FONTSIZE', (0, 1), (-1, -1), 8),
-                ('ALIGN', (0, 1), (0, -1), 'LEFT'),
-                ('ALIGN', (1, 1), (-1, -1), 'CENTER'),
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-
-                # Grid
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f9f9f9')]),
-            ]))
+            items_table.setStyle(layout.items_style)
             story.append(items_table)
             story.append(Spacer(1, 8 * mm))
 
@@ -212,24 +213,13 @@ class PDFService:
             totals_data.append(['TOTAL:', f"{order.currency} {order.total:.2f}"])
 
             totals_table = Table(totals_data, colWidths=[120 * mm, 50 * mm])
-            totals_table.setStyle(TableStyle([
-                ('FONTNAME', (0, 0), (0, -2), 'Helvetica'),
-                ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, -2), 10),
-                ('FONTSIZE', (0, -1), (-1, -1), 12),
-                ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
-                ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
-                ('TEXTCOLOR', (0, -1), (-1, -1), colors.HexColor('#1a1a1a')),
-                ('LINEABOVE', (0, -1), (-1, -1), 2, colors.HexColor('#333333')),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-            ]))
+            totals_table.setStyle(layout.totals_style)
             story.append(totals_table)
             story.append(Spacer(1, 8 * mm))
 
             # Payment information
             if order.paymentDetails:
-                story.append(Paragraph("<b>Payment Information</b>", styles['Heading3']))
-                story.append(Spacer(1, 3 * mm))
+                story.extend(layout.section("Payment Information"))
 
                 payment_data = [
                     ['Payment Method:', order.paymentDetails.method.replace('_', ' ').title()],
@@ -246,41 +236,32 @@ class PDFService:
                     ])
 
                 payment_table = Table(payment_data, colWidths=[45 * mm, 120 * mm])
-                payment_table.setStyle(TableStyle([
-                    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-                    ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),
-                    ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
-                    ('ALIGN', (1, 0), (1, -1), 'LEFT'),
-                    ('BOTTOMPADDING', (0, 0), (-1, -1), 3),
-                ]))
+                payment_table.setStyle(layout.payment_style)
                 story.append(payment_table)
                 story.append(Spacer(1, 8 * mm))
 
             # Footer
-            footer_style = ParagraphStyle(
-                'Footer',
-                parent=styles['Normal'],
-                fontSize=8,
-                textColor=colors.HexColor('#888888'),
-                alignment=1  # Center alignment
-            )
-            story.append(Spacer(1, 10 * mm))
-            story.append(Paragraph(
-                "Thank you for your business!<br/>This is a computer-generated invoice.",
-                footer_style
-            ))
+            story.extend(layout.footer())
 
             # Build PDF
-            doc.build(story)
-
-            # Get PDF bytes
-            pdf_bytes = buffer.getvalue()
-            buffer.close()
+            doc.build(story, onFirstPage=layout.draw_background, onLaterPages=layout.draw_background)
 
-            logger.info(f"PDF generated successfully: {len(pdf_bytes)} bytes")
-            return pdf_bytes
+            logger.info(f"PDF generated successfully: {sink.bytes_written} bytes")
+            return sink.bytes_written
 
         except Exception as e:
             logger.error(f"Error generating PDF: {str(e)}", exc_info=True)
             raise
+
+
+class _CountingWriter:
+    """Write-through file wrapper counting the bytes ReportLab writes."""
+
+    def __init__(self, output: BinaryIO):
+        self._output = output
+        self.bytes_written = 0
+
+    def write(self, data: bytes) -> int:
+        self._output.write(data)
+        self.bytes_written += len(data)
+        return len(data)
@@ -0,0 +1,279 @@
+"""
+Streaming PDF uploads to S3.
+
+File-like sinks that ReportLab writes into directly, so a generated PDF is
+never held both in a BytesIO buffer and as a bytes copy before upload:
+
+- MultipartPDFUpload feeds S3 multipart upload parts as data is written
+- SpooledPDFUpload spools to memory, then to a /tmp file, and uploads on close
+
+Both are context managers: leaving the block uploads (completes) the PDF,
+an exception aborts the upload so no partial object is left behind.
+"""
+
+import logging
+import tempfile
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# S3 minimum size for every part except the last
+MIN_PART_SIZE = 5 * 1024 * 1024
+DEFAULT_PART_SIZE = 8 * 1024 * 1024
+DEFAULT_SPOOL_MAX_SIZE = 16 * 1024 * 1024
+
+
+class PDFUpload(ABC):
+    """
+    Writable binary sink that ends up as one S3 object.
+
+    Attributes:
+        s3_client: Boto3 S3 client
+        bucket_name: S3 bucket name
+        key: S3 object key
+        url: S3 URL of the object
+        extra_args: PutObject arguments (ContentType, encryption, metadata)
+        bytes_written: Bytes written so far
+        etag: ETag of the S3 object (None until closed)
+    """
+
+    def __init__(self, s3_client, bucket_name: str, key: str, extra_args: Dict[str, Any]):
+        """
+        Initialize PDFUpload.
+
+        Args:
+            s3_client: Boto3 S3 client
+            bucket_name: S3 bucket name
+            key: S3 object key
+            extra_args: PutObject arguments (ContentType, ServerSideEncryption, Metadata)
+        """
+        self.s3_client = s3_client
+        self.bucket_name = bucket_name
+        self.key = key
+        self.url = f"https://{bucket_name}.s3.amazonaws.com/{key}"
+        self.extra_args = extra_args
+        self.bytes_written = 0
+        self.etag: Optional[str] = None
+        self.closed = False
+
+    def writable(self) -> bool:
+        """File-like protocol: the sink accepts writes."""
+        return True
+
+    @abstractmethod
+    def write(self, data: bytes) -> int:
+        """
+        Write PDF data.
+
+        Args:
+            data: Next chunk of the PDF
+
+        Returns:
+            Number of bytes written
+        """
+
+    def flush(self) -> None:
+        """File-like protocol: data is uploaded by write() and close()."""
+
+    @abstractmethod
+    def close(self) -> None:
+        """Finish the upload; the object exists in S3 afterwards."""
+
+    @abstractmethod
+    def abort(self) -> None:
+        """Discard the upload; no object is created."""
+
+    def __enter__(self) -> 'PDFUpload':
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+class MultipartPDFUpload(PDFUpload):
+    """
+    Upload PDF data as S3 multipart upload parts while it is written.
+
+    At most one part (part_size) is buffered. The multipart upload is only
+    created once a full part has been written; a PDF smaller than one part
+    (almost every invoice) is sent with a single PutObject on close.
+    """
+
+    def __init__(
+        self,
+        s3_client,
+        bucket_name: str,
+        key: str,
+        extra_args: Dict[str, Any],
+        part_size: int = DEFAULT_PART_SIZE
+    ):
+        """
+        Initialize MultipartPDFUpload.
+
+        Args:
+            s3_client: Boto3 S3 client
+            bucket_name: S3 bucket name
+            key: S3 object key
+            extra_args: PutObject arguments (ContentType, ServerSideEncryption, Metadata)
+            part_size: Bytes per part (at least 5 MiB)
+        """
+        super().__init__(s3_client, bucket_name, key, extra_args)
+        self.part_size = max(part_size, MIN_PART_SIZE)
+        self.upload_id: Optional[str] = None
+        self._parts: List[Dict[str, Any]] = []
+        self._buffer = bytearray()
+
+    def write(self, data: bytes) -> int:
+        view = memoryview(data)
+        size = len(view)
+        self.bytes_written += size
+
+        while len(view):
+            take = min(self.part_size - len(self._buffer), len(view))
+            if not self._buffer and take == self.part_size:
+                # Full part straight from the caller's data, without buffering
+                self._upload_part(bytes(view[:take]))
+            else:
+                self._buffer += view[:take]
+                if len(self._buffer) == self.part_size:
+                    self._upload_part(bytes(self._buffer))
+                    self._buffer.clear()
+            view = view[take:]
+
+        return size
+
+    def _upload_part(self, body: bytes) -> None:
+        """Upload one part, starting the multipart upload on the first one."""
+        if self.upload_id is None:
+            response = self.s3_client.create_multipart_upload(
+                Bucket=self.bucket_name,
+                Key=self.key,
+                **self.extra_args
+            )
+            self.upload_id = response['UploadId']
+            logger.info(f"Multipart upload started: key={self.key}, uploadId={self.upload_id}")
+
+        part_number = len(self._parts) + 1
+        response = self.s3_client.upload_part(
+            Bucket=self.bucket_name,
+            Key=self.key,
+            UploadId=self.upload_id,
+            PartNumber=part_number,
+            Body=body
+        )
+        self._parts.append({'ETag': response['ETag'], 'PartNumber': part_number})
+
+    def close(self) -> None:
+        if self.closed:
+            return
+
+        if self.upload_id is None:
+            response = self.s3_client.put_object(
+                Bucket=self.bucket_name,
+                Key=self.key,
+                Body=bytes(self._buffer),
+                **self.extra_args
+            )
+        else:
+            try:
+                if self._buffer:
+                    self._upload_part(bytes(self._buffer))
+                response = self.s3_client.complete_multipart_upload(
+                    Bucket=self.bucket_name,
+                    Key=self.key,
+                    UploadId=self.upload_id,
+                    MultipartUpload={'Parts': self._parts}
+                )
+            except Exception:
+                self.abort()
+                raise
+            logger.info(f"Multipart upload completed: key={self.key}, parts={len(self._parts)}")
+
+        self.etag = response.get('ETag')
+        self._buffer = bytearray()
+        self.closed = True
+
+    def abort(self) -> None:
+        if self.closed:
+            return
+
+        self._buffer = bytearray()
+        self.closed = True
+
+        if self.upload_id is not None:
+            try:
+                self.s3_client.abort_multipart_upload(
+                    Bucket=self.bucket_name,
+                    Key=self.key,
+                    UploadId=self.upload_id
+                )
+                logger.info(f"Multipart upload aborted: key={self.key}, uploadId={self.upload_id}")
+            except Exception as e:
+                # Left to the bucket's AbortIncompleteMultipartUpload lifecycle rule
+                logger.error(f"Error aborting multipart upload {self.upload_id}: {str(e)}")
+
+
+class SpooledPDFUpload(PDFUpload):
+    """
+    Spool PDF data to a temporary file and upload it on close.
+
+    Data stays in memory up to max_size, then moves to a file in /tmp.
+    Nothing is sent to S3 until the PDF is complete, and the upload reads a
+    seekable file, so the boto3 managed transfer can retry it and split large
+    files into concurrent parts. The managed transfer returns no ETag, so it
+    is read back with HeadObject once the upload completes.
+    """
+
+    def __init__(
+        self,
+        s3_client,
+        bucket_name: str,
+        key: str,
+        extra_args: Dict[str, Any],
+        max_size: int = DEFAULT_SPOOL_MAX_SIZE
+    ):
+        """
+        Initialize SpooledPDFUpload.
+
+        Args:
+            s3_client: Boto3 S3 client
+            bucket_name: S3 bucket name
+            key: S3 object key
+            extra_args: PutObject arguments (ContentType, ServerSideEncryption, Metadata)
+            max_size: Bytes kept in memory before spooling to /tmp
+        """
+        super().__init__(s3_client, bucket_name, key, extra_args)
+        self._file = tempfile.SpooledTemporaryFile(max_size=max_size)
+
+    def write(self, data: bytes) -> int:
+        self._file.write(data)
+        self.bytes_written += len(data)
+        return len(data)
+
+    def close(self) -> None:
+        if self.closed:
+            return
+
+        try:
+            self._file.seek(0)
+            self.s3_client.upload_fileobj(
+                self._file,
+                self.bucket_name,
+                self.key,
+                ExtraArgs=self.extra_args
+            )
+            self.etag = self.s3_client.head_object(Bucket=self.bucket_name, Key=self.key)['ETag']
+        finally:
+            self._file.close()
+            self.closed = True
+
+    def abort(self) -> None:
+        if self.closed:
+            return
+
+        self._file.close()
+        self.closed = True
@@ -5,7 +5,16 @@ Handles PDF upload to S3 with proper configuration.
 """
 
 import logging
-from typing import BinaryIO
+from typing import Any, BinaryIO, Dict, Optional
+from botocore.exceptions import ClientError
+
+from src.services.pdf_upload import (
+    DEFAULT_PART_SIZE,
+    DEFAULT_SPOOL_MAX_SIZE,
+    MultipartPDFUpload,
+    PDFUpload,
+    SpooledPDFUpload
+)
 
 logger = logging.getLogger(__name__)
 
@@ -57,7 +66,7 @@ class S3Service:
         """
         try:
             # Build S3 key
-            s3_key = f"{tenant_id}/orders/order_{order_id}.pdf"
+            s3_key = self._pdf_key(tenant_id, order_id)
 
             logger.info(f"Uploading PDF to S3: bucket={self.bucket_name}, key={s3_key}")
 
@@ -66,13 +75,7 @@ class S3Service:
                 Bucket=self.bucket_name,
                 Key=s3_key,
                 Body=file_data,
-                ContentType='application/pdf',
-                ServerSideEncryption='AES256',  # SSE-S3 encryption
-                Metadata={
-                    'tenant-id': tenant_id,
-                    'order-id': order_id,
-                    'document-type': 'invoice'
-                }
+                **self._pdf_put_args(tenant_id, order_id)
             )
 
             # Build S3 URL
@@ -85,6 +88,66 @@ class S3Service:
             logger.error(f"Error uploading PDF to S3: {str(e)}", exc_info=True)
             raise
 
+    def open_pdf_upload(
+        self,
+        tenant_id: str,
+        order_id: str,
+        spooled: bool = False,
+        part_size: int = DEFAULT_PART_SIZE,
+        spool_max_size: int = DEFAULT_SPOOL_MAX_SIZE
+    ) -> PDFUpload:
+        """
+        Open a file-like upload for an order PDF.
+
+        Write the PDF into the returned object inside a with block; leaving
+        the block uploads it, an exception aborts the upload.
+
+        Example:
+            with s3_service.open_pdf_upload(tenant_id, order_id) as upload:
+                pdf_service.write_invoice_pdf(order, upload)
+            pdf_url = upload.url
+
+        Args:
+            tenant_id: Tenant identifier
+            order_id: Order identifier
+            spooled: Spool to a temporary file and upload on close instead of
+                streaming multipart upload parts
+            part_size: Multipart part size in bytes (streaming)
+            spool_max_size: Bytes kept in memory before spooling to /tmp (spooled)
+
+        Returns:
+            Writable PDF upload with the S3 URL in its url attribute
+        """
+        s3_key = self._pdf_key(tenant_id, order_id)
+        extra_args = self._pdf_put_args(tenant_id, order_id)
+
+        logger.info(
+            f"Opening {'spooled' if spooled else 'streaming'} PDF upload: "
+            f"bucket={self.bucket_name}, key={s3_key}"
+        )
+
+        if spooled:
+            return SpooledPDFUpload(self.s3_client, self.bucket_name, s3_key, extra_args, max_size=spool_max_size)
+        return MultipartPDFUpload(self.s3_client, self.bucket_name, s3_key, extra_args, part_size=part_size)
+
+    @staticmethod
+    def _pdf_key(tenant_id: str, order_id: str) -> str:
+        """S3 key of an order PDF."""
+        return f"{tenant_id}/orders/order_{order_id}.pdf"
+
+    @staticmethod
+    def _pdf_put_args(tenant_id: str, order_id: str) -> Dict[str, Any]:
+        """Content type, encryption and metadata for an order PDF."""
+        return {
+            'ContentType': 'application/pdf',
+            'ServerSideEncryption': 'AES256',  # SSE-S3 encryption
+            'Metadata': {
+                'tenant-id': tenant_id,
+                'order-id': order_id,
+                'document-type': 'invoice'
+            }
+        }
+
     def get_pdf_url(self, tenant_id: str, order_id: str) -> str:
         """
         Get S3 URL for order PDF.
@@ -119,3 +182,28 @@ class S3Service:
         except Exception as e:
             logger.error(f"Error checking PDF existence: {str(e)}")
             return False
+
+    def get_pdf_etag(self, tenant_id: str, order_id: str) -> Optional[str]:
+        """
+        Get the ETag of an order PDF (reconciliation sweep).
+
+        Args:
+            tenant_id: Tenant identifier
+            order_id: Order identifier
+
+        Returns:
+            ETag of the PDF, or None if it does not exist
+
+        Raises:
+            ClientError: If the HEAD request fails for another reason
+        """
+        try:
+            response = self.s3_client.head_object(
+                Bucket=self.bucket_name,
+                Key=self._pdf_key(tenant_id, order_id)
+            )
+            return response.get('ETag')
+        except ClientError as e:
+            if e.response['Error']['Code'] in ('404', 'NoSuchKey', 'NotFound'):
+                return None
+            raise
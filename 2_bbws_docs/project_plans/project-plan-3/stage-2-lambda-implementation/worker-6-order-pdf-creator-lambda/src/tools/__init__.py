@@ -0,0 +1,5 @@
+"""
+Operational tools for Order Lambda.
+
+Command line tools reusing the Lambda services, run from the worker directory.
+"""
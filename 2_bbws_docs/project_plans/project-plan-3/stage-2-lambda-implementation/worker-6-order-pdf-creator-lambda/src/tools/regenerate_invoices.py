@@ -0,0 +1,371 @@
+"""
+Bulk invoice regeneration for the OrderPDFCreator.
+
+Re-renders the invoice PDFs of a tenant's orders in a date range after a
+layout or branding (COMPANY_NAME) change, without one SQS message per order.
+
+- Orders are streamed from GSI1 by parallel queries over date sub-ranges
+- PDFs are rendered in a process pool sized to the CPU cores
+- Uploads and DynamoDB updates run in a thread pool
+- Each order goes through the same content hash / claim / record steps as
+  the Lambda, so running alongside it never renders an invoice twice
+- Completed order IDs are appended to a checkpoint file; a rerun skips them
+
+Usage (from the worker directory):
+    python -m src.tools.regenerate_invoices --tenant tenant-123 \\
+        --from 2025-01-01 --to 2025-12-31 --company-name BBWS \\
+        --checkpoint regenerate-tenant-123.checkpoint
+"""
+
+import argparse
+import logging
+import os
+import queue
+import threading
+import time
+import uuid
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import date, timedelta
+from typing import Iterator, List, Optional, Set, Tuple
+
+from src.dao.order_dao import OrderDAO
+from src.models.order import Order
+from src.services.pdf_service import PDFService
+from src.services.s3_service import S3Service
+from src.utils.aws_clients import client_metrics, get_client
+
+logger = logging.getLogger(__name__)
+
+# Claims outlive a Lambda attempt; a regeneration may wait behind a deep queue
+CLAIM_LEASE_SECONDS = 900
+
+_END = object()
+
+# PDFService of a render process (built once per process by the pool initializer)
+_worker_pdf_service: Optional[PDFService] = None
+
+
+def _init_render_process(company_name: str, cache_background: bool) -> None:
+    """Process pool initializer: build the invoice layout once per process."""
+    global _worker_pdf_service
+    _worker_pdf_service = PDFService(company_name=company_name, cache_background=cache_background)
+
+
+def _render(order: Order) -> bytes:
+    """Render one invoice in a pool process."""
+    return _worker_pdf_service.generate_invoice_pdf(order)
+
+
+def split_date_range(date_from: date, date_to: date, segments: int) -> List[Tuple[str, str]]:
+    """
+    Split an inclusive date range into at most `segments` whole-day sub-ranges.
+
+    Args:
+        date_from: First day
+        date_to: Last day (inclusive)
+        segments: Number of parallel queries
+
+    Returns:
+        List of (from, to) ISO dates, inclusive and non-overlapping
+    """
+    days = (date_to - date_from).days + 1
+    if days <= 0:
+        return []
+
+    segments = max(1, min(segments, days))
+    size, extra = divmod(days, segments)
+    ranges = []
+    start = date_from
+    for index in range(segments):
+        end = start + timedelta(days=size + (1 if index < extra else 0) - 1)
+        ranges.append((start.isoformat(), end.isoformat()))
+        start = end + timedelta(days=1)
+    return ranges
+
+
+class Checkpoint:
+    """
+    Append-only file of completed order IDs.
+
+    Attributes:
+        path: Checkpoint file path (None = no checkpoint)
+        done: Order IDs completed in this or earlier runs
+    """
+
+    def __init__(self, path: Optional[str]):
+        """
+        Load an existing checkpoint.
+
+        Args:
+            path: Checkpoint file path (None = no checkpoint)
+        """
+        self.path = path
+        self.done: Set[str] = set()
+        self._lock = threading.Lock()
+        self._file = None
+
+        if path and os.path.exists(path):
+            with open(path) as f:
+                self.done = {line.strip() for line in f if line.strip()}
+            logger.info(f"Checkpoint loaded: {len(self.done)} orders already done")
+
+        if path:
+            self._file = open(path, 'a')
+
+    def add(self, order_id: str) -> None:
+        """Record a completed order (flushed immediately)."""
+        with self._lock:
+            self.done.add(order_id)
+            if self._file:
+                self._file.write(f"{order_id}\n")
+                self._file.flush()
+
+    def close(self) -> None:
+        """Close the checkpoint file."""
+        if self._file:
+            self._file.close()
+            self._file = None
+
+
+class InvoiceRegenerator:
+    """
+    Regenerate invoice PDFs for a tenant's orders in a date range.
+
+    Attributes:
+        order_dao: OrderDAO for queries, claims and PDF records
+        s3_service: S3Service for uploads
+        pdf_service: PDFService of this process (content hashes)
+        checkpoint: Completed order IDs
+        force: Regenerate even if the recorded content hash matches
+        dry_run: Only report which orders would be regenerated
+        stats: Counters (queried, skipped, rendered, would_render, failed)
+    """
+
+    def __init__(
+        self,
+        order_dao: OrderDAO,
+        s3_service: S3Service,
+        pdf_service: PDFService,
+        render_pool: Executor,
+        upload_pool: Executor,
+        checkpoint: Checkpoint,
+        max_in_flight: int = 64,
+        force: bool = False,
+        dry_run: bool = False
+    ):
+        """
+        Initialize InvoiceRegenerator.
+
+        Args:
+            order_dao: OrderDAO for queries, claims and PDF records
+            s3_service: S3Service for uploads
+            pdf_service: PDFService of this process (content hashes)
+            render_pool: Executor rendering PDFs (process pool)
+            upload_pool: Executor uploading and recording PDFs (thread pool)
+            checkpoint: Completed order IDs
+            max_in_flight: Orders claimed but not yet finished, at most
+            force: Regenerate even if the recorded content hash matches
+            dry_run: Only report which orders would be regenerated
+        """
+        self.order_dao = order_dao
+        self.s3_service = s3_service
+        self.pdf_service = pdf_service
+        self.render_pool = render_pool
+        self.upload_pool = upload_pool
+        self.checkpoint = checkpoint
+        self.force = force
+        self.dry_run = dry_run
+        self.stats = {'queried': 0, 'skipped': 0, 'rendered': 0, 'would_render': 0, 'failed': 0}
+        self._stats_lock = threading.Lock()
+        self._in_flight = threading.BoundedSemaphore(max_in_flight)
+        self._pending: List[Future] = []
+
+    def run(self, tenant_id: str, date_ranges: List[Tuple[str, str]]) -> dict:
+        """
+        Regenerate all orders of the tenant in the date ranges.
+
+        Args:
+            tenant_id: Tenant identifier
+            date_ranges: (from, to) sub-ranges queried in parallel
+
+        Returns:
+            Counters (queried, skipped, rendered, would_render, failed)
+        """
+        for order in self.stream_orders(tenant_id, date_ranges):
+            self._count('queried')
+            self.submit(order)
+
+        for future in self._pending:
+            future.result()
+
+        return dict(self.stats)
+
+    def stream_orders(self, tenant_id: str, date_ranges: List[Tuple[str, str]]) -> Iterator[Order]:
+        """
+        Query the date sub-ranges in parallel threads and yield orders as they arrive.
+
+        Args:
+            tenant_id: Tenant identifier
+            date_ranges: (from, to) sub-ranges
+
+        Yields:
+            Orders in arrival order
+        """
+        orders: queue.Queue = queue.Queue(maxsize=1000)
+        errors: List[Exception] = []
+
+        def query(date_from: str, date_to: str) -> None:
+            try:
+                for order in self.order_dao.iter_orders_by_date(tenant_id, date_from, date_to):
+                    orders.put(order)
+            except Exception as e:
+                logger.error(f"Query {date_from}..{date_to} failed: {str(e)}")
+                errors.append(e)
+            finally:
+                orders.put(_END)
+
+        threads = [
+            threading.Thread(target=query, args=date_range, daemon=True)
+            for date_range in date_ranges
+        ]
+        for thread in threads:
+            thread.start()
+
+        finished = 0
+        while finished < len(threads):
+            item = orders.get()
+            if item is _END:
+                finished += 1
+            else:
+                yield item
+
+        if errors:
+            # Orders finished so far are in the checkpoint; rerun to resume
+            raise errors[0]
+
+    def submit(self, order: Order) -> None:
+        """
+        Claim an order and hand it to the render pool.
+
+        Args:
+            order: Order to regenerate
+        """
+        if order.id in self.checkpoint.done:
+            self._count('skipped')
+            return
+
+        content_hash = self.pdf_service.invoice_content_hash(order)
+        if not self.force and order.pdfUrl and order.pdfContentHash == content_hash:
+            self._count('skipped')
+            self.checkpoint.add(order.id)
+            return
+
+        if self.dry_run:
+            logger.info(f"Would regenerate {order.orderNumber} ({order.id})")
+            self._count('would_render')
+            return
+
+        if self.force and order.pdfContentHash:
+            self.order_dao.clear_pdf_record(order.tenantId, order.id, order.pdfContentHash)
+
+        claim_token = str(uuid.uuid4())
+        if not self.order_dao.claim_pdf_generation(
+            order.tenantId, order.id, content_hash, claim_token, CLAIM_LEASE_SECONDS
+        ):
+            # Current already, or being generated by the Lambda right now
+            self._count('skipped')
+            return
+
+        self._in_flight.acquire()
+        rendered = self.render_pool.submit(_render, order)
+        # The upload task waits for its render, so uploads overlap with rendering
+        self._pending.append(self.upload_pool.submit(self._upload, order, content_hash, claim_token, rendered))
+
+    def _upload(self, order: Order, content_hash: str, claim_token: str, rendered: Future) -> None:
+        """Upload a rendered PDF and record it on the order (upload pool)."""
+        try:
+            pdf_bytes = rendered.result()
+            with self.s3_service.open_pdf_upload(order.tenantId, order.id) as upload:
+                upload.write(pdf_bytes)
+            self.order_dao.record_pdf(
+                order.tenantId, order.id, upload.url, content_hash, upload.etag, claim_token
+            )
+            self.checkpoint.add(order.id)
+            self._count('rendered')
+        except Exception as e:
+            logger.error(f"Failed to regenerate {order.orderNumber} ({order.id}): {str(e)}")
+            self.order_dao.release_pdf_claim(order.tenantId, order.id, claim_token)
+            self._count('failed')
+        finally:
+            self._in_flight.release()
+
+    def _count(self, name: str) -> None:
+        with self._stats_lock:
+            self.stats[name] += 1
+
+
+def main() -> None:
+    """Parse arguments, run the regeneration and print a summary."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--tenant', required=True, help='Tenant ID')
+    parser.add_argument('--from', dest='date_from', required=True, type=date.fromisoformat, help='First order date (YYYY-MM-DD)')
+    parser.add_argument('--to', dest='date_to', required=True, type=date.fromisoformat, help='Last order date (YYYY-MM-DD, inclusive)')
+    parser.add_argument('--table', default=os.environ.get('DYNAMODB_TABLE_NAME', 'bbws-customer-portal-orders-dev'), help='Orders table')
+    parser.add_argument('--bucket', default=os.environ.get('S3_ORDERS_BUCKET', 'bbws-orders-dev'), help='Orders bucket')
+    parser.add_argument('--company-name', default=os.environ.get('COMPANY_NAME', 'BBWS'), help='Invoice company name')
+    parser.add_argument('--cache-background', action='store_true', help='Draw the page background from a form XObject')
+    parser.add_argument('--processes', type=int, default=os.cpu_count() or 1, help='Render processes (default: CPU cores)')
+    parser.add_argument('--upload-threads', type=int, default=32, help='Concurrent uploads (default 32)')
+    parser.add_argument('--query-segments', type=int, default=8, help='Parallel date range queries (default 8)')
+    parser.add_argument('--checkpoint', help='Checkpoint file of completed order IDs (resume with the same file)')
+    parser.add_argument('--force', action='store_true', help='Regenerate even if the recorded content hash matches')
+    parser.add_argument('--dry-run', action='store_true', help='Only report which orders would be regenerated')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='[%(asctime)s] %(levelname)s: %(message)s')
+
+    date_ranges = split_date_range(args.date_from, args.date_to, args.query_segments)
+    pool_size = max(args.upload_threads, args.query_segments) + 10
+    order_dao = OrderDAO(get_client('dynamodb', max_pool_connections=pool_size), args.table)
+    s3_service = S3Service(get_client('s3', max_pool_connections=pool_size), args.bucket)
+    # Latency is summarised at the end instead of as EMF lines during the run
+    client_metrics.interval = 0
+    pdf_service = PDFService(company_name=args.company_name)
+    checkpoint = Checkpoint(args.checkpoint)
+
+    start = time.perf_counter()
+    try:
+        with ProcessPoolExecutor(
+            max_workers=args.processes,
+            initializer=_init_render_process,
+            initargs=(args.company_name, args.cache_background)
+        ) as render_pool, ThreadPoolExecutor(max_workers=args.upload_threads) as upload_pool:
+            regenerator = InvoiceRegenerator(
+                order_dao,
+                s3_service,
+                pdf_service,
+                render_pool,
+                upload_pool,
+                checkpoint,
+                max_in_flight=args.processes * 4 + args.upload_threads,
+                force=args.force,
+                dry_run=args.dry_run
+            )
+            stats = regenerator.run(args.tenant, date_ranges)
+    finally:
+        checkpoint.close()
+
+    elapsed = time.perf_counter() - start
+    print(
+        f"queried={stats['queried']} rendered={stats['rendered']} would_render={stats['would_render']} "
+        f"skipped={stats['skipped']} failed={stats['failed']} in {elapsed:.1f}s ({stats['rendered'] / elapsed if elapsed else 0:.1f} invoices/s)"
+    )
+    for operation, call_stats in sorted(client_metrics.snapshot().items()):
+        print(
+            f"  {operation}: {call_stats['count']} calls, avg {call_stats['avgMs']:.1f} ms, "
+            f"max {call_stats['maxMs']:.1f} ms, {call_stats['retries']} retries, {call_stats['errors']} errors"
+        )
+
+
+if __name__ == '__main__':
+    main()
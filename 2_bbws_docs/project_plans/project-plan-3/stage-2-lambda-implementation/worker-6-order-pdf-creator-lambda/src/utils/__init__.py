@@ -4,4 +4,7 @@ Utility modules for Order Lambda.
 This module provides helper functions and utilities.
 """
 
-__all__ = []
+from .aws_clients import client_metrics, get_client, get_resource
+from .sqs_batch_runner import SQSBatchRunner
+
+__all__ = ['SQSBatchRunner', 'client_metrics', 'get_client', 'get_resource']
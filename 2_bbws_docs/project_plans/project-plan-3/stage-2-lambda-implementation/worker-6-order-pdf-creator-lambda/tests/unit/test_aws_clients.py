@@ -0,0 +1,160 @@
+"""
+Unit tests for the shared boto3 client factory.
+
+Tests memoisation, Config from the environment and latency metrics, with
+HTTP responses served by a botocore before-send hook.
+"""
+
+import json
+import pytest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+from botocore.awsrequest import AWSResponse
+from src.utils import aws_clients
+from src.utils.aws_clients import ClientMetrics, client_config, clear_clients, get_client, get_resource
+
+
+class _RawBody:
+    """Minimal urllib3-like body for AWSResponse."""
+
+    def __init__(self, body: bytes):
+        self.body = body
+
+    def stream(self, **kwargs):
+        yield self.body
+
+
+def serve(client, responses):
+    """Answer the client's HTTP requests with (status, JSON body) pairs in order."""
+    def send(request, **kwargs):
+        status, body = responses.pop(0)
+        return AWSResponse(request.url, status, {}, _RawBody(json.dumps(body).encode()))
+
+    client.meta.events.register('before-send', send)
+
+
+@pytest.fixture(autouse=True)
+def fresh_clients(monkeypatch):
+    """Fresh factory state, credentials and metrics for every test."""
+    monkeypatch.setenv('AWS_ACCESS_KEY_ID', 'testing')
+    monkeypatch.setenv('AWS_SECRET_ACCESS_KEY', 'testing')
+    monkeypatch.setenv('AWS_DEFAULT_REGION', 'af-south-1')
+    clear_clients()
+    metrics = ClientMetrics(interval=0)
+    with patch.object(aws_clients, 'client_metrics', metrics):
+        yield metrics
+    clear_clients()
+
+
+class TestClientConfig:
+    """Tests for client_config function."""
+
+    def test_defaults(self):
+        """Test the defaults tuned for Lambda."""
+        config = client_config()
+
+        assert config.max_pool_connections == 50
+        assert config.retries == {'mode': 'adaptive', 'total_max_attempts': 5}
+        assert (config.connect_timeout, config.read_timeout) == (2.0, 10.0)
+        assert config.tcp_keepalive is True
+
+    def test_environment_and_overrides(self, monkeypatch):
+        """Test settings come from the environment and per-client overrides win."""
+        monkeypatch.setenv('AWS_CLIENT_MAX_POOL_CONNECTIONS', '20')
+        monkeypatch.setenv('AWS_CLIENT_RETRY_MODE', 'standard')
+        monkeypatch.setenv('AWS_CLIENT_TCP_KEEPALIVE', 'false')
+
+        config = client_config(max_attempts=2)
+
+        assert config.max_pool_connections == 20
+        assert config.retries == {'mode': 'standard', 'total_max_attempts': 2}
+        assert config.tcp_keepalive is False
+
+    def test_unknown_setting(self):
+        """Test a misspelt override is rejected."""
+        with pytest.raises(ValueError, match="max_pool"):
+            client_config(max_pool=5)
+
+
+class TestFactory:
+    """Tests for get_client and get_resource functions."""
+
+    def test_client_memoised(self):
+        """Test callers share one client per service, region and settings."""
+        client = get_client('dynamodb')
+
+        assert get_client('dynamodb') is client
+        assert get_client('dynamodb', 'eu-west-1') is not client
+        assert get_client('dynamodb', max_pool_connections=5) is not client
+        assert get_client('dynamodb', 'eu-west-1').meta.region_name == 'eu-west-1'
+
+    def test_resource_memoised(self):
+        """Test callers share one resource per service."""
+        resource = get_resource('dynamodb')
+
+        assert get_resource('dynamodb') is resource
+        assert resource.meta.client.meta.config.max_pool_connections == 50
+
+    def test_assumed_role_credentials(self):
+        """Test role clients sign with credentials from STS AssumeRole."""
+        sts_client = get_client('sts')
+        credentials = {
+            'AccessKeyId': 'role-key',
+            'SecretAccessKey': 'role-secret',
+            'SessionToken': 'role-token',
+            'Expiration': datetime.now(timezone.utc) + timedelta(hours=1)
+        }
+
+        with patch.object(sts_client, 'assume_role', return_value={'Credentials': credentials}) as assume_role:
+            client = get_client('s3', role_arn='arn:aws:iam::123456789012:role/reader')
+            frozen = client._request_signer._credentials.get_frozen_credentials()
+
+        assert (frozen.access_key, frozen.token) == ('role-key', 'role-token')
+        assert assume_role.call_args[1]['RoleArn'] == 'arn:aws:iam::123456789012:role/reader'
+        assert client is not get_client('s3')
+
+
+class TestClientMetrics:
+    """Tests for ClientMetrics class."""
+
+    def test_records_latency_retries_and_errors(self, fresh_clients):
+        """Test calls are recorded per operation, retries included."""
+        client = get_client('dynamodb')
+        serve(client, [
+            (500, {'__type': 'InternalServerError'}),
+            (200, {}),
+            (400, {'__type': 'com.amazonaws.dynamodb.v20120810#ResourceNotFoundException'}),
+        ])
+
+        client.get_item(TableName='orders', Key={'PK': {'S': 'TENANT#t1'}})
+        with pytest.raises(client.exceptions.ResourceNotFoundException):
+            client.get_item(TableName='orders', Key={'PK': {'S': 'TENANT#t1'}})
+
+        stats = fresh_clients.snapshot()['dynamodb.GetItem']
+        assert (stats['count'], stats['retries'], stats['errors']) == (2, 1, 1)
+        assert stats['maxMs'] >= stats['avgMs'] > 0
+
+    def test_publish_emf(self, fresh_clients, capsys):
+        """Test publish writes EMF documents and starts a new interval."""
+        fresh_clients.record('s3', 'PutObject', 12.5, 0, False)
+        fresh_clients.record('s3', 'PutObject', 20.0, 2, True)
+
+        documents = fresh_clients.publish()
+
+        assert len(documents) == 1
+        document = json.loads(capsys.readouterr().out)
+        assert document == documents[0]
+        assert document['_aws']['CloudWatchMetrics'][0]['Dimensions'] == [['Service', 'Operation']]
+        assert document['AWSCallLatency'] == [12.5, 20.0]
+        assert (document['AWSCallCount'], document['AWSCallErrors'], document['AWSCallRetries']) == (2, 1, 2)
+        assert fresh_clients.snapshot() == {}
+
+    def test_publish_after_interval(self, capsys):
+        """Test recording publishes once the interval has passed."""
+        metrics = ClientMetrics(interval=60)
+
+        with patch('src.utils.aws_clients.time.monotonic', return_value=metrics._last_publish + 61):
+            metrics.record('sqs', 'SendMessage', 5.0, 0, False)
+
+        assert json.loads(capsys.readouterr().out)['Operation'] == 'SendMessage'
+        assert metrics.snapshot() == {}
@@ -6,8 +6,16 @@ Tests Lambda function logic with mocked dependencies.
 
 import pytest
 import json
-from unittest.mock import patch, MagicMock
-from src.handlers.order_pdf_creator import lambda_handler, process_order_pdf
+from unittest.mock import ANY, patch, MagicMock
+from src.handlers.order_pdf_creator import lambda_handler, pdf_service, process_order_pdf
+
+
+def mock_pdf_upload(mock_s3_service, url="https://s3.amazonaws.com/bucket/order.pdf"):
+    """Make mock_s3_service.open_pdf_upload return an upload for the given URL."""
+    upload = mock_s3_service.open_pdf_upload.return_value.__enter__.return_value
+    upload.url = url
+    upload.bytes_written = 1024
+    return upload
 
 
 class TestLambdaHandler:
@@ -24,12 +32,8 @@ class TestLambdaHandler:
         # Mock DAO response
         mock_order_dao.get_order.return_value = sample_order
 
-        # Mock PDF service
-        mock_pdf_service.generate_invoice_pdf.return_value = b"PDF content"
-
         # Mock S3 service
-        mock_s3_service.check_pdf_exists.return_value = False
-        mock_s3_service.upload_pdf.return_value = "https://s3.amazonaws.com/bucket/order.pdf"
+        mock_pdf_upload(mock_s3_service)
 
         # Invoke Lambda
         response = lambda_handler(sqs_event_single_message, lambda_context)
@@ -39,9 +43,9 @@ class TestLambdaHandler:
 
         # Verify services were called
         mock_order_dao.get_order.assert_called_once_with("tenant-123", "550e8400-e29b-41d4-a716-446655440000")
-        mock_pdf_service.generate_invoice_pdf.assert_called_once()
-        mock_s3_service.upload_pdf.assert_called_once()
-        mock_order_dao.update_order.assert_called_once()
+        mock_pdf_service.write_invoice_pdf.assert_called_once()
+        mock_s3_service.open_pdf_upload.assert_called_once()
+        mock_order_dao.record_pdf.assert_called_once()
 
     @patch('src.handlers.order_pdf_creator.order_dao')
     @patch('src.handlers.order_pdf_creator.pdf_service')
@@ -55,9 +59,7 @@ class TestLambdaHandler:
         mock_order_dao.get_order.return_value = sample_order
 
         # Mock services
-        mock_pdf_service.generate_invoice_pdf.return_value = b"PDF content"
-        mock_s3_service.check_pdf_exists.return_value = False
-        mock_s3_service.upload_pdf.return_value = "https://s3.amazonaws.com/bucket/order.pdf"
+        mock_pdf_upload(mock_s3_service)
 
         # Invoke Lambda
         response = lambda_handler(sqs_event_batch_messages, lambda_context)
@@ -67,7 +69,7 @@ class TestLambdaHandler:
 
         # Verify services were called twice (2 messages)
         assert mock_order_dao.get_order.call_count == 2
-        assert mock_pdf_service.generate_invoice_pdf.call_count == 2
+        assert mock_pdf_service.write_invoice_pdf.call_count == 2
 
     @patch('src.handlers.order_pdf_creator.order_dao')
     def test_lambda_handler_missing_order_id(self, mock_order_dao, lambda_context):
@@ -103,22 +105,23 @@ class TestLambdaHandler:
         self, mock_s3_service, mock_pdf_service, mock_order_dao,
         sqs_event_single_message, lambda_context, sample_order
     ):
-        """Test idempotency - skip if PDF already exists."""
-        # Set PDF URL on order
+        """Test idempotency - skip if a PDF was recorded for the order content."""
+        # Set PDF URL and content hash on order
         sample_order.pdfUrl = "https://s3.amazonaws.com/bucket/order.pdf"
+        sample_order.pdfContentHash = "hash-1"
+        mock_pdf_service.invoice_content_hash.return_value = "hash-1"
         mock_order_dao.get_order.return_value = sample_order
 
-        # Mock S3 check - PDF exists
-        mock_s3_service.check_pdf_exists.return_value = True
-
         response = lambda_handler(sqs_event_single_message, lambda_context)
 
         # Should succeed without regenerating PDF
         assert response['batchItemFailures'] == []
 
-        # Verify PDF was not regenerated
-        mock_pdf_service.generate_invoice_pdf.assert_not_called()
-        mock_s3_service.upload_pdf.assert_not_called()
+        # Verify PDF was not regenerated and S3 was not checked
+        mock_pdf_service.write_invoice_pdf.assert_not_called()
+        mock_s3_service.open_pdf_upload.assert_not_called()
+        mock_s3_service.check_pdf_exists.assert_not_called()
+        mock_order_dao.claim_pdf_generation.assert_not_called()
 
     @patch('src.handlers.order_pdf_creator.order_dao')
     @patch('src.handlers.order_pdf_creator.pdf_service')
@@ -128,7 +131,7 @@ class TestLambdaHandler:
     ):
         """Test handling of PDF generation error."""
         mock_order_dao.get_order.return_value = sample_order
-        mock_pdf_service.generate_invoice_pdf.side_effect = Exception("PDF generation failed")
+        mock_pdf_service.write_invoice_pdf.side_effect = Exception("PDF generation failed")
 
         response = lambda_handler(sqs_event_single_message, lambda_context)
 
@@ -145,9 +148,7 @@ class TestLambdaHandler:
     ):
         """Test handling of S3 upload error."""
         mock_order_dao.get_order.return_value = sample_order
-        mock_pdf_service.generate_invoice_pdf.return_value = b"PDF content"
-        mock_s3_service.check_pdf_exists.return_value = False
-        mock_s3_service.upload_pdf.side_effect = Exception("S3 upload failed")
+        mock_s3_service.open_pdf_upload.side_effect = Exception("S3 upload failed")
 
         response = lambda_handler(sqs_event_single_message, lambda_context)
 
@@ -175,11 +176,11 @@ class TestLambdaHandler:
             ]
         }
 
-        # First order succeeds, second fails
-        mock_order_dao.get_order.side_effect = [sample_order, None]
-        mock_pdf_service.generate_invoice_pdf.return_value = b"PDF content"
-        mock_s3_service.check_pdf_exists.return_value = False
-        mock_s3_service.upload_pdf.return_value = "https://s3.amazonaws.com/bucket/order.pdf"
+        # First order succeeds, second fails (records are processed concurrently)
+        mock_order_dao.get_order.side_effect = (
+            lambda tenant_id, order_id: sample_order if order_id == 'order-1' else None
+        )
+        mock_pdf_upload(mock_s3_service)
 
         response = lambda_handler(event, lambda_context)
 
@@ -199,18 +200,43 @@ class TestProcessOrderPDF:
     ):
         """Test successful order PDF processing."""
         mock_order_dao.get_order.return_value = sample_order
-        mock_pdf_service.generate_invoice_pdf.return_value = b"PDF content"
-        mock_s3_service.check_pdf_exists.return_value = False
-        mock_s3_service.upload_pdf.return_value = "https://s3.amazonaws.com/bucket/order.pdf"
+        mock_order_dao.claim_pdf_generation.return_value = True
+        mock_pdf_service.invoice_content_hash.return_value = "hash-1"
+        upload = mock_pdf_upload(mock_s3_service)
+        upload.etag = '"etag-1"'
 
         process_order_pdf("tenant-123", "order-123")
 
         # Verify all steps executed
         mock_order_dao.get_order.assert_called_once_with("tenant-123", "order-123")
-        mock_s3_service.check_pdf_exists.assert_called_once()
-        mock_pdf_service.generate_invoice_pdf.assert_called_once_with(sample_order)
+        mock_order_dao.claim_pdf_generation.assert_called_once_with("tenant-123", "order-123", "hash-1", ANY, 60)
+        assert mock_s3_service.open_pdf_upload.call_args[0] == ("tenant-123", "order-123")
+        mock_pdf_service.write_invoice_pdf.assert_called_once_with(sample_order, upload)
+        claim_token = mock_order_dao.claim_pdf_generation.call_args[0][3]
+        mock_order_dao.record_pdf.assert_called_once_with(
+            "tenant-123", "order-123", "https://s3.amazonaws.com/bucket/order.pdf", "hash-1", '"etag-1"', claim_token
+        )
+        mock_s3_service.check_pdf_exists.assert_not_called()
+
+    @patch('src.handlers.order_pdf_creator.PDF_UPLOAD_MODE', 'buffer')
+    @patch('src.handlers.order_pdf_creator.order_dao')
+    @patch('src.handlers.order_pdf_creator.pdf_service')
+    @patch('src.handlers.order_pdf_creator.s3_service')
+    def test_process_order_pdf_buffer_mode(
+        self, mock_s3_service, mock_pdf_service, mock_order_dao, sample_order
+    ):
+        """Test buffer upload mode generates bytes and uses PutObject."""
+        mock_order_dao.get_order.return_value = sample_order
+        mock_pdf_service.generate_invoice_pdf.return_value = b"PDF content"
+        mock_s3_service.upload_pdf.return_value = "https://s3.amazonaws.com/bucket/order.pdf"
+
+        process_order_pdf("tenant-123", "order-123")
+
         mock_s3_service.upload_pdf.assert_called_once_with(b"PDF content", "tenant-123", "order-123")
-        mock_order_dao.update_order.assert_called_once()
+        mock_s3_service.open_pdf_upload.assert_not_called()
+        assert mock_order_dao.record_pdf.call_args[0][2:5] == (
+            "https://s3.amazonaws.com/bucket/order.pdf", mock_pdf_service.invoice_content_hash.return_value, None
+        )
 
     @patch('src.handlers.order_pdf_creator.order_dao')
     def test_process_order_pdf_order_not_found(self, mock_order_dao):
@@ -227,33 +253,89 @@ class TestProcessOrderPDF:
     def test_process_order_pdf_already_exists(
         self, mock_s3_service, mock_order_dao, sample_order
     ):
-        """Test skipping when PDF already exists."""
+        """Test skipping when a PDF was recorded for the current order content."""
         sample_order.pdfUrl = "https://s3.amazonaws.com/bucket/order.pdf"
+        sample_order.pdfContentHash = pdf_service.invoice_content_hash(sample_order)
         mock_order_dao.get_order.return_value = sample_order
-        mock_s3_service.check_pdf_exists.return_value = True
 
         process_order_pdf("tenant-123", "order-123")
 
-        # Should skip PDF generation
-        mock_s3_service.upload_pdf.assert_not_called()
-        mock_order_dao.update_order.assert_not_called()
+        # Should skip PDF generation without checking S3
+        mock_s3_service.open_pdf_upload.assert_not_called()
+        mock_s3_service.check_pdf_exists.assert_not_called()
+        mock_order_dao.claim_pdf_generation.assert_not_called()
+        mock_order_dao.record_pdf.assert_not_called()
 
     @patch('src.handlers.order_pdf_creator.order_dao')
     @patch('src.handlers.order_pdf_creator.pdf_service')
     @patch('src.handlers.order_pdf_creator.s3_service')
-    def test_process_order_pdf_regenerate_missing(
+    def test_process_order_pdf_regenerate_changed(
         self, mock_s3_service, mock_pdf_service, mock_order_dao, sample_order
     ):
-        """Test regenerating PDF when URL exists but file is missing."""
+        """Test regenerating PDF when the order changed since it was generated."""
         sample_order.pdfUrl = "https://s3.amazonaws.com/bucket/order.pdf"
+        sample_order.pdfContentHash = "stale-hash"
+        mock_pdf_service.invoice_content_hash.return_value = "hash-2"
         mock_order_dao.get_order.return_value = sample_order
-        mock_s3_service.check_pdf_exists.return_value = False  # File missing
-        mock_pdf_service.generate_invoice_pdf.return_value = b"PDF content"
-        mock_s3_service.upload_pdf.return_value = "https://s3.amazonaws.com/bucket/order.pdf"
+        mock_order_dao.claim_pdf_generation.return_value = True
+        mock_pdf_upload(mock_s3_service)
 
         process_order_pdf("tenant-123", "order-123")
 
         # Should regenerate PDF
-        mock_pdf_service.generate_invoice_pdf.assert_called_once()
-        mock_s3_service.upload_pdf.assert_called_once()
-        mock_order_dao.update_order.assert_called_once()
+        mock_pdf_service.write_invoice_pdf.assert_called_once()
+        mock_s3_service.open_pdf_upload.assert_called_once()
+        mock_order_dao.record_pdf.assert_called_once()
+
+    @patch('src.handlers.order_pdf_creator.order_dao')
+    @patch('src.handlers.order_pdf_creator.pdf_service')
+    @patch('src.handlers.order_pdf_creator.s3_service')
+    def test_process_order_pdf_claimed_elsewhere(
+        self, mock_s3_service, mock_pdf_service, mock_order_dao, sample_order
+    ):
+        """Test skipping when another invocation holds or completed the claim."""
+        mock_order_dao.get_order.return_value = sample_order
+        mock_order_dao.claim_pdf_generation.return_value = False
+
+        process_order_pdf("tenant-123", "order-123")
+
+        mock_pdf_service.write_invoice_pdf.assert_not_called()
+        mock_s3_service.open_pdf_upload.assert_not_called()
+        mock_order_dao.record_pdf.assert_not_called()
+
+    @patch('src.handlers.order_pdf_creator.order_dao')
+    @patch('src.handlers.order_pdf_creator.pdf_service')
+    @patch('src.handlers.order_pdf_creator.s3_service')
+    def test_process_order_pdf_error_releases_claim(
+        self, mock_s3_service, mock_pdf_service, mock_order_dao, sample_order
+    ):
+        """Test a failed generation releases the claim for the SQS retry."""
+        mock_order_dao.get_order.return_value = sample_order
+        mock_order_dao.claim_pdf_generation.return_value = True
+        mock_pdf_service.write_invoice_pdf.side_effect = Exception("PDF generation failed")
+
+        with pytest.raises(Exception, match="PDF generation failed"):
+            process_order_pdf("tenant-123", "order-123")
+
+        claim_token = mock_order_dao.claim_pdf_generation.call_args[0][3]
+        mock_order_dao.release_pdf_claim.assert_called_once_with("tenant-123", "order-123", claim_token)
+        mock_order_dao.record_pdf.assert_not_called()
+
+    @patch('src.handlers.order_pdf_creator.order_dao')
+    @patch('src.handlers.order_pdf_creator.pdf_service')
+    @patch('src.handlers.order_pdf_creator.s3_service')
+    def test_process_order_pdf_force_ignores_recorded_hash(
+        self, mock_s3_service, mock_pdf_service, mock_order_dao, sample_order
+    ):
+        """Test force skips the item check and relies on the conditional claim."""
+        sample_order.pdfUrl = "https://s3.amazonaws.com/bucket/order.pdf"
+        sample_order.pdfContentHash = "hash-1"
+        mock_pdf_service.invoice_content_hash.return_value = "hash-1"
+        mock_order_dao.get_order.return_value = sample_order
+        mock_order_dao.claim_pdf_generation.return_value = True
+        mock_pdf_upload(mock_s3_service)
+
+        process_order_pdf("tenant-123", "order-123", force=True)
+
+        mock_order_dao.claim_pdf_generation.assert_called_once()
+        mock_pdf_service.write_invoice_pdf.assert_called_once()
@@ -6,6 +6,7 @@ Tests DynamoDB operations with mocked boto3 client.
 
 import pytest
 from datetime import datetime
+from botocore.exceptions import ClientError
 from src.dao.order_dao import OrderDAO
 from src.models.order import Order
 
@@ -140,6 +141,8 @@ class TestOrderDAO:
         assert '2025-12-30' in item['GSI1_SK']['S']
         assert item['GSI2_PK']['S'] == 'ORDER#550e8400-e29b-41d4-a716-446655440000'
         assert item['GSI2_SK']['S'] == 'METADATA'
+        assert item['GSI3_PK']['S'] == f'TENANT#tenant-123#STATUS#{sample_order.status.upper()}'
+        assert item['GSI3_SK']['S'] == item['GSI1_SK']['S']
 
         # Verify attributes
         assert item['id']['S'] == sample_order.id
@@ -178,3 +181,145 @@ class TestOrderDAO:
         assert order_data['isActive'] is True
         assert isinstance(order_data['items'], list)
         assert isinstance(order_data['billingAddress'], dict)
+
+    @staticmethod
+    def _conditional_check_failed():
+        return ClientError({'Error': {'Code': 'ConditionalCheckFailedException'}}, 'UpdateItem')
+
+    def test_claim_pdf_generation_success(self, mock_dynamodb_client):
+        """Test claiming PDF generation with a conditional update."""
+        dao = OrderDAO(mock_dynamodb_client, "test-table")
+
+        claimed = dao.claim_pdf_generation("tenant-123", "order-123", "hash-1", "token-1", 60)
+
+        assert claimed is True
+        call_args = mock_dynamodb_client.update_item.call_args[1]
+        assert call_args['Key'] == {'PK': {'S': 'TENANT#tenant-123'}, 'SK': {'S': 'ORDER#order-123'}}
+        assert 'pdfContentHash <> :hash' in call_args['ConditionExpression']
+        assert 'pdfClaimExpiresAt < :now' in call_args['ConditionExpression']
+        values = call_args['ExpressionAttributeValues']
+        assert values[':token'] == {'S': 'token-1'}
+        assert values[':hash'] == {'S': 'hash-1'}
+        assert int(values[':expires']['N']) - int(values[':now']['N']) == 60
+
+    def test_claim_pdf_generation_taken(self, mock_dynamodb_client):
+        """Test a failed condition means the PDF is done or claimed elsewhere."""
+        mock_dynamodb_client.update_item.side_effect = self._conditional_check_failed()
+        dao = OrderDAO(mock_dynamodb_client, "test-table")
+
+        assert dao.claim_pdf_generation("tenant-123", "order-123", "hash-1", "token-1", 60) is False
+
+    def test_claim_pdf_generation_error(self, mock_dynamodb_client):
+        """Test other DynamoDB errors are raised."""
+        mock_dynamodb_client.update_item.side_effect = ClientError(
+            {'Error': {'Code': 'ProvisionedThroughputExceededException'}}, 'UpdateItem'
+        )
+        dao = OrderDAO(mock_dynamodb_client, "test-table")
+
+        with pytest.raises(ClientError):
+            dao.claim_pdf_generation("tenant-123", "order-123", "hash-1", "token-1", 60)
+
+    def test_record_pdf(self, mock_dynamodb_client):
+        """Test recording the PDF updates only PDF attributes, guarded by the claim."""
+        dao = OrderDAO(mock_dynamodb_client, "test-table")
+
+        recorded = dao.record_pdf("tenant-123", "order-123", "https://bucket/order.pdf", "hash-1", '"etag-1"', "token-1")
+
+        assert recorded is True
+        mock_dynamodb_client.put_item.assert_not_called()
+        call_args = mock_dynamodb_client.update_item.call_args[1]
+        assert call_args['UpdateExpression'] == (
+            'SET pdfUrl = :url, pdfContentHash = :hash, dateLastUpdated = :updated, pdfETag = :etag '
+            'REMOVE pdfClaimToken, pdfClaimExpiresAt'
+        )
+        assert call_args['ConditionExpression'] == 'pdfClaimToken = :token'
+        assert call_args['ExpressionAttributeValues'][':etag'] == {'S': '"etag-1"'}
+
+    def test_record_pdf_without_etag(self, mock_dynamodb_client):
+        """Test a stale ETag is removed when the upload returned none."""
+        dao = OrderDAO(mock_dynamodb_client, "test-table")
+
+        dao.record_pdf("tenant-123", "order-123", "https://bucket/order.pdf", "hash-1", None, "token-1")
+
+        call_args = mock_dynamodb_client.update_item.call_args[1]
+        assert call_args['UpdateExpression'].endswith('REMOVE pdfClaimToken, pdfClaimExpiresAt, pdfETag')
+        assert ':etag' not in call_args['ExpressionAttributeValues']
+
+    def test_record_pdf_claim_lost(self, mock_dynamodb_client):
+        """Test recording reports a claim taken over by another invocation."""
+        mock_dynamodb_client.update_item.side_effect = self._conditional_check_failed()
+        dao = OrderDAO(mock_dynamodb_client, "test-table")
+
+        assert dao.record_pdf("tenant-123", "order-123", "url", "hash-1", None, "token-1") is False
+
+    def test_release_pdf_claim_ignores_errors(self, mock_dynamodb_client):
+        """Test releasing a claim never raises."""
+        mock_dynamodb_client.update_item.side_effect = self._conditional_check_failed()
+        dao = OrderDAO(mock_dynamodb_client, "test-table")
+
+        dao.release_pdf_claim("tenant-123", "order-123", "token-1")
+
+        assert mock_dynamodb_client.update_item.call_args[1]['ConditionExpression'] == 'pdfClaimToken = :token'
+
+    def test_clear_pdf_record(self, mock_dynamodb_client):
+        """Test clearing a PDF record is conditional on the recorded hash."""
+        dao = OrderDAO(mock_dynamodb_client, "test-table")
+
+        assert dao.clear_pdf_record("tenant-123", "order-123", "hash-1") is True
+        call_args = mock_dynamodb_client.update_item.call_args[1]
+        assert call_args['UpdateExpression'] == 'REMOVE pdfContentHash, pdfETag'
+        assert call_args['ExpressionAttributeValues'] == {':hash': {'S': 'hash-1'}}
+
+        mock_dynamodb_client.update_item.side_effect = self._conditional_check_failed()
+        assert dao.clear_pdf_record("tenant-123", "order-123", "hash-1") is False
+
+    def test_scan_pdf_records_pages(self, mock_dynamodb_client):
+        """Test scanning recorded PDFs page by page."""
+        mock_dynamodb_client.scan.side_effect = [
+            {
+                'Items': [{'tenantId': {'S': 't1'}, 'id': {'S': 'o1'}, 'pdfContentHash': {'S': 'h1'}}],
+                'LastEvaluatedKey': {'PK': {'S': 'TENANT#t1'}, 'SK': {'S': 'ORDER#o1'}}
+            },
+            {'Items': []}
+        ]
+        dao = OrderDAO(mock_dynamodb_client, "test-table")
+
+        pages = list(dao.scan_pdf_records(page_size=10))
+
+        assert pages[0]['records'] == [{'tenantId': 't1', 'id': 'o1', 'pdfContentHash': 'h1'}]
+        assert pages[1] == {'records': [], 'lastEvaluatedKey': None}
+        second_call = mock_dynamodb_client.scan.call_args_list[1][1]
+        assert second_call['ExclusiveStartKey'] == {'PK': {'S': 'TENANT#t1'}, 'SK': {'S': 'ORDER#o1'}}
+        assert second_call['Limit'] == 10
+
+    def test_reconciliation_cursor_round_trip(self, mock_dynamodb_client):
+        """Test the sweep cursor is saved, read back and deleted when done."""
+        dao = OrderDAO(mock_dynamodb_client, "test-table")
+        start_key = {'PK': {'S': 'TENANT#t1'}, 'SK': {'S': 'ORDER#o1'}}
+
+        dao.save_reconciliation_cursor(start_key)
+        mock_dynamodb_client.get_item.return_value = {'Item': mock_dynamodb_client.put_item.call_args[1]['Item']}
+
+        assert dao.get_reconciliation_cursor() == start_key
+
+        dao.save_reconciliation_cursor(None)
+        mock_dynamodb_client.delete_item.assert_called_once()
+
+    def test_iter_orders_by_date_pages(self, mock_dynamodb_client, sample_order):
+        """Test iterating orders by date follows LastEvaluatedKey on GSI1."""
+        dao = OrderDAO(mock_dynamodb_client, "test-table")
+        item = dao._serialize_order(sample_order)
+        mock_dynamodb_client.query.side_effect = [
+            {'Items': [item], 'LastEvaluatedKey': {'PK': {'S': 'TENANT#tenant-123'}}},
+            {'Items': [item]}
+        ]
+
+        orders = list(dao.iter_orders_by_date("tenant-123", "2025-01-01", "2025-01-31", page_size=50))
+
+        assert [order.id for order in orders] == [sample_order.id, sample_order.id]
+        first_call = mock_dynamodb_client.query.call_args_list[0][1]
+        assert first_call['IndexName'] == 'OrdersByDateIndex'
+        assert first_call['ExpressionAttributeValues'][':to'] == {'S': '2025-01-31~'}
+        assert first_call['Limit'] == 50
+        second_call = mock_dynamodb_client.query.call_args_list[1][1]
+        assert second_call['ExclusiveStartKey'] == {'PK': {'S': 'TENANT#tenant-123'}}
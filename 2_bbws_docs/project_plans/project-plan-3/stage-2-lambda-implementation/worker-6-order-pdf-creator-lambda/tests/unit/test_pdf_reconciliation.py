@@ -0,0 +1,125 @@
+"""
+Unit tests for PDF reconciliation Lambda handler.
+
+Tests the sweep logic with mocked dependencies.
+"""
+
+import pytest
+from unittest.mock import MagicMock, patch
+from src.handlers.pdf_reconciliation import lambda_handler, reconcile_record
+
+
+RECORD = {'tenantId': 'tenant-123', 'id': 'order-123', 'pdfContentHash': 'hash-1', 'pdfETag': '"etag-1"'}
+
+
+@pytest.fixture
+def context():
+    """Lambda context with plenty of time left."""
+    context = MagicMock()
+    context.get_remaining_time_in_millis.return_value = 300000
+    return context
+
+
+class TestReconcileRecord:
+    """Tests for reconcile_record function."""
+
+    @patch('src.handlers.pdf_reconciliation.process_order_pdf')
+    @patch('src.handlers.pdf_reconciliation.order_dao')
+    @patch('src.handlers.pdf_reconciliation.s3_service')
+    def test_pdf_in_order(self, mock_s3_service, mock_order_dao, mock_process):
+        """Test a PDF with the recorded ETag is left alone."""
+        mock_s3_service.get_pdf_etag.return_value = '"etag-1"'
+
+        assert reconcile_record(RECORD) is False
+
+        mock_order_dao.clear_pdf_record.assert_not_called()
+        mock_process.assert_not_called()
+
+    @patch('src.handlers.pdf_reconciliation.process_order_pdf')
+    @patch('src.handlers.pdf_reconciliation.order_dao')
+    @patch('src.handlers.pdf_reconciliation.s3_service')
+    def test_pdf_without_recorded_etag(self, mock_s3_service, mock_order_dao, mock_process):
+        """Test an existing PDF is accepted when no ETag was recorded."""
+        mock_s3_service.get_pdf_etag.return_value = '"etag-2"'
+
+        assert reconcile_record({**RECORD, 'pdfETag': None}) is False
+
+        mock_process.assert_not_called()
+
+    @patch('src.handlers.pdf_reconciliation.process_order_pdf')
+    @patch('src.handlers.pdf_reconciliation.order_dao')
+    @patch('src.handlers.pdf_reconciliation.s3_service')
+    def test_missing_pdf_regenerated(self, mock_s3_service, mock_order_dao, mock_process):
+        """Test a missing PDF is cleared and regenerated."""
+        mock_s3_service.get_pdf_etag.return_value = None
+        mock_order_dao.clear_pdf_record.return_value = True
+
+        assert reconcile_record(RECORD) is True
+
+        mock_order_dao.clear_pdf_record.assert_called_once_with('tenant-123', 'order-123', 'hash-1')
+        mock_process.assert_called_once_with('tenant-123', 'order-123', force=True)
+
+    @patch('src.handlers.pdf_reconciliation.process_order_pdf')
+    @patch('src.handlers.pdf_reconciliation.order_dao')
+    @patch('src.handlers.pdf_reconciliation.s3_service')
+    def test_replaced_pdf_regenerated(self, mock_s3_service, mock_order_dao, mock_process):
+        """Test a PDF whose ETag differs from the recorded one is regenerated."""
+        mock_s3_service.get_pdf_etag.return_value = '"etag-other"'
+        mock_order_dao.clear_pdf_record.return_value = True
+
+        assert reconcile_record(RECORD) is True
+
+        mock_process.assert_called_once()
+
+    @patch('src.handlers.pdf_reconciliation.process_order_pdf')
+    @patch('src.handlers.pdf_reconciliation.order_dao')
+    @patch('src.handlers.pdf_reconciliation.s3_service')
+    def test_record_changed_since_scan(self, mock_s3_service, mock_order_dao, mock_process):
+        """Test nothing is regenerated if the record changed since the scan."""
+        mock_s3_service.get_pdf_etag.return_value = None
+        mock_order_dao.clear_pdf_record.return_value = False
+
+        assert reconcile_record(RECORD) is False
+
+        mock_process.assert_not_called()
+
+
+class TestLambdaHandler:
+    """Tests for the reconciliation sweep handler."""
+
+    @patch('src.handlers.pdf_reconciliation.reconcile_record')
+    @patch('src.handlers.pdf_reconciliation.order_dao')
+    def test_full_sweep(self, mock_order_dao, mock_reconcile, context):
+        """Test a sweep over all pages clears the cursor."""
+        mock_order_dao.get_reconciliation_cursor.return_value = None
+        mock_order_dao.scan_pdf_records.return_value = iter([
+            {'records': [RECORD, RECORD], 'lastEvaluatedKey': {'PK': {'S': 'x'}}},
+            {'records': [RECORD], 'lastEvaluatedKey': None},
+        ])
+        mock_reconcile.side_effect = [False, True, Exception("S3 error")]
+
+        result = lambda_handler({}, context)
+
+        assert result == {'checked': 3, 'repaired': 1, 'failed': 1, 'completed': True}
+        mock_order_dao.scan_pdf_records.assert_called_once_with(start_key=None, page_size=100)
+        assert mock_order_dao.save_reconciliation_cursor.call_args_list[-1][0] == (None,)
+
+    @patch('src.handlers.pdf_reconciliation.reconcile_record')
+    @patch('src.handlers.pdf_reconciliation.order_dao')
+    def test_stops_before_timeout(self, mock_order_dao, mock_reconcile, context):
+        """Test the sweep saves its cursor and stops when time runs short."""
+        cursor = {'PK': {'S': 'TENANT#t1'}, 'SK': {'S': 'ORDER#o1'}}
+        next_key = {'PK': {'S': 'TENANT#t2'}, 'SK': {'S': 'ORDER#o2'}}
+        mock_order_dao.get_reconciliation_cursor.return_value = cursor
+        mock_order_dao.scan_pdf_records.return_value = iter([
+            {'records': [RECORD], 'lastEvaluatedKey': next_key},
+            {'records': [RECORD], 'lastEvaluatedKey': None},
+        ])
+        mock_reconcile.return_value = False
+        context.get_remaining_time_in_millis.return_value = 1000
+
+        result = lambda_handler({}, context)
+
+        assert result == {'checked': 1, 'repaired': 0, 'failed': 0, 'completed': False}
+        mock_order_dao.scan_pdf_records.assert_called_once_with(start_key=cursor, page_size=100)
+        mock_order_dao.save_reconciliation_cursor.assert_called_once_with(next_key)
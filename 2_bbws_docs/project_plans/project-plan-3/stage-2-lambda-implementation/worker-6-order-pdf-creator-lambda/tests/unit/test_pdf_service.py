@@ -101,6 +101,54 @@ class TestPDFService:
         assert "Premium WordPress Theme" in page_text
         assert "WordPress Plugin" in page_text
 
+    def test_layout_reused_across_invoices(self, sample_order):
+        """Test styles and static blocks are built once and reused per invoice."""
+        service = PDFService(company_name="BBWS")
+        layout = service.layout
+
+        first = service.generate_invoice_pdf(sample_order)
+        second = service.generate_invoice_pdf(sample_order)
+
+        assert service.layout is layout
+        assert "BBWS" in PdfReader(BytesIO(first)).pages[0].extract_text()
+        assert "BBWS" in PdfReader(BytesIO(second)).pages[0].extract_text()
+
+    def test_generate_invoice_pdf_cached_background_multi_page(self, sample_order, sample_order_item):
+        """Test a multi-page invoice with the background drawn from a form XObject."""
+        sample_order.items = []
+        for i in range(200):
+            item = sample_order_item.copy(deep=True)
+            item.productSku = f"WP-THEME-{i:03d}"
+            sample_order.items.append(item)
+
+        service = PDFService(company_name="BBWS", cache_background=True)
+
+        pdf_bytes = service.generate_invoice_pdf(sample_order)
+
+        pdf_reader = PdfReader(BytesIO(pdf_bytes))
+        assert len(pdf_reader.pages) > 1
+        for page in pdf_reader.pages:
+            assert "BBWS - Order Invoice" in page.extract_text()
+        assert "WP-THEME-199" in pdf_reader.pages[-1].extract_text()
+
+    def test_invoice_content_hash(self, sample_order):
+        """Test the content hash changes with invoiced fields only."""
+        service = PDFService(company_name="BBWS")
+        content_hash = service.invoice_content_hash(sample_order)
+
+        # Bookkeeping fields do not change the invoice
+        sample_order.pdfUrl = "https://s3.amazonaws.com/bucket/order.pdf"
+        sample_order.notes = "Internal note"
+        assert service.invoice_content_hash(sample_order) == content_hash
+
+        # Invoiced fields do
+        sample_order.status = "refunded"
+        assert service.invoice_content_hash(sample_order) != content_hash
+
+        # So does the company name in the header
+        sample_order.status = "paid"
+        assert PDFService(company_name="Other").invoice_content_hash(sample_order) != content_hash
+
     def test_generate_invoice_pdf_pending_order(self, sample_order):
         """Test PDF generation for pending order without payment."""
         sample_order.status = "pending"
@@ -0,0 +1,161 @@
+"""
+Unit tests for streaming PDF uploads.
+
+Tests multipart and spooled uploads with mocked boto3 client.
+"""
+
+import pytest
+from io import BytesIO
+from PyPDF2 import PdfReader
+from src.services.pdf_service import PDFService
+from src.services.pdf_upload import MIN_PART_SIZE, MultipartPDFUpload, PDFUpload
+from src.services.s3_service import S3Service
+
+
+PART = MIN_PART_SIZE
+
+
+def test_pdf_upload_is_abstract(mock_s3_client):
+    """Test the base class cannot be used without a write/close/abort implementation."""
+    with pytest.raises(TypeError):
+        PDFUpload(mock_s3_client, "bucket", "key", {})
+
+
+class TestMultipartPDFUpload:
+    """Tests for MultipartPDFUpload class."""
+
+    @pytest.fixture
+    def s3_client(self, mock_s3_client):
+        """Mock S3 client accepting multipart uploads."""
+        mock_s3_client.create_multipart_upload.return_value = {'UploadId': 'upload-1'}
+        mock_s3_client.upload_part.side_effect = lambda **kwargs: {'ETag': f'"etag-{kwargs["PartNumber"]}"'}
+        return mock_s3_client
+
+    def test_small_pdf_single_put(self, s3_client):
+        """Test a PDF smaller than one part is sent with one PutObject."""
+        service = S3Service(s3_client, "bbws-orders-dev")
+
+        with service.open_pdf_upload("tenant-123", "order-123") as upload:
+            upload.write(b"%PDF-1.4 ")
+            upload.write(b"content")
+
+        s3_client.create_multipart_upload.assert_not_called()
+        call_args = s3_client.put_object.call_args[1]
+        assert call_args['Key'] == "tenant-123/orders/order_order-123.pdf"
+        assert call_args['Body'] == b"%PDF-1.4 content"
+        assert call_args['ContentType'] == 'application/pdf'
+        assert call_args['ServerSideEncryption'] == 'AES256'
+        assert upload.bytes_written == 16
+        assert upload.url == "https://bbws-orders-dev.s3.amazonaws.com/tenant-123/orders/order_order-123.pdf"
+
+    def test_large_pdf_multipart(self, s3_client):
+        """Test a large PDF is uploaded in parts as it is written."""
+        upload = MultipartPDFUpload(s3_client, "bucket", "key.pdf", {'ContentType': 'application/pdf'}, part_size=PART)
+
+        upload.write(b"a" * (PART - 10))
+        s3_client.upload_part.assert_not_called()
+
+        upload.write(b"b" * (2 * PART - 20))
+        assert s3_client.upload_part.call_count == 2
+
+        upload.close()
+
+        bodies = [call[1]['Body'] for call in s3_client.upload_part.call_args_list]
+        assert [len(body) for body in bodies] == [PART, PART, PART - 30]
+        assert b"".join(bodies) == b"a" * (PART - 10) + b"b" * (2 * PART - 20)
+        s3_client.create_multipart_upload.assert_called_once_with(
+            Bucket="bucket", Key="key.pdf", ContentType='application/pdf'
+        )
+        s3_client.complete_multipart_upload.assert_called_once_with(
+            Bucket="bucket",
+            Key="key.pdf",
+            UploadId='upload-1',
+            MultipartUpload={'Parts': [
+                {'ETag': '"etag-1"', 'PartNumber': 1},
+                {'ETag': '"etag-2"', 'PartNumber': 2},
+                {'ETag': '"etag-3"', 'PartNumber': 3},
+            ]}
+        )
+        s3_client.put_object.assert_not_called()
+
+    def test_part_size_minimum(self, s3_client):
+        """Test parts are never smaller than the S3 minimum."""
+        upload = MultipartPDFUpload(s3_client, "bucket", "key.pdf", {}, part_size=1024)
+        assert upload.part_size == MIN_PART_SIZE
+
+    def test_error_aborts_multipart_upload(self, s3_client):
+        """Test an error inside the with block aborts the upload."""
+        with pytest.raises(ValueError):
+            with MultipartPDFUpload(s3_client, "bucket", "key.pdf", {}, part_size=PART) as upload:
+                upload.write(b"a" * PART)
+                raise ValueError("render failed")
+
+        s3_client.abort_multipart_upload.assert_called_once_with(Bucket="bucket", Key="key.pdf", UploadId='upload-1')
+        s3_client.complete_multipart_upload.assert_not_called()
+
+    def test_error_before_first_part_uploads_nothing(self, s3_client):
+        """Test an error before the first part sends no request."""
+        with pytest.raises(ValueError):
+            with MultipartPDFUpload(s3_client, "bucket", "key.pdf", {}) as upload:
+                upload.write(b"%PDF")
+                raise ValueError("render failed")
+
+        s3_client.put_object.assert_not_called()
+        s3_client.abort_multipart_upload.assert_not_called()
+
+    def test_complete_error_aborts(self, s3_client):
+        """Test a failed CompleteMultipartUpload aborts the upload and raises."""
+        s3_client.complete_multipart_upload.side_effect = Exception("S3 error")
+        upload = MultipartPDFUpload(s3_client, "bucket", "key.pdf", {}, part_size=PART)
+        upload.write(b"a" * (PART + 1))
+
+        with pytest.raises(Exception, match="S3 error"):
+            upload.close()
+
+        s3_client.abort_multipart_upload.assert_called_once()
+
+    def test_invoice_streamed_into_upload(self, s3_client, sample_order):
+        """Test ReportLab writes a complete invoice into the upload."""
+        service = S3Service(s3_client, "bucket")
+        pdf_service = PDFService(company_name="BBWS")
+
+        with service.open_pdf_upload("tenant-123", "order-123") as upload:
+            size = pdf_service.write_invoice_pdf(sample_order, upload)
+
+        body = s3_client.put_object.call_args[1]['Body']
+        assert size == len(body) == upload.bytes_written
+        assert sample_order.orderNumber in PdfReader(BytesIO(body)).pages[0].extract_text()
+
+
+class TestSpooledPDFUpload:
+    """Tests for SpooledPDFUpload class."""
+
+    def test_upload_on_close(self, mock_s3_client):
+        """Test the spooled file is uploaded with the managed transfer on close."""
+        uploaded = {}
+        mock_s3_client.upload_fileobj.side_effect = (
+            lambda fileobj, bucket, key, ExtraArgs: uploaded.update(body=fileobj.read(), extra=ExtraArgs)
+        )
+        mock_s3_client.head_object.return_value = {'ETag': '"etag-1"'}
+        service = S3Service(mock_s3_client, "bucket")
+
+        with service.open_pdf_upload("tenant-123", "order-123", spooled=True, spool_max_size=4) as upload:
+            upload.write(b"%PDF-1.4 content")
+            mock_s3_client.upload_fileobj.assert_not_called()
+
+        assert uploaded['body'] == b"%PDF-1.4 content"
+        assert uploaded['extra']['Metadata']['order-id'] == "order-123"
+        assert mock_s3_client.upload_fileobj.call_args[0][1:] == ("bucket", "tenant-123/orders/order_order-123.pdf")
+        mock_s3_client.head_object.assert_called_once_with(Bucket="bucket", Key="tenant-123/orders/order_order-123.pdf")
+        assert upload.etag == '"etag-1"'
+
+    def test_error_uploads_nothing(self, mock_s3_client):
+        """Test an error inside the with block discards the spooled PDF."""
+        service = S3Service(mock_s3_client, "bucket")
+
+        with pytest.raises(ValueError):
+            with service.open_pdf_upload("tenant-123", "order-123", spooled=True) as upload:
+                upload.write(b"%PDF")
+                raise ValueError("render failed")
+
+        mock_s3_client.upload_fileobj.assert_not_called()
@@ -0,0 +1,192 @@
+"""
+Unit tests for the bulk invoice regeneration tool.
+
+Tests the regeneration flow with mocked DAO and S3 service and thread pools
+in place of the render process pool.
+"""
+
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from unittest.mock import MagicMock
+from src.services.pdf_service import PDFService
+from src.tools import regenerate_invoices
+from src.tools.regenerate_invoices import Checkpoint, InvoiceRegenerator, split_date_range
+
+
+@pytest.fixture
+def pdf_service():
+    """PDFService for content hashes, also used by the render 'process'."""
+    regenerate_invoices._init_render_process("BBWS", False)
+    return PDFService(company_name="BBWS")
+
+
+@pytest.fixture
+def mock_order_dao():
+    """Mock OrderDAO granting every claim."""
+    dao = MagicMock()
+    dao.claim_pdf_generation.return_value = True
+    return dao
+
+
+@pytest.fixture
+def mock_s3_service():
+    """Mock S3Service whose uploads return a URL and ETag."""
+    service = MagicMock()
+    upload = service.open_pdf_upload.return_value.__enter__.return_value
+    upload.url = "https://bucket/order.pdf"
+    upload.etag = '"etag-1"'
+    return service
+
+
+def make_orders(sample_order, count):
+    """Copies of the sample order with distinct IDs."""
+    orders = []
+    for i in range(count):
+        order = sample_order.copy(deep=True)
+        order.id = f"order-{i}"
+        orders.append(order)
+    return orders
+
+
+def run_regenerator(order_dao, s3_service, pdf_service, checkpoint, **kwargs):
+    """Run a regenerator with thread pools over one date range."""
+    with ThreadPoolExecutor(max_workers=2) as render_pool, ThreadPoolExecutor(max_workers=2) as upload_pool:
+        regenerator = InvoiceRegenerator(
+            order_dao, s3_service, pdf_service, render_pool, upload_pool, checkpoint, max_in_flight=4, **kwargs
+        )
+        return regenerator.run("tenant-123", [("2025-01-01", "2025-12-31")])
+
+
+class TestSplitDateRange:
+    """Tests for split_date_range function."""
+
+    def test_even_split(self):
+        """Test a range splits into contiguous, non-overlapping sub-ranges."""
+        ranges = split_date_range(date(2025, 1, 1), date(2025, 1, 10), 3)
+
+        assert ranges == [
+            ("2025-01-01", "2025-01-04"),
+            ("2025-01-05", "2025-01-07"),
+            ("2025-01-08", "2025-01-10"),
+        ]
+
+    def test_more_segments_than_days(self):
+        """Test segments are capped at one per day."""
+        assert split_date_range(date(2025, 1, 1), date(2025, 1, 2), 8) == [
+            ("2025-01-01", "2025-01-01"),
+            ("2025-01-02", "2025-01-02"),
+        ]
+
+    def test_empty_range(self):
+        """Test an inverted range yields no queries."""
+        assert split_date_range(date(2025, 1, 2), date(2025, 1, 1), 4) == []
+
+
+class TestCheckpoint:
+    """Tests for Checkpoint class."""
+
+    def test_resume(self, tmp_path):
+        """Test completed orders are read back by the next run."""
+        path = str(tmp_path / "regen.checkpoint")
+        checkpoint = Checkpoint(path)
+        checkpoint.add("order-1")
+        checkpoint.add("order-2")
+        checkpoint.close()
+
+        assert Checkpoint(path).done == {"order-1", "order-2"}
+
+    def test_without_file(self):
+        """Test a checkpoint without a path only tracks in memory."""
+        checkpoint = Checkpoint(None)
+        checkpoint.add("order-1")
+
+        assert checkpoint.done == {"order-1"}
+
+
+class TestInvoiceRegenerator:
+    """Tests for InvoiceRegenerator class."""
+
+    def test_regenerates_orders(self, mock_order_dao, mock_s3_service, pdf_service, sample_order):
+        """Test every order is claimed, rendered, uploaded and recorded."""
+        orders = make_orders(sample_order, 5)
+        mock_order_dao.iter_orders_by_date.return_value = iter(orders)
+        checkpoint = Checkpoint(None)
+
+        stats = run_regenerator(mock_order_dao, mock_s3_service, pdf_service, checkpoint)
+
+        assert stats == {'queried': 5, 'skipped': 0, 'rendered': 5, 'would_render': 0, 'failed': 0}
+        assert mock_order_dao.record_pdf.call_count == 5
+        upload = mock_s3_service.open_pdf_upload.return_value.__enter__.return_value
+        assert all(call[0][0].startswith(b"%PDF") for call in upload.write.call_args_list)
+        assert checkpoint.done == {order.id for order in orders}
+        content_hash = pdf_service.invoice_content_hash(orders[0])
+        assert mock_order_dao.record_pdf.call_args_list[0][0][3:5] == (content_hash, '"etag-1"')
+
+    def test_skips_checkpointed_and_current(self, mock_order_dao, mock_s3_service, pdf_service, sample_order):
+        """Test checkpointed orders and orders with a current PDF are skipped."""
+        done, current, stale = make_orders(sample_order, 3)
+        current.pdfUrl = "https://bucket/order.pdf"
+        current.pdfContentHash = pdf_service.invoice_content_hash(current)
+        mock_order_dao.iter_orders_by_date.return_value = iter([done, current, stale])
+        checkpoint = Checkpoint(None)
+        checkpoint.add(done.id)
+
+        stats = run_regenerator(mock_order_dao, mock_s3_service, pdf_service, checkpoint)
+
+        assert stats == {'queried': 3, 'skipped': 2, 'rendered': 1, 'would_render': 0, 'failed': 0}
+        mock_order_dao.claim_pdf_generation.assert_called_once()
+        assert mock_order_dao.claim_pdf_generation.call_args[0][1] == stale.id
+
+    def test_force_clears_record(self, mock_order_dao, mock_s3_service, pdf_service, sample_order):
+        """Test force regenerates a current PDF after clearing its record."""
+        order = make_orders(sample_order, 1)[0]
+        order.pdfUrl = "https://bucket/order.pdf"
+        order.pdfContentHash = pdf_service.invoice_content_hash(order)
+        mock_order_dao.iter_orders_by_date.return_value = iter([order])
+
+        stats = run_regenerator(mock_order_dao, mock_s3_service, pdf_service, Checkpoint(None), force=True)
+
+        assert stats['rendered'] == 1
+        mock_order_dao.clear_pdf_record.assert_called_once_with(order.tenantId, order.id, order.pdfContentHash)
+
+    def test_claimed_elsewhere_skipped(self, mock_order_dao, mock_s3_service, pdf_service, sample_order):
+        """Test orders claimed by the Lambda are left to it."""
+        mock_order_dao.iter_orders_by_date.return_value = iter(make_orders(sample_order, 1))
+        mock_order_dao.claim_pdf_generation.return_value = False
+
+        stats = run_regenerator(mock_order_dao, mock_s3_service, pdf_service, Checkpoint(None))
+
+        assert stats == {'queried': 1, 'skipped': 1, 'rendered': 0, 'would_render': 0, 'failed': 0}
+        mock_s3_service.open_pdf_upload.assert_not_called()
+
+    def test_upload_failure_releases_claim(self, mock_order_dao, mock_s3_service, pdf_service, sample_order):
+        """Test a failed upload releases the claim and is not checkpointed."""
+        order = make_orders(sample_order, 1)[0]
+        mock_order_dao.iter_orders_by_date.return_value = iter([order])
+        mock_s3_service.open_pdf_upload.side_effect = Exception("S3 error")
+        checkpoint = Checkpoint(None)
+
+        stats = run_regenerator(mock_order_dao, mock_s3_service, pdf_service, checkpoint)
+
+        assert stats['failed'] == 1
+        mock_order_dao.release_pdf_claim.assert_called_once()
+        assert order.id not in checkpoint.done
+
+    def test_dry_run(self, mock_order_dao, mock_s3_service, pdf_service, sample_order):
+        """Test a dry run claims and uploads nothing."""
+        mock_order_dao.iter_orders_by_date.return_value = iter(make_orders(sample_order, 2))
+
+        stats = run_regenerator(mock_order_dao, mock_s3_service, pdf_service, Checkpoint(None), dry_run=True)
+
+        assert stats['would_render'] == 2
+        assert stats['rendered'] == 0
+        mock_order_dao.claim_pdf_generation.assert_not_called()
+        mock_s3_service.open_pdf_upload.assert_not_called()
+
+    def test_query_error_raised(self, mock_order_dao, mock_s3_service, pdf_service):
+        """Test a failed date range query stops the run."""
+        mock_order_dao.iter_orders_by_date.side_effect = Exception("DynamoDB error")
+
+        with pytest.raises(Exception, match="DynamoDB error"):
+            run_regenerator(mock_order_dao, mock_s3_service, pdf_service, Checkpoint(None))
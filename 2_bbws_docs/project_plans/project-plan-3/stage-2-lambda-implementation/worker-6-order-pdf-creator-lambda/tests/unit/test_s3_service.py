@@ -5,6 +5,7 @@ Tests S3 operations with mocked boto3 client.
 """
 
 import pytest
+from botocore.exceptions import ClientError
 from src.services.s3_service import S3Service
 
 
@@ -102,3 +103,31 @@ class TestS3Service:
         exists = service.check_pdf_exists("tenant-123", "order-123")
 
         assert exists is False
+
+    def test_get_pdf_etag(self, mock_s3_client):
+        """Test getting the ETag of an existing PDF."""
+        mock_s3_client.head_object.return_value = {'ETag': '"etag-1"'}
+
+        service = S3Service(mock_s3_client, "test-bucket")
+
+        assert service.get_pdf_etag("tenant-123", "order-123") == '"etag-1"'
+        mock_s3_client.head_object.assert_called_once_with(
+            Bucket="test-bucket", Key="tenant-123/orders/order_order-123.pdf"
+        )
+
+    def test_get_pdf_etag_missing(self, mock_s3_client):
+        """Test a missing PDF returns None."""
+        mock_s3_client.head_object.side_effect = ClientError({'Error': {'Code': '404'}}, 'HeadObject')
+
+        service = S3Service(mock_s3_client, "test-bucket")
+
+        assert service.get_pdf_etag("tenant-123", "order-123") is None
+
+    def test_get_pdf_etag_error(self, mock_s3_client):
+        """Test other S3 errors are raised rather than reported as missing."""
+        mock_s3_client.head_object.side_effect = ClientError({'Error': {'Code': '403'}}, 'HeadObject')
+
+        service = S3Service(mock_s3_client, "test-bucket")
+
+        with pytest.raises(ClientError):
+            service.get_pdf_etag("tenant-123", "order-123")
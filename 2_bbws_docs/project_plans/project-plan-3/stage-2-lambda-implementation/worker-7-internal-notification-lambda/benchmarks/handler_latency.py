@@ -0,0 +1,213 @@
+"""
+Benchmark: cold and warm latency of the internal notification handler.
+
+DynamoDB, S3 and SES are served by moto, so the numbers show the Lambda's
+own cost of building clients and dependencies, not network latency.
+
+- cold: a fresh Python process per sample, timing Lambda init (importing
+  the handler, which builds the container and preloads the templates) and
+  the first single-record invocation
+- warm: repeated single-record invocations in one process, either reusing
+  the container (what the handler does) or building OrderDAO and
+  EmailService on every invocation (what it did before the container)
+
+Usage (from the worker directory):
+    python -m benchmarks.handler_latency --cold-samples 5 --warm-invocations 200
+"""
+import argparse
+import contextlib
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterator, List
+
+TABLE_NAME = 'bbws-orders-benchmark'
+TEMPLATE_BUCKET = 'bbws-email-templates-benchmark'
+FROM_EMAIL = 'noreply@kimmyai.io'
+EVENT = {
+    'Records': [{
+        'messageId': 'msg-1',
+        'receiptHandle': 'receipt-1',
+        'body': json.dumps({'tenantId': 'tenant-1', 'orderId': 'order-1'})
+    }]
+}
+
+
+@contextlib.contextmanager
+def mock_services() -> Iterator[None]:
+    """Serve DynamoDB, S3 and SES from moto (moto 5 or 4)."""
+    try:
+        from moto import mock_aws
+        with mock_aws():
+            yield
+    except ImportError:
+        from moto import mock_dynamodb, mock_s3, mock_ses
+        with mock_dynamodb(), mock_s3(), mock_ses():
+            yield
+
+
+def create_resources() -> None:
+    """Create the orders table with one order, the template bucket and the SES identity."""
+    import boto3
+    from src.models import BillingAddress, Campaign, Order, OrderItem
+
+    order = Order(
+        orderId='order-1',
+        tenantId='tenant-1',
+        orderNumber='ORD-2025-001',
+        customerEmail='customer@example.com',
+        customerName='John Doe',
+        items=[
+            OrderItem(
+                itemId='item-1',
+                campaign=Campaign(campaignId='campaign-1', campaignName='Basic Website Package', price=499.99),
+                quantity=1,
+                unitPrice=499.99,
+                subtotal=499.99
+            )
+        ],
+        subtotal=499.99,
+        tax=75.00,
+        shipping=0.00,
+        discount=0.00,
+        total=574.99,
+        orderStatus='pending',
+        paymentStatus='pending',
+        billingAddress=BillingAddress(street='123 Main St', city='Cape Town', postalCode='8001', country='ZA'),
+        createdAt=datetime(2025, 12, 30, 10, 0, 0),
+        updatedAt=datetime(2025, 12, 30, 10, 0, 0),
+        createdBy='user-1'
+    )
+
+    table = boto3.resource('dynamodb').create_table(
+        TableName=TABLE_NAME,
+        KeySchema=[{'AttributeName': 'PK', 'KeyType': 'HASH'}, {'AttributeName': 'SK', 'KeyType': 'RANGE'}],
+        AttributeDefinitions=[
+            {'AttributeName': 'PK', 'AttributeType': 'S'},
+            {'AttributeName': 'SK', 'AttributeType': 'S'}
+        ],
+        BillingMode='PAY_PER_REQUEST'
+    )
+    item = json.loads(order.json(), parse_float=Decimal)
+    table.put_item(Item={'PK': 'TENANT#tenant-1', 'SK': 'ORDER#order-1', **item})
+
+    s3 = boto3.client('s3')
+    s3.create_bucket(Bucket=TEMPLATE_BUCKET, CreateBucketConfiguration={'LocationConstraint': os.environ['AWS_DEFAULT_REGION']})
+    for name, key in (('order_notification.html', 'internal/order_notification.html'),
+                      ('order_digest.html', 'internal/order_digest.html')):
+        with open(os.path.join('templates', name), 'rb') as f:
+            s3.put_object(Bucket=TEMPLATE_BUCKET, Key=key, Body=f.read())
+
+    boto3.client('ses').verify_email_identity(EmailAddress=FROM_EMAIL)
+
+    # moto reports a MaxSendRate of 1/s; pacing would dominate the timings
+    from src.services.ses_service import send_rate_limiter
+    send_rate_limiter.max_send_rate = 0.0
+
+
+def run_cold() -> None:
+    """Child process: time Lambda init and the first invocation, print JSON."""
+    with mock_services():
+        create_resources()
+
+        start = time.perf_counter()
+        from src.handlers.order_internal_notification_sender import lambda_handler
+        init_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        response = lambda_handler(EVENT, None)
+        first_ms = (time.perf_counter() - start) * 1000
+
+    assert response['batchItemFailures'] == [], response
+    print(json.dumps({'init_ms': init_ms, 'first_ms': first_ms}))
+
+
+def time_invocations(invoke: Callable[[], Any], count: int) -> List[float]:
+    """Latency in milliseconds of each of count invocations."""
+    samples = []
+    for _ in range(count):
+        start = time.perf_counter()
+        invoke()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def run_warm(count: int) -> Dict[str, List[float]]:
+    """Warm invocations with and without reusing the container."""
+    with mock_services():
+        create_resources()
+        from src.container import container
+        from src.handlers.order_internal_notification_sender import lambda_handler
+
+        container.warm()
+        lambda_handler(EVENT, None)
+
+        def per_invocation() -> Any:
+            container.reset()
+            return lambda_handler(EVENT, None)
+
+        return {
+            'warm (container)': time_invocations(lambda: lambda_handler(EVENT, None), count),
+            'warm (per invocation)': time_invocations(per_invocation, count),
+        }
+
+
+def summarise(name: str, samples: List[float]) -> str:
+    """One table row: mean, p50 and p99 in milliseconds."""
+    ordered = sorted(samples)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    return f"{name:<22} {statistics.mean(ordered):>9.2f} {statistics.median(ordered):>9.2f} {p99:>9.2f}"
+
+
+def main() -> None:
+    """Run the cold samples in child processes, then the warm comparison."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--cold-samples', type=int, default=5, help='Fresh processes to time (default 5)')
+    parser.add_argument('--warm-invocations', type=int, default=200, help='Warm invocations per variant (default 200)')
+    parser.add_argument('--cold-child', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    os.environ.setdefault('AWS_DEFAULT_REGION', 'af-south-1')
+    os.environ.setdefault('AWS_ACCESS_KEY_ID', 'benchmark')
+    os.environ.setdefault('AWS_SECRET_ACCESS_KEY', 'benchmark')
+    os.environ['DYNAMODB_TABLE_NAME'] = TABLE_NAME
+    os.environ['EMAIL_TEMPLATE_BUCKET'] = TEMPLATE_BUCKET
+    os.environ['SES_FROM_EMAIL'] = FROM_EMAIL
+    # Metrics lines would interleave with the child's JSON result
+    os.environ['AWS_CLIENT_METRICS_INTERVAL'] = '0'
+
+    if args.cold_child:
+        import logging
+        logging.disable(logging.INFO)
+        run_cold()
+        return
+
+    child_env = {**os.environ, 'AWS_LAMBDA_FUNCTION_NAME': 'internal-notification-benchmark'}
+    cold = []
+    for _ in range(args.cold_samples):
+        output = subprocess.run(
+            [sys.executable, '-m', 'benchmarks.handler_latency', '--cold-child'],
+            check=True,
+            capture_output=True,
+            text=True,
+            env=child_env
+        ).stdout
+        cold.append(json.loads(output.strip().splitlines()[-1]))
+
+    import logging
+    logging.disable(logging.INFO)
+
+    print(f"{'variant':<22} {'mean ms':>9} {'p50 ms':>9} {'p99 ms':>9}")
+    print(summarise('cold init', [sample['init_ms'] for sample in cold]))
+    print(summarise('cold first invocation', [sample['first_ms'] for sample in cold]))
+    for name, samples in run_warm(args.warm_invocations).items():
+        print(summarise(name, samples))
+
+
+if __name__ == '__main__':
+    main()
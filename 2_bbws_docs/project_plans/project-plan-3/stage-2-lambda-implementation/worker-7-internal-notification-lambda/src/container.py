@@ -0,0 +1,73 @@
+"""
+Dependency container for the Lambda handler.
+
+Builds OrderDAO and EmailService once per Lambda container instead of on
+every invocation. The handler reads them from the module-level container;
+tests swap them with container.override(...).
+"""
+
+from contextlib import contextmanager
+from functools import cached_property
+from typing import Any, Dict, Iterator, List
+
+from src.dao.order_dao import OrderDAO
+from src.services.email_service import EmailService
+
+
+class Container:
+    """Lazily built, per-container handler dependencies."""
+
+    @cached_property
+    def order_dao(self) -> OrderDAO:
+        """OrderDAO on the container's DynamoDB resource."""
+        return OrderDAO()
+
+    @cached_property
+    def email_service(self) -> EmailService:
+        """EmailService with the container's S3 and SES clients and template cache."""
+        return EmailService()
+
+    def warm(self) -> None:
+        """Build every dependency now (call during Lambda init)."""
+        for name in self._dependency_names():
+            getattr(self, name)
+
+    def reset(self) -> None:
+        """Drop built dependencies so the next access rebuilds them."""
+        for name in self._dependency_names():
+            self.__dict__.pop(name, None)
+
+    @contextmanager
+    def override(self, **instances: Any) -> Iterator['Container']:
+        """
+        Replace dependencies for the duration of a with block.
+
+        Args:
+            **instances: Replacement objects keyed by dependency name
+
+        Yields:
+            This container
+
+        Raises:
+            AttributeError: If a name is not a dependency
+        """
+        unknown = set(instances) - set(self._dependency_names())
+        if unknown:
+            raise AttributeError(f"Unknown dependencies: {', '.join(sorted(unknown))}")
+
+        saved: Dict[str, Any] = {name: self.__dict__[name] for name in instances if name in self.__dict__}
+        self.__dict__.update(instances)
+        try:
+            yield self
+        finally:
+            for name in instances:
+                self.__dict__.pop(name, None)
+            self.__dict__.update(saved)
+
+    @classmethod
+    def _dependency_names(cls) -> List[str]:
+        """Names of the container's dependencies."""
+        return [name for name, value in vars(cls).items() if isinstance(value, cached_property)]
+
+
+container = Container()
@@ -3,5 +3,6 @@
 from .s3_service import S3Service
 from .ses_service import SESService
 from .email_service import EmailService
+from .template_cache import TemplateCache
 
-__all__ = ["S3Service", "SESService", "EmailService"]
+__all__ = ["S3Service", "SESService", "EmailService", "TemplateCache"]
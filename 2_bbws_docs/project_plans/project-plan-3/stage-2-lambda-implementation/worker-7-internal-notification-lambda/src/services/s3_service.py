@@ -2,10 +2,11 @@
 
 import os
 import logging
-from typing import Optional
-import boto3
+from typing import Optional, Tuple
 from botocore.exceptions import ClientError
 
+from src.utils.aws_clients import get_client
+
 logger = logging.getLogger(__name__)
 
 
@@ -17,14 +18,14 @@ class S3Service:
     """
 
     def __init__(self):
-        """Initialize S3Service with S3 client."""
-        self.s3_client = boto3.client('s3')
+        """Initialize S3Service with the container's S3 client."""
+        self.s3_client = get_client('s3')
         self.bucket_name = os.environ.get('EMAIL_TEMPLATE_BUCKET', 'bbws-email-templates-dev')
         logger.info(f"S3Service initialized with bucket: {self.bucket_name}")
 
     def get_template(self, template_key: str) -> Optional[str]:
         """
-        Retrieve email template from S3.
+        Retrieve email template from S3 unconditionally.
 
         Args:
             template_key: S3 key for the template (e.g., 'internal/order_notification.html')
@@ -35,25 +36,52 @@ class S3Service:
         Raises:
             Exception: If S3 operation fails (except NotFound/AccessDenied)
         """
+        content, _ = self.get_template_if_modified(template_key)
+        return content
+
+    def get_template_if_modified(
+        self,
+        template_key: str,
+        etag: Optional[str] = None
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Retrieve email template from S3 unless it still matches an ETag.
+
+        Args:
+            template_key: S3 key for the template
+            etag: ETag of the cached version (sent as If-None-Match)
+
+        Returns:
+            (content, etag) of the current version; (None, etag) if the template
+            still matches the given ETag (304 Not Modified); (None, None) if the
+            template is not found or access is denied
+
+        Raises:
+            Exception: If S3 operation fails (except NotFound/AccessDenied)
+        """
+        request = {'Bucket': self.bucket_name, 'Key': template_key}
+        if etag:
+            request['IfNoneMatch'] = etag
+
         try:
-            logger.info(f"Retrieving template from S3: bucket={self.bucket_name}, key={template_key}")
+            logger.info(f"Retrieving template from S3: bucket={self.bucket_name}, key={template_key}, etag={etag}")
 
-            response = self.s3_client.get_object(
-                Bucket=self.bucket_name,
-                Key=template_key
-            )
+            response = self.s3_client.get_object(**request)
 
             template_content = response['Body'].read().decode('utf-8')
             logger.info(f"Successfully retrieved template: {template_key} ({len(template_content)} bytes)")
-            return template_content
+            return template_content, response.get('ETag')
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
             error_message = e.response['Error']['Message']
 
-            if error_code in ['NoSuchKey', 'AccessDenied']:
+            if error_code in ['304', 'NotModified']:
+                logger.info(f"Template not modified: {template_key}")
+                return None, etag
+            elif error_code in ['NoSuchKey', 'AccessDenied']:
                 logger.warning(f"Template not found or access denied: {template_key} - {error_code}")
-                return None
+                return None, None
             else:
                 logger.error(f"S3 ClientError: {error_code} - {error_message}")
                 raise Exception(f"Failed to retrieve template from S3: {error_message}")
@@ -61,7 +89,3 @@ class S3Service:
         except UnicodeDecodeError as e:
             logger.error(f"Failed to decode template {template_key}: {str(e)}")
             raise Exception(f"Template decoding error: {str(e)}")
-
-        except Exception as e:
-            logger.error(f"Unexpected error retrieving template {template_key}: {str(e)}")
-            raise
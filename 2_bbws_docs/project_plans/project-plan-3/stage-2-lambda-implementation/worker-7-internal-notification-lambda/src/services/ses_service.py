@@ -2,23 +2,90 @@
 
 import os
 import logging
-from typing import Optional
-import boto3
+import random
+import threading
+import time
+from typing import Any, Dict, Optional
 from botocore.exceptions import ClientError
 
+from src.utils.aws_clients import get_client
+
 logger = logging.getLogger(__name__)
 
+# SES error codes for exceeding the maximum send rate
+THROTTLING_ERROR_CODES = ('Throttling', 'ThrottlingException', 'TooManyRequestsException')
+
+# Attempts per SES call while throttled, with exponential backoff and jitter between them
+MAX_SEND_ATTEMPTS = int(os.environ.get('SES_MAX_SEND_ATTEMPTS', '5'))
+BACKOFF_BASE_SECONDS = 0.2
+BACKOFF_MAX_SECONDS = 5.0
+
+
+class SendRateLimiter:
+    """
+    Paces SES calls to stay under the account's MaxSendRate (recipients per second).
+
+    Shared by every SESService in the container, so concurrent records and
+    bulk sends draw from the same budget. MaxSendRate is read once with
+    GetSendQuota; if that fails, calls are not paced (throttling errors are
+    still retried with backoff).
+    """
+
+    def __init__(self):
+        """Initialize SendRateLimiter (rate unknown until configured)."""
+        self.max_send_rate: Optional[float] = None
+        self._next_send = 0.0
+        self._lock = threading.Lock()
+
+    def configure(self, ses_client) -> None:
+        """
+        Read MaxSendRate from SES once per container.
+
+        Args:
+            ses_client: Boto3 SES client
+        """
+        if self.max_send_rate is not None:
+            return
+        try:
+            self.max_send_rate = float(ses_client.get_send_quota()['MaxSendRate'])
+            logger.info(f"SES max send rate: {self.max_send_rate}/s")
+        except Exception as e:
+            logger.warning(f"Failed to read SES send quota, sending without pacing: {str(e)}")
+            self.max_send_rate = 0.0
+
+    def acquire(self, recipients: int = 1) -> None:
+        """
+        Wait until sending to the given number of recipients stays within the rate.
+
+        Args:
+            recipients: Recipients of the next SES call
+        """
+        if not self.max_send_rate:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_send)
+            self._next_send = start + recipients / self.max_send_rate
+        if start > now:
+            time.sleep(start - now)
+
+
+send_rate_limiter = SendRateLimiter()
+
 
 class SESService:
     """
     Service for sending emails via Amazon SES.
 
     Handles email composition and delivery with proper error handling.
+    SES calls are paced by the container's SendRateLimiter and retried with
+    backoff when SES throttles them.
     """
 
     def __init__(self):
-        """Initialize SESService with SES client."""
-        self.ses_client = boto3.client('ses')
+        """Initialize SESService with the container's SES client."""
+        # Standard retries: SendRateLimiter already paces SES, so no adaptive client-side limiting
+        self.ses_client = get_client('ses', retry_mode='standard')
         self.from_email = os.environ.get('SES_FROM_EMAIL', 'noreply@kimmyai.io')
         self.default_to_email = os.environ.get('INTERNAL_NOTIFICATION_EMAIL', 'internal@kimmyai.io')
         logger.info(f"SESService initialized with from_email: {self.from_email}")
@@ -68,7 +135,9 @@ class SESService:
                     'Charset': 'UTF-8'
                 }
 
-            response = self.ses_client.send_email(
+            response = self._call_ses(
+                'send_email',
+                1,
                 Source=self.from_email,
                 Destination={
                     'ToAddresses': [recipient]
@@ -95,3 +164,43 @@ class SESService:
         except Exception as e:
             logger.error(f"Unexpected error sending email: {str(e)}")
             raise
+
+    def _call_ses(self, operation: str, recipients: int, **params) -> Dict[str, Any]:
+        """
+        Call an SES send operation, pacing it and retrying while throttled.
+
+        Args:
+            operation: SES client method name (e.g., 'send_email')
+            recipients: Recipients of the call (counted against MaxSendRate)
+            **params: Operation parameters
+
+        Returns:
+            SES response
+
+        Raises:
+            ClientError: If SES rejects the call, or is still throttling after
+                MAX_SEND_ATTEMPTS attempts
+        """
+        send_rate_limiter.configure(self.ses_client)
+
+        for attempt in range(1, MAX_SEND_ATTEMPTS + 1):
+            send_rate_limiter.acquire(recipients)
+            try:
+                return getattr(self.ses_client, operation)(**params)
+            except ClientError as e:
+                if not self._is_throttled(e) or attempt == MAX_SEND_ATTEMPTS:
+                    raise
+                delay = min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * 2 ** (attempt - 1))
+                delay = random.uniform(delay / 2, delay)
+                logger.warning(
+                    f"SES throttled {operation}, retrying in {delay:.2f}s "
+                    f"(attempt {attempt}/{MAX_SEND_ATTEMPTS})"
+                )
+                time.sleep(delay)
+
+    @staticmethod
+    def _is_throttled(error: ClientError) -> bool:
+        """Return True for send-rate throttling (the daily quota is not retried)."""
+        error_code = error.response['Error']['Code']
+        error_message = error.response['Error'].get('Message', '')
+        return error_code in THROTTLING_ERROR_CODES and 'Daily message quota exceeded' not in error_message
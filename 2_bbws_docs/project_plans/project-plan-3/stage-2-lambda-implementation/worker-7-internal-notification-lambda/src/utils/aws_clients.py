@@ -0,0 +1,354 @@
+"""
+Shared boto3 client factory.
+
+Clients are created once per container and memoised per (service, region,
+role, overrides), so handlers, DAOs and services can ask for a client on every
+invocation without paying for a new client, connection pool and TLS handshake.
+Shared by all the order Lambdas (workers 1-8).
+
+Every client gets the same botocore Config, read from the environment:
+
+- AWS_CLIENT_MAX_POOL_CONNECTIONS: connections per client (default 50)
+- AWS_CLIENT_RETRY_MODE: botocore retry mode (default adaptive)
+- AWS_CLIENT_MAX_ATTEMPTS: attempts per call, including the first (default 5)
+- AWS_CLIENT_CONNECT_TIMEOUT / AWS_CLIENT_READ_TIMEOUT: seconds (default 2 / 10)
+- AWS_CLIENT_TCP_KEEPALIVE: keep idle pooled connections alive (default true)
+
+Every call's latency, retries and errors are recorded per operation in
+client_metrics and written to stdout as CloudWatch Embedded Metric Format.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import boto3
+import botocore.session
+from botocore.config import Config
+from botocore.credentials import DeferredRefreshableCredentials
+
+logger = logging.getLogger(__name__)
+
+# Latency samples kept per operation between publishes (EMF allows 100 values)
+MAX_LATENCY_SAMPLES = 100
+
+# Key under which the call start is kept in botocore's per-call context
+_CONTEXT_KEY = 'aws_clients_call'
+
+
+def client_config(**overrides: Any) -> Config:
+    """
+    Build the botocore Config for factory clients from the environment.
+
+    Args:
+        **overrides: max_pool_connections, retry_mode, max_attempts,
+            connect_timeout, read_timeout or tcp_keepalive for one client
+
+    Returns:
+        botocore Config
+    """
+    settings = {
+        'max_pool_connections': int(os.environ.get('AWS_CLIENT_MAX_POOL_CONNECTIONS', '50')),
+        'retry_mode': os.environ.get('AWS_CLIENT_RETRY_MODE', 'adaptive'),
+        'max_attempts': int(os.environ.get('AWS_CLIENT_MAX_ATTEMPTS', '5')),
+        'connect_timeout': float(os.environ.get('AWS_CLIENT_CONNECT_TIMEOUT', '2')),
+        'read_timeout': float(os.environ.get('AWS_CLIENT_READ_TIMEOUT', '10')),
+        'tcp_keepalive': os.environ.get('AWS_CLIENT_TCP_KEEPALIVE', 'true').lower() == 'true',
+    }
+    unknown = set(overrides) - set(settings)
+    if unknown:
+        raise ValueError(f"Unknown client settings: {', '.join(sorted(unknown))}")
+    settings.update(overrides)
+
+    return Config(
+        max_pool_connections=settings['max_pool_connections'],
+        retries={'mode': settings['retry_mode'], 'total_max_attempts': settings['max_attempts']},
+        connect_timeout=settings['connect_timeout'],
+        read_timeout=settings['read_timeout'],
+        tcp_keepalive=settings['tcp_keepalive'],
+    )
+
+
+class ClientMetrics:
+    """
+    Per-operation call latency of the factory's clients.
+
+    Calls are recorded by botocore event hooks on every factory client.
+    publish() writes one EMF document per operation and starts a new interval;
+    it runs by itself once AWS_CLIENT_METRICS_INTERVAL seconds have passed
+    since the last publish, and can be called at the end of an invocation
+    or tool run.
+
+    Attributes:
+        namespace: CloudWatch namespace of the published metrics
+        interval: Seconds between automatic publishes (0 = only explicit)
+    """
+
+    def __init__(self, namespace: str = 'BBWS/AWSClients', interval: float = 60.0):
+        """
+        Initialize ClientMetrics.
+
+        Args:
+            namespace: CloudWatch namespace
+            interval: Seconds between automatic publishes (0 = only explicit)
+        """
+        self.namespace = namespace
+        self.interval = interval
+        self._stats: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._last_publish = time.monotonic()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> 'ClientMetrics':
+        """
+        Build from AWS_CLIENT_METRICS_NAMESPACE and AWS_CLIENT_METRICS_INTERVAL.
+
+        Returns:
+            ClientMetrics
+        """
+        return cls(
+            namespace=os.environ.get('AWS_CLIENT_METRICS_NAMESPACE', 'BBWS/AWSClients'),
+            interval=float(os.environ.get('AWS_CLIENT_METRICS_INTERVAL', '60'))
+        )
+
+    def record(self, service: str, operation: str, elapsed_ms: float, retries: int, error: bool) -> None:
+        """
+        Record one API call.
+
+        Args:
+            service: Service name (e.g. dynamodb)
+            operation: Operation name (e.g. GetItem)
+            elapsed_ms: Call latency including retries
+            retries: Retry attempts botocore made
+            error: Whether the call failed
+        """
+        with self._lock:
+            stats = self._stats.get((service, operation))
+            if stats is None:
+                stats = self._stats[(service, operation)] = {
+                    'count': 0, 'errors': 0, 'retries': 0, 'totalMs': 0.0, 'maxMs': 0.0, 'samples': []
+                }
+            stats['count'] += 1
+            stats['errors'] += int(error)
+            stats['retries'] += retries
+            stats['totalMs'] += elapsed_ms
+            stats['maxMs'] = max(stats['maxMs'], elapsed_ms)
+            if len(stats['samples']) < MAX_LATENCY_SAMPLES:
+                stats['samples'].append(round(elapsed_ms, 3))
+            due = self.interval > 0 and time.monotonic() - self._last_publish >= self.interval
+
+        if due:
+            self.publish()
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """
+        Totals of the current interval.
+
+        Returns:
+            Dictionary keyed by 'service.Operation' with count, errors,
+            retries, avgMs and maxMs
+        """
+        with self._lock:
+            return {
+                f'{service}.{operation}': {
+                    'count': stats['count'],
+                    'errors': stats['errors'],
+                    'retries': stats['retries'],
+                    'avgMs': stats['totalMs'] / stats['count'],
+                    'maxMs': stats['maxMs'],
+                }
+                for (service, operation), stats in self._stats.items()
+            }
+
+    def publish(self) -> List[Dict[str, Any]]:
+        """
+        Write the current interval as EMF documents and start a new one.
+
+        Returns:
+            The EMF documents written
+        """
+        with self._lock:
+            stats, self._stats = self._stats, {}
+            self._last_publish = time.monotonic()
+
+        timestamp = int(time.time() * 1000)
+        documents = []
+        for (service, operation), entry in stats.items():
+            document = {
+                '_aws': {
+                    'Timestamp': timestamp,
+                    'CloudWatchMetrics': [{
+                        'Namespace': self.namespace,
+                        'Dimensions': [['Service', 'Operation']],
+                        'Metrics': [
+                            {'Name': 'AWSCallLatency', 'Unit': 'Milliseconds'},
+                            {'Name': 'AWSCallCount', 'Unit': 'Count'},
+                            {'Name': 'AWSCallErrors', 'Unit': 'Count'},
+                            {'Name': 'AWSCallRetries', 'Unit': 'Count'},
+                        ]
+                    }]
+                },
+                'Service': service,
+                'Operation': operation,
+                'AWSCallLatency': entry['samples'],
+                'AWSCallCount': entry['count'],
+                'AWSCallErrors': entry['errors'],
+                'AWSCallRetries': entry['retries'],
+                'AWSCallMaxLatency': round(entry['maxMs'], 3),
+            }
+            # Plain stdout line: the logging handler's prefix would stop CloudWatch extracting it
+            print(json.dumps(document), flush=True)
+            documents.append(document)
+        return documents
+
+    def _before_call(self, model, context, **kwargs) -> None:
+        """botocore before-call hook: note the operation and start time."""
+        context[_CONTEXT_KEY] = (model.service_model.service_name, model.name, time.perf_counter())
+
+    def _after_call(self, http_response, parsed, context, **kwargs) -> None:
+        """botocore after-call hook: record a call that got a response (4xx/5xx count as errors)."""
+        call = context.get(_CONTEXT_KEY)
+        if call is None:
+            return
+        service, operation, start = call
+        retries = parsed.get('ResponseMetadata', {}).get('RetryAttempts', 0)
+        error = http_response.status_code >= 400
+        self.record(service, operation, (time.perf_counter() - start) * 1000, retries, error)
+
+    def _after_call_error(self, context, **kwargs) -> None:
+        """botocore after-call-error hook: record a call that got no response."""
+        call = context.get(_CONTEXT_KEY)
+        if call is None:
+            return
+        service, operation, start = call
+        self.record(service, operation, (time.perf_counter() - start) * 1000, 0, True)
+
+    def instrument(self, client: Any) -> None:
+        """
+        Register the latency hooks on a client.
+
+        Args:
+            client: Boto3 client
+        """
+        client.meta.events.register_first('before-call', self._before_call)
+        client.meta.events.register('after-call', self._after_call)
+        client.meta.events.register('after-call-error', self._after_call_error)
+
+
+client_metrics = ClientMetrics.from_env()
+
+_ClientKey = Tuple[str, Optional[str], Optional[str], Tuple[Tuple[str, Any], ...]]
+
+_sessions: Dict[Tuple[Optional[str], Optional[str]], boto3.session.Session] = {}
+_clients: Dict[_ClientKey, Any] = {}
+_resources: Dict[_ClientKey, Any] = {}
+_lock = threading.RLock()
+
+
+def get_client(
+    service: str,
+    region_name: Optional[str] = None,
+    role_arn: Optional[str] = None,
+    **overrides: Any
+) -> Any:
+    """
+    Get the container's client for a service, region and role.
+
+    Args:
+        service: Service name (e.g. 'dynamodb')
+        region_name: Region (None = the Lambda's region)
+        role_arn: Role to assume (None = the Lambda's execution role)
+        **overrides: client_config() settings for this client only
+
+    Returns:
+        Boto3 client, shared by every caller with the same arguments
+    """
+    key = (service, region_name, role_arn, tuple(sorted(overrides.items())))
+    client = _clients.get(key)
+    if client is not None:
+        return client
+
+    with _lock:
+        client = _clients.get(key)
+        if client is None:
+            client = _session(region_name, role_arn).client(service, config=client_config(**overrides))
+            client_metrics.instrument(client)
+            _clients[key] = client
+            logger.debug(f"Created {service} client (region={region_name}, role={role_arn})")
+        return client
+
+
+def get_resource(
+    service: str,
+    region_name: Optional[str] = None,
+    role_arn: Optional[str] = None,
+    **overrides: Any
+) -> Any:
+    """
+    Get the container's boto3 resource for a service, region and role.
+
+    Args:
+        service: Service name (e.g. 'dynamodb')
+        region_name: Region (None = the Lambda's region)
+        role_arn: Role to assume (None = the Lambda's execution role)
+        **overrides: client_config() settings for this resource only
+
+    Returns:
+        Boto3 service resource, shared by every caller with the same arguments
+    """
+    key = (service, region_name, role_arn, tuple(sorted(overrides.items())))
+    resource = _resources.get(key)
+    if resource is not None:
+        return resource
+
+    with _lock:
+        resource = _resources.get(key)
+        if resource is None:
+            resource = _session(region_name, role_arn).resource(service, config=client_config(**overrides))
+            client_metrics.instrument(resource.meta.client)
+            _resources[key] = resource
+        return resource
+
+
+def clear_clients() -> None:
+    """Forget all memoised sessions, clients and resources (tests, credential rotation)."""
+    with _lock:
+        _sessions.clear()
+        _clients.clear()
+        _resources.clear()
+
+
+def _session(region_name: Optional[str], role_arn: Optional[str]) -> boto3.session.Session:
+    """Session for a region and role; assumed-role credentials refresh before they expire."""
+    key = (region_name, role_arn)
+    session = _sessions.get(key)
+    if session is not None:
+        return session
+
+    if role_arn is None:
+        session = boto3.session.Session(region_name=region_name)
+    else:
+        sts_client = get_client('sts', region_name)
+        session_name = os.environ.get('AWS_LAMBDA_FUNCTION_NAME', 'bbws-order-lambda')[:64]
+
+        def assume_role() -> Dict[str, str]:
+            credentials = sts_client.assume_role(RoleArn=role_arn, RoleSessionName=session_name)['Credentials']
+            return {
+                'access_key': credentials['AccessKeyId'],
+                'secret_key': credentials['SecretAccessKey'],
+                'token': credentials['SessionToken'],
+                'expiry_time': credentials['Expiration'].isoformat(),
+            }
+
+        botocore_session = botocore.session.get_session()
+        botocore_session._credentials = DeferredRefreshableCredentials(
+            refresh_using=assume_role,
+            method='sts-assume-role'
+        )
+        session = boto3.session.Session(botocore_session=botocore_session, region_name=region_name)
+
+    _sessions[key] = session
+    return session
@@ -5,8 +5,10 @@ import pytest
 from unittest.mock import Mock, MagicMock, patch
 from datetime import datetime
 
+from src.container import container
 from src.handlers.order_internal_notification_sender import lambda_handler
 from src.models import Order, OrderItem, Campaign, BillingAddress
+from src.utils.sqs_batch_runner import SQSBatchRunner
 
 
 class TestOrderInternalNotificationSenderHandler:
@@ -95,6 +97,20 @@ class TestOrderInternalNotificationSenderHandler:
             ]
         }
 
+    @pytest.fixture
+    def mock_order_dao(self):
+        """Mock OrderDAO swapped into the handler's container."""
+        order_dao = Mock()
+        with container.override(order_dao=order_dao):
+            yield order_dao
+
+    @pytest.fixture
+    def mock_email_service(self):
+        """Mock EmailService swapped into the handler's container."""
+        email_service = Mock()
+        with container.override(email_service=email_service):
+            yield email_service
+
     @pytest.fixture
     def mock_context(self):
         """Create mock Lambda context."""
@@ -104,19 +120,12 @@ class TestOrderInternalNotificationSenderHandler:
         context.aws_request_id = 'test-aws-request-id'
         return context
 
-    @patch('src.handlers.order_internal_notification_sender.OrderDAO')
-    @patch('src.handlers.order_internal_notification_sender.EmailService')
     def test_lambda_handler_single_message_success(
-        self, mock_email_service_class, mock_order_dao_class,
+        self, mock_email_service, mock_order_dao,
         sqs_event_single_record, mock_context, sample_order
     ):
         """Test successful processing of single SQS message."""
         # Arrange
-        mock_order_dao = Mock()
-        mock_email_service = Mock()
-        mock_order_dao_class.return_value = mock_order_dao
-        mock_email_service_class.return_value = mock_email_service
-
         mock_order_dao.get_order.return_value = sample_order
         mock_email_service.send_internal_notification.return_value = 'msg-ses-123'
 
@@ -133,19 +142,12 @@ class TestOrderInternalNotificationSenderHandler:
         # Verify email was sent
         mock_email_service.send_internal_notification.assert_called_once_with(sample_order)
 
-    @patch('src.handlers.order_internal_notification_sender.OrderDAO')
-    @patch('src.handlers.order_internal_notification_sender.EmailService')
     def test_lambda_handler_batch_messages_success(
-        self, mock_email_service_class, mock_order_dao_class,
+        self, mock_email_service, mock_order_dao,
         sqs_event_batch, mock_context, sample_order
     ):
         """Test successful processing of batch SQS messages."""
         # Arrange
-        mock_order_dao = Mock()
-        mock_email_service = Mock()
-        mock_order_dao_class.return_value = mock_order_dao
-        mock_email_service_class.return_value = mock_email_service
-
         mock_order_dao.get_order.return_value = sample_order
         mock_email_service.send_internal_notification.return_value = 'msg-ses-123'
 
@@ -158,19 +160,12 @@ class TestOrderInternalNotificationSenderHandler:
         assert mock_order_dao.get_order.call_count == 2
         assert mock_email_service.send_internal_notification.call_count == 2
 
-    @patch('src.handlers.order_internal_notification_sender.OrderDAO')
-    @patch('src.handlers.order_internal_notification_sender.EmailService')
     def test_lambda_handler_order_not_found(
-        self, mock_email_service_class, mock_order_dao_class,
+        self, mock_email_service, mock_order_dao,
         sqs_event_single_record, mock_context
     ):
         """Test handling when order is not found in DynamoDB."""
         # Arrange
-        mock_order_dao = Mock()
-        mock_email_service = Mock()
-        mock_order_dao_class.return_value = mock_order_dao
-        mock_email_service_class.return_value = mock_email_service
-
         mock_order_dao.get_order.return_value = None
 
         # Act
@@ -183,19 +178,12 @@ class TestOrderInternalNotificationSenderHandler:
         # Email should not be sent
         mock_email_service.send_internal_notification.assert_not_called()
 
-    @patch('src.handlers.order_internal_notification_sender.OrderDAO')
-    @patch('src.handlers.order_internal_notification_sender.EmailService')
     def test_lambda_handler_email_send_failure(
-        self, mock_email_service_class, mock_order_dao_class,
+        self, mock_email_service, mock_order_dao,
         sqs_event_single_record, mock_context, sample_order
     ):
         """Test handling of email send failure (should retry via SQS)."""
         # Arrange
-        mock_order_dao = Mock()
-        mock_email_service = Mock()
-        mock_order_dao_class.return_value = mock_order_dao
-        mock_email_service_class.return_value = mock_email_service
-
         mock_order_dao.get_order.return_value = sample_order
         mock_email_service.send_internal_notification.side_effect = Exception("SES error")
 
@@ -207,19 +195,13 @@ class TestOrderInternalNotificationSenderHandler:
         assert len(response['batchItemFailures']) == 1
         assert response['batchItemFailures'][0]['itemIdentifier'] == 'msg-123'
 
-    @patch('src.handlers.order_internal_notification_sender.OrderDAO')
-    @patch('src.handlers.order_internal_notification_sender.EmailService')
+    @patch('src.handlers.order_internal_notification_sender.batch_runner', SQSBatchRunner(max_workers=1))
     def test_lambda_handler_partial_batch_failure(
-        self, mock_email_service_class, mock_order_dao_class,
+        self, mock_email_service, mock_order_dao,
         sqs_event_batch, mock_context, sample_order
     ):
         """Test partial batch failure handling."""
         # Arrange
-        mock_order_dao = Mock()
-        mock_email_service = Mock()
-        mock_order_dao_class.return_value = mock_order_dao
-        mock_email_service_class.return_value = mock_email_service
-
         mock_order_dao.get_order.return_value = sample_order
 
         # First call succeeds, second fails
@@ -236,18 +218,11 @@ class TestOrderInternalNotificationSenderHandler:
         assert len(response['batchItemFailures']) == 1
         assert response['batchItemFailures'][0]['itemIdentifier'] == 'msg-2'
 
-    @patch('src.handlers.order_internal_notification_sender.OrderDAO')
-    @patch('src.handlers.order_internal_notification_sender.EmailService')
     def test_lambda_handler_invalid_json_body(
-        self, mock_email_service_class, mock_order_dao_class, mock_context
+        self, mock_email_service, mock_order_dao, mock_context
     ):
         """Test handling of invalid JSON in SQS message body."""
         # Arrange
-        mock_order_dao = Mock()
-        mock_email_service = Mock()
-        mock_order_dao_class.return_value = mock_order_dao
-        mock_email_service_class.return_value = mock_email_service
-
         event = {
             'Records': [
                 {
@@ -266,18 +241,11 @@ class TestOrderInternalNotificationSenderHandler:
         assert len(response['batchItemFailures']) == 1
         assert response['batchItemFailures'][0]['itemIdentifier'] == 'msg-invalid'
 
-    @patch('src.handlers.order_internal_notification_sender.OrderDAO')
-    @patch('src.handlers.order_internal_notification_sender.EmailService')
     def test_lambda_handler_missing_required_fields(
-        self, mock_email_service_class, mock_order_dao_class, mock_context
+        self, mock_email_service, mock_order_dao, mock_context
     ):
         """Test handling of missing required fields in message."""
         # Arrange
-        mock_order_dao = Mock()
-        mock_email_service = Mock()
-        mock_order_dao_class.return_value = mock_order_dao
-        mock_email_service_class.return_value = mock_email_service
-
         event = {
             'Records': [
                 {
@@ -298,19 +266,12 @@ class TestOrderInternalNotificationSenderHandler:
         assert response['statusCode'] == 200
         assert len(response['batchItemFailures']) == 1
 
-    @patch('src.handlers.order_internal_notification_sender.OrderDAO')
-    @patch('src.handlers.order_internal_notification_sender.EmailService')
     def test_lambda_handler_dao_exception(
-        self, mock_email_service_class, mock_order_dao_class,
+        self, mock_email_service, mock_order_dao,
         sqs_event_single_record, mock_context
     ):
         """Test handling of DAO exception."""
         # Arrange
-        mock_order_dao = Mock()
-        mock_email_service = Mock()
-        mock_order_dao_class.return_value = mock_order_dao
-        mock_email_service_class.return_value = mock_email_service
-
         mock_order_dao.get_order.side_effect = Exception("DynamoDB error")
 
         # Act
@@ -320,3 +281,70 @@ class TestOrderInternalNotificationSenderHandler:
         assert response['statusCode'] == 200
         assert len(response['batchItemFailures']) == 1
         assert response['batchItemFailures'][0]['itemIdentifier'] == 'msg-123'
+
+    @patch('src.handlers.order_internal_notification_sender.email_batch_mode', True)
+    def test_lambda_handler_batch_mode_sends_digest(
+        self, mock_email_service, mock_order_dao,
+        sqs_event_batch, mock_context, sample_order
+    ):
+        """Test batch mode sends one digest email for the whole batch."""
+        # Arrange
+        mock_order_dao.get_order.return_value = sample_order
+        mock_email_service.send_internal_digest.return_value = 'msg-ses-digest'
+
+        # Act
+        response = lambda_handler(sqs_event_batch, mock_context)
+
+        # Assert
+        assert response['statusCode'] == 200
+        assert response['batchItemFailures'] == []
+        mock_email_service.send_internal_digest.assert_called_once_with([sample_order, sample_order])
+        mock_email_service.send_internal_notification.assert_not_called()
+
+    @patch('src.handlers.order_internal_notification_sender.email_batch_mode', True)
+    def test_lambda_handler_batch_mode_skips_failed_and_missing_orders(
+        self, mock_email_service, mock_order_dao, mock_context, sample_order
+    ):
+        """Test batch mode leaves out orders that are missing or fail to load."""
+        # Arrange
+        def get_order(tenant_id, order_id):
+            if order_id == 'order-2':
+                raise Exception("DynamoDB error")
+            return None if order_id == 'order-3' else sample_order
+
+        mock_order_dao.get_order.side_effect = get_order
+        event = {
+            'Records': [
+                {
+                    'messageId': f'msg-{i}',
+                    'body': json.dumps({'tenantId': 'tenant-1', 'orderId': f'order-{i}'})
+                }
+                for i in range(1, 4)
+            ]
+        }
+
+        # Act
+        response = lambda_handler(event, mock_context)
+
+        # Assert
+        assert response['batchItemFailures'] == [{'itemIdentifier': 'msg-2'}]
+        mock_email_service.send_internal_digest.assert_called_once_with([sample_order])
+
+    @patch('src.handlers.order_internal_notification_sender.email_batch_mode', True)
+    def test_lambda_handler_batch_mode_digest_failure(
+        self, mock_email_service, mock_order_dao,
+        sqs_event_batch, mock_context, sample_order
+    ):
+        """Test every record of a digest that cannot be sent is retried."""
+        # Arrange
+        mock_order_dao.get_order.return_value = sample_order
+        mock_email_service.send_internal_digest.side_effect = Exception("SES error")
+
+        # Act
+        response = lambda_handler(sqs_event_batch, mock_context)
+
+        # Assert
+        assert response['batchItemFailures'] == [
+            {'itemIdentifier': 'msg-1'},
+            {'itemIdentifier': 'msg-2'}
+        ]
@@ -0,0 +1,162 @@
+"""Unit tests for TemplateCache."""
+
+import pytest
+from unittest.mock import Mock, patch
+
+from src.services.template_cache import TemplateCache
+
+
+TEMPLATE_KEY = 'internal/order_notification.html'
+
+
+class TestTemplateCache:
+    """Test cases for TemplateCache."""
+
+    @pytest.fixture
+    def mock_s3_service(self):
+        """Create mock S3Service serving version 1 of the template."""
+        service = Mock()
+        service.get_template_if_modified.return_value = ("<p>v1 {{ orderNumber }}</p>", '"etag-1"')
+        return service
+
+    @pytest.fixture
+    def clock(self):
+        """Patch the cache clock; advance with clock.now += seconds."""
+        clock = Mock(now=1000.0)
+        with patch('src.services.template_cache.time.monotonic', side_effect=lambda: clock.now):
+            yield clock
+
+    def test_get_compiles_and_caches(self, mock_s3_service, clock):
+        """Test a template is fetched and compiled once within the interval."""
+        # Arrange
+        cache = TemplateCache(revalidate_seconds=60)
+
+        # Act
+        first = cache.get(mock_s3_service, TEMPLATE_KEY)
+        clock.now += 30
+        second = cache.get(mock_s3_service, TEMPLATE_KEY)
+
+        # Assert
+        assert first is second
+        assert first.render(orderNumber='ORD-1') == "<p>v1 ORD-1</p>"
+        mock_s3_service.get_template_if_modified.assert_called_once_with(TEMPLATE_KEY, etag=None)
+
+    def test_revalidate_not_modified(self, mock_s3_service, clock):
+        """Test an unchanged template is revalidated by ETag and not recompiled."""
+        # Arrange
+        cache = TemplateCache(revalidate_seconds=60)
+        first = cache.get(mock_s3_service, TEMPLATE_KEY)
+        mock_s3_service.get_template_if_modified.return_value = (None, '"etag-1"')
+
+        # Act
+        clock.now += 61
+        second = cache.get(mock_s3_service, TEMPLATE_KEY)
+        clock.now += 30
+        third = cache.get(mock_s3_service, TEMPLATE_KEY)
+
+        # Assert
+        assert first is second is third
+        assert mock_s3_service.get_template_if_modified.call_count == 2
+        mock_s3_service.get_template_if_modified.assert_called_with(TEMPLATE_KEY, etag='"etag-1"')
+
+    def test_revalidate_modified(self, mock_s3_service, clock):
+        """Test a changed template replaces the cached version."""
+        # Arrange
+        cache = TemplateCache(revalidate_seconds=60)
+        cache.get(mock_s3_service, TEMPLATE_KEY)
+        mock_s3_service.get_template_if_modified.return_value = ("<p>v2</p>", '"etag-2"')
+
+        # Act
+        clock.now += 61
+        template = cache.get(mock_s3_service, TEMPLATE_KEY)
+
+        # Assert
+        assert template.render() == "<p>v2</p>"
+
+    def test_s3_error_serves_last_good_version(self, mock_s3_service, clock):
+        """Test S3 failures fall back to the cached template."""
+        # Arrange
+        cache = TemplateCache(revalidate_seconds=60)
+        first = cache.get(mock_s3_service, TEMPLATE_KEY)
+        mock_s3_service.get_template_if_modified.side_effect = Exception("S3 unavailable")
+
+        # Act
+        clock.now += 61
+        second = cache.get(mock_s3_service, TEMPLATE_KEY)
+
+        # Assert
+        assert second is first
+
+    def test_s3_error_without_cached_version(self, mock_s3_service, clock):
+        """Test S3 failures are raised when nothing is cached."""
+        # Arrange
+        cache = TemplateCache()
+        mock_s3_service.get_template_if_modified.side_effect = Exception("S3 unavailable")
+
+        # Act & Assert
+        with pytest.raises(Exception, match="S3 unavailable"):
+            cache.get(mock_s3_service, TEMPLATE_KEY)
+
+    def test_invalid_new_version_serves_last_good_version(self, mock_s3_service, clock):
+        """Test a new version with invalid syntax does not replace the cached one."""
+        # Arrange
+        cache = TemplateCache(revalidate_seconds=60)
+        first = cache.get(mock_s3_service, TEMPLATE_KEY)
+        mock_s3_service.get_template_if_modified.return_value = ("<p>{{ unclosed </p>", '"etag-2"')
+
+        # Act
+        clock.now += 61
+        second = cache.get(mock_s3_service, TEMPLATE_KEY)
+
+        # Assert
+        assert second is first
+
+    def test_invalid_template_without_cached_version(self, mock_s3_service, clock):
+        """Test a template with invalid syntax raises when nothing is cached."""
+        # Arrange
+        cache = TemplateCache()
+        mock_s3_service.get_template_if_modified.return_value = ("<p>{{ unclosed </p>", '"etag-1"')
+
+        # Act & Assert
+        with pytest.raises(Exception, match="Failed to compile template"):
+            cache.get(mock_s3_service, TEMPLATE_KEY)
+
+    def test_missing_template_is_cached(self, mock_s3_service, clock):
+        """Test a missing template is not fetched again within the interval."""
+        # Arrange
+        cache = TemplateCache(revalidate_seconds=60)
+        mock_s3_service.get_template_if_modified.return_value = (None, None)
+
+        # Act
+        first = cache.get(mock_s3_service, TEMPLATE_KEY)
+        second = cache.get(mock_s3_service, TEMPLATE_KEY)
+
+        # Assert
+        assert first is None
+        assert second is None
+        mock_s3_service.get_template_if_modified.assert_called_once()
+
+    def test_preload(self, mock_s3_service, clock):
+        """Test preloaded templates are served without another S3 call."""
+        # Arrange
+        cache = TemplateCache()
+
+        # Act
+        cache.preload(mock_s3_service, [TEMPLATE_KEY])
+        template = cache.get(mock_s3_service, TEMPLATE_KEY)
+
+        # Assert
+        assert template is not None
+        mock_s3_service.get_template_if_modified.assert_called_once()
+
+    def test_preload_ignores_errors(self, mock_s3_service, clock):
+        """Test preload failures do not raise."""
+        # Arrange
+        cache = TemplateCache()
+        mock_s3_service.get_template_if_modified.side_effect = Exception("S3 unavailable")
+
+        # Act (should not raise)
+        cache.preload(mock_s3_service, [TEMPLATE_KEY])
+
+        # Assert
+        mock_s3_service.get_template_if_modified.assert_called_once()
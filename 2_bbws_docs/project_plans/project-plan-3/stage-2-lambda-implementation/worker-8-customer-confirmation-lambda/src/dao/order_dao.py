@@ -3,14 +3,17 @@
 import os
 import logging
 from typing import Optional
-from decimal import Decimal
-import boto3
 from botocore.exceptions import ClientError
 
+from src.codec import codec_for
 from src.models import Order
+from src.utils.aws_clients import get_resource
 
 logger = logging.getLogger(__name__)
 
+# Compiled once per container; Order amounts are floats in this service
+ORDER_CODEC = codec_for(Order, number=float)
+
 
 class OrderDAO:
     """
@@ -24,8 +27,8 @@ class OrderDAO:
     """
 
     def __init__(self):
-        """Initialize OrderDAO with DynamoDB client."""
-        self.dynamodb = boto3.resource('dynamodb')
+        """Initialize OrderDAO with the container's DynamoDB resource."""
+        self.dynamodb = get_resource('dynamodb')
         self.table_name = os.environ.get('DYNAMODB_TABLE_NAME', 'bbws-orders-dev')
         self.table = self.dynamodb.Table(self.table_name)
         logger.info(f"OrderDAO initialized with table: {self.table_name}")
@@ -85,31 +88,5 @@ class OrderDAO:
         Returns:
             Dictionary with float values (Pydantic-compatible)
         """
-        # Remove DynamoDB keys
-        item.pop('PK', None)
-        item.pop('SK', None)
-        item.pop('GSI1PK', None)
-        item.pop('GSI1SK', None)
-        item.pop('GSI2PK', None)
-
-        # Convert Decimal to float recursively
-        return self._convert_decimals(item)
-
-    def _convert_decimals(self, obj):
-        """
-        Recursively convert Decimal objects to float.
-
-        Args:
-            obj: Object that may contain Decimal values
-
-        Returns:
-            Object with Decimals converted to float
-        """
-        if isinstance(obj, Decimal):
-            return float(obj)
-        elif isinstance(obj, dict):
-            return {k: self._convert_decimals(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [self._convert_decimals(item) for item in obj]
-        else:
-            return obj
+        # Drops DynamoDB keys and converts Decimals per the compiled Order schema
+        return ORDER_CODEC.normalize(item)
@@ -9,15 +9,28 @@ Target: SES (internal team email)
 
 import json
 import logging
-from typing import Any, Dict, List
+import os
+from typing import Any, Dict, List, Tuple
 
 from src.dao.order_dao import OrderDAO
-from src.services.email_service import EmailService
+from src.models import Order
+from src.services.email_service import EmailService, DIGEST_TEMPLATE_KEY, INTERNAL_TEMPLATE_KEY
+from src.utils.sqs_batch_runner import SQSBatchRunner
 
 # Configure logging
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# Records of a batch are processed concurrently (SQS_BATCH_MAX_WORKERS, SQS_RECORD_TIMEOUT_SECONDS)
+batch_runner = SQSBatchRunner.from_env()
+
+# Send one internal digest email per SQS batch ('false' = one email per order)
+email_batch_mode = os.environ.get('EMAIL_BATCH_MODE', 'false').lower() == 'true'
+
+# Compile email templates during Lambda init (TEMPLATE_PRELOAD, on by default inside Lambda)
+if os.environ.get('TEMPLATE_PRELOAD', 'true' if os.environ.get('AWS_LAMBDA_FUNCTION_NAME') else 'false').lower() == 'true':
+    EmailService().preload_templates([INTERNAL_TEMPLATE_KEY, DIGEST_TEMPLATE_KEY])
+
 
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
@@ -39,60 +52,19 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     order_dao = OrderDAO()
     email_service = EmailService()
 
-    batch_item_failures = []
-    successful_count = 0
-    failed_count = 0
+    records = event.get('Records', [])
 
-    # Process each SQS record
-    for record in event.get('Records', []):
-        message_id = record.get('messageId')
-
-        try:
-            # Parse message body
-            body = json.loads(record['body'])
-            tenant_id = body['tenantId']
-            order_id = body['orderId']
-
-            logger.info(f"Processing message {message_id}: tenantId={tenant_id}, orderId={order_id}")
-
-            # Retrieve order from DynamoDB
-            order = order_dao.get_order(tenant_id, order_id)
-
-            if not order:
-                logger.warning(f"Order not found: tenantId={tenant_id}, orderId={order_id}")
-                # Treat as success (idempotent - order may have been deleted)
-                successful_count += 1
-                continue
-
-            # Send internal notification email
-            message_id_ses = email_service.send_internal_notification(order)
-            logger.info(f"Internal notification sent for order {order_id}: SES MessageId={message_id_ses}")
-
-            successful_count += 1
-
-        except KeyError as e:
-            logger.error(f"Missing required field in message {message_id}: {str(e)}")
-            # Report as failure for retry
-            batch_item_failures.append({
-                'itemIdentifier': message_id
-            })
-            failed_count += 1
-
-        except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON in message {message_id}: {str(e)}")
-            # Report as failure for retry
-            batch_item_failures.append({
-                'itemIdentifier': message_id
-            })
-            failed_count += 1
-
-        except Exception as e:
-            logger.error(f"Error processing message {message_id}: {str(e)}", exc_info=True)
-            # Report as failure for retry
-            batch_item_failures.append({
-                'itemIdentifier': message_id
-            })
-            failed_count += 1
+    if email_batch_mode:
+        batch_item_failures = process_batch(records, order_dao, email_service, context)
+    else:
+        # Process SQS records concurrently; failed records are retried by SQS
+        batch_item_failures = batch_runner.run(
+            records,
+            lambda record: process_record(record, order_dao, email_service),
+            context
+        )
+    failed_count = len(batch_item_failures)
+    successful_count = len(records) - failed_count
 
     # Log summary
     logger.info(f"Batch processing complete: {successful_count} succeeded, {failed_count} failed")
@@ -102,3 +74,122 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         'statusCode': 200,
         'batchItemFailures': batch_item_failures
     }
+
+
+def process_record(record: Dict[str, Any], order_dao: OrderDAO, email_service: EmailService) -> None:
+    """
+    Process one SQS record.
+
+    Args:
+        record: SQS record with an order creation message body
+        order_dao: OrderDAO for this invocation
+        email_service: EmailService for this invocation
+
+    Raises:
+        KeyError: If tenantId or orderId is missing
+        json.JSONDecodeError: If the body is not valid JSON
+        Exception: If the order lookup or email send fails
+    """
+    message_id = record.get('messageId')
+
+    # Parse message body
+    body = json.loads(record['body'])
+    tenant_id = body['tenantId']
+    order_id = body['orderId']
+
+    logger.info(f"Processing message {message_id}: tenantId={tenant_id}, orderId={order_id}")
+
+    # Retrieve order from DynamoDB
+    order = order_dao.get_order(tenant_id, order_id)
+
+    if not order:
+        logger.warning(f"Order not found: tenantId={tenant_id}, orderId={order_id}")
+        # Treat as success (idempotent - order may have been deleted)
+        return
+
+    # Send internal notification email
+    message_id_ses = email_service.send_internal_notification(order)
+    logger.info(f"Internal notification sent for order {order_id}: SES MessageId={message_id_ses}")
+
+
+def process_batch(
+    records: List[Dict[str, Any]],
+    order_dao: OrderDAO,
+    email_service: EmailService,
+    context: Any = None
+) -> List[Dict[str, str]]:
+    """
+    Send one internal digest email for the orders of an SQS batch.
+
+    Records whose order cannot be loaded fail individually; if the digest
+    cannot be sent, every record in it fails and is retried by SQS.
+
+    Args:
+        records: SQS records with order creation message bodies
+        order_dao: OrderDAO for this invocation
+        email_service: EmailService for this invocation
+        context: Lambda context (used for the invocation deadline)
+
+    Returns:
+        batchItemFailures entries in record order
+    """
+    batch_item_failures, loaded = load_orders(records, order_dao, context)
+
+    if loaded:
+        try:
+            message_id_ses = email_service.send_internal_digest([order for _, order in loaded])
+            logger.info(f"Internal digest sent for {len(loaded)} orders: SES MessageId={message_id_ses}")
+        except Exception as e:
+            logger.error(f"Failed to send internal digest for {len(loaded)} orders: {str(e)}")
+            batch_item_failures.extend({'itemIdentifier': message_id} for message_id, _ in loaded)
+
+    return _in_record_order(records, batch_item_failures)
+
+
+def load_orders(
+    records: List[Dict[str, Any]],
+    order_dao: OrderDAO,
+    context: Any = None
+) -> Tuple[List[Dict[str, str]], List[Tuple[str, Order]]]:
+    """
+    Load the orders of an SQS batch concurrently.
+
+    Args:
+        records: SQS records with order creation message bodies
+        order_dao: OrderDAO for this invocation
+        context: Lambda context (used for the invocation deadline)
+
+    Returns:
+        (batchItemFailures for records that could not be loaded,
+        [(messageId, order)] in record order). Records whose order no longer
+        exists are in neither list (idempotent success).
+    """
+    orders_by_message_id: Dict[str, Order] = {}
+
+    def load_record(record: Dict[str, Any]) -> None:
+        message_id = record.get('messageId')
+        body = json.loads(record['body'])
+        tenant_id = body['tenantId']
+        order_id = body['orderId']
+
+        order = order_dao.get_order(tenant_id, order_id)
+        if not order:
+            logger.warning(f"Order not found: tenantId={tenant_id}, orderId={order_id}")
+            return
+        orders_by_message_id[message_id] = order
+
+    batch_item_failures = batch_runner.run(records, load_record, context)
+
+    failed_ids = {failure['itemIdentifier'] for failure in batch_item_failures}
+    loaded = [
+        (record.get('messageId'), orders_by_message_id[record.get('messageId')])
+        for record in records
+        if record.get('messageId') in orders_by_message_id and record.get('messageId') not in failed_ids
+    ]
+    return batch_item_failures, loaded
+
+
+def _in_record_order(records: List[Dict[str, Any]], batch_item_failures: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    """Sort batchItemFailures by the position of their record in the batch."""
+    positions = {record.get('messageId'): index for index, record in enumerate(records)}
+    return sorted(batch_item_failures, key=lambda failure: positions.get(failure['itemIdentifier'], len(records)))
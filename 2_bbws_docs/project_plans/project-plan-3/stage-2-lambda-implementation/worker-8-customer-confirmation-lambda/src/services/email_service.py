@@ -2,16 +2,26 @@
 
 import os
 import logging
-from typing import Optional
+from typing import List, Optional, Union
 from datetime import datetime
 from jinja2 import Template, TemplateError
 
 from src.models import Order
 from src.services.s3_service import S3Service
 from src.services.ses_service import SESService
+from src.services.template_cache import TemplateCache
 
 logger = logging.getLogger(__name__)
 
+INTERNAL_TEMPLATE_KEY = 'internal/order_notification.html'
+CUSTOMER_TEMPLATE_KEY = 'customer/order_confirmation.html'
+DIGEST_TEMPLATE_KEY = 'internal/order_digest.html'
+
+# Compiled templates shared by every EmailService in the container
+template_cache = TemplateCache(
+    revalidate_seconds=float(os.environ.get('TEMPLATE_CACHE_TTL_SECONDS', '300'))
+)
+
 
 class EmailService:
     """
@@ -19,14 +29,28 @@ class EmailService:
 
     Handles template retrieval, rendering, and email delivery with fallback mechanisms.
     Supports both internal notifications and customer confirmations.
+    Templates are compiled once per container and revalidated against S3 by ETag
+    (see TemplateCache).
     """
 
-    def __init__(self):
-        """Initialize EmailService with dependencies."""
+    def __init__(self, cache: Optional[TemplateCache] = None):
+        """
+        Initialize EmailService with dependencies.
+
+        Args:
+            cache: Template cache (default: the container-wide cache)
+        """
         self.s3_service = S3Service()
         self.ses_service = SESService()
-        self.internal_template_key = 'internal/order_notification.html'
-        self.customer_template_key = 'customer/order_confirmation.html'
+        self.template_cache = cache or template_cache
+        self.internal_template_key = INTERNAL_TEMPLATE_KEY
+        self.customer_template_key = CUSTOMER_TEMPLATE_KEY
+        self.digest_template_key = DIGEST_TEMPLATE_KEY
+        # SES template used for bulk customer confirmations (EMAIL_BATCH_MODE)
+        self.customer_ses_template_name = os.environ.get(
+            'SES_CUSTOMER_TEMPLATE_NAME',
+            'bbws-customer-order-confirmation'
+        )
         self.admin_portal_url = os.environ.get(
             'ADMIN_PORTAL_URL',
             'https://admin.kimmyai.io'
@@ -57,12 +81,12 @@ class EmailService:
         try:
             logger.info(f"Preparing internal notification for order: {order.order_id}")
 
-            # Retrieve template from S3
-            template_html = self.s3_service.get_template(self.internal_template_key)
+            # Retrieve compiled template (cached, revalidated against S3)
+            template = self.template_cache.get(self.s3_service, self.internal_template_key)
 
-            if template_html:
+            if template is not None:
                 # Render HTML template
-                html_body = self.render_template(template_html, order, email_type='internal')
+                html_body = self.render_template(template, order, email_type='internal')
                 text_body = None
                 logger.info("Using HTML template from S3")
             else:
@@ -103,12 +127,12 @@ class EmailService:
         try:
             logger.info(f"Preparing customer confirmation for order: {order.order_id}")
 
-            # Retrieve template from S3
-            template_html = self.s3_service.get_template(self.customer_template_key)
+            # Retrieve compiled template (cached, revalidated against S3)
+            template = self.template_cache.get(self.s3_service, self.customer_template_key)
 
-            if template_html:
+            if template is not None:
                 # Render HTML template with customer context and presigned URL
-                html_body = self.render_template(template_html, order, email_type='customer')
+                html_body = self.render_template(template, order, email_type='customer')
                 text_body = None
                 logger.info("Using HTML template from S3")
             else:
@@ -134,12 +158,150 @@ class EmailService:
             logger.error(f"Failed to send customer confirmation for order {order.order_id}: {str(e)}")
             raise
 
-    def render_template(self, template_html: str, order: Order, email_type: str = 'internal') -> str:
+    def send_internal_digest(self, orders: List[Order]) -> str:
+        """
+        Send one internal notification email for a batch of new orders.
+
+        A single order is sent as a regular internal notification.
+
+        Args:
+            orders: Orders to include in the digest
+
+        Returns:
+            SES Message ID
+
+        Raises:
+            ValueError: If no orders are given
+            Exception: If email sending fails
+        """
+        if not orders:
+            raise ValueError("At least one order is required for a digest")
+
+        if len(orders) == 1:
+            return self.send_internal_notification(orders[0])
+
+        try:
+            logger.info(f"Preparing internal digest for {len(orders)} orders")
+
+            # Retrieve compiled digest template (cached, revalidated against S3)
+            template = self.template_cache.get(self.s3_service, self.digest_template_key)
+
+            if template is not None:
+                # Render HTML digest, one template context per order
+                contexts = [self._get_template_context(order, email_type='internal') for order in orders]
+                html_body = template.render(orders=contexts, orderCount=len(orders))
+                text_body = None
+                logger.info("Using HTML digest template from S3")
+            else:
+                # Fallback to plain text digest
+                logger.warning(f"Template not found: {self.digest_template_key}, using fallback plain text")
+                html_body = None
+                text_body = self._create_fallback_digest_email(orders)
+
+            # Send email
+            subject = f"{len(orders)} New Orders Received"
+            message_id = self.ses_service.send_email(
+                to_email=None,  # Uses default internal email
+                subject=subject,
+                html_body=html_body,
+                text_body=text_body
+            )
+
+            logger.info(f"Internal digest sent successfully: MessageId={message_id}")
+            return message_id
+
+        except TemplateError as e:
+            logger.error(f"Jinja2 template error: {str(e)}")
+            raise Exception(f"Failed to render template: {str(e)}")
+
+        except Exception as e:
+            logger.error(f"Failed to send internal digest for {len(orders)} orders: {str(e)}")
+            raise
+
+    def send_customer_confirmations(self, orders: List[Order]) -> List[Optional[Exception]]:
+        """
+        Send customer confirmation emails for many orders with SES bulk templated sends.
+
+        Renders nothing locally: each order's template context (including the
+        presigned invoice URL) is passed as ReplacementTemplateData to the SES
+        template SES_CUSTOMER_TEMPLATE_NAME, up to 50 recipients per SES call.
+        The SES template is a deployment prerequisite (see README, Batch Mode);
+        if it does not exist, a warning is logged and orders are sent one by
+        one with send_customer_confirmation.
+
+        Args:
+            orders: Orders to confirm
+
+        Returns:
+            One entry per order, in order: None if sent, otherwise the exception
+        """
+        results: List[Optional[Exception]] = [None] * len(orders)
+        destinations = []
+        positions = []
+
+        for index, order in enumerate(orders):
+            try:
+                destinations.append({
+                    'to_email': order.customer_email,
+                    'template_data': self._get_template_context(order, email_type='customer')
+                })
+                positions.append(index)
+            except Exception as e:
+                logger.error(f"Failed to prepare customer confirmation for order {order.order_id}: {str(e)}")
+                results[index] = e
+
+        if not destinations:
+            return results
+
+        statuses = self.ses_service.send_bulk_templated_email(
+            template_name=self.customer_ses_template_name,
+            destinations=destinations,
+            reply_to='support@kimmyai.io'
+        )
+
+        unsent = []
+        for index, status in zip(positions, statuses):
+            order = orders[index]
+            if status.get('Status') == 'Success':
+                logger.info(f"Customer confirmation sent to {order.customer_email}: MessageId={status.get('MessageId')}")
+            elif status.get('Status') == 'TemplateDoesNotExist':
+                unsent.append(index)
+            else:
+                error = status.get('Error') or status.get('Status')
+                logger.error(f"Failed to send customer confirmation for order {order.order_id}: {error}")
+                results[index] = Exception(f"Failed to send customer confirmation: {error}")
+
+        if unsent:
+            # SES template not deployed: send these orders with the S3 template instead
+            logger.warning(
+                f"SES template {self.customer_ses_template_name} does not exist; create it before enabling "
+                f"EMAIL_BATCH_MODE (see README, Batch Mode). Sending {len(unsent)} confirmations individually"
+            )
+            for index in unsent:
+                try:
+                    self.send_customer_confirmation(orders[index])
+                except Exception as e:
+                    results[index] = e
+
+        return results
+
+    def preload_templates(self, template_keys: Optional[List[str]] = None) -> None:
+        """
+        Load and compile email templates (call during Lambda init).
+
+        Args:
+            template_keys: Template keys to load (default: internal, digest and customer templates)
+        """
+        if template_keys is None:
+            template_keys = [self.internal_template_key, self.digest_template_key, self.customer_template_key]
+        self.template_cache.preload(self.s3_service, template_keys)
+
+    def render_template(self, template_html: Union[str, Template], order: Order, email_type: str = 'internal') -> str:
         """
         Render email template with order data using Jinja2.
 
         Args:
-            template_html: HTML template string
+            template_html: HTML template string or compiled template
             order: Order object for template context
             email_type: Type of email ('internal' or 'customer')
 
@@ -151,7 +313,7 @@ class EmailService:
         """
         try:
             context = self._get_template_context(order, email_type=email_type)
-            template = Template(template_html)
+            template = template_html if isinstance(template_html, Template) else Template(template_html)
             rendered = template.render(**context)
             logger.debug(f"Template rendered successfully for order: {order.order_id}")
             return rendered
@@ -413,3 +575,32 @@ If you have any questions, please contact our support team at support@kimmyai.io
 Thank you for your business!
 BBWS Order System
         """.strip()
+
+    def _create_fallback_digest_email(self, orders: List[Order]) -> str:
+        """
+        Create plain text digest email when the digest template is not available.
+
+        Args:
+            orders: Orders in the digest
+
+        Returns:
+            Plain text email body
+        """
+        orders_text = "\n".join([
+            f"- {order.order_number} | {order.customer_name} <{order.customer_email}> | "
+            f"R{order.total:.2f} | {order.order_status}\n"
+            f"  {self.admin_portal_url}/tenants/{order.tenant_id}/orders/{order.order_id}"
+            for order in orders
+        ])
+        total = sum(order.total for order in orders)
+
+        return f"""
+{len(orders)} New Orders Received
+
+{orders_text}
+
+Total Amount: R{total:.2f}
+
+---
+This is an automated notification from the BBWS Order System.
+        """.strip()
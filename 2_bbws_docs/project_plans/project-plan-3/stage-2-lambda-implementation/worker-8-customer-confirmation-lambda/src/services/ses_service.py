@@ -1,24 +1,95 @@
 """SES Service for email sending."""
 
 import os
+import json
 import logging
-from typing import Optional
-import boto3
+import random
+import threading
+import time
+from typing import Any, Dict, List, Optional
 from botocore.exceptions import ClientError
 
+from src.utils.aws_clients import get_client
+
 logger = logging.getLogger(__name__)
 
+# SES error codes for exceeding the maximum send rate
+THROTTLING_ERROR_CODES = ('Throttling', 'ThrottlingException', 'TooManyRequestsException')
+
+# Attempts per SES call while throttled, with exponential backoff and jitter between them
+MAX_SEND_ATTEMPTS = int(os.environ.get('SES_MAX_SEND_ATTEMPTS', '5'))
+BACKOFF_BASE_SECONDS = 0.2
+BACKOFF_MAX_SECONDS = 5.0
+
+# SendBulkTemplatedEmail accepts at most 50 destinations per call
+MAX_BULK_DESTINATIONS = 50
+
+
+class SendRateLimiter:
+    """
+    Paces SES calls to stay under the account's MaxSendRate (recipients per second).
+
+    Shared by every SESService in the container, so concurrent records and
+    bulk sends draw from the same budget. MaxSendRate is read once with
+    GetSendQuota; if that fails, calls are not paced (throttling errors are
+    still retried with backoff).
+    """
+
+    def __init__(self):
+        """Initialize SendRateLimiter (rate unknown until configured)."""
+        self.max_send_rate: Optional[float] = None
+        self._next_send = 0.0
+        self._lock = threading.Lock()
+
+    def configure(self, ses_client) -> None:
+        """
+        Read MaxSendRate from SES once per container.
+
+        Args:
+            ses_client: Boto3 SES client
+        """
+        if self.max_send_rate is not None:
+            return
+        try:
+            self.max_send_rate = float(ses_client.get_send_quota()['MaxSendRate'])
+            logger.info(f"SES max send rate: {self.max_send_rate}/s")
+        except Exception as e:
+            logger.warning(f"Failed to read SES send quota, sending without pacing: {str(e)}")
+            self.max_send_rate = 0.0
+
+    def acquire(self, recipients: int = 1) -> None:
+        """
+        Wait until sending to the given number of recipients stays within the rate.
+
+        Args:
+            recipients: Recipients of the next SES call
+        """
+        if not self.max_send_rate:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_send)
+            self._next_send = start + recipients / self.max_send_rate
+        if start > now:
+            time.sleep(start - now)
+
+
+send_rate_limiter = SendRateLimiter()
+
 
 class SESService:
     """
     Service for sending emails via Amazon SES.
 
     Handles email composition and delivery with proper error handling.
+    SES calls are paced by the container's SendRateLimiter and retried with
+    backoff when SES throttles them.
     """
 
     def __init__(self):
-        """Initialize SESService with SES client."""
-        self.ses_client = boto3.client('ses')
+        """Initialize SESService with the container's SES client."""
+        # Standard retries: SendRateLimiter already paces SES, so no adaptive client-side limiting
+        self.ses_client = get_client('ses', retry_mode='standard')
         self.from_email = os.environ.get('SES_FROM_EMAIL', 'noreply@kimmyai.io')
         self.default_to_email = os.environ.get('INTERNAL_NOTIFICATION_EMAIL', 'internal@kimmyai.io')
         logger.info(f"SESService initialized with from_email: {self.from_email}")
@@ -90,7 +161,7 @@ class SESService:
                 ses_params['ReplyToAddresses'] = [reply_to]
                 logger.info(f"Reply-To address set: {reply_to}")
 
-            response = self.ses_client.send_email(**ses_params)
+            response = self._call_ses('send_email', 1, **ses_params)
 
             message_id = response['MessageId']
             logger.info(f"Email sent successfully: MessageId={message_id}")
@@ -105,3 +176,103 @@ class SESService:
         except Exception as e:
             logger.error(f"Unexpected error sending email: {str(e)}")
             raise
+
+    def send_bulk_templated_email(
+        self,
+        template_name: str,
+        destinations: List[Dict[str, Any]],
+        default_template_data: Optional[Dict[str, Any]] = None,
+        reply_to: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Send an SES template to many recipients with SendBulkTemplatedEmail.
+
+        Destinations are sent in calls of up to MAX_BULK_DESTINATIONS. A call
+        that fails as a whole marks all of its destinations as failed; the
+        remaining calls are still made.
+
+        Args:
+            template_name: Name of the SES template
+            destinations: [{'to_email': str, 'template_data': dict}, ...]
+            default_template_data: Template data used for missing replacement values
+            reply_to: Reply-To email address (optional)
+
+        Returns:
+            One status per destination, in order: {'Status': 'Success', 'MessageId': ...}
+            or {'Status': <error code>, 'Error': <message>}
+        """
+        statuses: List[Dict[str, Any]] = []
+
+        for start in range(0, len(destinations), MAX_BULK_DESTINATIONS):
+            chunk = destinations[start:start + MAX_BULK_DESTINATIONS]
+            ses_params = {
+                'Source': self.from_email,
+                'Template': template_name,
+                'DefaultTemplateData': json.dumps(default_template_data or {}, default=str),
+                'Destinations': [
+                    {
+                        'Destination': {
+                            'ToAddresses': [destination['to_email']]
+                        },
+                        'ReplacementTemplateData': json.dumps(destination['template_data'], default=str)
+                    }
+                    for destination in chunk
+                ]
+            }
+            if reply_to:
+                ses_params['ReplyToAddresses'] = [reply_to]
+
+            try:
+                logger.info(f"Sending bulk templated email {template_name} to {len(chunk)} recipients")
+                response = self._call_ses('send_bulk_templated_email', len(chunk), **ses_params)
+                statuses.extend(response['Status'])
+
+            except ClientError as e:
+                error_code = e.response['Error']['Code']
+                error_message = e.response['Error']['Message']
+                logger.error(f"SES ClientError: {error_code} - {error_message}")
+                statuses.extend({'Status': error_code, 'Error': error_message} for _ in chunk)
+
+        sent = sum(1 for status in statuses if status.get('Status') == 'Success')
+        logger.info(f"Bulk templated email {template_name}: {sent}/{len(destinations)} sent")
+        return statuses
+
+    def _call_ses(self, operation: str, recipients: int, **params) -> Dict[str, Any]:
+        """
+        Call an SES send operation, pacing it and retrying while throttled.
+
+        Args:
+            operation: SES client method name (e.g., 'send_email')
+            recipients: Recipients of the call (counted against MaxSendRate)
+            **params: Operation parameters
+
+        Returns:
+            SES response
+
+        Raises:
+            ClientError: If SES rejects the call, or is still throttling after
+                MAX_SEND_ATTEMPTS attempts
+        """
+        send_rate_limiter.configure(self.ses_client)
+
+        for attempt in range(1, MAX_SEND_ATTEMPTS + 1):
+            send_rate_limiter.acquire(recipients)
+            try:
+                return getattr(self.ses_client, operation)(**params)
+            except ClientError as e:
+                if not self._is_throttled(e) or attempt == MAX_SEND_ATTEMPTS:
+                    raise
+                delay = min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * 2 ** (attempt - 1))
+                delay = random.uniform(delay / 2, delay)
+                logger.warning(
+                    f"SES throttled {operation}, retrying in {delay:.2f}s "
+                    f"(attempt {attempt}/{MAX_SEND_ATTEMPTS})"
+                )
+                time.sleep(delay)
+
+    @staticmethod
+    def _is_throttled(error: ClientError) -> bool:
+        """Return True for send-rate throttling (the daily quota is not retried)."""
+        error_code = error.response['Error']['Code']
+        error_message = error.response['Error'].get('Message', '')
+        return error_code in THROTTLING_ERROR_CODES and 'Daily message quota exceeded' not in error_message
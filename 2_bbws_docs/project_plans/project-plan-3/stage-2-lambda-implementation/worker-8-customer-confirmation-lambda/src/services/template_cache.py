@@ -0,0 +1,127 @@
+"""Compiled email template cache for warm Lambda containers."""
+
+import logging
+import threading
+import time
+from typing import Dict, Iterable, Optional
+from jinja2 import Template, TemplateError
+
+from src.services.s3_service import S3Service
+
+logger = logging.getLogger(__name__)
+
+
+class _CachedTemplate:
+    """Last good version of one template."""
+
+    __slots__ = ('template', 'etag', 'checked_at')
+
+    def __init__(self, template: Optional[Template], etag: Optional[str], checked_at: float):
+        self.template = template
+        self.etag = etag
+        self.checked_at = checked_at
+
+
+class TemplateCache:
+    """
+    Cache of compiled Jinja2 templates keyed by S3 template key.
+
+    A cached template is used as is for revalidate_seconds, then revalidated
+    with a conditional GetObject (If-None-Match on the cached ETag), so an
+    unchanged template costs one small 304 response per interval and is never
+    recompiled. If S3 fails, or a new version does not compile, the last good
+    version keeps being served. A missing template is cached too (as None),
+    so the plain text fallback does not cost an S3 call per email.
+    """
+
+    def __init__(self, revalidate_seconds: float = 300):
+        """
+        Initialize TemplateCache.
+
+        Args:
+            revalidate_seconds: Seconds a cached template is used before it is
+                revalidated against S3 (0 = revalidate on every use)
+        """
+        self.revalidate_seconds = revalidate_seconds
+        self._entries: Dict[str, _CachedTemplate] = {}
+        # Records of a batch share the cache; one thread revalidates while the others wait
+        self._lock = threading.Lock()
+
+    def get(self, s3_service: S3Service, template_key: str) -> Optional[Template]:
+        """
+        Return the compiled template for a key.
+
+        Args:
+            s3_service: S3Service used to fetch or revalidate the template
+            template_key: S3 key for the template
+
+        Returns:
+            Compiled Jinja2 template, or None if the template does not exist
+
+        Raises:
+            Exception: If the template cannot be fetched or compiled and no
+                earlier version is cached
+        """
+        with self._lock:
+            entry = self._entries.get(template_key)
+            now = time.monotonic()
+
+            if entry is not None and now - entry.checked_at < self.revalidate_seconds:
+                return entry.template
+
+            try:
+                template_html, etag = s3_service.get_template_if_modified(
+                    template_key,
+                    etag=entry.etag if entry is not None else None
+                )
+            except Exception as e:
+                if entry is None:
+                    raise
+                logger.warning(f"Template revalidation failed for {template_key}, using cached version: {str(e)}")
+                entry.checked_at = now
+                return entry.template
+
+            if template_html is None and etag is not None:
+                # 304 Not Modified
+                entry.checked_at = now
+                return entry.template
+
+            if template_html is None:
+                self._entries[template_key] = _CachedTemplate(None, None, now)
+                return None
+
+            try:
+                template = Template(template_html)
+            except TemplateError as e:
+                logger.error(f"Jinja2 template error in {template_key}: {str(e)}")
+                if entry is None:
+                    raise Exception(f"Failed to compile template {template_key}: {str(e)}")
+                # Keep serving the last good version; retry after the interval
+                entry.checked_at = now
+                return entry.template
+
+            self._entries[template_key] = _CachedTemplate(template, etag, now)
+            logger.info(f"Compiled template cached: {template_key} (ETag={etag})")
+            return template
+
+    def preload(self, s3_service: S3Service, template_keys: Iterable[str]) -> None:
+        """
+        Fetch and compile templates ahead of the first email (Lambda init phase).
+
+        Failures are logged and otherwise ignored; the template is fetched
+        again on first use.
+
+        Args:
+            s3_service: S3Service used to fetch the templates
+            template_keys: S3 keys of the templates to load
+        """
+        for template_key in template_keys:
+            try:
+                self.get(s3_service, template_key)
+            except Exception as e:
+                logger.warning(f"Failed to preload template {template_key}: {str(e)}")
+
+    def clear(self) -> None:
+        """Drop all cached templates."""
+        with self._lock:
+            self._entries.clear()
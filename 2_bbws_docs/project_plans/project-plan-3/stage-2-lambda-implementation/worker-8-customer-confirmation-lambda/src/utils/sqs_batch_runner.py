@@ -0,0 +1,203 @@
+"""
+Bounded-concurrency runner for SQS batch records.
+
+Runs a per-record function on a thread pool and collects batchItemFailures,
+so a batch costs about as long as its slowest records instead of the sum of
+all of them. Shared by the SQS consumer Lambdas (workers 5-8).
+"""
+
+import logging
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+# Stop waiting this long before the Lambda deadline so unfinished records can
+# still be reported as failures instead of the whole invocation timing out
+DEADLINE_MARGIN_SECONDS = 2.0
+
+# Upper bound between timeout checks while records are running
+POLL_SECONDS = 0.1
+
+
+class SQSBatchRunner:
+    """
+    Process SQS records concurrently with per-record failure reporting.
+
+    A record fails if its function raises, exceeds record_timeout, or has
+    not finished shortly before the Lambda deadline. Records that time out
+    cannot be interrupted; their threads finish in the background, so record
+    functions must be idempotent (SQS redelivers failed records anyway).
+
+    Attributes:
+        max_workers: Records processed at the same time (1 = serial)
+        record_timeout: Seconds a record may run before it is reported as failed
+    """
+
+    def __init__(self, max_workers: int = 4, record_timeout: Optional[float] = None):
+        """
+        Initialize SQSBatchRunner.
+
+        Args:
+            max_workers: Thread pool size (1 processes records serially, in order)
+            record_timeout: Per-record timeout in seconds (None = no limit;
+                not enforced when running serially)
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        self.max_workers = max_workers
+        self.record_timeout = record_timeout
+
+    @classmethod
+    def from_env(cls) -> 'SQSBatchRunner':
+        """
+        Build a runner from SQS_BATCH_MAX_WORKERS and SQS_RECORD_TIMEOUT_SECONDS.
+
+        Returns:
+            SQSBatchRunner (defaults: 4 workers, 20 second record timeout)
+        """
+        max_workers = int(os.environ.get('SQS_BATCH_MAX_WORKERS', '4'))
+        record_timeout = float(os.environ.get('SQS_RECORD_TIMEOUT_SECONDS', '20'))
+        return cls(max_workers, record_timeout or None)
+
+    def run(
+        self,
+        records: List[Dict[str, Any]],
+        process_record: Callable[[Dict[str, Any]], Any],
+        context: Any = None
+    ) -> List[Dict[str, str]]:
+        """
+        Run process_record for every record and return the failed ones.
+
+        Args:
+            records: SQS event records
+            process_record: Called with one record; raising marks it as failed
+            context: Lambda context (used for the invocation deadline)
+
+        Returns:
+            batchItemFailures entries in record order
+        """
+        if not records:
+            return []
+
+        deadline = self._deadline(context)
+
+        if self.max_workers == 1 or len(records) == 1:
+            failed = self._run_serial(records, process_record, deadline)
+        else:
+            failed = self._run_concurrent(records, process_record, deadline)
+
+        return [{'itemIdentifier': records[i].get('messageId')} for i in sorted(failed)]
+
+    def _run_serial(
+        self,
+        records: List[Dict[str, Any]],
+        process_record: Callable[[Dict[str, Any]], Any],
+        deadline: Optional[float]
+    ) -> Set[int]:
+        """Process records one at a time, skipping those left at the deadline."""
+        failed: Set[int] = set()
+        for index, record in enumerate(records):
+            if deadline is not None and time.monotonic() >= deadline:
+                self._log_unfinished(record)
+                failed.add(index)
+                continue
+            try:
+                process_record(record)
+            except Exception as e:
+                self._log_error(record, e)
+                failed.add(index)
+        return failed
+
+    def _run_concurrent(
+        self,
+        records: List[Dict[str, Any]],
+        process_record: Callable[[Dict[str, Any]], Any],
+        deadline: Optional[float]
+    ) -> Set[int]:
+        """Process records on a thread pool, enforcing timeouts and the deadline."""
+        failed: Set[int] = set()
+        started: Dict[int, float] = {}
+        lock = threading.Lock()
+
+        def task(index: int, record: Dict[str, Any]) -> None:
+            with lock:
+                started[index] = time.monotonic()
+            process_record(record)
+
+        executor = ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(records)),
+            thread_name_prefix='sqs-record'
+        )
+        futures: Dict[Future, int] = {
+            executor.submit(task, index, record): index for index, record in enumerate(records)
+        }
+        pending = set(futures)
+
+        try:
+            while pending:
+                poll = POLL_SECONDS if (deadline is not None or self.record_timeout) else None
+                done, pending = wait(pending, timeout=poll, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    error = future.exception()
+                    if error is not None:
+                        index = futures[future]
+                        self._log_error(records[index], error)
+                        failed.add(index)
+
+                now = time.monotonic()
+                if deadline is not None and now >= deadline:
+                    for future in pending:
+                        future.cancel()
+                        self._log_unfinished(records[futures[future]])
+                        failed.add(futures[future])
+                    break
+
+                if self.record_timeout:
+                    with lock:
+                        expired = {
+                            future for future in pending
+                            if futures[future] in started
+                            and now - started[futures[future]] >= self.record_timeout
+                        }
+                    for future in expired:
+                        index = futures[future]
+                        logger.error(
+                            f"Message {records[index].get('messageId')} exceeded "
+                            f"record timeout of {self.record_timeout}s"
+                        )
+                        failed.add(index)
+                    pending -= expired
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        return failed
+
+    @staticmethod
+    def _deadline(context: Any) -> Optional[float]:
+        """Monotonic time to stop waiting, from the Lambda context (None if unknown)."""
+        get_remaining = getattr(context, 'get_remaining_time_in_millis', None)
+        if not callable(get_remaining):
+            return None
+        remaining_ms = get_remaining()
+        if not isinstance(remaining_ms, (int, float)):
+            return None
+        return time.monotonic() + remaining_ms / 1000 - DEADLINE_MARGIN_SECONDS
+
+    @staticmethod
+    def _log_error(record: Dict[str, Any], error: BaseException) -> None:
+        """Log a record that raised."""
+        logger.error(
+            f"Error processing message {record.get('messageId')}: {str(error)}",
+            exc_info=error
+        )
+
+    @staticmethod
+    def _log_unfinished(record: Dict[str, Any]) -> None:
+        """Log a record given up on at the Lambda deadline."""
+        logger.warning(f"Message {record.get('messageId')} not finished before Lambda deadline, will be retried")
@@ -7,6 +7,7 @@ from datetime import datetime
 
 from src.handlers.order_internal_notification_sender import lambda_handler
 from src.models import Order, OrderItem, Campaign, BillingAddress
+from src.utils.sqs_batch_runner import SQSBatchRunner
 
 
 class TestOrderInternalNotificationSenderHandler:
@@ -207,6 +208,7 @@ class TestOrderInternalNotificationSenderHandler:
         assert len(response['batchItemFailures']) == 1
         assert response['batchItemFailures'][0]['itemIdentifier'] == 'msg-123'
 
+    @patch('src.handlers.order_internal_notification_sender.batch_runner', SQSBatchRunner(max_workers=1))
     @patch('src.handlers.order_internal_notification_sender.OrderDAO')
     @patch('src.handlers.order_internal_notification_sender.EmailService')
     def test_lambda_handler_partial_batch_failure(
@@ -320,3 +322,91 @@ class TestOrderInternalNotificationSenderHandler:
         assert response['statusCode'] == 200
         assert len(response['batchItemFailures']) == 1
         assert response['batchItemFailures'][0]['itemIdentifier'] == 'msg-123'
+
+    @patch('src.handlers.order_internal_notification_sender.email_batch_mode', True)
+    @patch('src.handlers.order_internal_notification_sender.OrderDAO')
+    @patch('src.handlers.order_internal_notification_sender.EmailService')
+    def test_lambda_handler_batch_mode_sends_digest(
+        self, mock_email_service_class, mock_order_dao_class,
+        sqs_event_batch, mock_context, sample_order
+    ):
+        """Test batch mode sends one digest email for the whole batch."""
+        # Arrange
+        mock_order_dao = Mock()
+        mock_email_service = Mock()
+        mock_order_dao_class.return_value = mock_order_dao
+        mock_email_service_class.return_value = mock_email_service
+
+        mock_order_dao.get_order.return_value = sample_order
+        mock_email_service.send_internal_digest.return_value = 'msg-ses-digest'
+
+        # Act
+        response = lambda_handler(sqs_event_batch, mock_context)
+
+        # Assert
+        assert response['statusCode'] == 200
+        assert response['batchItemFailures'] == []
+        mock_email_service.send_internal_digest.assert_called_once_with([sample_order, sample_order])
+        mock_email_service.send_internal_notification.assert_not_called()
+
+    @patch('src.handlers.order_internal_notification_sender.email_batch_mode', True)
+    @patch('src.handlers.order_internal_notification_sender.OrderDAO')
+    @patch('src.handlers.order_internal_notification_sender.EmailService')
+    def test_lambda_handler_batch_mode_skips_failed_and_missing_orders(
+        self, mock_email_service_class, mock_order_dao_class, mock_context, sample_order
+    ):
+        """Test batch mode leaves out orders that are missing or fail to load."""
+        # Arrange
+        mock_order_dao = Mock()
+        mock_email_service = Mock()
+        mock_order_dao_class.return_value = mock_order_dao
+        mock_email_service_class.return_value = mock_email_service
+
+        def get_order(tenant_id, order_id):
+            if order_id == 'order-2':
+                raise Exception("DynamoDB error")
+            return None if order_id == 'order-3' else sample_order
+
+        mock_order_dao.get_order.side_effect = get_order
+        event = {
+            'Records': [
+                {
+                    'messageId': f'msg-{i}',
+                    'body': json.dumps({'tenantId': 'tenant-1', 'orderId': f'order-{i}'})
+                }
+                for i in range(1, 4)
+            ]
+        }
+
+        # Act
+        response = lambda_handler(event, mock_context)
+
+        # Assert
+        assert response['batchItemFailures'] == [{'itemIdentifier': 'msg-2'}]
+        mock_email_service.send_internal_digest.assert_called_once_with([sample_order])
+
+    @patch('src.handlers.order_internal_notification_sender.email_batch_mode', True)
+    @patch('src.handlers.order_internal_notification_sender.OrderDAO')
+    @patch('src.handlers.order_internal_notification_sender.EmailService')
+    def test_lambda_handler_batch_mode_digest_failure(
+        self, mock_email_service_class, mock_order_dao_class,
+        sqs_event_batch, mock_context, sample_order
+    ):
+        """Test every record of a digest that cannot be sent is retried."""
+        # Arrange
+        mock_order_dao = Mock()
+        mock_email_service = Mock()
+        mock_order_dao_class.return_value = mock_order_dao
+        mock_email_service_class.return_value = mock_email_service
+
+        mock_order_dao.get_order.return_value = sample_order
+        mock_email_service.send_internal_digest.side_effect = Exception("SES error")
+
+        # Act
+        response = lambda_handler(sqs_event_batch, mock_context)
+
+        # Assert
+        assert response['batchItemFailures'] == [
+            {'itemIdentifier': 'msg-1'},
+            {'itemIdentifier': 'msg-2'}
+        ]
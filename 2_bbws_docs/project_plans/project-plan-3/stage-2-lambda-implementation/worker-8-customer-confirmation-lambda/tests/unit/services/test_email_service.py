@@ -5,6 +5,7 @@ from unittest.mock import Mock, MagicMock, patch
 from datetime import datetime
 
 from src.services.email_service import EmailService
+from src.services.template_cache import TemplateCache
 from src.models import Order, OrderItem, Campaign, BillingAddress
 
 
@@ -24,7 +25,7 @@ class TestEmailService:
     @pytest.fixture
     def email_service(self, mock_s3_service, mock_ses_service):
         """Create EmailService instance with mocked dependencies."""
-        service = EmailService()
+        service = EmailService(cache=TemplateCache())
         service.s3_service = mock_s3_service
         service.ses_service = mock_ses_service
         return service
@@ -144,13 +145,13 @@ class TestEmailService:
         """Test sending internal notification with HTML template."""
         # Arrange
         template_html = "<h1>Order {{ orderNumber }}</h1>"
-        mock_s3_service.get_template.return_value = template_html
+        mock_s3_service.get_template_if_modified.return_value = (template_html, '"etag-1"')
 
         # Act
         email_service.send_internal_notification(sample_order)
 
         # Assert
-        mock_s3_service.get_template.assert_called_once_with('internal/order_notification.html')
+        mock_s3_service.get_template_if_modified.assert_called_once_with('internal/order_notification.html', etag=None)
         mock_ses_service.send_email.assert_called_once()
 
         call_args = mock_ses_service.send_email.call_args
@@ -162,13 +163,13 @@ class TestEmailService:
     ):
         """Test sending internal notification when template not found (fallback to plain text)."""
         # Arrange
-        mock_s3_service.get_template.return_value = None
+        mock_s3_service.get_template_if_modified.return_value = (None, None)
 
         # Act
         email_service.send_internal_notification(sample_order)
 
         # Assert
-        mock_s3_service.get_template.assert_called_once()
+        mock_s3_service.get_template_if_modified.assert_called_once()
         mock_ses_service.send_email.assert_called_once()
 
         call_args = mock_ses_service.send_email.call_args
@@ -181,7 +182,7 @@ class TestEmailService:
     ):
         """Test handling of SES send failure."""
         # Arrange
-        mock_s3_service.get_template.return_value = "<h1>Test</h1>"
+        mock_s3_service.get_template_if_modified.return_value = ("<h1>Test</h1>", '"etag-1"')
         mock_ses_service.send_email.side_effect = Exception("SES error")
 
         # Act & Assert
@@ -216,3 +217,131 @@ class TestEmailService:
         assert 'orderDetailsUrl' in context
         assert 'tenant-123' in context['orderDetailsUrl']
         assert 'order-123' in context['orderDetailsUrl']
+
+    def test_send_internal_digest_with_template(
+        self, email_service, mock_s3_service, mock_ses_service, sample_order
+    ):
+        """Test a digest renders every order into one email."""
+        # Arrange
+        template_html = "{{ orderCount }}:{% for order in orders %} {{ order.orderNumber }}{% endfor %}"
+        mock_s3_service.get_template_if_modified.return_value = (template_html, '"etag-1"')
+        mock_ses_service.send_email.return_value = 'msg-ses-digest'
+
+        # Act
+        message_id = email_service.send_internal_digest([sample_order, sample_order])
+
+        # Assert
+        assert message_id == 'msg-ses-digest'
+        mock_s3_service.get_template_if_modified.assert_called_once_with('internal/order_digest.html', etag=None)
+        mock_ses_service.send_email.assert_called_once()
+
+        call_args = mock_ses_service.send_email.call_args[1]
+        assert call_args['to_email'] is None
+        assert call_args['subject'] == '2 New Orders Received'
+        assert call_args['html_body'] == '2: ORD-2025-001 ORD-2025-001'
+
+    def test_send_internal_digest_template_not_found(
+        self, email_service, mock_s3_service, mock_ses_service, sample_order
+    ):
+        """Test a digest falls back to plain text without a template."""
+        # Arrange
+        mock_s3_service.get_template_if_modified.return_value = (None, None)
+
+        # Act
+        email_service.send_internal_digest([sample_order, sample_order])
+
+        # Assert
+        call_args = mock_ses_service.send_email.call_args[1]
+        assert call_args['html_body'] is None
+        assert call_args['text_body'].startswith('2 New Orders Received')
+        assert call_args['text_body'].count('ORD-2025-001') == 2
+        assert 'R1149.98' in call_args['text_body']
+
+    def test_send_internal_digest_single_order(
+        self, email_service, mock_s3_service, mock_ses_service, sample_order
+    ):
+        """Test a digest of one order is sent as a regular notification."""
+        # Arrange
+        mock_s3_service.get_template_if_modified.return_value = (None, None)
+
+        # Act
+        email_service.send_internal_digest([sample_order])
+
+        # Assert
+        mock_s3_service.get_template_if_modified.assert_called_once_with('internal/order_notification.html', etag=None)
+        assert 'ORD-2025-001' in mock_ses_service.send_email.call_args[1]['subject']
+
+    def test_send_internal_digest_no_orders(self, email_service):
+        """Test a digest needs at least one order."""
+        with pytest.raises(ValueError):
+            email_service.send_internal_digest([])
+
+    def test_send_customer_confirmations_bulk(
+        self, email_service, mock_s3_service, mock_ses_service, sample_order
+    ):
+        """Test customer confirmations are sent with one bulk templated call."""
+        # Arrange
+        mock_s3_service.generate_presigned_url.return_value = 'https://s3.example.com/invoice.pdf'
+        mock_ses_service.send_bulk_templated_email.return_value = [
+            {'Status': 'Success', 'MessageId': 'msg-1'},
+            {'Status': 'MessageRejected', 'Error': 'Email address is not verified'}
+        ]
+
+        # Act
+        results = email_service.send_customer_confirmations([sample_order, sample_order])
+
+        # Assert
+        assert results[0] is None
+        assert 'Email address is not verified' in str(results[1])
+
+        call_args = mock_ses_service.send_bulk_templated_email.call_args[1]
+        assert call_args['template_name'] == email_service.customer_ses_template_name
+        assert call_args['reply_to'] == 'support@kimmyai.io'
+        destination = call_args['destinations'][0]
+        assert destination['to_email'] == 'customer@example.com'
+        assert destination['template_data']['orderNumber'] == 'ORD-2025-001'
+        assert destination['template_data']['pdfPresignedUrl'] == 'https://s3.example.com/invoice.pdf'
+        mock_ses_service.send_email.assert_not_called()
+
+    def test_send_customer_confirmations_missing_ses_template(
+        self, email_service, mock_s3_service, mock_ses_service, sample_order
+    ):
+        """Test orders are sent individually when the SES template does not exist."""
+        # Arrange
+        mock_s3_service.generate_presigned_url.return_value = 'https://s3.example.com/invoice.pdf'
+        mock_s3_service.get_template_if_modified.return_value = (None, None)
+        mock_ses_service.send_bulk_templated_email.return_value = [
+            {'Status': 'TemplateDoesNotExist', 'Error': 'Template does not exist'}
+        ]
+        mock_ses_service.send_email.return_value = 'msg-ses-123'
+
+        # Act
+        results = email_service.send_customer_confirmations([sample_order])
+
+        # Assert
+        assert results == [None]
+        mock_ses_service.send_email.assert_called_once()
+        assert mock_ses_service.send_email.call_args[1]['to_email'] == 'customer@example.com'
+
+    def test_send_customer_confirmations_missing_ses_template_warns_once(
+        self, email_service, mock_s3_service, mock_ses_service, sample_order, caplog
+    ):
+        """Test a missing SES template is reported once per batch, naming the template."""
+        # Arrange
+        mock_s3_service.generate_presigned_url.return_value = 'https://s3.example.com/invoice.pdf'
+        mock_s3_service.get_template_if_modified.return_value = (None, None)
+        mock_ses_service.send_bulk_templated_email.return_value = [
+            {'Status': 'TemplateDoesNotExist', 'Error': 'Template does not exist'}
+        ] * 2
+        mock_ses_service.send_email.return_value = 'msg-ses-123'
+
+        # Act
+        with caplog.at_level('WARNING', logger='src.services.email_service'):
+            results = email_service.send_customer_confirmations([sample_order, sample_order])
+
+        # Assert
+        assert results == [None, None]
+        assert mock_ses_service.send_email.call_count == 2
+        warnings = [r.getMessage() for r in caplog.records if 'SES template' in r.getMessage()]
+        assert len(warnings) == 1
+        assert 'bbws-customer-order-confirmation' in warnings[0]
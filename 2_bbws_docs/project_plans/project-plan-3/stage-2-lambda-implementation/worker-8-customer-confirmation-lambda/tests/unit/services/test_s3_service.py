@@ -84,6 +84,67 @@ class TestS3Service:
 
         assert 'Failed to retrieve template' in str(exc_info.value)
 
+    def test_get_template_if_modified_returns_etag(self, s3_service, mock_s3_client):
+        """Test template retrieval returns content and ETag."""
+        # Arrange
+        mock_s3_client.get_object.return_value = {
+            'Body': Mock(read=Mock(return_value=b"<p>{{orderNumber}}</p>")),
+            'ETag': '"etag-1"'
+        }
+
+        # Act
+        content, etag = s3_service.get_template_if_modified('internal/order_notification.html')
+
+        # Assert
+        assert content == "<p>{{orderNumber}}</p>"
+        assert etag == '"etag-1"'
+        mock_s3_client.get_object.assert_called_once_with(
+            Bucket='test-templates-bucket',
+            Key='internal/order_notification.html'
+        )
+
+    def test_get_template_if_modified_not_modified(self, s3_service, mock_s3_client):
+        """Test conditional retrieval of an unchanged template (304)."""
+        # Arrange
+        error_response = {'Error': {'Code': '304', 'Message': 'Not Modified'}}
+        mock_s3_client.get_object.side_effect = ClientError(error_response, 'GetObject')
+
+        # Act
+        content, etag = s3_service.get_template_if_modified('internal/order_notification.html', etag='"etag-1"')
+
+        # Assert
+        assert content is None
+        assert etag == '"etag-1"'
+        mock_s3_client.get_object.assert_called_once_with(
+            Bucket='test-templates-bucket',
+            Key='internal/order_notification.html',
+            IfNoneMatch='"etag-1"'
+        )
+
+    def test_get_template_if_modified_not_found(self, s3_service, mock_s3_client):
+        """Test conditional retrieval of a missing template."""
+        # Arrange
+        error_response = {'Error': {'Code': 'NoSuchKey', 'Message': 'Key not found'}}
+        mock_s3_client.get_object.side_effect = ClientError(error_response, 'GetObject')
+
+        # Act
+        result = s3_service.get_template_if_modified('nonexistent/template.html', etag='"etag-1"')
+
+        # Assert
+        assert result == (None, None)
+
+    def test_get_template_if_modified_other_client_error(self, s3_service, mock_s3_client):
+        """Test conditional retrieval raises on other S3 errors."""
+        # Arrange
+        error_response = {'Error': {'Code': 'InternalError', 'Message': 'Internal error'}}
+        mock_s3_client.get_object.side_effect = ClientError(error_response, 'GetObject')
+
+        # Act & Assert
+        with pytest.raises(Exception) as exc_info:
+            s3_service.get_template_if_modified('internal/template.html')
+
+        assert 'Failed to retrieve template from S3' in str(exc_info.value)
+
     def test_get_template_decoding_error(self, s3_service, mock_s3_client):
         """Test template decoding error."""
         # Arrange
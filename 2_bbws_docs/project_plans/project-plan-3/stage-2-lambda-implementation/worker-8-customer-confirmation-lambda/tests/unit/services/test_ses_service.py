@@ -1,10 +1,11 @@
 """Unit tests for SESService."""
 
+import json
 import pytest
 from unittest.mock import Mock, patch
 from botocore.exceptions import ClientError
 
-from src.services.ses_service import SESService
+from src.services.ses_service import MAX_SEND_ATTEMPTS, SESService, SendRateLimiter, send_rate_limiter
 
 
 class TestSESService:
@@ -166,3 +167,169 @@ class TestSESService:
         # Assert
         call_args = mock_ses_client.send_email.call_args[1]
         assert call_args['Destination']['ToAddresses'] == ['internal@kimmyai.io']
+
+    @patch('src.services.ses_service.time.sleep')
+    @patch.object(send_rate_limiter, 'max_send_rate', 0.0)
+    def test_send_email_retries_when_throttled(self, mock_sleep, ses_service, mock_ses_client):
+        """Test throttled sends are retried with backoff."""
+        # Arrange
+        throttled = ClientError(
+            {'Error': {'Code': 'Throttling', 'Message': 'Maximum sending rate exceeded.'}},
+            'SendEmail'
+        )
+        mock_ses_client.send_email.side_effect = [throttled, throttled, {'MessageId': 'msg-123'}]
+
+        # Act
+        message_id = ses_service.send_email(
+            to_email='recipient@example.com',
+            subject='Test',
+            text_body='Test'
+        )
+
+        # Assert
+        assert message_id == 'msg-123'
+        assert mock_ses_client.send_email.call_count == 3
+        assert mock_sleep.call_count == 2
+
+    @patch('src.services.ses_service.time.sleep')
+    @patch.object(send_rate_limiter, 'max_send_rate', 0.0)
+    def test_send_email_daily_quota_not_retried(self, mock_sleep, ses_service, mock_ses_client):
+        """Test exceeding the daily quota fails without retrying."""
+        # Arrange
+        mock_ses_client.send_email.side_effect = ClientError(
+            {'Error': {'Code': 'Throttling', 'Message': 'Daily message quota exceeded.'}},
+            'SendEmail'
+        )
+
+        # Act & Assert
+        with pytest.raises(Exception) as exc_info:
+            ses_service.send_email(
+                to_email='recipient@example.com',
+                subject='Test',
+                text_body='Test'
+            )
+
+        assert 'Daily message quota exceeded' in str(exc_info.value)
+        mock_ses_client.send_email.assert_called_once()
+        mock_sleep.assert_not_called()
+
+    @patch('src.services.ses_service.time.sleep')
+    @patch.object(send_rate_limiter, 'max_send_rate', 0.0)
+    def test_send_email_throttled_until_max_attempts(self, mock_sleep, ses_service, mock_ses_client):
+        """Test sending gives up after MAX_SEND_ATTEMPTS throttled attempts."""
+        # Arrange
+        mock_ses_client.send_email.side_effect = ClientError(
+            {'Error': {'Code': 'Throttling', 'Message': 'Maximum sending rate exceeded.'}},
+            'SendEmail'
+        )
+
+        # Act & Assert
+        with pytest.raises(Exception) as exc_info:
+            ses_service.send_email(
+                to_email='recipient@example.com',
+                subject='Test',
+                text_body='Test'
+            )
+
+        assert 'Failed to send email' in str(exc_info.value)
+        assert mock_ses_client.send_email.call_count == MAX_SEND_ATTEMPTS
+
+    @patch.object(send_rate_limiter, 'max_send_rate', 0.0)
+    def test_send_bulk_templated_email_chunks_destinations(self, ses_service, mock_ses_client):
+        """Test bulk sends are split into calls of at most 50 destinations."""
+        # Arrange
+        destinations = [
+            {'to_email': f'customer{i}@example.com', 'template_data': {'orderNumber': f'ORD-{i}'}}
+            for i in range(120)
+        ]
+        mock_ses_client.send_bulk_templated_email.side_effect = lambda **kwargs: {
+            'Status': [{'Status': 'Success', 'MessageId': 'msg'} for _ in kwargs['Destinations']]
+        }
+
+        # Act
+        statuses = ses_service.send_bulk_templated_email(
+            template_name='order-confirmation',
+            destinations=destinations,
+            reply_to='support@kimmyai.io'
+        )
+
+        # Assert
+        assert len(statuses) == 120
+        calls = mock_ses_client.send_bulk_templated_email.call_args_list
+        assert [len(call[1]['Destinations']) for call in calls] == [50, 50, 20]
+
+        first_call = calls[0][1]
+        assert first_call['Source'] == 'test@kimmyai.io'
+        assert first_call['Template'] == 'order-confirmation'
+        assert first_call['ReplyToAddresses'] == ['support@kimmyai.io']
+        assert first_call['Destinations'][0]['Destination']['ToAddresses'] == ['customer0@example.com']
+        assert json.loads(first_call['Destinations'][0]['ReplacementTemplateData']) == {'orderNumber': 'ORD-0'}
+
+    @patch.object(send_rate_limiter, 'max_send_rate', 0.0)
+    def test_send_bulk_templated_email_failed_call(self, ses_service, mock_ses_client):
+        """Test a rejected bulk call marks its destinations as failed."""
+        # Arrange
+        destinations = [
+            {'to_email': 'customer@example.com', 'template_data': {}},
+            {'to_email': 'other@example.com', 'template_data': {}}
+        ]
+        mock_ses_client.send_bulk_templated_email.side_effect = ClientError(
+            {'Error': {'Code': 'TemplateDoesNotExist', 'Message': 'Template does not exist'}},
+            'SendBulkTemplatedEmail'
+        )
+
+        # Act
+        statuses = ses_service.send_bulk_templated_email('order-confirmation', destinations)
+
+        # Assert
+        assert statuses == [
+            {'Status': 'TemplateDoesNotExist', 'Error': 'Template does not exist'},
+            {'Status': 'TemplateDoesNotExist', 'Error': 'Template does not exist'}
+        ]
+
+
+class TestSendRateLimiter:
+    """Test cases for SendRateLimiter."""
+
+    def test_configure_reads_send_quota(self):
+        """Test MaxSendRate is read once from SES."""
+        # Arrange
+        limiter = SendRateLimiter()
+        ses_client = Mock()
+        ses_client.get_send_quota.return_value = {'MaxSendRate': 14.0}
+
+        # Act
+        limiter.configure(ses_client)
+        limiter.configure(ses_client)
+
+        # Assert
+        assert limiter.max_send_rate == 14.0
+        ses_client.get_send_quota.assert_called_once()
+
+    def test_configure_failure_disables_pacing(self):
+        """Test a failed GetSendQuota call leaves sends unpaced."""
+        # Arrange
+        limiter = SendRateLimiter()
+        ses_client = Mock()
+        ses_client.get_send_quota.side_effect = Exception("AccessDenied")
+
+        # Act
+        limiter.configure(ses_client)
+
+        # Assert
+        assert limiter.max_send_rate == 0.0
+
+    @patch('src.services.ses_service.time.sleep')
+    @patch('src.services.ses_service.time.monotonic', return_value=100.0)
+    def test_acquire_spaces_sends(self, mock_monotonic, mock_sleep):
+        """Test recipients beyond the send rate wait for their share of a second."""
+        # Arrange
+        limiter = SendRateLimiter()
+        limiter.max_send_rate = 10.0
+
+        # Act
+        limiter.acquire(5)
+        limiter.acquire(5)
+
+        # Assert - first call is immediate, second waits 5/10 seconds
+        mock_sleep.assert_called_once_with(pytest.approx(0.5))
@@ -0,0 +1 @@
+"""Benchmarks for the Marketing Lambda."""
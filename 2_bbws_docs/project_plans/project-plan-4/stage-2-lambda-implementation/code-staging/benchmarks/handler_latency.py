@@ -0,0 +1,155 @@
+"""Benchmark: cold and warm latency of the get_campaign handler.
+
+DynamoDB is served by moto, so the numbers show the Lambda's own cost of
+building boto3 resources and dependencies, not network latency.
+
+- cold: a fresh Python process per sample, timing Lambda init (importing
+  the handler, which builds the container) and the first invocation
+- warm: repeated invocations in one process, either reusing the container
+  (what the handler does) or rebuilding the repository and service on
+  every request (what it did before the container)
+
+Usage (from the code-staging directory):
+    python -m benchmarks.handler_latency --cold-samples 5 --warm-invocations 200
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+from moto import mock_aws
+
+TABLE_NAME = "bbws-cpp-benchmark"
+EVENT = {"pathParameters": {"code": "SUMMER2025"}}
+
+
+def create_table() -> None:
+    """Create the campaigns table with one campaign in moto."""
+    import boto3
+
+    dynamodb = boto3.resource("dynamodb")
+    table = dynamodb.create_table(
+        TableName=TABLE_NAME,
+        KeySchema=[{"AttributeName": "PK", "KeyType": "HASH"}, {"AttributeName": "SK", "KeyType": "RANGE"}],
+        AttributeDefinitions=[
+            {"AttributeName": "PK", "AttributeType": "S"},
+            {"AttributeName": "SK", "AttributeType": "S"},
+        ],
+        BillingMode="PAY_PER_REQUEST",
+    )
+    table.put_item(
+        Item={
+            "PK": "CAMPAIGN#SUMMER2025",
+            "SK": "METADATA",
+            "code": "SUMMER2025",
+            "productId": "PROD-001",
+            "discountPercent": 20,
+            "listPrice": "100.00",
+            "price": "80.00",
+            "termsAndConditions": "Valid until end of summer",
+            "status": "ACTIVE",
+            "fromDate": "2025-06-01T00:00:00Z",
+            "toDate": "2099-08-31T23:59:59Z",
+        }
+    )
+
+
+def run_cold() -> None:
+    """Child process: time Lambda init and the first invocation, print JSON."""
+    with mock_aws():
+        create_table()
+
+        start = time.perf_counter()
+        from src.handlers.get_campaign import lambda_handler
+
+        init_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        response = lambda_handler(EVENT, None)
+        first_ms = (time.perf_counter() - start) * 1000
+
+    assert response["statusCode"] == 200, response
+    print(json.dumps({"init_ms": init_ms, "first_ms": first_ms}))
+
+
+def time_invocations(invoke: Callable[[], Any], count: int) -> List[float]:
+    """Latency in milliseconds of each of count invocations."""
+    samples = []
+    for _ in range(count):
+        start = time.perf_counter()
+        invoke()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def run_warm(count: int) -> Dict[str, List[float]]:
+    """Warm invocations with and without reusing the container."""
+    with mock_aws():
+        create_table()
+        from src.container import container
+        from src.handlers.get_campaign import lambda_handler
+
+        container.warm()
+        lambda_handler(EVENT, None)
+
+        def per_request() -> Any:
+            container.reset()
+            return lambda_handler(EVENT, None)
+
+        return {
+            "warm (container)": time_invocations(lambda: lambda_handler(EVENT, None), count),
+            "warm (per request)": time_invocations(per_request, count),
+        }
+
+
+def summarise(name: str, samples: List[float]) -> str:
+    """One table row: mean, p50 and p99 in milliseconds."""
+    ordered = sorted(samples)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    return f"{name:<22} {statistics.mean(ordered):>9.2f} {statistics.median(ordered):>9.2f} {p99:>9.2f}"
+
+
+def main() -> None:
+    """Run the cold samples in child processes, then the warm comparison."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cold-samples", type=int, default=5, help="Fresh processes to time (default 5)")
+    parser.add_argument("--warm-invocations", type=int, default=200, help="Warm invocations per variant (default 200)")
+    parser.add_argument("--cold-child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    os.environ.setdefault("AWS_DEFAULT_REGION", "eu-west-1")
+    os.environ.setdefault("AWS_ACCESS_KEY_ID", "benchmark")
+    os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "benchmark")
+    os.environ["DYNAMODB_TABLE_NAME"] = TABLE_NAME
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+    if args.cold_child:
+        run_cold()
+        return
+
+    child_env = {**os.environ, "AWS_LAMBDA_FUNCTION_NAME": "get-campaign-benchmark"}
+    cold = []
+    for _ in range(args.cold_samples):
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.handler_latency", "--cold-child"],
+            check=True,
+            capture_output=True,
+            text=True,
+            env=child_env,
+        ).stdout
+        cold.append(json.loads(output.strip().splitlines()[-1]))
+
+    print(f"{'variant':<22} {'mean ms':>9} {'p50 ms':>9} {'p99 ms':>9}")
+    print(summarise("cold init", [sample["init_ms"] for sample in cold]))
+    print(summarise("cold first request", [sample["first_ms"] for sample in cold]))
+    for name, samples in run_warm(args.warm_invocations).items():
+        print(summarise(name, samples))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Dependency container for the Lambda handlers.
+
+Builds the repository and service once per Lambda container instead of on
+every request, so warm invocations reuse the boto3 resource and its
+connection pool. Handlers read dependencies from the module-level
+``container``; tests swap them with ``container.override(...)``.
+"""
+
+from contextlib import contextmanager
+from functools import cached_property
+from typing import Any, Dict, Iterator, List
+
+import boto3
+
+from src.repositories.campaign_repository import CampaignRepository
+from src.repositories.campaign_snapshot_store import CampaignSnapshotStore
+from src.services.campaign_service import CampaignService
+
+
+class Container:
+    """Lazily built, per-container handler dependencies."""
+
+    @cached_property
+    def campaign_repository(self) -> CampaignRepository:
+        """Campaign repository (creates the DynamoDB resource)."""
+        return CampaignRepository()
+
+    @cached_property
+    def campaign_service(self) -> CampaignService:
+        """Campaign service backed by the container's repository."""
+        return CampaignService(self.campaign_repository)
+
+    @cached_property
+    def snapshot_store(self) -> CampaignSnapshotStore:
+        """Store for the active-campaign snapshot in S3."""
+        return CampaignSnapshotStore()
+
+    @cached_property
+    def cloudfront_client(self) -> Any:
+        """CloudFront client used to invalidate cached API responses."""
+        return boto3.client("cloudfront")
+
+    def warm(self, *names: str) -> None:
+        """
+        Build dependencies now (call during Lambda init).
+
+        Args:
+            *names: Dependencies the handler uses (default: all of them)
+        """
+        for name in names or self._dependency_names():
+            getattr(self, name)
+
+    def reset(self) -> None:
+        """Drop built dependencies so the next access rebuilds them."""
+        for name in self._dependency_names():
+            self.__dict__.pop(name, None)
+
+    @contextmanager
+    def override(self, **instances: Any) -> Iterator["Container"]:
+        """
+        Replace dependencies for the duration of a ``with`` block.
+
+        Args:
+            **instances: Replacement objects keyed by dependency name
+
+        Yields:
+            This container
+
+        Raises:
+            AttributeError: If a name is not a dependency
+        """
+        unknown = set(instances) - set(self._dependency_names())
+        if unknown:
+            raise AttributeError(f"Unknown dependencies: {', '.join(sorted(unknown))}")
+
+        saved: Dict[str, Any] = {
+            name: self.__dict__[name] for name in instances if name in self.__dict__
+        }
+        self.__dict__.update(instances)
+        try:
+            yield self
+        finally:
+            for name in instances:
+                self.__dict__.pop(name, None)
+            self.__dict__.update(saved)
+
+    @classmethod
+    def _dependency_names(cls) -> List[str]:
+        """Names of the container's dependencies."""
+        return [
+            name
+            for name, value in vars(cls).items()
+            if isinstance(value, cached_property)
+        ]
+
+
+container = Container()
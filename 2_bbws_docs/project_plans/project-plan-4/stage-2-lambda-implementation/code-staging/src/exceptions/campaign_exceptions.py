@@ -20,6 +20,14 @@ class CampaignNotFoundException(BusinessException):
         self.code = code
 
 
+class InvalidRequestException(BusinessException):
+    """Raised when a request body or parameter is invalid."""
+
+    def __init__(self, message: str) -> None:
+        """Initialize invalid request exception."""
+        super().__init__(message, status_code=400)
+
+
 class SystemException(Exception):
     """Base class for system exceptions (5xx errors)."""
 
@@ -37,3 +45,12 @@ class DynamoDBException(SystemException):
         """Initialize DynamoDB exception."""
         super().__init__(f"DynamoDB error: {message}", status_code=500)
         self.original_error = original_error
+
+
+class SnapshotException(SystemException):
+    """Raised when the campaign snapshot cannot be read or written."""
+
+    def __init__(self, message: str, original_error: Exception) -> None:
+        """Initialize snapshot exception."""
+        super().__init__(f"Snapshot error: {message}", status_code=500)
+        self.original_error = original_error
@@ -0,0 +1,129 @@
+"""Lambda handler for POST /v1.0/campaigns:batchGet."""
+
+import base64
+import json
+import logging
+import os
+from typing import Any, Dict, List
+
+from src.container import container
+from src.exceptions.campaign_exceptions import (
+    BusinessException,
+    CampaignNotFoundException,
+    InvalidRequestException,
+    SystemException,
+)
+from src.handlers.http import response
+from src.models.campaign import CampaignResponse
+
+# Configure logging
+LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO")
+logging.basicConfig(level=LOG_LEVEL)
+logger = logging.getLogger(__name__)
+
+# Codes accepted per request
+MAX_CODES = 100
+
+# Build the repository and service during Lambda init, not per request
+if os.environ.get("AWS_LAMBDA_FUNCTION_NAME"):
+    container.warm("campaign_service")
+
+
+def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    """
+    Lambda handler for resolving several campaign codes at once.
+
+    Request body: {"codes": ["SUMMER2025", ...]} with 1-100 codes.
+    Response body: {"campaigns": [...], "errors": [{"code", "statusCode", "message"}]},
+    both in request order; a code appears in exactly one of them.
+
+    Args:
+        event: API Gateway event
+        context: Lambda context
+
+    Returns:
+        API Gateway response
+    """
+    try:
+        codes = _extract_codes(event)
+        logger.info(f"Processing batch campaign request for {len(codes)} code(s)")
+
+        campaigns = container.campaign_service.get_campaigns(codes)
+
+        results: List[Dict[str, Any]] = []
+        errors: List[Dict[str, Any]] = []
+        for code in codes:
+            campaign = campaigns.get(code)
+            if campaign is None:
+                not_found = CampaignNotFoundException(code)
+                errors.append(
+                    {
+                        "code": code,
+                        "statusCode": not_found.status_code,
+                        "message": not_found.message,
+                    }
+                )
+            else:
+                results.append(
+                    CampaignResponse.from_campaign(campaign).model_dump(
+                        mode="json", by_alias=True
+                    )
+                )
+
+        return response(
+            200, json.dumps({"campaigns": results, "errors": errors}), "no-store"
+        )
+
+    except BusinessException as e:
+        logger.warning(f"Business exception: {e.message}")
+        return response(e.status_code, json.dumps({"message": e.message}), "no-store")
+
+    except SystemException as e:
+        logger.error(f"System exception: {e.message}")
+        return response(
+            e.status_code, json.dumps({"message": "Internal server error"}), "no-store"
+        )
+
+    except Exception as e:
+        logger.error(f"Unexpected exception: {str(e)}", exc_info=True)
+        return response(
+            500, json.dumps({"message": "Internal server error"}), "no-store"
+        )
+
+
+def _extract_codes(event: Dict[str, Any]) -> List[str]:
+    """
+    Extract the requested codes from the request body.
+
+    Args:
+        event: API Gateway event
+
+    Returns:
+        Codes in request order, without duplicates
+
+    Raises:
+        InvalidRequestException: If the body is not {"codes": [1-100 non-empty strings]}
+    """
+    body = event.get("body") or ""
+    if event.get("isBase64Encoded"):
+        body = base64.b64decode(body).decode("utf-8")
+
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        raise InvalidRequestException("Request body must be JSON")
+
+    codes = payload.get("codes") if isinstance(payload, dict) else None
+    if not isinstance(codes, list) or not codes:
+        raise InvalidRequestException(
+            "Request body must contain a non-empty 'codes' list"
+        )
+    if not all(isinstance(code, str) and code for code in codes):
+        raise InvalidRequestException("Campaign codes must be non-empty strings")
+
+    unique = list(dict.fromkeys(codes))
+    if len(unique) > MAX_CODES:
+        raise InvalidRequestException(
+            f"At most {MAX_CODES} codes can be requested at once"
+        )
+    return unique
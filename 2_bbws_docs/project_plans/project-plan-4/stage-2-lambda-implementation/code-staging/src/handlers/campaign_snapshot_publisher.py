@@ -0,0 +1,42 @@
+"""Scheduled Lambda handler that publishes the active-campaign snapshot to S3."""
+
+import json
+import logging
+import os
+from typing import Any, Dict
+
+from src.container import container
+from src.models.campaign import CampaignResponse
+
+# Configure logging
+LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO")
+logging.basicConfig(level=LOG_LEVEL)
+logger = logging.getLogger(__name__)
+
+# Build the service and store during Lambda init, not per run
+if os.environ.get("AWS_LAMBDA_FUNCTION_NAME"):
+    container.warm("campaign_service", "snapshot_store")
+
+
+def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    """
+    Lambda handler for the snapshot schedule.
+
+    Reads ACTIVE campaigns from the status index and writes a new snapshot
+    version only if the list changed. Failures are raised so the run is
+    reported as failed; the previous snapshot stays in place.
+
+    Args:
+        event: EventBridge scheduled event
+        context: Lambda context
+
+    Returns:
+        Snapshot version and number of campaigns
+    """
+    logger.info(f"Received event: {json.dumps(event)}")
+
+    campaigns = container.campaign_service.list_active_campaigns()
+    responses = [CampaignResponse.from_campaign(campaign) for campaign in campaigns]
+    version = container.snapshot_store.publish(responses)
+
+    return {"version": version, "campaigns": len(responses)}
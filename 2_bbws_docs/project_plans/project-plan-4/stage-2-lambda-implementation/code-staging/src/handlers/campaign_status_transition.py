@@ -0,0 +1,46 @@
+"""Scheduled Lambda handler that persists campaign status transitions.
+
+Runs on an EventBridge schedule and moves campaigns whose start or end has
+passed (DRAFT -> ACTIVE, ACTIVE/DRAFT -> EXPIRED), keeping the sparse
+CampaignStatusIndex current. Invoke with {"backfill": true} once to add
+epochs and index attributes to campaigns written before they existed.
+"""
+
+import json
+import logging
+import os
+from typing import Any, Dict
+
+from src.container import container
+
+# Configure logging
+LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO")
+logging.basicConfig(level=LOG_LEVEL)
+logger = logging.getLogger(__name__)
+
+# Build the repository and service during Lambda init, not per run
+if os.environ.get("AWS_LAMBDA_FUNCTION_NAME"):
+    container.warm("campaign_service")
+
+
+def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    """
+    Lambda handler for the status transition schedule.
+
+    Failures are raised so the run is reported as failed; the next run
+    picks up anything left, and each write is conditional on the status
+    it read.
+
+    Args:
+        event: EventBridge scheduled event, or {"backfill": true}
+        context: Lambda context
+
+    Returns:
+        Transition counts, or the number of backfilled campaigns
+    """
+    logger.info(f"Received event: {json.dumps(event)}")
+
+    if event.get("backfill"):
+        return {"backfilled": container.campaign_service.backfill_status_index()}
+
+    return {"transitions": container.campaign_service.transition_due_campaigns()}
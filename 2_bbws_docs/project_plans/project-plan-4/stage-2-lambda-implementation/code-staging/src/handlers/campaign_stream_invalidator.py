@@ -0,0 +1,81 @@
+"""Lambda handler for the campaign table's DynamoDB Stream.
+
+Invalidates cached campaigns when campaign items change: bumps the cache
+generation every get_campaign container polls, and invalidates the changed
+codes in CloudFront when CLOUDFRONT_DISTRIBUTION_ID is set.
+"""
+
+import logging
+import os
+import time
+from typing import Any, Dict, List
+
+from src.container import container
+
+# Configure logging
+LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO")
+logging.basicConfig(level=LOG_LEVEL)
+logger = logging.getLogger(__name__)
+
+CAMPAIGN_PATH = "/v1.0/campaigns/{code}"
+
+# Build the repository during Lambda init, not per batch
+if os.environ.get("AWS_LAMBDA_FUNCTION_NAME"):
+    container.warm("campaign_repository")
+
+
+def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    """
+    Lambda handler for campaign stream batches.
+
+    Failures are raised so Lambda retries the batch; repeating an
+    invalidation is harmless.
+
+    Args:
+        event: DynamoDB Stream event
+        context: Lambda context
+
+    Returns:
+        Changed campaign codes and the new cache generation
+    """
+    codes = _changed_codes(event.get("Records", []))
+    if not codes:
+        logger.info("No campaign changes in batch")
+        return {"codes": [], "generation": None}
+
+    logger.info(f"Campaigns changed: {', '.join(codes)}")
+    generation = container.campaign_repository.bump_cache_generation()
+
+    distribution_id = os.environ.get("CLOUDFRONT_DISTRIBUTION_ID")
+    if distribution_id:
+        paths = [CAMPAIGN_PATH.format(code=code) for code in codes]
+        container.cloudfront_client.create_invalidation(
+            DistributionId=distribution_id,
+            InvalidationBatch={
+                "Paths": {"Quantity": len(paths), "Items": paths},
+                "CallerReference": f"campaigns-{generation}-{int(time.time() * 1000)}",
+            },
+        )
+        logger.info(f"Requested CloudFront invalidation of {len(paths)} path(s)")
+
+    return {"codes": codes, "generation": generation}
+
+
+def _changed_codes(records: List[Dict[str, Any]]) -> List[str]:
+    """
+    Campaign codes touched by a batch of stream records.
+
+    Args:
+        records: DynamoDB Stream records
+
+    Returns:
+        Sorted unique codes of inserted, modified or removed campaign items
+    """
+    codes = set()
+    for record in records:
+        keys = record.get("dynamodb", {}).get("Keys", {})
+        pk = keys.get("PK", {}).get("S", "")
+        sk = keys.get("SK", {}).get("S", "")
+        if pk.startswith("CAMPAIGN#") and sk == "METADATA":
+            codes.add(pk.removeprefix("CAMPAIGN#"))
+    return sorted(codes)
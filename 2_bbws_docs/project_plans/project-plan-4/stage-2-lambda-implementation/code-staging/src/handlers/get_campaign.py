@@ -1,25 +1,38 @@
 """Lambda handler for GET /v1.0/campaigns/{code}."""
 
+import hashlib
 import json
 import logging
 import os
+import time
 from typing import Any, Dict
 
+from src.container import container
 from src.exceptions.campaign_exceptions import BusinessException, SystemException
-from src.models.campaign import CampaignResponse
-from src.repositories.campaign_repository import CampaignRepository
-from src.services.campaign_service import CampaignService
+from src.handlers.http import if_none_match, response
+from src.models.campaign import Campaign, CampaignResponse
 
 # Configure logging
 LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO")
 logging.basicConfig(level=LOG_LEVEL)
 logger = logging.getLogger(__name__)
 
+# Seconds API Gateway / CloudFront may cache a campaign, and an unknown code
+HTTP_MAX_AGE = int(os.environ.get("CAMPAIGN_HTTP_MAX_AGE", "60"))
+HTTP_NEGATIVE_MAX_AGE = int(os.environ.get("CAMPAIGN_HTTP_NEGATIVE_MAX_AGE", "30"))
+
+# Build the repository and service during Lambda init, not per request
+if os.environ.get("AWS_LAMBDA_FUNCTION_NAME"):
+    container.warm("campaign_service")
+
 
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     Lambda handler for getting campaign by code.
 
+    Responses carry Cache-Control (and an ETag for campaigns) so API Gateway
+    and CloudFront can cache them; a matching If-None-Match gets a 304.
+
     Args:
         event: API Gateway event
         context: Lambda context
@@ -34,57 +47,61 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         code = _extract_path_param(event, "code")
         logger.info(f"Processing campaign request for code: {code}")
 
-        # Initialize dependencies
-        repository = CampaignRepository()
-        service = CampaignService(repository)
-
         # Get campaign
-        campaign = service.get_campaign(code)
+        campaign = container.campaign_service.get_campaign(code)
 
         # Build response
         campaign_response = CampaignResponse.from_campaign(campaign)
+        body = campaign_response.model_dump_json(by_alias=True)
+        etag = '"' + hashlib.sha256(body.encode()).hexdigest()[:32] + '"'
+        max_age = min(HTTP_MAX_AGE, _seconds_until_status_change(campaign))
+        cache_control = f"public, max-age={max_age}"
 
-        return {
-            "statusCode": 200,
-            "headers": {
-                "Content-Type": "application/json",
-                "Access-Control-Allow-Origin": "*",
-            },
-            "body": campaign_response.model_dump_json(by_alias=True),
-        }
+        if etag in if_none_match(event):
+            return response(304, "", cache_control, etag)
+        return response(200, body, cache_control, etag)
 
     except BusinessException as e:
         logger.warning(f"Business exception: {e.message}")
-        return {
-            "statusCode": e.status_code,
-            "headers": {
-                "Content-Type": "application/json",
-                "Access-Control-Allow-Origin": "*",
-            },
-            "body": json.dumps({"message": e.message}),
-        }
+        cache_control = (
+            f"public, max-age={HTTP_NEGATIVE_MAX_AGE}"
+            if e.status_code == 404
+            else "no-store"
+        )
+        return response(
+            e.status_code, json.dumps({"message": e.message}), cache_control
+        )
 
     except SystemException as e:
         logger.error(f"System exception: {e.message}")
-        return {
-            "statusCode": e.status_code,
-            "headers": {
-                "Content-Type": "application/json",
-                "Access-Control-Allow-Origin": "*",
-            },
-            "body": json.dumps({"message": "Internal server error"}),
-        }
+        return response(
+            e.status_code, json.dumps({"message": "Internal server error"}), "no-store"
+        )
 
     except Exception as e:
         logger.error(f"Unexpected exception: {str(e)}", exc_info=True)
-        return {
-            "statusCode": 500,
-            "headers": {
-                "Content-Type": "application/json",
-                "Access-Control-Allow-Origin": "*",
-            },
-            "body": json.dumps({"message": "Internal server error"}),
-        }
+        return response(
+            500, json.dumps({"message": "Internal server error"}), "no-store"
+        )
+
+
+def _seconds_until_status_change(campaign: Campaign) -> int:
+    """
+    Seconds until the campaign's status changes by date (starts or expires).
+
+    Args:
+        campaign: Campaign
+
+    Returns:
+        Seconds until the next change, or HTTP_MAX_AGE if none is ahead
+    """
+    now = int(time.time())
+    upcoming = [
+        boundary - now
+        for boundary in (campaign.from_epoch, campaign.to_epoch)
+        if boundary > now
+    ]
+    return min(upcoming) if upcoming else HTTP_MAX_AGE
 
 
 def _extract_path_param(event: Dict[str, Any], param_name: str) -> str:
@@ -0,0 +1,45 @@
+"""API Gateway response and conditional request helpers shared by the campaign handlers."""
+
+from typing import Any, Dict, List, Optional
+
+
+def response(
+    status_code: int, body: str, cache_control: str, etag: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Build an API Gateway response.
+
+    Args:
+        status_code: HTTP status code
+        body: JSON body (empty for 304)
+        cache_control: Cache-Control header value
+        etag: ETag header value, if any
+
+    Returns:
+        API Gateway response
+    """
+    headers = {
+        "Content-Type": "application/json",
+        "Access-Control-Allow-Origin": "*",
+        "Cache-Control": cache_control,
+    }
+    if etag:
+        headers["ETag"] = etag
+    return {"statusCode": status_code, "headers": headers, "body": body}
+
+
+def if_none_match(event: Dict[str, Any]) -> List[str]:
+    """
+    ETags from the request's If-None-Match header.
+
+    Args:
+        event: API Gateway event
+
+    Returns:
+        Strong forms of the listed ETags (empty if the header is absent)
+    """
+    headers = event.get("headers") or {}
+    value = next((v for k, v in headers.items() if k.lower() == "if-none-match"), None)
+    if not value:
+        return []
+    return [tag.strip().removeprefix("W/") for tag in value.split(",")]
@@ -0,0 +1,60 @@
+"""Lambda handler for GET /v1.0/campaigns."""
+
+import json
+import logging
+import os
+from typing import Any, Dict
+
+from src.container import container
+from src.exceptions.campaign_exceptions import SystemException
+from src.handlers.http import if_none_match, response
+
+# Configure logging
+LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO")
+logging.basicConfig(level=LOG_LEVEL)
+logger = logging.getLogger(__name__)
+
+# Seconds API Gateway / CloudFront may cache the listing
+HTTP_MAX_AGE = int(os.environ.get("CAMPAIGN_LIST_HTTP_MAX_AGE", "60"))
+
+# Build the snapshot store during Lambda init, not per request
+if os.environ.get("AWS_LAMBDA_FUNCTION_NAME"):
+    container.warm("snapshot_store")
+
+
+def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    """
+    Lambda handler for listing ACTIVE campaigns.
+
+    Serves the S3 snapshot published by campaign_snapshot_publisher; the
+    ETag is the snapshot version, so a matching If-None-Match gets a 304.
+
+    Args:
+        event: API Gateway event
+        context: Lambda context
+
+    Returns:
+        API Gateway response
+    """
+    try:
+        snapshot = container.snapshot_store.load()
+        etag = f'"v{snapshot.version}"'
+        cache_control = f"public, max-age={HTTP_MAX_AGE}"
+
+        if etag in if_none_match(event):
+            return response(304, "", cache_control, etag)
+        return response(
+            200, snapshot.model_dump_json(by_alias=True), cache_control, etag
+        )
+
+    except SystemException as e:
+        logger.error(f"System exception: {e.message}")
+        return response(
+            e.status_code, json.dumps({"message": "Internal server error"}), "no-store"
+        )
+
+    except Exception as e:
+        logger.error(f"Unexpected exception: {str(e)}", exc_info=True)
+        return response(
+            500, json.dumps({"message": "Internal server error"}), "no-store"
+        )
@@ -1,10 +1,16 @@
 """Campaign domain models using Pydantic for validation."""
 
+from datetime import datetime
 from decimal import Decimal
 from enum import Enum
-from typing import Optional
+from typing import Any, List, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
+
+
+def iso_to_epoch(value: str) -> int:
+    """Convert an ISO 8601 timestamp (e.g. 2025-06-01T00:00:00Z) to epoch seconds."""
+    return int(datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp())
 
 
 class CampaignStatus(str, Enum):
@@ -27,6 +33,8 @@ class Campaign(BaseModel):
     status: CampaignStatus
     from_date: str = Field(..., alias="fromDate")
     to_date: str = Field(..., alias="toDate")
+    from_epoch: int = Field(..., alias="fromEpoch")
+    to_epoch: int = Field(..., alias="toEpoch")
     special_conditions: Optional[str] = Field(None, alias="specialConditions")
     active: bool = True
 
@@ -36,6 +44,25 @@ class Campaign(BaseModel):
         populate_by_name = True
         use_enum_values = True
 
+    @model_validator(mode="before")
+    @classmethod
+    def derive_epochs(cls, data: Any) -> Any:
+        """Derive fromEpoch/toEpoch from the ISO dates when they are not given."""
+        if not isinstance(data, dict):
+            return data
+        data = dict(data)
+        for epoch_alias, epoch_name, date_alias, date_name in (
+            ("fromEpoch", "from_epoch", "fromDate", "from_date"),
+            ("toEpoch", "to_epoch", "toDate", "to_date"),
+        ):
+            if data.get(epoch_alias) is None and data.get(epoch_name) is None:
+                data.pop(epoch_alias, None)
+                data.pop(epoch_name, None)
+                date = data.get(date_alias, data.get(date_name))
+                if isinstance(date, str):
+                    data[epoch_alias] = iso_to_epoch(date)
+        return data
+
     @field_validator("discount_percent")
     @classmethod
     def validate_discount(cls, v: int) -> int:
@@ -90,3 +117,16 @@ class CampaignResponse(BaseModel):
             specialConditions=campaign.special_conditions,
             isValid=campaign.status == CampaignStatus.ACTIVE,
         )
+
+
+class CampaignSnapshot(BaseModel):
+    """Versioned list of ACTIVE campaigns, published to S3."""
+
+    version: int
+    generated_at: str = Field(..., alias="generatedAt")
+    campaigns: List[CampaignResponse]
+
+    class Config:
+        """Pydantic configuration."""
+
+        populate_by_name = True
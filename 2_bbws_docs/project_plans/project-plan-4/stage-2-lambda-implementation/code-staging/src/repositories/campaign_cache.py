@@ -0,0 +1,139 @@
+"""In-memory TTL LRU cache for campaign lookups."""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple, Union
+
+from src.models.campaign import Campaign
+
+# Cached result for a code that has no campaign
+NOT_FOUND = object()
+
+CacheValue = Union[Campaign, object]
+
+
+class CampaignCache:
+    """
+    Per-container LRU cache of campaigns by code, with expiring entries.
+
+    Unknown codes are cached too (negative caching, with their own shorter
+    TTL) so enumeration traffic for made-up codes does not reach DynamoDB.
+    Campaigns are copied on the way in and out because CampaignService
+    updates status and price on the object it is given.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: float = 60.0,
+        negative_ttl_seconds: float = 30.0,
+    ) -> None:
+        """
+        Initialize campaign cache.
+
+        Args:
+            max_entries: Entries kept before the least recently used is evicted
+            ttl_seconds: Seconds a campaign is served from the cache (0 disables caching)
+            negative_ttl_seconds: Seconds an unknown code is remembered (0 disables)
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        # None for a cached unknown code
+        self._entries: "OrderedDict[str, Tuple[float, Optional[Campaign]]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "CampaignCache":
+        """
+        Build a cache from CAMPAIGN_CACHE_* environment variables.
+
+        Returns:
+            CampaignCache (defaults: 1024 entries, 60s TTL, 30s negative TTL)
+        """
+        return cls(
+            max_entries=int(os.environ.get("CAMPAIGN_CACHE_MAX_ENTRIES", "1024")),
+            ttl_seconds=float(os.environ.get("CAMPAIGN_CACHE_TTL_SECONDS", "60")),
+            negative_ttl_seconds=float(
+                os.environ.get("CAMPAIGN_CACHE_NEGATIVE_TTL_SECONDS", "30")
+            ),
+        )
+
+    def get(self, code: str) -> Optional[CacheValue]:
+        """
+        Look up a code.
+
+        Args:
+            code: Campaign code
+
+        Returns:
+            A copy of the cached Campaign, NOT_FOUND for a cached unknown
+            code, or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(code)
+            if entry is None:
+                return None
+            expires_at, campaign = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[code]
+                return None
+            self._entries.move_to_end(code)
+
+        if campaign is None:
+            return NOT_FOUND
+        return campaign.model_copy()
+
+    def put(self, code: str, campaign: Campaign) -> None:
+        """
+        Cache a campaign.
+
+        Args:
+            code: Campaign code
+            campaign: Campaign as read from DynamoDB
+        """
+        self._store(code, campaign.model_copy(), self.ttl_seconds)
+
+    def put_not_found(self, code: str) -> None:
+        """
+        Remember that a code has no campaign.
+
+        Args:
+            code: Campaign code
+        """
+        self._store(code, None, self.negative_ttl_seconds)
+
+    def invalidate(self, code: str) -> None:
+        """
+        Drop one code from the cache.
+
+        Args:
+            code: Campaign code
+        """
+        with self._lock:
+            self._entries.pop(code, None)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        """Number of entries, including expired ones not yet evicted."""
+        return len(self._entries)
+
+    def _store(
+        self, code: str, campaign: Optional[Campaign], ttl_seconds: float
+    ) -> None:
+        """Insert or refresh an entry, evicting the least recently used."""
+        if ttl_seconds <= 0 or self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[code] = (time.monotonic() + ttl_seconds, campaign)
+            self._entries.move_to_end(code)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
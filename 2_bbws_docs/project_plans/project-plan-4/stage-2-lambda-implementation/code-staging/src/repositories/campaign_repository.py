@@ -2,26 +2,91 @@
 
 import logging
 import os
+import time
 from decimal import Decimal
-from typing import Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 import boto3
+from boto3.dynamodb.conditions import Attr, Key
 from botocore.exceptions import ClientError
 
-from src.exceptions.campaign_exceptions import CampaignNotFoundException, DynamoDBException
+from src.exceptions.campaign_exceptions import (
+    CampaignNotFoundException,
+    DynamoDBException,
+)
 from src.models.campaign import Campaign, CampaignStatus
+from src.repositories.campaign_cache import NOT_FOUND, CampaignCache
 
 logger = logging.getLogger(__name__)
 
+# Keys per BatchGetItem request (DynamoDB limit)
+BATCH_GET_SIZE = 100
+
+# Attempts at a batch before UnprocessedKeys are given up on
+BATCH_GET_MAX_ATTEMPTS = 5
+
+# Sparse GSI of campaigns still due a status change: DRAFT items keyed by
+# fromEpoch and ACTIVE items by toEpoch. EXPIRED items drop out of it.
+STATUS_INDEX_NAME = os.environ.get("CAMPAIGN_STATUS_INDEX_NAME", "CampaignStatusIndex")
+
+# Item whose counter is bumped whenever a campaign changes (see bump_cache_generation)
+CACHE_GENERATION_KEY = {"PK": "CACHE#CAMPAIGNS", "SK": "GENERATION"}
+
+
+def status_index_attributes(
+    status: str, from_epoch: int, to_epoch: int
+) -> Dict[str, Any]:
+    """
+    CampaignStatusIndex key attributes for a campaign in a status.
+
+    Args:
+        status: Campaign status
+        from_epoch: Campaign start (epoch seconds)
+        to_epoch: Campaign end (epoch seconds)
+
+    Returns:
+        statusKey and transitionAt, or an empty dict if the campaign leaves the index
+    """
+    if status == CampaignStatus.DRAFT:
+        return {
+            "statusKey": f"STATUS#{CampaignStatus.DRAFT.value}",
+            "transitionAt": from_epoch,
+        }
+    if status == CampaignStatus.ACTIVE:
+        return {
+            "statusKey": f"STATUS#{CampaignStatus.ACTIVE.value}",
+            "transitionAt": to_epoch,
+        }
+    return {}
+
 
 class CampaignRepository:
-    """Repository for campaign data access."""
+    """
+    Repository for campaign data access.
 
-    def __init__(self) -> None:
-        """Initialize campaign repository."""
+    Lookups are read through a per-container CampaignCache. Other containers
+    cannot reach this cache, so the campaign stream consumer bumps a
+    generation counter in the table instead; find_by_code re-reads it at
+    most every CAMPAIGN_CACHE_GENERATION_CHECK_SECONDS and clears the cache
+    when it has moved.
+    """
+
+    def __init__(self, cache: Optional[CampaignCache] = None) -> None:
+        """
+        Initialize campaign repository.
+
+        Args:
+            cache: Campaign cache (default: built from CAMPAIGN_CACHE_* variables)
+        """
         self.dynamodb = boto3.resource("dynamodb")
         self.table_name = os.environ.get("DYNAMODB_TABLE_NAME", "bbws-cpp-dev")
         self.table = self.dynamodb.Table(self.table_name)
+        self.cache = cache if cache is not None else CampaignCache.from_env()
+        self.generation_check_seconds = float(
+            os.environ.get("CAMPAIGN_CACHE_GENERATION_CHECK_SECONDS", "5")
+        )
+        self._generation: Optional[int] = None
+        self._generation_checked_at: Optional[float] = None
         logger.info(f"Initialized CampaignRepository with table: {self.table_name}")
 
     def find_by_code(self, code: str) -> Campaign:
@@ -38,6 +103,15 @@ class CampaignRepository:
             CampaignNotFoundException: If campaign not found
             DynamoDBException: If DynamoDB operation fails
         """
+        self._sync_cache_generation()
+        cached = self.cache.get(code)
+        if cached is NOT_FOUND:
+            logger.info(f"Campaign not found (cached): {code}")
+            raise CampaignNotFoundException(code)
+        if isinstance(cached, Campaign):
+            logger.info(f"Campaign found (cached): {code}")
+            return cached
+
         try:
             logger.info(f"Finding campaign by code: {code}")
 
@@ -47,12 +121,15 @@ class CampaignRepository:
 
             if "Item" not in response:
                 logger.warning(f"Campaign not found: {code}")
+                self.cache.put_not_found(code)
                 raise CampaignNotFoundException(code)
 
             item = response["Item"]
             logger.info(f"Campaign found: {code}")
 
-            return self._to_entity(item)
+            campaign = self._to_entity(item)
+            self.cache.put(code, campaign)
+            return campaign
 
         except CampaignNotFoundException:
             raise
@@ -63,6 +140,288 @@ class CampaignRepository:
             logger.error(f"Unexpected error: {e}")
             raise DynamoDBException("Unexpected error retrieving campaign", e)
 
+    def find_by_codes(self, codes: List[str]) -> Dict[str, Campaign]:
+        """
+        Find several campaigns by code with BatchGetItem.
+
+        Cached codes are answered from the cache; the rest are read in
+        batches of up to 100 keys, retrying UnprocessedKeys with backoff.
+
+        Args:
+            codes: Campaign codes
+
+        Returns:
+            Campaigns keyed by code (codes without a campaign are absent)
+
+        Raises:
+            DynamoDBException: If DynamoDB operation fails or keys stay unprocessed
+        """
+        self._sync_cache_generation()
+        campaigns: Dict[str, Campaign] = {}
+        pending: List[str] = []
+        for code in dict.fromkeys(codes):
+            cached = self.cache.get(code)
+            if isinstance(cached, Campaign):
+                campaigns[code] = cached
+            elif cached is not NOT_FOUND:
+                pending.append(code)
+
+        logger.info(f"Finding {len(codes)} campaign(s), {len(pending)} not cached")
+        try:
+            for start in range(0, len(pending), BATCH_GET_SIZE):
+                chunk = pending[start : start + BATCH_GET_SIZE]
+                for item in self._batch_get(
+                    [{"PK": f"CAMPAIGN#{code}", "SK": "METADATA"} for code in chunk]
+                ):
+                    campaign = self._to_entity(item)
+                    self.cache.put(campaign.code, campaign)
+                    campaigns[campaign.code] = campaign
+                for code in chunk:
+                    if code not in campaigns:
+                        self.cache.put_not_found(code)
+
+        except DynamoDBException:
+            raise
+        except ClientError as e:
+            logger.error(f"DynamoDB ClientError: {e}")
+            raise DynamoDBException("Failed to retrieve campaigns", e)
+        except Exception as e:
+            logger.error(f"Unexpected error: {e}")
+            raise DynamoDBException("Unexpected error retrieving campaigns", e)
+
+        return campaigns
+
+    def _batch_get(self, keys: List[Dict[str, str]]) -> List[dict]:
+        """
+        Read up to 100 keys, retrying UnprocessedKeys with exponential backoff.
+
+        Args:
+            keys: Item keys
+
+        Returns:
+            Items found
+
+        Raises:
+            DynamoDBException: If keys are still unprocessed after the last attempt
+        """
+        items: List[dict] = []
+        request: Dict[str, Any] = {self.table_name: {"Keys": keys}}
+        for attempt in range(BATCH_GET_MAX_ATTEMPTS):
+            if attempt:
+                time.sleep(min(0.05 * 2**attempt, 1.0))
+            response = self.dynamodb.batch_get_item(RequestItems=request)
+            items.extend(response.get("Responses", {}).get(self.table_name, []))
+            request = response.get("UnprocessedKeys") or {}
+            if not request:
+                return items
+            logger.warning(
+                f"Retrying {len(request[self.table_name]['Keys'])} unprocessed key(s)"
+            )
+
+        unprocessed = len(request[self.table_name]["Keys"])
+        raise DynamoDBException(
+            f"{unprocessed} key(s) unprocessed after {BATCH_GET_MAX_ATTEMPTS} attempts",
+            RuntimeError("UnprocessedKeys"),
+        )
+
+    def find_active(self) -> List[Campaign]:
+        """
+        List ACTIVE campaigns from the status index.
+
+        Returns:
+            Active campaigns, soonest to expire first
+
+        Raises:
+            DynamoDBException: If DynamoDB operation fails
+        """
+        return list(self._query_status_index(CampaignStatus.ACTIVE))
+
+    def find_due_transitions(self, status: CampaignStatus, now: int) -> List[Campaign]:
+        """
+        List campaigns in a status whose next status change is due.
+
+        Args:
+            status: DRAFT (due to start) or ACTIVE (due to expire)
+            now: Current time (epoch seconds)
+
+        Returns:
+            Campaigns whose transitionAt is at or before now
+
+        Raises:
+            DynamoDBException: If DynamoDB operation fails
+        """
+        return list(self._query_status_index(status, until=now))
+
+    def find_without_epochs(self) -> Iterator[Campaign]:
+        """
+        Scan for campaign items written before fromEpoch/toEpoch existed.
+
+        Yields:
+            Campaigns (epochs derived from their ISO dates)
+
+        Raises:
+            DynamoDBException: If DynamoDB operation fails
+        """
+        kwargs: Dict[str, Any] = {
+            "FilterExpression": Attr("PK").begins_with("CAMPAIGN#")
+            & Attr("SK").eq("METADATA")
+            & Attr("fromEpoch").not_exists()
+        }
+        try:
+            while True:
+                response = self.table.scan(**kwargs)
+                for item in response.get("Items", []):
+                    yield self._to_entity(item)
+                if "LastEvaluatedKey" not in response:
+                    return
+                kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+        except ClientError as e:
+            logger.error(f"DynamoDB ClientError: {e}")
+            raise DynamoDBException("Failed to scan campaigns", e)
+
+    def update_status(self, campaign: Campaign, status: CampaignStatus) -> bool:
+        """
+        Persist a campaign's status, epochs and status index attributes.
+
+        The write is conditional on the stored status still being the
+        campaign's, so a concurrent edit is not overwritten.
+
+        Args:
+            campaign: Campaign as read (its status is the expected stored status)
+            status: New status
+
+        Returns:
+            True if written, False if the stored status had changed
+
+        Raises:
+            DynamoDBException: If DynamoDB operation fails
+        """
+        index = status_index_attributes(status, campaign.from_epoch, campaign.to_epoch)
+        values: Dict[str, Any] = {
+            ":status": CampaignStatus(status).value,
+            ":expected": CampaignStatus(campaign.status).value,
+            ":fromEpoch": campaign.from_epoch,
+            ":toEpoch": campaign.to_epoch,
+        }
+        update = "SET #status = :status, fromEpoch = :fromEpoch, toEpoch = :toEpoch"
+        if index:
+            update += ", statusKey = :statusKey, transitionAt = :transitionAt"
+            values.update(
+                {
+                    ":statusKey": index["statusKey"],
+                    ":transitionAt": index["transitionAt"],
+                }
+            )
+        else:
+            update += " REMOVE statusKey, transitionAt"
+
+        try:
+            self.table.update_item(
+                Key={"PK": f"CAMPAIGN#{campaign.code}", "SK": "METADATA"},
+                UpdateExpression=update,
+                ConditionExpression="#status = :expected",
+                ExpressionAttributeNames={"#status": "status"},
+                ExpressionAttributeValues=values,
+            )
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                logger.warning(
+                    f"Campaign {campaign.code} changed status concurrently, skipped"
+                )
+                return False
+            logger.error(f"DynamoDB ClientError: {e}")
+            raise DynamoDBException("Failed to update campaign status", e)
+
+        logger.info(
+            f"Campaign {campaign.code}: {campaign.status} -> {CampaignStatus(status).value}"
+        )
+        return True
+
+    def _query_status_index(
+        self, status: CampaignStatus, until: Optional[int] = None
+    ) -> Iterator[Campaign]:
+        """Query the status index for a status, optionally up to a transition time."""
+        condition: Any = Key("statusKey").eq(f"STATUS#{status.value}")
+        if until is not None:
+            condition = condition & Key("transitionAt").lte(until)
+        kwargs: Dict[str, Any] = {
+            "IndexName": STATUS_INDEX_NAME,
+            "KeyConditionExpression": condition,
+        }
+        try:
+            while True:
+                response = self.table.query(**kwargs)
+                for item in response.get("Items", []):
+                    yield self._to_entity(item)
+                if "LastEvaluatedKey" not in response:
+                    return
+                kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+        except ClientError as e:
+            logger.error(f"DynamoDB ClientError: {e}")
+            raise DynamoDBException("Failed to query campaign status index", e)
+
+    def invalidate(self, code: str) -> None:
+        """
+        Drop a campaign from this container's cache.
+
+        Args:
+            code: Campaign code
+        """
+        self.cache.invalidate(code)
+
+    def bump_cache_generation(self) -> int:
+        """
+        Tell every container to drop its cached campaigns.
+
+        Returns:
+            The new generation
+
+        Raises:
+            DynamoDBException: If DynamoDB operation fails
+        """
+        try:
+            response = self.table.update_item(
+                Key=CACHE_GENERATION_KEY,
+                UpdateExpression="ADD generation :one",
+                ExpressionAttributeValues={":one": 1},
+                ReturnValues="UPDATED_NEW",
+            )
+        except ClientError as e:
+            logger.error(f"DynamoDB ClientError: {e}")
+            raise DynamoDBException("Failed to bump campaign cache generation", e)
+
+        generation = int(str(response["Attributes"]["generation"]))
+        logger.info(f"Campaign cache generation is now {generation}")
+        return generation
+
+    def _sync_cache_generation(self) -> None:
+        """Clear the cache if the generation moved since it was last read."""
+        if self.cache.ttl_seconds <= 0:
+            return
+        now = time.monotonic()
+        if (
+            self._generation_checked_at is not None
+            and now - self._generation_checked_at < self.generation_check_seconds
+        ):
+            return
+        self._generation_checked_at = now
+
+        try:
+            response = self.table.get_item(Key=CACHE_GENERATION_KEY)
+        except ClientError as e:
+            # Entries still expire with the TTL; try again on the next check
+            logger.warning(f"Could not read campaign cache generation: {e}")
+            return
+
+        generation = int(str(response.get("Item", {}).get("generation", 0)))
+        if generation != self._generation:
+            if self._generation is not None:
+                logger.info(
+                    f"Campaign cache generation moved to {generation}, clearing cache"
+                )
+            self.cache.clear()
+            self._generation = generation
+
     def _to_entity(self, item: dict) -> Campaign:
         """
         Convert DynamoDB item to Campaign entity.
@@ -73,16 +432,22 @@ class CampaignRepository:
         Returns:
             Campaign domain model
         """
-        return Campaign(
-            code=item["code"],
-            productId=item["productId"],
-            discountPercent=int(item["discountPercent"]),
-            listPrice=Decimal(str(item["listPrice"])),
-            price=Decimal(str(item["price"])),
-            termsAndConditions=item["termsAndConditions"],
-            status=CampaignStatus(item["status"]),
-            fromDate=item["fromDate"],
-            toDate=item["toDate"],
-            specialConditions=item.get("specialConditions"),
-            active=item.get("active", True),
+        # Items written before the status transition job carry no epochs;
+        # Campaign derives them from the ISO dates
+        return Campaign.model_validate(
+            {
+                "code": item["code"],
+                "productId": item["productId"],
+                "discountPercent": int(item["discountPercent"]),
+                "listPrice": Decimal(str(item["listPrice"])),
+                "price": Decimal(str(item["price"])),
+                "termsAndConditions": item["termsAndConditions"],
+                "status": CampaignStatus(item["status"]),
+                "fromDate": item["fromDate"],
+                "toDate": item["toDate"],
+                "fromEpoch": int(item["fromEpoch"]) if "fromEpoch" in item else None,
+                "toEpoch": int(item["toEpoch"]) if "toEpoch" in item else None,
+                "specialConditions": item.get("specialConditions"),
+                "active": item.get("active", True),
+            }
         )
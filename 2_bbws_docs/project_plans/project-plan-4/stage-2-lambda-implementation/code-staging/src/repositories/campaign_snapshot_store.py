@@ -0,0 +1,172 @@
+"""S3 store for the active-campaign snapshot."""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+import boto3
+from botocore.exceptions import ClientError
+
+from src.exceptions.campaign_exceptions import SnapshotException
+from src.models.campaign import CampaignResponse, CampaignSnapshot
+
+logger = logging.getLogger(__name__)
+
+
+class CampaignSnapshotStore:
+    """
+    Reads and writes the gzip'd JSON snapshot of ACTIVE campaigns.
+
+    The version and a hash of the campaigns are kept in the object's
+    metadata, so publishing an unchanged list writes nothing and keeps the
+    version (and ETag) stable. load() keeps the last snapshot in memory and
+    revalidates it with a conditional GET at most every refresh_seconds.
+    """
+
+    def __init__(self, bucket: Optional[str] = None, key: Optional[str] = None) -> None:
+        """
+        Initialize snapshot store.
+
+        Args:
+            bucket: Bucket (default: CAMPAIGN_SNAPSHOT_BUCKET)
+            key: Object key (default: CAMPAIGN_SNAPSHOT_KEY)
+        """
+        self.s3 = boto3.client("s3")
+        self.bucket = bucket or os.environ.get(
+            "CAMPAIGN_SNAPSHOT_BUCKET", "bbws-campaign-snapshots-dev"
+        )
+        self.key = key or os.environ.get(
+            "CAMPAIGN_SNAPSHOT_KEY", "campaigns/active.json.gz"
+        )
+        self.refresh_seconds = float(
+            os.environ.get("CAMPAIGN_SNAPSHOT_REFRESH_SECONDS", "30")
+        )
+        self.cache_control = os.environ.get(
+            "CAMPAIGN_SNAPSHOT_CACHE_CONTROL", "public, max-age=60"
+        )
+        self._snapshot: Optional[CampaignSnapshot] = None
+        self._etag: Optional[str] = None
+        self._checked_at: Optional[float] = None
+        logger.info(
+            f"Initialized CampaignSnapshotStore with s3://{self.bucket}/{self.key}"
+        )
+
+    def publish(self, campaigns: List[CampaignResponse]) -> int:
+        """
+        Write a new snapshot version if the campaigns changed.
+
+        Args:
+            campaigns: ACTIVE campaigns
+
+        Returns:
+            Version of the stored snapshot
+
+        Raises:
+            SnapshotException: If S3 operation fails
+        """
+        content = [
+            campaign.model_dump(mode="json", by_alias=True) for campaign in campaigns
+        ]
+        content_hash = hashlib.sha256(
+            json.dumps(content, sort_keys=True, separators=(",", ":")).encode()
+        ).hexdigest()
+
+        current = self._head_metadata()
+        if current is not None and current.get("content-sha256") == content_hash:
+            version = int(current["snapshot-version"])
+            logger.info(f"Campaign snapshot unchanged at version {version}")
+            return version
+
+        version = (
+            int(current.get("snapshot-version", "0")) + 1 if current is not None else 1
+        )
+        snapshot = CampaignSnapshot(
+            version=version,
+            generatedAt=datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            campaigns=campaigns,
+        )
+        body = gzip.compress(snapshot.model_dump_json(by_alias=True).encode(), mtime=0)
+
+        try:
+            self.s3.put_object(
+                Bucket=self.bucket,
+                Key=self.key,
+                Body=body,
+                ContentType="application/json",
+                ContentEncoding="gzip",
+                CacheControl=self.cache_control,
+                Metadata={
+                    "snapshot-version": str(version),
+                    "content-sha256": content_hash,
+                },
+            )
+        except ClientError as e:
+            logger.error(f"S3 ClientError: {e}")
+            raise SnapshotException("Failed to write campaign snapshot", e)
+
+        logger.info(
+            f"Published campaign snapshot version {version}: {len(campaigns)} campaign(s), {len(body)} bytes"
+        )
+        return version
+
+    def load(self) -> CampaignSnapshot:
+        """
+        Get the current snapshot.
+
+        Returns:
+            Snapshot (the in-memory copy if S3 has not changed; a stale copy
+            if S3 cannot be reached)
+
+        Raises:
+            SnapshotException: If no snapshot could be loaded yet
+        """
+        now = time.monotonic()
+        if self._snapshot is not None and self._checked_at is not None:
+            if now - self._checked_at < self.refresh_seconds:
+                return self._snapshot
+        self._checked_at = now
+
+        kwargs: Dict[str, Any] = {"Bucket": self.bucket, "Key": self.key}
+        if self._etag:
+            kwargs["IfNoneMatch"] = self._etag
+        try:
+            response = self.s3.get_object(**kwargs)
+            snapshot = CampaignSnapshot.model_validate_json(
+                gzip.decompress(response["Body"].read())
+            )
+        except ClientError as e:
+            if self._snapshot is not None:
+                if e.response["Error"]["Code"] not in ("304", "NotModified"):
+                    logger.warning(
+                        f"Could not refresh campaign snapshot, serving version {self._snapshot.version}: {e}"
+                    )
+                return self._snapshot
+            logger.error(f"S3 ClientError: {e}")
+            raise SnapshotException("Failed to read campaign snapshot", e)
+        except (OSError, ValueError) as e:
+            logger.error(f"Invalid campaign snapshot: {e}")
+            if self._snapshot is not None:
+                return self._snapshot
+            raise SnapshotException("Invalid campaign snapshot", e)
+
+        self._snapshot = snapshot
+        self._etag = response["ETag"]
+        logger.info(f"Loaded campaign snapshot version {snapshot.version}")
+        return snapshot
+
+    def _head_metadata(self) -> Optional[Dict[str, str]]:
+        """Metadata of the stored snapshot, or None if there is none yet."""
+        try:
+            response = self.s3.head_object(Bucket=self.bucket, Key=self.key)
+        except ClientError as e:
+            if e.response["Error"]["Code"] in ("404", "NoSuchKey"):
+                return None
+            logger.error(f"S3 ClientError: {e}")
+            raise SnapshotException("Failed to read campaign snapshot metadata", e)
+        metadata: Dict[str, str] = response.get("Metadata", {})
+        return metadata
@@ -1,8 +1,9 @@
 """Campaign service containing business logic."""
 
 import logging
-from datetime import datetime
+import time
 from decimal import Decimal
+from typing import Dict, List, Optional
 
 from src.models.campaign import Campaign, CampaignStatus
 from src.repositories.campaign_repository import CampaignRepository
@@ -48,34 +49,151 @@ class CampaignService:
         # Calculate effective price based on discount
         campaign = self._calculate_effective_price(campaign)
 
-        logger.info(f"Campaign retrieved successfully: {code}, status: {campaign.status}")
+        logger.info(
+            f"Campaign retrieved successfully: {code}, status: {campaign.status}"
+        )
         return campaign
 
+    def get_campaigns(self, codes: List[str]) -> Dict[str, Campaign]:
+        """
+        Get several campaigns with validation and price calculation.
+
+        Args:
+            codes: Campaign codes
+
+        Returns:
+            Validated, priced campaigns keyed by code (unknown codes are absent)
+
+        Raises:
+            DynamoDBException: If database error occurs
+        """
+        logger.info(f"Getting {len(codes)} campaign(s)")
+
+        campaigns = self.repository.find_by_codes(codes)
+        for code, campaign in campaigns.items():
+            campaign = self._validate_campaign_status(campaign)
+            campaigns[code] = self._calculate_effective_price(campaign)
+
+        logger.info(f"Campaigns retrieved: {len(campaigns)} of {len(codes)}")
+        return campaigns
+
+    def list_active_campaigns(self) -> List[Campaign]:
+        """
+        List ACTIVE campaigns, priced.
+
+        Campaigns the index still lists as ACTIVE but whose end has passed
+        (the transition job has not run yet) are left out.
+
+        Returns:
+            Active campaigns from the status index, soonest to expire first
+
+        Raises:
+            DynamoDBException: If database error occurs
+        """
+        campaigns = [
+            self._validate_campaign_status(campaign)
+            for campaign in self.repository.find_active()
+        ]
+        return [
+            self._calculate_effective_price(campaign)
+            for campaign in campaigns
+            if campaign.status == CampaignStatus.ACTIVE
+        ]
+
+    def transition_due_campaigns(self, now: Optional[int] = None) -> Dict[str, int]:
+        """
+        Persist DRAFT -> ACTIVE and ACTIVE/DRAFT -> EXPIRED changes that are due.
+
+        Args:
+            now: Current time in epoch seconds (default: now)
+
+        Returns:
+            Number of campaigns moved to each status, and skipped writes
+
+        Raises:
+            DynamoDBException: If database error occurs
+        """
+        now = int(time.time()) if now is None else now
+        due = self.repository.find_due_transitions(CampaignStatus.DRAFT, now)
+        due += self.repository.find_due_transitions(CampaignStatus.ACTIVE, now)
+
+        counts = {
+            CampaignStatus.ACTIVE.value: 0,
+            CampaignStatus.EXPIRED.value: 0,
+            "skipped": 0,
+        }
+        for campaign in due:
+            status = self._status_at(campaign, now)
+            if status == campaign.status:
+                continue
+            if self.repository.update_status(campaign, status):
+                counts[status.value] += 1
+            else:
+                counts["skipped"] += 1
+
+        logger.info(f"Campaign status transitions: {counts}")
+        return counts
+
+    def backfill_status_index(self, now: Optional[int] = None) -> int:
+        """
+        Add epochs and status index attributes to campaigns written without them.
+
+        Args:
+            now: Current time in epoch seconds (default: now)
+
+        Returns:
+            Number of campaigns updated
+
+        Raises:
+            DynamoDBException: If database error occurs
+        """
+        now = int(time.time()) if now is None else now
+        updated = 0
+        for campaign in self.repository.find_without_epochs():
+            if self.repository.update_status(campaign, self._status_at(campaign, now)):
+                updated += 1
+
+        logger.info(f"Backfilled status index for {updated} campaign(s)")
+        return updated
+
     def _validate_campaign_status(self, campaign: Campaign) -> Campaign:
         """
         Validate and update campaign status based on dates.
 
+        The transition job persists status changes; this covers the time
+        between a boundary passing and the job's next run.
+
         Args:
             campaign: Campaign to validate
 
         Returns:
             Campaign with updated status if needed
         """
-        now = datetime.utcnow()
-        from_date = datetime.fromisoformat(campaign.from_date.replace("Z", "+00:00"))
-        to_date = datetime.fromisoformat(campaign.to_date.replace("Z", "+00:00"))
-
-        # Check if campaign has expired
-        if now > to_date:
-            logger.info(f"Campaign {campaign.code} has expired")
-            campaign.status = CampaignStatus.EXPIRED
-        # Check if campaign is active
-        elif from_date <= now <= to_date and campaign.status == CampaignStatus.DRAFT:
-            logger.info(f"Campaign {campaign.code} is now active")
-            campaign.status = CampaignStatus.ACTIVE
+        status = self._status_at(campaign, int(time.time()))
+        if status != campaign.status:
+            logger.info(f"Campaign {campaign.code} is now {status.value}")
+            campaign.status = status
 
         return campaign
 
+    def _status_at(self, campaign: Campaign, now: int) -> CampaignStatus:
+        """
+        Status a campaign should have at a time.
+
+        Args:
+            campaign: Campaign
+            now: Time in epoch seconds
+
+        Returns:
+            EXPIRED after toEpoch, ACTIVE for a DRAFT inside its window,
+            otherwise the current status
+        """
+        if now > campaign.to_epoch:
+            return CampaignStatus.EXPIRED
+        if campaign.from_epoch <= now and campaign.status == CampaignStatus.DRAFT:
+            return CampaignStatus.ACTIVE
+        return CampaignStatus(campaign.status)
+
     def _calculate_effective_price(self, campaign: Campaign) -> Campaign:
         """
         Calculate effective price based on discount.
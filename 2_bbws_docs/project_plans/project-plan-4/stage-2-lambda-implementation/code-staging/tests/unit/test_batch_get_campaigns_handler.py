@@ -0,0 +1,110 @@
+"""Unit tests for the batch_get_campaigns Lambda handler."""
+
+import base64
+import json
+from decimal import Decimal
+from typing import Any, Iterator
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.container import container
+from src.exceptions.campaign_exceptions import DynamoDBException
+from src.handlers.batch_get_campaigns import lambda_handler
+from src.models.campaign import Campaign, CampaignStatus
+
+
+@pytest.fixture
+def campaign_service() -> Iterator[MagicMock]:
+    """Campaign service swapped into the handler's container."""
+    service = MagicMock()
+    with container.override(campaign_service=service):
+        yield service
+
+
+def _campaign(code: str) -> Campaign:
+    """Active campaign with a 20% discount."""
+    return Campaign(
+        code=code,
+        productId="PROD-001",
+        discountPercent=20,
+        listPrice=Decimal("100.00"),
+        price=Decimal("80.00"),
+        termsAndConditions="Valid until end of summer",
+        status=CampaignStatus.ACTIVE,
+        fromDate="2025-06-01T00:00:00Z",
+        toDate="2099-08-31T23:59:59Z",
+    )
+
+
+def _event(body: Any) -> dict:
+    """API Gateway event for POST /v1.0/campaigns:batchGet."""
+    return {"body": json.dumps(body)}
+
+
+class TestBatchGetCampaignsHandler:
+    """Tests for lambda_handler."""
+
+    def test_results_and_errors(self, campaign_service: MagicMock) -> None:
+        """Test found codes are returned and unknown codes reported, in request order."""
+        campaign_service.get_campaigns.return_value = {
+            "B": _campaign("B"),
+            "A": _campaign("A"),
+        }
+
+        response = lambda_handler(_event({"codes": ["A", "NOPE", "B", "A"]}), None)
+
+        assert response["statusCode"] == 200
+        body = json.loads(response["body"])
+        assert [campaign["code"] for campaign in body["campaigns"]] == ["A", "B"]
+        assert body["campaigns"][0]["listPrice"] == "100.00"
+        assert body["errors"] == [
+            {"code": "NOPE", "statusCode": 404, "message": "Campaign not found: NOPE"}
+        ]
+        campaign_service.get_campaigns.assert_called_once_with(["A", "NOPE", "B"])
+
+    def test_base64_body(self, campaign_service: MagicMock) -> None:
+        """Test base64-encoded bodies are decoded."""
+        campaign_service.get_campaigns.return_value = {}
+        body = base64.b64encode(json.dumps({"codes": ["A"]}).encode()).decode()
+
+        response = lambda_handler({"body": body, "isBase64Encoded": True}, None)
+
+        assert json.loads(response["body"])["errors"][0]["code"] == "A"
+
+    @pytest.mark.parametrize(
+        "body",
+        [
+            "not json",
+            json.dumps([]),
+            json.dumps({"codes": []}),
+            json.dumps({"codes": ["A", 1]}),
+            json.dumps({}),
+        ],
+    )
+    def test_invalid_body(self, campaign_service: MagicMock, body: str) -> None:
+        """Test malformed requests are rejected with 400."""
+        response = lambda_handler({"body": body}, None)
+
+        assert response["statusCode"] == 400
+        campaign_service.get_campaigns.assert_not_called()
+
+    def test_too_many_codes(self, campaign_service: MagicMock) -> None:
+        """Test more than 100 distinct codes are rejected."""
+        response = lambda_handler(
+            _event({"codes": [f"C{i}" for i in range(101)]}), None
+        )
+
+        assert response["statusCode"] == 400
+        assert "100" in json.loads(response["body"])["message"]
+
+    def test_system_error(self, campaign_service: MagicMock) -> None:
+        """Test repository failures map to 500 without details."""
+        campaign_service.get_campaigns.side_effect = DynamoDBException(
+            "boom", Exception("boom")
+        )
+
+        response = lambda_handler(_event({"codes": ["A"]}), None)
+
+        assert response["statusCode"] == 500
+        assert json.loads(response["body"]) == {"message": "Internal server error"}
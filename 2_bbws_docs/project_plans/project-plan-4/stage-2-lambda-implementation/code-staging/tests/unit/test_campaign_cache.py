@@ -0,0 +1,119 @@
+"""Unit tests for CampaignCache."""
+
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+
+from src.models.campaign import Campaign, CampaignStatus
+from src.repositories.campaign_cache import NOT_FOUND, CampaignCache
+
+
+def _campaign(code: str = "SUMMER2025") -> Campaign:
+    """Active campaign with a 20% discount."""
+    return Campaign(
+        code=code,
+        productId="PROD-001",
+        discountPercent=20,
+        listPrice=Decimal("100.00"),
+        price=Decimal("80.00"),
+        termsAndConditions="Valid until end of summer",
+        status=CampaignStatus.ACTIVE,
+        fromDate="2025-06-01T00:00:00Z",
+        toDate="2099-08-31T23:59:59Z",
+    )
+
+
+class TestCampaignCache:
+    """Tests for CampaignCache."""
+
+    def test_hit_returns_copy(self) -> None:
+        """Test hits are copies, so callers cannot change the cached campaign."""
+        cache = CampaignCache()
+        cache.put("SUMMER2025", _campaign())
+
+        hit = cache.get("SUMMER2025")
+        assert isinstance(hit, Campaign)
+        hit.price = Decimal("1.00")
+
+        again = cache.get("SUMMER2025")
+        assert isinstance(again, Campaign)
+        assert again.price == Decimal("80.00")
+
+    def test_miss(self) -> None:
+        """Test an unknown code is a miss."""
+        assert CampaignCache().get("NOPE") is None
+
+    def test_negative_entry(self) -> None:
+        """Test unknown codes are remembered as NOT_FOUND."""
+        cache = CampaignCache()
+        cache.put_not_found("NOPE")
+
+        assert cache.get("NOPE") is NOT_FOUND
+
+    def test_entries_expire(self) -> None:
+        """Test campaigns and negative entries expire with their own TTLs."""
+        cache = CampaignCache(ttl_seconds=60, negative_ttl_seconds=10)
+        with patch(
+            "src.repositories.campaign_cache.time.monotonic", return_value=1000.0
+        ):
+            cache.put("SUMMER2025", _campaign())
+            cache.put_not_found("NOPE")
+
+        with patch(
+            "src.repositories.campaign_cache.time.monotonic", return_value=1011.0
+        ):
+            assert cache.get("NOPE") is None
+            assert isinstance(cache.get("SUMMER2025"), Campaign)
+
+        with patch(
+            "src.repositories.campaign_cache.time.monotonic", return_value=1061.0
+        ):
+            assert cache.get("SUMMER2025") is None
+        assert len(cache) == 0
+
+    def test_least_recently_used_evicted(self) -> None:
+        """Test the least recently used code is evicted when full."""
+        cache = CampaignCache(max_entries=2)
+        cache.put("A", _campaign("A"))
+        cache.put("B", _campaign("B"))
+        cache.get("A")
+
+        cache.put("C", _campaign("C"))
+
+        assert cache.get("B") is None
+        assert isinstance(cache.get("A"), Campaign)
+        assert isinstance(cache.get("C"), Campaign)
+
+    def test_zero_ttl_disables(self) -> None:
+        """Test a zero TTL stores nothing."""
+        cache = CampaignCache(ttl_seconds=0, negative_ttl_seconds=0)
+        cache.put("SUMMER2025", _campaign())
+        cache.put_not_found("NOPE")
+
+        assert len(cache) == 0
+
+    def test_invalidate_and_clear(self) -> None:
+        """Test single codes and the whole cache can be dropped."""
+        cache = CampaignCache()
+        cache.put("A", _campaign("A"))
+        cache.put("B", _campaign("B"))
+
+        cache.invalidate("A")
+        assert cache.get("A") is None
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_from_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test settings come from CAMPAIGN_CACHE_* variables."""
+        monkeypatch.setenv("CAMPAIGN_CACHE_MAX_ENTRIES", "10")
+        monkeypatch.setenv("CAMPAIGN_CACHE_TTL_SECONDS", "5")
+        monkeypatch.setenv("CAMPAIGN_CACHE_NEGATIVE_TTL_SECONDS", "2")
+
+        cache = CampaignCache.from_env()
+
+        assert (cache.max_entries, cache.ttl_seconds, cache.negative_ttl_seconds) == (
+            10,
+            5.0,
+            2.0,
+        )
@@ -4,7 +4,7 @@ import pytest
 from decimal import Decimal
 from pydantic import ValidationError
 
-from src.models.campaign import Campaign, CampaignResponse, CampaignStatus
+from src.models.campaign import Campaign, CampaignResponse, CampaignStatus, iso_to_epoch
 
 
 class TestCampaignStatus:
@@ -110,6 +110,46 @@ class TestCampaign:
         assert "Price cannot exceed list price" in str(exc_info.value)
 
 
+class TestCampaignEpochs:
+    """Tests for Campaign epoch fields."""
+
+    def test_epochs_derived_from_dates(self) -> None:
+        """Test fromEpoch/toEpoch default to the ISO dates."""
+        campaign = Campaign(
+            code="SUMMER2025",
+            productId="PROD-001",
+            discountPercent=20,
+            listPrice=Decimal("100.00"),
+            price=Decimal("80.00"),
+            termsAndConditions="Valid until end of summer",
+            status=CampaignStatus.ACTIVE,
+            fromDate="2025-06-01T00:00:00Z",
+            toDate="2025-08-31T23:59:59+00:00",
+            fromEpoch=None,
+        )
+
+        assert campaign.from_epoch == 1748736000
+        assert campaign.to_epoch == iso_to_epoch("2025-08-31T23:59:59Z")
+
+    def test_stored_epochs_kept(self) -> None:
+        """Test stored epochs are used as given."""
+        campaign = Campaign(
+            code="SUMMER2025",
+            productId="PROD-001",
+            discountPercent=20,
+            listPrice=Decimal("100.00"),
+            price=Decimal("80.00"),
+            termsAndConditions="Valid until end of summer",
+            status=CampaignStatus.ACTIVE,
+            fromDate="2025-06-01T00:00:00Z",
+            toDate="2025-08-31T23:59:59Z",
+            fromEpoch=1,
+            toEpoch=2,
+        )
+
+        assert (campaign.from_epoch, campaign.to_epoch) == (1, 2)
+
+
 class TestCampaignResponse:
     """Tests for CampaignResponse model."""
 
@@ -0,0 +1,295 @@
+"""Unit tests for CampaignRepository against a moto DynamoDB table."""
+
+from decimal import Decimal
+from typing import Any, Iterator
+from unittest.mock import patch
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from src.exceptions.campaign_exceptions import (
+    CampaignNotFoundException,
+    DynamoDBException,
+)
+from src.repositories.campaign_cache import CampaignCache
+from src.repositories import campaign_repository
+from src.models.campaign import CampaignStatus, iso_to_epoch
+from src.repositories.campaign_repository import CampaignRepository
+
+TABLE_NAME = "bbws-cpp-test"
+
+
+@pytest.fixture
+def table(monkeypatch: pytest.MonkeyPatch) -> Iterator[Any]:
+    """Campaign table with one campaign."""
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "af-south-1")
+    monkeypatch.setenv("DYNAMODB_TABLE_NAME", TABLE_NAME)
+    with mock_aws():
+        table = boto3.resource("dynamodb").create_table(
+            TableName=TABLE_NAME,
+            KeySchema=[
+                {"AttributeName": "PK", "KeyType": "HASH"},
+                {"AttributeName": "SK", "KeyType": "RANGE"},
+            ],
+            AttributeDefinitions=[
+                {"AttributeName": "PK", "AttributeType": "S"},
+                {"AttributeName": "SK", "AttributeType": "S"},
+                {"AttributeName": "statusKey", "AttributeType": "S"},
+                {"AttributeName": "transitionAt", "AttributeType": "N"},
+            ],
+            GlobalSecondaryIndexes=[
+                {
+                    "IndexName": "CampaignStatusIndex",
+                    "KeySchema": [
+                        {"AttributeName": "statusKey", "KeyType": "HASH"},
+                        {"AttributeName": "transitionAt", "KeyType": "RANGE"},
+                    ],
+                    "Projection": {"ProjectionType": "ALL"},
+                }
+            ],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        table.put_item(Item=_item("SUMMER2025", "100.00"))
+        yield table
+
+
+def _item(code: str, list_price: str) -> dict:
+    """Campaign item with a 20% discount."""
+    return {
+        "PK": f"CAMPAIGN#{code}",
+        "SK": "METADATA",
+        "code": code,
+        "productId": "PROD-001",
+        "discountPercent": 20,
+        "listPrice": list_price,
+        "price": list_price,
+        "termsAndConditions": "Valid until end of summer",
+        "status": "ACTIVE",
+        "fromDate": "2025-06-01T00:00:00Z",
+        "toDate": "2099-08-31T23:59:59Z",
+    }
+
+
+def _count_get_items(repository: CampaignRepository) -> list:
+    """Record the keys of every GetItem the repository makes."""
+    calls: list = []
+    repository.table.meta.client.meta.events.register(
+        "before-parameter-build.dynamodb.GetItem",
+        lambda params, **kwargs: calls.append(params["Key"]),
+    )
+    return calls
+
+
+class TestCampaignRepository:
+    """Tests for CampaignRepository."""
+
+    def test_find_reads_through_cache(self, table: Any) -> None:
+        """Test a repeated lookup is served from the cache."""
+        repository = CampaignRepository()
+        calls = _count_get_items(repository)
+
+        first = repository.find_by_code("SUMMER2025")
+        second = repository.find_by_code("SUMMER2025")
+
+        assert first.code == second.code == "SUMMER2025"
+        campaign_reads = [
+            key for key in calls if key["PK"]["S"] == "CAMPAIGN#SUMMER2025"
+        ]
+        assert len(campaign_reads) == 1
+
+    def test_unknown_code_cached(self, table: Any) -> None:
+        """Test unknown codes are answered from the negative cache."""
+        repository = CampaignRepository()
+        calls = _count_get_items(repository)
+
+        for _ in range(3):
+            with pytest.raises(CampaignNotFoundException):
+                repository.find_by_code("NOPE")
+
+        assert len([key for key in calls if key["PK"]["S"] == "CAMPAIGN#NOPE"]) == 1
+
+    def test_invalidate(self, table: Any) -> None:
+        """Test invalidate makes the next lookup read DynamoDB."""
+        repository = CampaignRepository()
+        repository.find_by_code("SUMMER2025")
+        table.put_item(Item=_item("SUMMER2025", "200.00"))
+
+        repository.invalidate("SUMMER2025")
+
+        assert repository.find_by_code("SUMMER2025").list_price == Decimal("200.00")
+
+    def test_generation_bump_clears_other_caches(self, table: Any) -> None:
+        """Test a bump from another container clears this one's cache at the next check."""
+        repository = CampaignRepository()
+        repository.generation_check_seconds = 0
+        repository.find_by_code("SUMMER2025")
+        table.put_item(Item=_item("SUMMER2025", "200.00"))
+
+        assert CampaignRepository().bump_cache_generation() == 1
+        assert repository.find_by_code("SUMMER2025").list_price == Decimal("200.00")
+
+    def test_generation_checked_at_interval(self, table: Any) -> None:
+        """Test the generation item is read at most once per interval."""
+        repository = CampaignRepository()
+        calls = _count_get_items(repository)
+
+        with patch(
+            "src.repositories.campaign_repository.time.monotonic", return_value=100.0
+        ):
+            repository.find_by_code("SUMMER2025")
+            repository.find_by_code("SUMMER2025")
+        with patch(
+            "src.repositories.campaign_repository.time.monotonic", return_value=106.0
+        ):
+            repository.find_by_code("SUMMER2025")
+
+        assert len([key for key in calls if key["PK"]["S"] == "CACHE#CAMPAIGNS"]) == 2
+
+    def test_cache_disabled(self, table: Any) -> None:
+        """Test a zero TTL reads DynamoDB every time and skips the generation check."""
+        repository = CampaignRepository(
+            cache=CampaignCache(ttl_seconds=0, negative_ttl_seconds=0)
+        )
+        calls = _count_get_items(repository)
+
+        repository.find_by_code("SUMMER2025")
+        repository.find_by_code("SUMMER2025")
+
+        assert [key["PK"]["S"] for key in calls] == [
+            "CAMPAIGN#SUMMER2025",
+            "CAMPAIGN#SUMMER2025",
+        ]
+
+
+class TestFindByCodes:
+    """Tests for CampaignRepository.find_by_codes."""
+
+    def test_batches_and_caches(
+        self, table: Any, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test codes are read in batches and found and missing codes are cached."""
+        monkeypatch.setattr(campaign_repository, "BATCH_GET_SIZE", 2)
+        table.put_item(Item=_item("WINTER2025", "50.00"))
+        table.put_item(Item=_item("SPRING2026", "70.00"))
+        repository = CampaignRepository()
+        batches: list = []
+        repository.dynamodb.meta.client.meta.events.register(
+            "before-parameter-build.dynamodb.BatchGetItem",
+            lambda params, **kwargs: batches.append(
+                len(params["RequestItems"][TABLE_NAME]["Keys"])
+            ),
+        )
+
+        campaigns = repository.find_by_codes(
+            ["SUMMER2025", "NOPE", "WINTER2025", "SPRING2026", "SUMMER2025"]
+        )
+
+        assert sorted(campaigns) == ["SPRING2026", "SUMMER2025", "WINTER2025"]
+        assert batches == [2, 2]
+
+        assert sorted(repository.find_by_codes(["SUMMER2025", "NOPE"])) == [
+            "SUMMER2025"
+        ]
+        assert batches == [2, 2]
+        with pytest.raises(CampaignNotFoundException):
+            repository.find_by_code("NOPE")
+
+    def test_unprocessed_keys_retried(
+        self, table: Any, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test UnprocessedKeys are requested again."""
+        monkeypatch.setattr(campaign_repository.time, "sleep", lambda seconds: None)
+        repository = CampaignRepository()
+        key = {"PK": "CAMPAIGN#SUMMER2025", "SK": "METADATA"}
+        responses = [
+            {
+                "Responses": {TABLE_NAME: []},
+                "UnprocessedKeys": {TABLE_NAME: {"Keys": [key]}},
+            },
+            {
+                "Responses": {TABLE_NAME: [_item("SUMMER2025", "100.00")]},
+                "UnprocessedKeys": {},
+            },
+        ]
+
+        with patch.object(
+            repository.dynamodb, "batch_get_item", side_effect=responses
+        ) as batch_get_item:
+            campaigns = repository.find_by_codes(["SUMMER2025"])
+
+        assert list(campaigns) == ["SUMMER2025"]
+        assert batch_get_item.call_args_list[1].kwargs["RequestItems"] == {
+            TABLE_NAME: {"Keys": [key]}
+        }
+
+    def test_unprocessed_keys_exhausted(
+        self, table: Any, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test keys still unprocessed after the last attempt fail the lookup."""
+        monkeypatch.setattr(campaign_repository.time, "sleep", lambda seconds: None)
+        repository = CampaignRepository()
+        key = {"PK": "CAMPAIGN#SUMMER2025", "SK": "METADATA"}
+        response = {"Responses": {}, "UnprocessedKeys": {TABLE_NAME: {"Keys": [key]}}}
+
+        with patch.object(
+            repository.dynamodb, "batch_get_item", return_value=response
+        ) as batch_get_item:
+            with pytest.raises(DynamoDBException, match="unprocessed"):
+                repository.find_by_codes(["SUMMER2025"])
+
+        assert batch_get_item.call_count == campaign_repository.BATCH_GET_MAX_ATTEMPTS
+
+
+class TestStatusIndex:
+    """Tests for the CampaignStatusIndex methods."""
+
+    def test_transitions_maintain_index(self, table: Any) -> None:
+        """Test status updates move campaigns through the sparse index."""
+        repository = CampaignRepository(cache=CampaignCache(ttl_seconds=0))
+        table.put_item(Item={**_item("WINTER2025", "50.00"), "status": "DRAFT"})
+        backfilled = {
+            campaign.code: campaign for campaign in repository.find_without_epochs()
+        }
+        assert sorted(backfilled) == ["SUMMER2025", "WINTER2025"]
+
+        assert repository.update_status(backfilled["SUMMER2025"], CampaignStatus.ACTIVE)
+        assert repository.update_status(backfilled["WINTER2025"], CampaignStatus.DRAFT)
+        assert list(repository.find_without_epochs()) == []
+
+        starts = iso_to_epoch("2025-06-01T00:00:00Z")
+        assert [
+            c.code
+            for c in repository.find_due_transitions(CampaignStatus.DRAFT, starts)
+        ] == ["WINTER2025"]
+        assert repository.find_due_transitions(CampaignStatus.DRAFT, starts - 1) == []
+        assert [c.code for c in repository.find_active()] == ["SUMMER2025"]
+
+        active = repository.find_active()[0]
+        assert repository.update_status(active, CampaignStatus.EXPIRED)
+        assert repository.find_active() == []
+        stored = table.get_item(Key={"PK": "CAMPAIGN#SUMMER2025", "SK": "METADATA"})[
+            "Item"
+        ]
+        assert stored["status"] == "EXPIRED"
+        assert "statusKey" not in stored
+        assert stored["toEpoch"] == iso_to_epoch("2099-08-31T23:59:59Z")
+
+    def test_update_status_skips_concurrent_change(self, table: Any) -> None:
+        """Test a status write is skipped if the stored status no longer matches."""
+        repository = CampaignRepository(cache=CampaignCache(ttl_seconds=0))
+        campaign = repository.find_by_code("SUMMER2025")
+        table.update_item(
+            Key={"PK": "CAMPAIGN#SUMMER2025", "SK": "METADATA"},
+            UpdateExpression="SET #status = :draft",
+            ExpressionAttributeNames={"#status": "status"},
+            ExpressionAttributeValues={":draft": "DRAFT"},
+        )
+
+        assert repository.update_status(campaign, CampaignStatus.EXPIRED) is False
+        stored = table.get_item(Key={"PK": "CAMPAIGN#SUMMER2025", "SK": "METADATA"})[
+            "Item"
+        ]
+        assert stored["status"] == "DRAFT"
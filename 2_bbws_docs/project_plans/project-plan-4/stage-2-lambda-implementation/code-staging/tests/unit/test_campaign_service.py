@@ -0,0 +1,138 @@
+"""Unit tests for CampaignService."""
+
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+from src.models.campaign import Campaign, CampaignStatus, iso_to_epoch
+from src.services.campaign_service import CampaignService
+
+
+def _campaign(status: CampaignStatus, from_date: str, to_date: str) -> Campaign:
+    """Campaign with a 20% discount on a 100.00 list price."""
+    return Campaign(
+        code="SUMMER2025",
+        productId="PROD-001",
+        discountPercent=20,
+        listPrice=Decimal("100.00"),
+        price=Decimal("100.00"),
+        termsAndConditions="Valid until end of summer",
+        status=status,
+        fromDate=from_date,
+        toDate=to_date,
+    )
+
+
+class TestCampaignService:
+    """Tests for CampaignService."""
+
+    def test_draft_campaign_in_window_is_active(self) -> None:
+        """Test a draft campaign within its dates is reported active and priced."""
+        repository = MagicMock()
+        repository.find_by_code.return_value = _campaign(
+            CampaignStatus.DRAFT, "2020-01-01T00:00:00Z", "2099-12-31T23:59:59Z"
+        )
+
+        campaign = CampaignService(repository).get_campaign("SUMMER2025")
+
+        assert campaign.status == CampaignStatus.ACTIVE
+        assert campaign.price == Decimal("80.00")
+
+    def test_past_campaign_is_expired(self) -> None:
+        """Test a campaign past its end date is reported expired."""
+        repository = MagicMock()
+        repository.find_by_code.return_value = _campaign(
+            CampaignStatus.ACTIVE, "2020-01-01T00:00:00Z", "2020-12-31T23:59:59Z"
+        )
+
+        campaign = CampaignService(repository).get_campaign("SUMMER2025")
+
+        assert campaign.status == CampaignStatus.EXPIRED
+
+    def test_get_campaigns_validates_each(self) -> None:
+        """Test batch results get the same status and price rules."""
+        repository = MagicMock()
+        repository.find_by_codes.return_value = {
+            "SUMMER2025": _campaign(
+                CampaignStatus.DRAFT, "2020-01-01T00:00:00Z", "2099-12-31T23:59:59Z"
+            ),
+        }
+
+        campaigns = CampaignService(repository).get_campaigns(["SUMMER2025", "NOPE"])
+
+        assert list(campaigns) == ["SUMMER2025"]
+        assert campaigns["SUMMER2025"].status == CampaignStatus.ACTIVE
+        assert campaigns["SUMMER2025"].price == Decimal("80.00")
+        repository.find_by_codes.assert_called_once_with(["SUMMER2025", "NOPE"])
+
+
+class TestStatusTransitions:
+    """Tests for the persisted status transitions."""
+
+    def test_transition_due_campaigns(self) -> None:
+        """Test due campaigns are moved and unchanged or contended ones are not."""
+        now = iso_to_epoch("2025-07-01T00:00:00Z")
+        starting = _campaign(
+            CampaignStatus.DRAFT, "2025-06-01T00:00:00Z", "2025-12-31T23:59:59Z"
+        )
+        ending = _campaign(
+            CampaignStatus.ACTIVE, "2025-01-01T00:00:00Z", "2025-06-30T23:59:59Z"
+        )
+        contended = _campaign(
+            CampaignStatus.DRAFT, "2025-01-01T00:00:00Z", "2025-02-01T00:00:00Z"
+        )
+        boundary = _campaign(
+            CampaignStatus.ACTIVE, "2025-01-01T00:00:00Z", "2025-07-01T00:00:00Z"
+        )
+        repository = MagicMock()
+        repository.find_due_transitions.side_effect = lambda status, at: (
+            [starting, contended]
+            if status == CampaignStatus.DRAFT
+            else [ending, boundary]
+        )
+        repository.update_status.side_effect = (
+            lambda campaign, status: campaign is not contended
+        )
+
+        counts = CampaignService(repository).transition_due_campaigns(now)
+
+        assert counts == {"ACTIVE": 1, "EXPIRED": 1, "skipped": 1}
+        written = [
+            (call.args[0], call.args[1])
+            for call in repository.update_status.call_args_list
+        ]
+        assert written == [
+            (starting, CampaignStatus.ACTIVE),
+            (contended, CampaignStatus.EXPIRED),
+            (ending, CampaignStatus.EXPIRED),
+        ]
+
+    def test_backfill_status_index(self) -> None:
+        """Test campaigns without epochs are written with their current status."""
+        now = iso_to_epoch("2025-07-01T00:00:00Z")
+        campaign = _campaign(
+            CampaignStatus.ACTIVE, "2025-01-01T00:00:00Z", "2025-06-30T23:59:59Z"
+        )
+        repository = MagicMock()
+        repository.find_without_epochs.return_value = iter([campaign])
+        repository.update_status.return_value = True
+
+        assert CampaignService(repository).backfill_status_index(now) == 1
+        repository.update_status.assert_called_once_with(
+            campaign, CampaignStatus.EXPIRED
+        )
+
+    def test_list_active_campaigns(self) -> None:
+        """Test active campaigns from the index are priced and already-ended ones dropped."""
+        repository = MagicMock()
+        repository.find_active.return_value = [
+            _campaign(
+                CampaignStatus.ACTIVE, "2020-01-01T00:00:00Z", "2099-12-31T23:59:59Z"
+            ),
+            _campaign(
+                CampaignStatus.ACTIVE, "2020-01-01T00:00:00Z", "2020-12-31T23:59:59Z"
+            ),
+        ]
+
+        campaigns = CampaignService(repository).list_active_campaigns()
+
+        assert [campaign.price for campaign in campaigns] == [Decimal("80.00")]
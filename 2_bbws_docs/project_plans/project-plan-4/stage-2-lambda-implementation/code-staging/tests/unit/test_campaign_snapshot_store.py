@@ -0,0 +1,148 @@
+"""Unit tests for CampaignSnapshotStore against a moto S3 bucket."""
+
+import gzip
+import json
+from decimal import Decimal
+from typing import Any, Iterator
+from unittest.mock import patch
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from src.exceptions.campaign_exceptions import SnapshotException
+from src.models.campaign import CampaignResponse, CampaignStatus
+from src.repositories.campaign_snapshot_store import CampaignSnapshotStore
+
+BUCKET = "bbws-campaign-snapshots-test"
+KEY = "campaigns/active.json.gz"
+
+
+@pytest.fixture
+def s3(monkeypatch: pytest.MonkeyPatch) -> Iterator[Any]:
+    """Empty snapshot bucket."""
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "af-south-1")
+    with mock_aws():
+        client = boto3.client("s3")
+        client.create_bucket(
+            Bucket=BUCKET,
+            CreateBucketConfiguration={"LocationConstraint": "af-south-1"},
+        )
+        yield client
+
+
+def _response(code: str, price: str = "80.00") -> CampaignResponse:
+    """Active campaign response."""
+    return CampaignResponse(
+        code=code,
+        productId="PROD-001",
+        discountPercent=20,
+        listPrice=Decimal("100.00"),
+        price=Decimal(price),
+        termsAndConditions="Valid until end of summer",
+        status=CampaignStatus.ACTIVE,
+        fromDate="2025-06-01T00:00:00Z",
+        toDate="2099-08-31T23:59:59Z",
+        isValid=True,
+    )
+
+
+def _record_gets(store: CampaignSnapshotStore) -> list:
+    """Record the If-None-Match of every GetObject the store makes."""
+    calls: list = []
+    store.s3.meta.events.register(
+        "before-parameter-build.s3.GetObject",
+        lambda params, **kwargs: calls.append(params.get("IfNoneMatch")),
+    )
+    return calls
+
+
+class TestPublish:
+    """Tests for CampaignSnapshotStore.publish."""
+
+    def test_writes_gzipped_versioned_snapshot(self, s3: Any) -> None:
+        """Test the snapshot is gzip'd JSON with the version inside and in metadata."""
+        store = CampaignSnapshotStore(BUCKET, KEY)
+
+        assert store.publish([_response("SUMMER2025")]) == 1
+
+        stored = s3.get_object(Bucket=BUCKET, Key=KEY)
+        assert stored["ContentEncoding"] == "gzip"
+        assert stored["Metadata"]["snapshot-version"] == "1"
+        document = json.loads(gzip.decompress(stored["Body"].read()))
+        assert document["version"] == 1
+        assert [campaign["code"] for campaign in document["campaigns"]] == [
+            "SUMMER2025"
+        ]
+        assert document["campaigns"][0]["isValid"] is True
+
+    def test_unchanged_list_keeps_version(self, s3: Any) -> None:
+        """Test republishing the same campaigns writes nothing new."""
+        store = CampaignSnapshotStore(BUCKET, KEY)
+        store.publish([_response("SUMMER2025")])
+        etag = s3.head_object(Bucket=BUCKET, Key=KEY)["ETag"]
+
+        assert store.publish([_response("SUMMER2025")]) == 1
+        assert s3.head_object(Bucket=BUCKET, Key=KEY)["ETag"] == etag
+
+    def test_changed_list_bumps_version(self, s3: Any) -> None:
+        """Test a changed campaign produces the next version."""
+        store = CampaignSnapshotStore(BUCKET, KEY)
+        store.publish([_response("SUMMER2025")])
+
+        assert store.publish([_response("SUMMER2025", "75.00")]) == 2
+        assert store.publish([]) == 3
+
+
+class TestLoad:
+    """Tests for CampaignSnapshotStore.load."""
+
+    def test_conditional_refresh(self, s3: Any) -> None:
+        """Test loads reuse the in-memory copy and revalidate with If-None-Match."""
+        CampaignSnapshotStore(BUCKET, KEY).publish([_response("SUMMER2025")])
+        store = CampaignSnapshotStore(BUCKET, KEY)
+        calls = _record_gets(store)
+
+        with patch(
+            "src.repositories.campaign_snapshot_store.time.monotonic",
+            return_value=100.0,
+        ):
+            first = store.load()
+            assert store.load() is first
+        assert calls == [None]
+
+        with patch(
+            "src.repositories.campaign_snapshot_store.time.monotonic",
+            return_value=200.0,
+        ):
+            assert store.load() is first
+        assert calls[1] is not None
+
+        CampaignSnapshotStore(BUCKET, KEY).publish(
+            [_response("SUMMER2025"), _response("WINTER2025")]
+        )
+        with patch(
+            "src.repositories.campaign_snapshot_store.time.monotonic",
+            return_value=300.0,
+        ):
+            refreshed = store.load()
+        assert refreshed.version == 2
+        assert len(refreshed.campaigns) == 2
+
+    def test_stale_copy_served_on_error(self, s3: Any) -> None:
+        """Test a failed refresh serves the last snapshot."""
+        CampaignSnapshotStore(BUCKET, KEY).publish([_response("SUMMER2025")])
+        store = CampaignSnapshotStore(BUCKET, KEY)
+        store.refresh_seconds = 0
+        first = store.load()
+
+        s3.delete_object(Bucket=BUCKET, Key=KEY)
+
+        assert store.load() is first
+
+    def test_missing_snapshot(self, s3: Any) -> None:
+        """Test loading before anything was published fails."""
+        with pytest.raises(SnapshotException):
+            CampaignSnapshotStore(BUCKET, KEY).load()
@@ -0,0 +1,41 @@
+"""Unit tests for the campaign_status_transition Lambda handler."""
+
+from typing import Iterator
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.container import container
+from src.handlers.campaign_status_transition import lambda_handler
+
+
+@pytest.fixture
+def campaign_service() -> Iterator[MagicMock]:
+    """Campaign service swapped into the handler's container."""
+    service = MagicMock()
+    with container.override(campaign_service=service):
+        yield service
+
+
+class TestCampaignStatusTransitionHandler:
+    """Tests for lambda_handler."""
+
+    def test_scheduled_run(self, campaign_service: MagicMock) -> None:
+        """Test a scheduled event runs the due transitions."""
+        campaign_service.transition_due_campaigns.return_value = {
+            "ACTIVE": 1,
+            "EXPIRED": 0,
+            "skipped": 0,
+        }
+
+        result = lambda_handler({"source": "aws.events"}, None)
+
+        assert result == {"transitions": {"ACTIVE": 1, "EXPIRED": 0, "skipped": 0}}
+        campaign_service.backfill_status_index.assert_not_called()
+
+    def test_backfill(self, campaign_service: MagicMock) -> None:
+        """Test a backfill event fills in the status index instead."""
+        campaign_service.backfill_status_index.return_value = 3
+
+        assert lambda_handler({"backfill": True}, None) == {"backfilled": 3}
+        campaign_service.transition_due_campaigns.assert_not_called()
@@ -0,0 +1,98 @@
+"""Unit tests for the campaign stream invalidator Lambda handler."""
+
+from typing import Iterator, Tuple
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.container import container
+from src.handlers.campaign_stream_invalidator import lambda_handler
+
+
+@pytest.fixture
+def dependencies() -> Iterator[Tuple[MagicMock, MagicMock]]:
+    """Repository and CloudFront client swapped into the handler's container."""
+    repository = MagicMock()
+    repository.bump_cache_generation.return_value = 7
+    cloudfront = MagicMock()
+    with container.override(
+        campaign_repository=repository, cloudfront_client=cloudfront
+    ):
+        yield repository, cloudfront
+
+
+def _record(event_name: str, pk: str, sk: str = "METADATA") -> dict:
+    """DynamoDB Stream record for a key."""
+    return {
+        "eventName": event_name,
+        "dynamodb": {"Keys": {"PK": {"S": pk}, "SK": {"S": sk}}},
+    }
+
+
+class TestCampaignStreamInvalidator:
+    """Tests for lambda_handler."""
+
+    def test_bumps_generation_and_invalidates_cloudfront(
+        self, dependencies: Tuple[MagicMock, MagicMock], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test changed campaigns bump the generation and invalidate their paths once each."""
+        repository, cloudfront = dependencies
+        monkeypatch.setenv("CLOUDFRONT_DISTRIBUTION_ID", "E123")
+        event = {
+            "Records": [
+                _record("MODIFY", "CAMPAIGN#SUMMER2025"),
+                _record("INSERT", "CAMPAIGN#WINTER2025"),
+                _record("REMOVE", "CAMPAIGN#SUMMER2025"),
+            ]
+        }
+
+        result = lambda_handler(event, None)
+
+        assert result == {"codes": ["SUMMER2025", "WINTER2025"], "generation": 7}
+        repository.bump_cache_generation.assert_called_once_with()
+        batch = cloudfront.create_invalidation.call_args.kwargs["InvalidationBatch"]
+        assert batch["Paths"] == {
+            "Quantity": 2,
+            "Items": ["/v1.0/campaigns/SUMMER2025", "/v1.0/campaigns/WINTER2025"],
+        }
+
+    def test_ignores_other_items(
+        self, dependencies: Tuple[MagicMock, MagicMock]
+    ) -> None:
+        """Test non-campaign items, including the generation item, change nothing."""
+        repository, cloudfront = dependencies
+        event = {
+            "Records": [
+                _record("MODIFY", "CACHE#CAMPAIGNS", "GENERATION"),
+                _record("MODIFY", "ORDER#1"),
+                _record("MODIFY", "CAMPAIGN#SUMMER2025", "STATS"),
+            ]
+        }
+
+        assert lambda_handler(event, None) == {"codes": [], "generation": None}
+        repository.bump_cache_generation.assert_not_called()
+        cloudfront.create_invalidation.assert_not_called()
+
+    def test_without_distribution(
+        self, dependencies: Tuple[MagicMock, MagicMock], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test CloudFront is skipped when no distribution is configured."""
+        repository, cloudfront = dependencies
+        monkeypatch.delenv("CLOUDFRONT_DISTRIBUTION_ID", raising=False)
+
+        lambda_handler({"Records": [_record("MODIFY", "CAMPAIGN#SUMMER2025")]}, None)
+
+        repository.bump_cache_generation.assert_called_once_with()
+        cloudfront.create_invalidation.assert_not_called()
+
+    def test_failure_raised_for_retry(
+        self, dependencies: Tuple[MagicMock, MagicMock]
+    ) -> None:
+        """Test a failed bump fails the batch so Lambda retries it."""
+        repository, _ = dependencies
+        repository.bump_cache_generation.side_effect = RuntimeError("throttled")
+
+        with pytest.raises(RuntimeError):
+            lambda_handler(
+                {"Records": [_record("MODIFY", "CAMPAIGN#SUMMER2025")]}, None
+            )
@@ -0,0 +1,64 @@
+"""Unit tests for the dependency container."""
+
+from typing import Iterator
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.container import Container
+
+
+@pytest.fixture
+def fresh_container() -> Iterator[Container]:
+    """Container whose repository does not touch AWS."""
+    with patch("src.container.CampaignRepository") as repository_class:
+        repository_class.side_effect = lambda: MagicMock()
+        yield Container()
+
+
+class TestContainer:
+    """Tests for Container."""
+
+    def test_dependencies_built_once(self, fresh_container: Container) -> None:
+        """Test dependencies are reused across accesses."""
+        service = fresh_container.campaign_service
+
+        assert fresh_container.campaign_service is service
+        assert service.repository is fresh_container.campaign_repository
+
+    def test_warm_builds_everything(self, fresh_container: Container) -> None:
+        """Test warm builds every dependency up front."""
+        fresh_container.warm()
+
+        assert {"campaign_repository", "campaign_service"} <= set(vars(fresh_container))
+
+    def test_warm_selected(self, fresh_container: Container) -> None:
+        """Test warm can build only the dependencies a handler uses."""
+        fresh_container.warm("campaign_service")
+
+        assert {"campaign_repository", "campaign_service"} <= set(vars(fresh_container))
+        assert "cloudfront_client" not in vars(fresh_container)
+
+    def test_reset_rebuilds(self, fresh_container: Container) -> None:
+        """Test reset drops built dependencies."""
+        service = fresh_container.campaign_service
+
+        fresh_container.reset()
+
+        assert fresh_container.campaign_service is not service
+
+    def test_override_restores(self, fresh_container: Container) -> None:
+        """Test override replaces a dependency only inside the block."""
+        service = fresh_container.campaign_service
+        replacement = MagicMock()
+
+        with fresh_container.override(campaign_service=replacement):
+            assert fresh_container.campaign_service is replacement
+
+        assert fresh_container.campaign_service is service
+
+    def test_override_unknown_dependency(self, fresh_container: Container) -> None:
+        """Test overriding a name that is not a dependency fails."""
+        with pytest.raises(AttributeError, match="campaign_srvice"):
+            with fresh_container.override(campaign_srvice=MagicMock()):
+                pass
@@ -0,0 +1,168 @@
+"""Unit tests for the get_campaign Lambda handler."""
+
+import json
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Iterator
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.container import container
+from src.exceptions.campaign_exceptions import (
+    CampaignNotFoundException,
+    DynamoDBException,
+)
+from src.handlers.get_campaign import lambda_handler
+from src.models.campaign import Campaign, CampaignStatus
+
+
+@pytest.fixture
+def campaign_service() -> Iterator[MagicMock]:
+    """Campaign service swapped into the handler's container."""
+    service = MagicMock()
+    with container.override(campaign_service=service):
+        yield service
+
+
+def _campaign(to_date: str) -> Campaign:
+    """Active campaign ending at to_date."""
+    return Campaign(
+        code="SUMMER2025",
+        productId="PROD-001",
+        discountPercent=20,
+        listPrice=Decimal("100.00"),
+        price=Decimal("80.00"),
+        termsAndConditions="Valid until end of summer",
+        status=CampaignStatus.ACTIVE,
+        fromDate="2025-06-01T00:00:00Z",
+        toDate=to_date,
+    )
+
+
+def _event(code: str) -> dict:
+    """API Gateway event for GET /v1.0/campaigns/{code}."""
+    return {"pathParameters": {"code": code}}
+
+
+class TestGetCampaignHandler:
+    """Tests for lambda_handler."""
+
+    def test_returns_campaign(self, campaign_service: MagicMock) -> None:
+        """Test a found campaign is returned with camelCase fields."""
+        campaign_service.get_campaign.return_value = Campaign(
+            code="SUMMER2025",
+            productId="PROD-001",
+            discountPercent=20,
+            listPrice=Decimal("100.00"),
+            price=Decimal("80.00"),
+            termsAndConditions="Valid until end of summer",
+            status=CampaignStatus.ACTIVE,
+            fromDate="2025-06-01T00:00:00Z",
+            toDate="2025-08-31T23:59:59Z",
+        )
+
+        response = lambda_handler(_event("SUMMER2025"), None)
+
+        assert response["statusCode"] == 200
+        body = json.loads(response["body"])
+        assert body["code"] == "SUMMER2025"
+        assert body["isValid"] is True
+        campaign_service.get_campaign.assert_called_once_with("SUMMER2025")
+
+    def test_service_reused_across_invocations(
+        self, campaign_service: MagicMock
+    ) -> None:
+        """Test warm invocations use the same service instance."""
+        campaign_service.get_campaign.side_effect = CampaignNotFoundException("X")
+
+        lambda_handler(_event("A"), None)
+        lambda_handler(_event("B"), None)
+
+        assert campaign_service.get_campaign.call_count == 2
+
+    def test_not_found(self, campaign_service: MagicMock) -> None:
+        """Test a missing campaign maps to 404."""
+        campaign_service.get_campaign.side_effect = CampaignNotFoundException("NOPE")
+
+        response = lambda_handler(_event("NOPE"), None)
+
+        assert response["statusCode"] == 404
+
+    def test_system_error(self, campaign_service: MagicMock) -> None:
+        """Test repository failures map to 500 without details."""
+        campaign_service.get_campaign.side_effect = DynamoDBException(
+            "boom", Exception("boom")
+        )
+
+        response = lambda_handler(_event("SUMMER2025"), None)
+
+        assert response["statusCode"] == 500
+        assert json.loads(response["body"]) == {"message": "Internal server error"}
+
+
+class TestHttpCaching:
+    """Tests for Cache-Control and ETag headers."""
+
+    def test_cache_headers(self, campaign_service: MagicMock) -> None:
+        """Test campaigns carry an ETag and a public max-age."""
+        campaign_service.get_campaign.return_value = _campaign("2099-12-31T23:59:59Z")
+
+        response = lambda_handler(_event("SUMMER2025"), None)
+
+        assert response["headers"]["Cache-Control"] == "public, max-age=60"
+        assert response["headers"]["ETag"].startswith('"')
+
+    def test_max_age_stops_at_status_change(self, campaign_service: MagicMock) -> None:
+        """Test responses are not cached past the campaign's end date."""
+        ends = datetime.now(timezone.utc) + timedelta(seconds=20)
+        campaign_service.get_campaign.return_value = _campaign(ends.isoformat())
+
+        response = lambda_handler(_event("SUMMER2025"), None)
+
+        max_age = int(response["headers"]["Cache-Control"].split("=")[1])
+        assert 0 <= max_age <= 20
+
+    def test_not_modified(self, campaign_service: MagicMock) -> None:
+        """Test a matching If-None-Match gets an empty 304."""
+        campaign_service.get_campaign.return_value = _campaign("2099-12-31T23:59:59Z")
+        etag = lambda_handler(_event("SUMMER2025"), None)["headers"]["ETag"]
+
+        event = {
+            **_event("SUMMER2025"),
+            "headers": {"if-none-match": f'"other", W/{etag}'},
+        }
+        response = lambda_handler(event, None)
+
+        assert response["statusCode"] == 304
+        assert response["body"] == ""
+        assert response["headers"]["ETag"] == etag
+
+    def test_etag_changes_with_campaign(self, campaign_service: MagicMock) -> None:
+        """Test a changed campaign is returned in full despite an old ETag."""
+        campaign_service.get_campaign.return_value = _campaign("2099-12-31T23:59:59Z")
+        etag = lambda_handler(_event("SUMMER2025"), None)["headers"]["ETag"]
+        campaign_service.get_campaign.return_value = _campaign("2099-12-30T23:59:59Z")
+
+        response = lambda_handler(
+            {**_event("SUMMER2025"), "headers": {"If-None-Match": etag}}, None
+        )
+
+        assert response["statusCode"] == 200
+        assert response["headers"]["ETag"] != etag
+
+    def test_not_found_cached_briefly(self, campaign_service: MagicMock) -> None:
+        """Test 404s use the negative max-age and errors are not cached."""
+        campaign_service.get_campaign.side_effect = CampaignNotFoundException("NOPE")
+        assert (
+            lambda_handler(_event("NOPE"), None)["headers"]["Cache-Control"]
+            == "public, max-age=30"
+        )
+
+        campaign_service.get_campaign.side_effect = DynamoDBException(
+            "boom", Exception("boom")
+        )
+        assert (
+            lambda_handler(_event("NOPE"), None)["headers"]["Cache-Control"]
+            == "no-store"
+        )
@@ -0,0 +1,109 @@
+"""Unit tests for the list_campaigns and campaign_snapshot_publisher Lambda handlers."""
+
+import json
+from decimal import Decimal
+from typing import Iterator, Tuple
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.container import container
+from src.exceptions.campaign_exceptions import SnapshotException
+from src.handlers import campaign_snapshot_publisher, list_campaigns
+from src.models.campaign import (
+    Campaign,
+    CampaignResponse,
+    CampaignSnapshot,
+    CampaignStatus,
+)
+
+
+@pytest.fixture
+def dependencies() -> Iterator[Tuple[MagicMock, MagicMock]]:
+    """Campaign service and snapshot store swapped into the handlers' container."""
+    service = MagicMock()
+    store = MagicMock()
+    with container.override(campaign_service=service, snapshot_store=store):
+        yield service, store
+
+
+def _campaign() -> Campaign:
+    """Active campaign with a 20% discount."""
+    return Campaign(
+        code="SUMMER2025",
+        productId="PROD-001",
+        discountPercent=20,
+        listPrice=Decimal("100.00"),
+        price=Decimal("80.00"),
+        termsAndConditions="Valid until end of summer",
+        status=CampaignStatus.ACTIVE,
+        fromDate="2025-06-01T00:00:00Z",
+        toDate="2099-08-31T23:59:59Z",
+    )
+
+
+class TestListCampaignsHandler:
+    """Tests for list_campaigns.lambda_handler."""
+
+    def test_returns_snapshot(self, dependencies: Tuple[MagicMock, MagicMock]) -> None:
+        """Test the snapshot is returned with a version ETag."""
+        _, store = dependencies
+        store.load.return_value = CampaignSnapshot(
+            version=4,
+            generatedAt="2025-07-01T00:00:00Z",
+            campaigns=[CampaignResponse.from_campaign(_campaign())],
+        )
+
+        response = list_campaigns.lambda_handler({}, None)
+
+        assert response["statusCode"] == 200
+        assert response["headers"]["ETag"] == '"v4"'
+        body = json.loads(response["body"])
+        assert body["version"] == 4
+        assert body["campaigns"][0]["code"] == "SUMMER2025"
+
+    def test_not_modified(self, dependencies: Tuple[MagicMock, MagicMock]) -> None:
+        """Test a matching If-None-Match gets an empty 304."""
+        _, store = dependencies
+        store.load.return_value = CampaignSnapshot(
+            version=4, generatedAt="2025-07-01T00:00:00Z", campaigns=[]
+        )
+
+        response = list_campaigns.lambda_handler(
+            {"headers": {"If-None-Match": '"v4"'}}, None
+        )
+
+        assert (response["statusCode"], response["body"]) == (304, "")
+
+    def test_snapshot_unavailable(
+        self, dependencies: Tuple[MagicMock, MagicMock]
+    ) -> None:
+        """Test a missing snapshot maps to 500 without details."""
+        _, store = dependencies
+        store.load.side_effect = SnapshotException("missing", Exception("NoSuchKey"))
+
+        response = list_campaigns.lambda_handler({}, None)
+
+        assert response["statusCode"] == 500
+        assert response["headers"]["Cache-Control"] == "no-store"
+
+
+class TestCampaignSnapshotPublisher:
+    """Tests for campaign_snapshot_publisher.lambda_handler."""
+
+    def test_publishes_active_campaigns(
+        self, dependencies: Tuple[MagicMock, MagicMock]
+    ) -> None:
+        """Test active campaigns are published as CampaignResponse models."""
+        service, store = dependencies
+        service.list_active_campaigns.return_value = [_campaign()]
+        store.publish.return_value = 7
+
+        result = campaign_snapshot_publisher.lambda_handler(
+            {"source": "aws.events"}, None
+        )
+
+        assert result == {"version": 7, "campaigns": 1}
+        published = store.publish.call_args.args[0]
+        assert [response.code for response in published] == ["SUMMER2025"]
+        assert published[0].is_valid is True